@@ -0,0 +1,144 @@
+"""
+Market-Basket Affinity Engine
+Support, confidence and lift for every product pair bought together in RetailMax order_items
+- Orders become rows of a sparse order x product incidence matrix; X.T @ X counts co-occurrences
+- Without scipy the same counts come from enumerating the product pairs inside each order
+- The result is a dense products x products matrix (300 x 300 for the catalog), so millions
+  of orders take seconds
+
+Usage:
+    python basket_affinity.py --scale 100 --top 20
+    python basket_affinity.py --order-items dataset/order_items.csv --min-support 0.0005
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+try:
+    import scipy.sparse as sparse
+except ImportError:  # Pair enumeration gives the same counts, just more slowly
+    sparse = None
+
+import retailmax_generator as rm
+
+# ============================================================================
+# CO-OCCURRENCE
+# ============================================================================
+
+def basket_codes(order_items_df: pd.DataFrame, product_ids=None):
+    """Integer order and product codes for every line; product codes follow `product_ids` when given"""
+    order_codes, orders = pd.factorize(order_items_df['order_id'])
+    if product_ids is None:
+        product_codes, product_ids = pd.factorize(order_items_df['product_id'])
+    else:
+        product_codes = pd.Index(product_ids).get_indexer(order_items_df['product_id'])
+        if (product_codes < 0).any():
+            raise ValueError("order_items contains product_ids that are missing from the catalog")
+    return order_codes, product_codes, len(orders), np.asarray(product_ids)
+
+def incidence_matrix(order_codes, product_codes, num_orders: int, num_products: int):
+    """Sparse 0/1 order x product matrix; repeated lines of one product count once"""
+    matrix = sparse.csr_matrix((np.ones(len(order_codes), dtype=np.int64), (order_codes, product_codes)),
+                               shape=(num_orders, num_products))
+    matrix.data[:] = 1
+    return matrix
+
+def pair_counts(order_codes, product_codes, num_products: int):
+    """Co-occurrence counts by enumerating every (product, product) pair inside each order"""
+    baskets = np.unique(np.asarray(order_codes, dtype=np.int64) * num_products + product_codes)
+    order, product = baskets // num_products, baskets % num_products
+    first, length = rm.runs(order)
+
+    size = np.repeat(length, length)  # Basket size of every line
+    left = np.repeat(np.arange(len(order)), size)
+    partner = (np.repeat(np.repeat(first, length), size)
+               + np.arange(len(left)) - np.repeat(np.cumsum(size) - size, size))
+    return np.bincount(product[left] * num_products + product[partner],
+                       minlength=num_products * num_products).reshape(num_products, num_products)
+
+def co_occurrence(order_codes, product_codes, num_orders: int, num_products: int):
+    """Dense products x products matrix of orders containing both products; the diagonal counts single products"""
+    if sparse is None:
+        return pair_counts(order_codes, product_codes, num_products)
+    matrix = incidence_matrix(order_codes, product_codes, num_orders, num_products)
+    return (matrix.T @ matrix).toarray()
+
+# ============================================================================
+# ASSOCIATION RULES
+# ============================================================================
+
+def association_rules(order_items_df: pd.DataFrame, products_df: pd.DataFrame = None, min_count: int = 1,
+                      min_support: float = 0.0, min_confidence: float = 0.0):
+    """Rules antecedent -> consequent for every product pair, strongest lift first
+
+    support = share of orders with both products, confidence = P(consequent | antecedent),
+    lift = confidence / share of orders with the consequent.
+    """
+    product_ids = None if products_df is None else products_df['product_id'].to_numpy()
+    order_codes, product_codes, num_orders, product_ids = basket_codes(order_items_df, product_ids)
+    counts = co_occurrence(order_codes, product_codes, num_orders, len(product_ids))
+
+    orders_with = np.diag(counts)
+    antecedent, consequent = np.nonzero(counts)
+    pair = (antecedent != consequent) & (counts[antecedent, consequent] >= min_count)
+    antecedent, consequent = antecedent[pair], consequent[pair]
+    together = counts[antecedent, consequent]
+
+    rules = pd.DataFrame({
+        'antecedent': product_ids[antecedent],
+        'consequent': product_ids[consequent],
+        'orders': together,
+        'support': together / num_orders,
+        'confidence': together / orders_with[antecedent],
+        'lift': together * num_orders / (orders_with[antecedent] * orders_with[consequent].astype(np.float64))
+    })
+    rules = rules[(rules['support'] >= min_support) & (rules['confidence'] >= min_confidence)]
+
+    if products_df is not None:
+        names = products_df.set_index('product_id')
+        for side in ['antecedent', 'consequent']:
+            rules[f'{side}_name'] = names['name'].reindex(rules[side]).to_numpy()
+            rules[f'{side}_category'] = names['category'].reindex(rules[side]).to_numpy()
+    return rules.sort_values(['lift', 'orders'], ascending=False, ignore_index=True)
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Mine product-pair rules from generated or saved order_items"""
+    parser = argparse.ArgumentParser(description="Support, confidence and lift for RetailMax product pairs")
+    parser.add_argument('--order-items', help="order_items.csv to analyse instead of generating the dataset")
+    parser.add_argument('--products', help="product_catalog.csv for product names (defaults next to --order-items)")
+    parser.add_argument('--scale', type=float, default=1.0)
+    parser.add_argument('--seed', type=int, default=rm.DEFAULT_SEED)
+    parser.add_argument('--min-count', type=int, default=5)
+    parser.add_argument('--min-support', type=float, default=0.0)
+    parser.add_argument('--min-confidence', type=float, default=0.0)
+    parser.add_argument('--top', type=int, default=15)
+    args = parser.parse_args()
+
+    if args.order_items:
+        order_items_df = pd.read_csv(args.order_items, usecols=['order_id', 'product_id'])
+        products_path = args.products or args.order_items.replace('order_items.csv', 'product_catalog.csv')
+        products_df = pd.read_csv(products_path)
+    else:
+        datasets, _ = rm.generate_all(args.scale, args.seed, verbose=False)
+        order_items_df, products_df = datasets['order_items'], datasets['product_catalog']
+
+    print("🧺 MARKET-BASKET AFFINITY")
+    print("=" * 55)
+    start_time = time.time()
+    rules = association_rules(order_items_df, products_df, args.min_count, args.min_support, args.min_confidence)
+    print(f"{order_items_df['order_id'].nunique():,} orders, {len(order_items_df):,} lines -> "
+          f"{len(rules):,} rules in {time.time() - start_time:.2f}s "
+          f"({'scipy.sparse' if sparse is not None else 'pair enumeration'})")
+    print("=" * 55)
+    print(rules.head(args.top)[['antecedent_name', 'consequent_name', 'orders', 'support', 'confidence', 'lift']]
+          .round(4).to_string(index=False))
+
+if __name__ == "__main__":
+    main()
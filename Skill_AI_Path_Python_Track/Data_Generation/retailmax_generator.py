@@ -0,0 +1,1280 @@
+"""
+RetailMax Synthetic Data Generator
+Importable version of synthetic_data_generation.ipynb
+- One function per table; each takes the tables it depends on and its own random generator
+- SCALE multiplies the notebook's row counts: 1 = 2,000 customers, 600 = RetailMax's 1.2M
+- Every table draws from a stream derived from (seed, table), so tables can be generated
+  and benchmarked one at a time with identical results
+
+Usage:
+    python retailmax_generator.py --scale 600 --output dataset
+    python retailmax_generator.py --scale 10 --benchmark
+    python retailmax_generator.py --scale 600 --attribution linear
+    python retailmax_generator.py --scale 10 --benchmark --check-fidelity
+    python retailmax_generator.py --scale 3000 --stream-transactions 32000000  # ~500M clickstream events
+"""
+
+import argparse
+import heapq
+import importlib
+import os
+import sys
+import time
+import zlib
+from collections import deque
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+
+# Shared dataset cache lives with the EduFin generator modules
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Skill_AI_Path_SQL_Track',
+                             'EduFin_SQL_V2_Collection_Strategy', 'Dataset'))
+from dataset_cache import DatasetCache, code_version
+from dataset_stats import StatsCatalog
+from dataset_fidelity import Calibrated, FidelityCheck, Shares, print_report
+from dataset_fingerprint import DatasetFingerprint, save_manifest
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+DEFAULT_SEED = 42
+
+# Notebook row counts at SCALE = 1; customers, transactions and sessions scale linearly.
+# 'sessions' counts visits on the customer timelines; sessionizing their clickstream can
+# merge back-to-back visits or split one with a long idle gap, so the final table is close to it
+BASE_COUNTS = {
+    'customers': 2000,
+    'transactions': 8000,
+    'sessions': 12000,
+    'campaigns': 25,
+    'products': 300,
+}
+SCALED_COUNTS = ['customers', 'transactions', 'sessions']
+FULL_SCALE = 600  # 1.2M active customers
+CHUNK_SIZE = 1_000_000  # Rows per vectorized batch for the large event tables
+STATS_FILE = 'stats.json'  # Statistics catalog written next to the CSVs (see dataset_stats.py)
+MANIFEST_FILE = 'manifest.json'  # Run settings and table fingerprints (see dataset_fingerprint.py)
+
+START_DATE = datetime(2023, 1, 1)
+END_DATE = datetime(2024, 3, 15)
+
+TABLE_NAMES = [
+    'customers', 'transactions', 'churn_labels', 'campaigns', 'campaign_performance', 'product_catalog',
+    'customer_feedback', 'sessions', 'orders', 'customer_behavior', 'billing_events', 'support_tickets',
+    'clickstream_events', 'order_items', 'campaign_attribution'
+]
+
+# ============================================================================
+# BUSINESS DATA
+# ============================================================================
+
+INDIAN_CITIES = [
+    'Mumbai', 'Delhi', 'Bangalore', 'Chennai', 'Hyderabad', 'Pune', 'Ahmedabad',
+    'Kolkata', 'Jaipur', 'Lucknow', 'Kanpur', 'Nagpur', 'Indore', 'Thane',
+    'Bhopal', 'Visakhapatnam', 'Patna', 'Vadodara', 'Ludhiana', 'Coimbatore'
+]
+
+# Weighted by RetailMax presence: Metro cities 70%, Tier-2 30%
+METRO_CITIES = ['Mumbai', 'Delhi', 'Bangalore', 'Chennai', 'Hyderabad', 'Pune', 'Kolkata']
+CITY_WEIGHTS = np.array([0.7 if city in METRO_CITIES else 0.3 for city in INDIAN_CITIES])
+CITY_WEIGHTS = CITY_WEIGHTS / CITY_WEIGHTS.sum()
+
+# Product categories as per RetailMax: Electronics 60%, Fashion 25%, Home & Living 15%
+PRODUCT_CATEGORIES = ['Electronics', 'Fashion', 'Home & Living']
+CATEGORY_WEIGHTS = [0.60, 0.25, 0.15]
+CATEGORY_PRICE_RANGES = {
+    'Electronics': (5000, 150000),
+    'Fashion': (500, 15000),
+    'Home & Living': (1000, 50000),
+}
+
+CUSTOMER_LOCALES = ['en_IN', 'en_US']  # Faker locales customer names are drawn from, equally often
+EMAIL_DOMAINS = ['example.com', 'example.net', 'example.org']
+
+LOYALTY_STATUSES = ['Bronze', 'Silver', 'Gold', 'Platinum']
+LOYALTY_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+
+ALL_PRODUCTS = {
+    'Electronics': [
+        'iPhone 15', 'Samsung Galaxy S24', 'MacBook Air M3', 'Dell XPS 13', 'iPad Pro',
+        'Sony WH-1000XM5', 'AirPods Pro', 'Canon EOS R5', 'Nintendo Switch',
+        'PlayStation 5', 'Xbox Series X', 'Apple Watch', 'Fitbit Charge 5',
+        'Kindle Paperwhite', 'Echo Dot', 'Mi Smart TV', 'OnePlus Nord',
+        'Realme GT Neo', 'Vivo V29', 'Oppo Reno', 'Nothing Phone', 'Google Pixel'
+    ],
+    'Fashion': [
+        'Levi\'s Jeans', 'Nike Air Force', 'Adidas Ultraboost', 'Zara Shirt',
+        'H&M Dress', 'Puma Sneakers', 'Ray-Ban Sunglasses', 'Fossil Watch',
+        'Michael Kors Bag', 'Coach Wallet', 'Titan Watch', 'Woodland Shoes',
+        'Peter England Shirt', 'Allen Solly Trousers', 'Van Heusen Suit',
+        'United Colors of Benetton', 'Myntra Kurta', 'Fabindia Saree'
+    ],
+    'Home & Living': [
+        'IKEA Sofa', 'Godrej Almirah', 'LG Refrigerator', 'Samsung Washing Machine',
+        'Whirlpool AC', 'Bajaj Mixer', 'Prestige Cooker', 'Pigeon Induction',
+        'Cello Water Bottle', 'Milton Tiffin', 'Tupperware Container',
+        'Sleepwell Mattress', 'Urban Ladder Table', 'Pepperfry Chair',
+        'Philips LED Bulb', 'Havells Fan', 'Orient Electric Heater'
+    ],
+}
+VARIANTS = ['Black', 'White', 'Blue', 'Red', 'Silver', 'S', 'M', 'L', 'XL', '32GB', '64GB', '128GB']
+INVENTORY_STATUSES = ['In Stock', 'Low Stock', 'Out of Stock']
+INVENTORY_WEIGHTS = [0.8, 0.15, 0.05]
+
+PAYMENT_METHODS = ['Credit Card', 'Debit Card', 'UPI', 'Net Banking', 'COD', 'Wallet']
+PAYMENT_WEIGHTS = [0.25, 0.20, 0.30, 0.10, 0.10, 0.05]
+QUANTITIES = [1, 2, 3]
+QUANTITY_WEIGHTS = [0.7, 0.2, 0.1]
+
+# Baskets: the transaction's product plus cross-sell lines drawn from its affinity cluster
+# (products often bought together), its category, or anywhere in the catalog
+BASKET_SIZES = [1, 2, 3, 4, 5]
+BASKET_SIZE_WEIGHTS = [0.55, 0.25, 0.12, 0.05, 0.03]
+AFFINITY_CLUSTER_SIZE = 6
+AFFINITY_SCOPES = ['cluster', 'category', 'catalog']
+AFFINITY_SCOPE_WEIGHTS = [0.5, 0.3, 0.2]
+
+TARGET_CHURN_RATE = 0.45  # 55% retention
+
+CAMPAIGN_TYPES = ['Acquisition', 'Retention', 'Win-back', 'Seasonal', 'Product Launch']
+TARGET_SEGMENTS = ['High Value', 'Medium Value', 'Low Value', 'New Customers', 'At-Risk', 'All Customers']
+CAMPAIGN_NAMES = [
+    'Summer Sale Bonanza', 'Diwali Mega Sale', 'New Year Special', 'Electronics Fest',
+    'Fashion Week Sale', 'Home Decor Carnival', 'Back to School', 'Monsoon Sale',
+    'Independence Day Sale', 'Valentine Special', 'Mother\'s Day Sale', 'Father\'s Day Sale',
+    'Holi Colors Sale', 'Christmas Special', 'Republic Day Sale', 'Women\'s Day Sale',
+    'Mobile Madness', 'Laptop Sale', 'Fashion Flash Sale', 'Home Appliance Sale',
+    'Student Discount', 'Senior Citizen Sale', 'First Time Buyer', 'Loyalty Rewards',
+    'Weekend Special'
+]
+CHANNELS = ['Email', 'Social Media', 'Search Ads', 'Influencer']
+CHANNEL_WEIGHTS = [0.4, 0.3, 0.2, 0.1]
+CHANNEL_CTR = {'Email': (0.02, 0.08), 'Social Media': (0.01, 0.04), 'Search Ads': (0.03, 0.12), 'Influencer': (0.005, 0.025)}
+
+# Attribution: a purchase inside a campaign's window (plus a week of carry-over) by a customer in its target
+# segment is touched with the channel's reach; the touched campaigns then share the purchase by rule
+ATTRIBUTION_RULES = ['last_touch', 'linear']
+ATTRIBUTION_WINDOW_DAYS = 7
+CHANNEL_REACH = {'Email': 0.20, 'Social Media': 0.12, 'Search Ads': 0.25, 'Influencer': 0.08}
+VALUE_SEGMENT_SPEND = [15000, 50000]  # Lifetime spend: Low below ₹15K, High above ₹50K, as in the notebook summary
+CLICK_CONVERSION_RATE = (0.01, 0.08)  # Share of campaign clicks that end in an attributed purchase
+NEW_CUSTOMER_DAYS = 90  # Purchases within 90 days of registration
+AT_RISK_DAYS = 90  # Purchases after more than 90 days without one
+
+FEEDBACK_TEXTS = [
+    "Great product quality and fast delivery!",
+    "Excellent customer service experience",
+    "Product was damaged during shipping",
+    "Very satisfied with the purchase",
+    "Could improve packaging quality",
+    "Amazing deals and discounts available",
+    "Website is easy to navigate",
+    "Delivery was delayed by 2 days",
+    "Product exactly as described",
+    "Outstanding shopping experience",
+    "Payment process was smooth",
+    "Customer support was very helpful",
+    "Product quality could be better",
+    "Fast and reliable delivery service",
+    "Great variety of products available"
+]
+RATINGS = [1, 2, 3, 4, 5]
+RATING_WEIGHTS = [0.05, 0.1, 0.2, 0.35, 0.3]
+
+DEVICE_TYPES = ['Desktop', 'Mobile', 'Tablet']
+DEVICE_WEIGHTS = [0.3, 0.6, 0.1]
+DEVICE_DURATION_MINUTES = {'Mobile': (2, 45), 'Tablet': (5, 60), 'Desktop': (8, 120)}
+
+# Clickstream: every visit opens with a page view, later events are page views, searches or cart adds
+EVENT_TYPES = ['page_view', 'search', 'add_to_cart', 'purchase']
+BROWSE_EVENT_WEIGHTS = [0.75, 0.17, 0.08]
+PAGE_TYPES = ['Home', 'Product_Page', 'Search', 'Cart']
+PAGE_TYPE_WEIGHTS = [0.3, 0.4, 0.2, 0.1]
+CART_LEAD_SECONDS = (60, 600)  # Purchased products are added to the cart 1-10 minutes before checkout
+SESSION_TIMEOUT_MINUTES = 30  # Inactivity gap that ends a session, as in web analytics tools
+
+ISSUE_TYPES = [
+    'Delivery Delay', 'Product Defect', 'Payment Issue', 'Return Request',
+    'Account Problem', 'Website Error', 'Order Cancellation', 'Refund Request',
+    'Product Information', 'Technical Support', 'Billing Inquiry', 'General Inquiry'
+]
+QUICK_ISSUES = ['Delivery Delay', 'Product Information', 'General Inquiry']
+ACCOUNT_ISSUES = ['Payment Issue', 'Account Problem', 'Billing Inquiry']
+TICKET_STATUSES = ['Open', 'In Progress', 'Resolved', 'Closed']
+PRIORITIES = ['Low', 'Medium', 'High']
+PRIORITY_WEIGHTS = [0.5, 0.4, 0.1]
+
+# Support desk: agents on fixed daily shifts always take the oldest ticket of the highest priority.
+# The desk is staffed for ordinary days at DESK_UTILIZATION, so a sale spike leaves a backlog for weeks
+SUPPORT_SHIFTS = [(8, 16), (12, 20), (16, 24)]  # Hours of the day; nobody works overnight
+SHIFT_WEIGHTS = [0.4, 0.35, 0.25]
+DESK_UTILIZATION = 0.7
+HANDLE_HOURS = {'quick': 0.5, 'account': 1.0, 'complex': 2.5}  # Median agent time per ticket
+HANDLE_SIGMA = 0.6  # Lognormal spread of agent time
+CLOSED_SHARE = 0.2  # Resolved tickets the customer has also confirmed
+SALE_TICKET_SPIKES = [(datetime(2023, 11, 1), datetime(2023, 11, 15), 3.0)]  # Diwali sale: 3x tickets per purchase
+
+# Customer timelines: gamma-distributed visit rates and buying propensities; the shapes keep heavy users
+# rare while leaving ~15% of customers without a purchase, so churn is still driven by recency
+SESSION_INTENSITY_SHAPE = 3.0
+PURCHASE_PROPENSITY_SHAPE = 6.0
+TICKET_RATE = 0.05  # Share of purchases followed by a support ticket
+TICKET_DELAY_HOURS = 48  # Mean wait between a purchase and its ticket
+
+# ============================================================================
+# HELPERS
+# ============================================================================
+
+def scaled_counts(scale: float = 1.0):
+    """Row counts for a scale factor"""
+    return {name: max(1, int(round(count * scale))) if name in SCALED_COUNTS else count
+            for name, count in BASE_COUNTS.items()}
+
+def table_rng(seed: int, table: str):
+    """Independent numpy Generator for one table, derived from the root seed"""
+    return np.random.default_rng([seed, zlib.crc32(table.encode())])
+
+def random_datetimes(rng, start_date, end_date, size: int):
+    """`size` random datetimes between start and end dates: a random day plus hour and minute, as datetime64[s]"""
+    minutes = (rng.integers((end_date - start_date).days, size=size) * 1440
+               + rng.integers(0, 24, size) * 60
+               + rng.integers(0, 60, size))
+    return (np.datetime64(start_date, 'm') + minutes.astype('timedelta64[m]')).astype('datetime64[s]')
+
+def sequence_ids(prefix: str, first: int, size: int, width: int):
+    """Zero-padded IDs like TXN_00000001 for a contiguous range of row numbers"""
+    numbers = np.arange(first, first + size).astype(str)
+    return np.char.add(prefix, np.char.zfill(numbers, width))
+
+def weighted_choice(rng, choices, weights):
+    """Make weighted random choice"""
+    return choices[rng.choice(len(choices), p=weights)]
+
+def indian_phones(rng, size: int):
+    """Indian phone numbers like +91-98765-43210"""
+    return np.char.add(np.char.add('+91-', rng.integers(70000, 100000, size).astype(str)),
+                       np.char.add('-', rng.integers(10000, 100000, size).astype(str)))
+
+def locale_names(locales):
+    """(first names, last names) of each Faker locale; weighted lists stay {name: weight} dicts"""
+    providers = [importlib.import_module(f"faker.providers.person.{locale}").Provider for locale in locales]
+    return [(provider.first_names, provider.last_names) for provider in providers]
+
+def draw_names(rng, names, size: int):
+    """Names drawn from a Faker list, honouring its weights when it has them"""
+    if isinstance(names, dict):
+        weights = np.fromiter(names.values(), dtype=np.float64)
+        return np.asarray(list(names))[rng.choice(len(names), size, p=weights / weights.sum())]
+    return np.asarray(names)[rng.integers(len(names), size=size)]
+
+# ============================================================================
+# CUSTOMER TIMELINE
+# ============================================================================
+
+def runs(keys):
+    """Start index and length of each run of equal consecutive keys, e.g. customers in a customer-sorted table"""
+    if len(keys) == 0:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return first, np.diff(np.r_[first, len(keys)])
+
+def grouped_cumsum(values, counts):
+    """Inclusive running total of `values` restarting at every group of `counts` consecutive rows"""
+    totals = np.r_[0, np.cumsum(values)]
+    return totals[1:] - np.repeat(totals[np.cumsum(counts) - counts], counts)
+
+def activity_windows(customers_df: pd.DataFrame):
+    """Minutes since START_DATE at which each customer's activity can start and end (registration to END_DATE)"""
+    end = (END_DATE - START_DATE) // timedelta(minutes=1)
+    if 'registration_date' not in customers_df:
+        return np.zeros(len(customers_df)), np.full(len(customers_df), float(end))
+    registered = (customers_df['registration_date'].to_numpy(dtype='datetime64[m]')
+                  - np.datetime64(START_DATE, 'm')).astype(np.int64)
+    return np.clip(registered, 0, end).astype(np.float64), np.full(len(customers_df), float(end))
+
+def visit_counts(num_customers: int, num_visits: int, rng):
+    """Visits per customer: a gamma visit rate per customer, then a multinomial split of the exact total"""
+    intensity = rng.gamma(SESSION_INTENSITY_SHAPE, 1.0, num_customers)
+    return rng.multinomial(num_visits, intensity / intensity.sum())
+
+def purchase_counts(visits_per_customer, num_transactions: int, rng):
+    """Purchases per customer: a gamma buying propensity times how often the customer visits"""
+    weights = rng.gamma(PURCHASE_PROPENSITY_SHAPE, 1.0, len(visits_per_customer)) * visits_per_customer
+    return rng.multinomial(num_transactions, weights / weights.sum())
+
+def timeline_visits(customer_ids, window_start, window_end, counts, rng):
+    """Non-overlapping visits in each customer's window, sorted by customer and start time"""
+    owner = np.repeat(np.arange(len(counts)), counts)
+    size = len(owner)
+    device = rng.choice(len(DEVICE_TYPES), size, p=DEVICE_WEIGHTS)
+    low, high = np.array([DEVICE_DURATION_MINUTES[name] for name in DEVICE_TYPES]).T
+    duration = rng.integers(low[device], high[device] + 1)
+
+    # k visits split the customer's idle time into k + 1 exponential gaps: the starts fall like a
+    # Poisson process conditioned on k events, but never overlap and never leave the window
+    gaps = grouped_cumsum(rng.exponential(size=size), counts)
+    last_gap = np.r_[0.0, gaps][np.cumsum(counts)] * (counts > 0)
+    gap_total = last_gap + rng.exponential(size=len(counts))
+    idle = np.maximum(window_end - window_start - np.bincount(owner, duration, len(counts)), 0)
+    busy_before = grouped_cumsum(duration, counts) - duration
+    start_minute = np.floor(window_start[owner] + idle[owner] * gaps / gap_total[owner]) + busy_before
+
+    visit_start = (np.datetime64(START_DATE, 'm') + start_minute.astype('timedelta64[m]')).astype('datetime64[s]')
+    return pd.DataFrame({
+        'customer_id': np.asarray(customer_ids)[owner],
+        'device_type': np.array(DEVICE_TYPES, dtype=object)[device],
+        'visit_start': visit_start,
+        'duration_minutes': duration,
+        'browse_events': np.maximum(1, duration // rng.integers(2, 9, size))
+    })
+
+def timeline_purchases(visits_df: pd.DataFrame, counts, products_df: pd.DataFrame, rng, first_id: int = 1):
+    """Purchases inside the visits of each customer in visits_df; counts has one entry per customer run"""
+    customer_ids = visits_df['customer_id'].to_numpy()
+    first, length = runs(customer_ids)
+    owner = np.repeat(np.arange(len(first)), counts)
+    size = len(owner)
+
+    # Sorting visit number + a uniform fraction orders purchases by visit, then by time within it
+    position = np.sort(first[owner] + (rng.random(size) * length[owner]).astype(np.int64) + rng.random(size))
+    visit = position.astype(np.int64)
+    offset = (position - visit) * visits_df['duration_minutes'].to_numpy()[visit] * 60
+
+    product_ids = products_df['product_id'].to_numpy()
+    products = rng.integers(len(product_ids), size=size)
+    quantity = rng.choice(QUANTITIES, size, p=QUANTITY_WEIGHTS)
+    variation = rng.uniform(0.85, 1.15, size)  # ±15% variation
+    return pd.DataFrame({
+        'transaction_id': sequence_ids('TXN_', first_id, size, 8),
+        'customer_id': customer_ids[first][owner],
+        'product_id': product_ids[products],
+        'transaction_date': (visits_df['visit_start'].to_numpy().astype('datetime64[s]')[visit]
+                             + offset.astype('timedelta64[s]')),
+        'amount_spent': (products_df['price'].to_numpy(dtype=np.float64)[products] * quantity * variation
+                         ).astype(np.int64),
+        'payment_method': rng.choice(PAYMENT_METHODS, size, p=PAYMENT_WEIGHTS),
+        'product_category': products_df['category'].to_numpy()[products],
+        'quantity': quantity
+    })
+
+def timeline_keys(customer_codes, times):
+    """One int64 per event ordering by customer, then time: the customer code above 32 bits of seconds"""
+    seconds = (times - np.datetime64(START_DATE, 's')).astype(np.int64)
+    return (np.asarray(customer_codes, dtype=np.int64) << 32) + seconds
+
+def sessionize(keys, timeout_minutes: int = SESSION_TIMEOUT_MINUTES):
+    """Session number of each event in sorted timeline_keys
+
+    A new session starts after more than `timeout_minutes` of inactivity; a change of customer
+    moves the key by at least 2^32 seconds, so one vectorized diff finds both kinds of boundary.
+    """
+    return np.cumsum(np.r_[True, np.diff(keys) > timeout_minutes * 60]) - 1
+
+def timeline_clickstream(visits_df: pd.DataFrame, transactions_df: pd.DataFrame, products_df: pd.DataFrame,
+                         rng, first_session: int = 1):
+    """Page view, search, cart and purchase events of every visit, sessionized and sorted by customer and time"""
+    customer_ids = visits_df['customer_id'].to_numpy()
+    first, length = runs(customer_ids)
+    visit_code = np.repeat(np.arange(len(first)), length)
+    visit_start = visits_df['visit_start'].to_numpy().astype('datetime64[s]')
+    visit_seconds = visits_df['duration_minutes'].to_numpy() * 60
+
+    # Browsing: a landing page view when the visit starts, then events spread over the rest of it
+    counts = visits_df['browse_events'].to_numpy()
+    landing = np.cumsum(counts) - counts
+    position = np.sort(np.repeat(np.arange(len(visits_df)), counts) + rng.random(counts.sum()))
+    browse_visit = position.astype(np.int64)
+    fraction = position - browse_visit
+    fraction[landing] = 0
+    browse_kind = rng.choice(len(BROWSE_EVENT_WEIGHTS), len(position), p=BROWSE_EVENT_WEIGHTS)
+    browse_kind[landing] = 0
+    browse_time = visit_start[browse_visit] + (fraction * visit_seconds[browse_visit]).astype('timedelta64[s]')
+
+    # Purchases: find each transaction's visit, and add the product to the cart shortly before checkout
+    purchase_ids = transactions_df['customer_id'].to_numpy()
+    purchase_first, purchase_length = runs(purchase_ids)
+    purchase_code = np.repeat(pd.Index(customer_ids[first]).get_indexer(purchase_ids[purchase_first]),
+                              purchase_length)
+    purchase_time = transactions_df['transaction_date'].to_numpy().astype('datetime64[s]')
+    purchase_visit = np.searchsorted(timeline_keys(visit_code, visit_start),
+                                     timeline_keys(purchase_code, purchase_time), side='right') - 1
+    cart_time = np.maximum(purchase_time - rng.integers(*CART_LEAD_SECONDS, len(purchase_time)).astype('timedelta64[s]'),
+                           visit_start[purchase_visit])
+
+    product_ids = products_df['product_id'].to_numpy()
+    purchase_product = pd.Index(product_ids).get_indexer(transactions_df['product_id'].to_numpy())
+    visit = np.r_[browse_visit, purchase_visit, purchase_visit]
+    time = np.r_[browse_time, cart_time, purchase_time]
+    kind = np.r_[browse_kind, np.full(len(purchase_time), 2), np.full(len(purchase_time), 3)]
+    product = np.r_[rng.integers(len(product_ids), size=len(browse_kind)), purchase_product, purchase_product]
+    page = np.array([0, 2, 1, 3])[kind]  # Searches on Search, cart adds on Product_Page, purchases on Cart
+    page[kind == 0] = rng.choice(len(PAGE_TYPES), (kind == 0).sum(), p=PAGE_TYPE_WEIGHTS)
+
+    # Stable sort keeps a cart add ahead of its purchase and browse events ahead of ties
+    keys = timeline_keys(visit_code[visit], time)
+    order = np.argsort(keys, kind='stable')
+    visit, time, kind, product, page = visit[order], time[order], kind[order], product[order], page[order]
+    session = sessionize(keys[order])
+    session_first = np.flatnonzero(np.r_[True, np.diff(session) != 0])
+
+    # Low-cardinality columns are built as categoricals from their codes, skipping string conversion
+    has_product = (page == PAGE_TYPES.index('Product_Page')) | (kind == EVENT_TYPES.index('purchase'))
+    device = pd.Categorical(visits_df['device_type'], categories=DEVICE_TYPES).codes
+    return pd.DataFrame({
+        'session_id': sequence_ids('SESS_', first_session, len(session_first), 8)[session],
+        'event_number': np.arange(len(session)) - session_first[session] + 1,
+        'customer_id': customer_ids[visit],
+        'event_time': time,
+        'event_type': pd.Categorical.from_codes(kind, EVENT_TYPES),
+        'page_type': pd.Categorical.from_codes(page, PAGE_TYPES),
+        'device_type': pd.Categorical.from_codes(device[visit], DEVICE_TYPES),
+        'product_id': pd.Categorical.from_codes(np.where(has_product, product, -1), product_ids)
+    })
+
+def session_summary(clickstream_df: pd.DataFrame):
+    """One row per session of a sessionized clickstream: first event, last event and counts by event type"""
+    starts = np.flatnonzero(clickstream_df['event_number'].to_numpy() == 1)
+    ends = np.r_[starts[1:], len(clickstream_df)] - 1
+    event_time = clickstream_df['event_time'].to_numpy().astype('datetime64[s]')
+    session = np.repeat(np.arange(len(starts)), np.diff(np.r_[starts, len(clickstream_df)]))
+    first_events = clickstream_df.iloc[starts]
+
+    # Sessions last at least a minute, so a lone page view still has a duration
+    duration = np.maximum(1, np.ceil((event_time[ends] - event_time[starts]) / np.timedelta64(60, 's')))
+    summary = pd.DataFrame({
+        'session_id': first_events['session_id'].to_numpy(),
+        'customer_id': first_events['customer_id'].to_numpy(),
+        'device_type': first_events['device_type'].to_numpy(),
+        'landing_page': first_events['page_type'].to_numpy(),
+        'session_start': event_time[starts],
+        'session_end': event_time[starts] + duration.astype('timedelta64[m]'),
+        'session_duration_minutes': duration.astype(np.int64)
+    })
+    for name, event in [('page_views', 'page_view'), ('searches', 'search'), ('cart_additions', 'add_to_cart'),
+                        ('purchases', 'purchase')]:
+        is_event = clickstream_df['event_type'].eq(event).to_numpy()
+        summary[name] = np.bincount(session, weights=is_event, minlength=len(starts)).astype(np.int64)
+    return summary
+
+def timeline_tickets(transactions_df: pd.DataFrame, rng, first_id: int = 1):
+    """Tickets raised a few hours or days after a share of purchases, sorted by customer and creation time
+
+    Only arrivals: assignment, resolution and status come from the support desk simulation.
+    """
+    customer_ids = transactions_df['customer_id'].to_numpy()
+    first, length = runs(customer_ids)
+    purchased = transactions_df['transaction_date'].to_numpy().astype('datetime64[s]')
+    rate = np.full(len(purchased), TICKET_RATE)
+    for start, end, multiplier in SALE_TICKET_SPIKES:
+        rate[(purchased >= np.datetime64(start, 's')) & (purchased < np.datetime64(end, 's'))] *= multiplier
+    raised = np.flatnonzero(rng.random(len(transactions_df)) < rate)
+    created = purchased[raised] + (rng.exponential(TICKET_DELAY_HOURS * 3600, len(raised))).astype('timedelta64[s]')
+    kept = created <= np.datetime64(END_DATE, 's')
+
+    # A ticket about a later purchase can still come first, so reorder within each customer
+    customer = np.repeat(np.arange(len(first)), length)[raised][kept]
+    order = np.lexsort((created[kept], customer))
+    raised, created = raised[kept][order], created[kept][order]
+    size = len(raised)
+
+    return pd.DataFrame({
+        'ticket_id': sequence_ids('TKT_', first_id, size, 6),
+        'customer_id': customer_ids[raised],
+        'issue_type': np.array(ISSUE_TYPES, dtype=object)[rng.integers(len(ISSUE_TYPES), size=size)],
+        'created_date': created,
+        'priority': rng.choice(PRIORITIES, size, p=PRIORITY_WEIGHTS)
+    })
+
+TIMELINE_TABLES = ['transactions', 'clickstream_events', 'sessions', 'customer_behavior', 'support_tickets']
+
+def timeline_chunks(customers_df: pd.DataFrame, products_df: pd.DataFrame, num_visits: int,
+                    num_transactions: int, seed: int, chunk_size: int = CHUNK_SIZE):
+    """Yield {table: DataFrame} for the TIMELINE_TABLES of consecutive blocks of customers
+
+    A block holds about chunk_size visits and purchases (roughly ten clickstream events each).
+    Blocks hold whole customers, so every chunk is already sorted and appending them keeps the
+    files sorted. With a single block the tables equal the per-table generators, except that
+    support_tickets only holds arrivals: the desk serves every customer, so it runs once at the end.
+    """
+    visit_rng, purchase_rng, click_rng, behavior_rng, ticket_rng = (
+        table_rng(seed, name) for name in ('visits', 'transactions', 'clickstream_events', 'customer_behavior',
+                                           'support_tickets'))
+    customer_ids = customers_df['customer_id'].to_numpy()
+    window_start, window_end = activity_windows(customers_df)
+    visits = visit_counts(len(customers_df), num_visits, visit_rng)
+    purchases = purchase_counts(visits, num_transactions, purchase_rng)
+
+    entries = np.cumsum(visits + purchases)
+    edges = np.unique(np.r_[0, np.searchsorted(entries, np.arange(chunk_size, entries[-1], chunk_size)),
+                            len(customers_df)])
+    written = dict.fromkeys(TIMELINE_TABLES, 0)
+    for start, stop in zip(edges[:-1], edges[1:]):
+        block = slice(start, stop)
+        visits_df = timeline_visits(customer_ids[block], window_start[block], window_end[block], visits[block],
+                                    visit_rng)
+        transactions_df = timeline_purchases(visits_df, purchases[block][visits[block] > 0], products_df,
+                                             purchase_rng, written['transactions'] + 1)
+        clickstream_df = timeline_clickstream(visits_df, transactions_df, products_df, click_rng,
+                                              written['sessions'] + 1)
+        chunk = {
+            'transactions': transactions_df,
+            'clickstream_events': clickstream_df,
+            'sessions': generate_sessions(clickstream_df),
+            'customer_behavior': generate_customer_behavior(clickstream_df, behavior_rng),
+            'support_tickets': timeline_tickets(transactions_df, ticket_rng, written['support_tickets'] + 1),
+        }
+        written = {name: written[name] + len(df) for name, df in chunk.items()}
+        yield chunk
+
+def open_csv_stream(path: str, schema: pa.Schema):
+    """Arrow CSV writer appending rows below an unquoted header, like DataFrame.to_csv"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(','.join(schema.names) + '\n')
+    sink = open(path, 'ab')
+    return sink, pa_csv.CSVWriter(sink, schema,
+                                  write_options=pa_csv.WriteOptions(include_header=False, quoting_style='none'))
+
+def write_timeline(output_dir: str, customers_df: pd.DataFrame, products_df: pd.DataFrame, num_visits: int,
+                   num_transactions: int, seed: int, chunk_size: int = CHUNK_SIZE):
+    """Stream the TIMELINE_TABLES to CSV so hundreds of millions of events never have to fit in memory"""
+    os.makedirs(output_dir, exist_ok=True)
+    streams, written, tickets = {}, dict.fromkeys(TIMELINE_TABLES, 0), []
+    catalog, fingerprint = StatsCatalog(), DatasetFingerprint()
+
+    def write(name: str, df: pd.DataFrame):
+        if df.empty:
+            return
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        if name not in streams:
+            streams[name] = (*open_csv_stream(os.path.join(output_dir, f'{name}.csv'), table.schema), table.schema)
+        _, writer, schema = streams[name]
+        writer.write_table(table.cast(schema))
+        catalog.update(name, table)
+        fingerprint.update(name, table)
+        written[name] += len(df)
+
+    for chunk in timeline_chunks(customers_df, products_df, num_visits, num_transactions, seed, chunk_size):
+        tickets.append(chunk.pop('support_tickets'))
+        for name, df in chunk.items():
+            write(name, df)
+        print("   🕒 " + ", ".join(f"{written[name]:,} {name}" for name in chunk) + " written")
+
+    write('support_tickets', run_support_desk(pd.concat(tickets, ignore_index=True), table_rng(seed, 'support_desk')))
+    print(f"   🎧 {written['support_tickets']:,} support_tickets through the support desk")
+    for sink, writer, _ in streams.values():
+        writer.close()
+        sink.close()
+    catalog.save(os.path.join(output_dir, STATS_FILE))
+    save_manifest(os.path.join(output_dir, MANIFEST_FILE), fingerprint, seed=seed, num_visits=num_visits,
+                  num_transactions=num_transactions, chunk_size=chunk_size, code_version=code_version(__file__))
+    return written
+
+# ============================================================================
+# CAMPAIGN ATTRIBUTION
+# ============================================================================
+
+def transaction_segments(transactions_df: pd.DataFrame, customers_df: pd.DataFrame = None):
+    """Bitmask over TARGET_SEGMENTS for every purchase: value tier, new customer, at-risk and all customers"""
+    bit = {segment: 1 << i for i, segment in enumerate(TARGET_SEGMENTS)}
+    codes, customer_ids = pd.factorize(transactions_df['customer_id'])
+    dates = transactions_df['transaction_date'].to_numpy().astype('datetime64[s]')
+    times = dates.astype(np.int64)
+
+    spend = np.bincount(codes, weights=transactions_df['amount_spent'].to_numpy(np.float64))
+    tier_bits = np.array([bit['Low Value'], bit['Medium Value'], bit['High Value']])
+    tier = (spend >= VALUE_SEGMENT_SPEND[0]).astype(np.int64) + (spend > VALUE_SEGMENT_SPEND[1])
+    segments = tier_bits[tier][codes] | bit['All Customers']
+
+    if customers_df is not None and 'registration_date' in customers_df:
+        registered = (customers_df.set_index('customer_id')['registration_date'].reindex(customer_ids)
+                      .to_numpy().astype('datetime64[s]'))
+        known = ~np.isnat(registered)[codes]
+        tenure = times - np.where(np.isnat(registered), 0, registered.astype(np.int64))[codes]
+        segments[known & (tenure <= NEW_CUSTOMER_DAYS * 86400)] |= bit['New Customers']
+
+    # Timeline transactions already run customer by customer in time order
+    keys = timeline_keys(codes, dates)
+    order = np.arange(len(keys)) if (np.diff(keys) >= 0).all() else np.argsort(keys, kind='stable')
+    lapsed = (codes[order[1:]] == codes[order[:-1]]) & (np.diff(times[order]) > AT_RISK_DAYS * 86400)
+    segments[order[1:][lapsed]] |= bit['At-Risk']
+    return segments
+
+def bernoulli_offsets(lengths, rates, rng):
+    """(interval, offset) of every success when interval i runs lengths[i] Bernoulli(rates[i]) trials
+
+    Successes are reached by geometric gaps, so the work grows with the successes, not the trials.
+    """
+    lengths, rates = np.asarray(lengths, dtype=np.int64), np.asarray(rates, dtype=np.float64)
+    last = np.full(len(lengths), -1, dtype=np.int64)
+    owners, offsets = [np.empty(0, dtype=np.int64)], [np.empty(0, dtype=np.int64)]
+    active = np.flatnonzero((lengths > 0) & (rates > 0))
+    while len(active):
+        # Enough gaps to cross the end of nearly every interval; the rest go round again
+        expected = (lengths[active] - 1 - last[active]) * rates[active]
+        draws = np.ceil(expected + 3 * np.sqrt(expected) + 1).astype(np.int64)
+        owner = np.repeat(active, draws)
+        offset = np.repeat(last[active], draws) + grouped_cumsum(rng.geometric(rates[owner]), draws)
+        inside = offset < lengths[owner]
+        owners.append(owner[inside])
+        offsets.append(offset[inside])
+        last[active] = offset[np.cumsum(draws) - 1]
+        active = active[last[active] < lengths[active]]
+    return np.concatenate(owners), np.concatenate(offsets)
+
+def campaign_touches(times, segments, campaigns_df: pd.DataFrame, rng):
+    """(transaction, campaign) pairs: purchase inside the window, customer in the segment, reached by the channel
+
+    Transactions sorted by time are the interval index: each campaign window is one contiguous slice
+    found by binary search, so nothing is ever compared against every campaign.
+    """
+    order = np.argsort(times, kind='stable')
+    sorted_times = times[order]
+    starts = campaigns_df['start_date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+    ends = (campaigns_df['end_date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+            + ATTRIBUTION_WINDOW_DAYS * 86400)
+    first = np.searchsorted(sorted_times, starts, side='left')
+    lengths = np.searchsorted(sorted_times, ends, side='right') - first
+    reach = campaigns_df['channel'].map(CHANNEL_REACH).to_numpy(np.float64)
+    targets = 1 << pd.Index(TARGET_SEGMENTS).get_indexer(campaigns_df['target_segment'])
+
+    # Campaigns are sampled in batches of about CHUNK_SIZE expected touches
+    transactions, campaigns = [np.empty(0, dtype=np.int32)], [np.empty(0, dtype=np.int32)]
+    batches = np.cumsum(lengths * reach).astype(np.int64) // CHUNK_SIZE
+    for batch in np.unique(batches):
+        members = np.flatnonzero(batches == batch)
+        owner, offset = bernoulli_offsets(lengths[members], reach[members], rng)
+        campaign = members[owner]
+        transaction = order[first[campaign] + offset]
+        in_segment = (segments[transaction] & targets[campaign]) != 0
+        transactions.append(transaction[in_segment].astype(np.int32))
+        campaigns.append(campaign[in_segment].astype(np.int32))
+    return np.concatenate(transactions), np.concatenate(campaigns)
+
+def attribution_credit(transactions, campaigns, priority, num_transactions: int, rule: str = 'last_touch'):
+    """Share of each purchase per touch: last_touch credits the latest-starting campaign, linear splits evenly"""
+    if rule == 'last_touch':
+        latest = np.full(num_transactions, -1, dtype=np.int64)
+        np.maximum.at(latest, transactions, priority[campaigns])
+        winner = priority[campaigns] == latest[transactions]
+        return transactions[winner], campaigns[winner], np.ones(int(winner.sum()))
+    if rule == 'linear':
+        touches = np.bincount(transactions, minlength=num_transactions)
+        return transactions, campaigns, 1.0 / touches[transactions]
+    raise ValueError(f"Unknown attribution rule '{rule}'; expected one of {ATTRIBUTION_RULES}")
+
+# ============================================================================
+# SUPPORT DESK
+# ============================================================================
+
+def desk_shifts(created, handle_seconds, num_agents: int = None):
+    """(start, end) second of the day worked by every agent; by default ordinary days run at DESK_UTILIZATION"""
+    if num_agents is None:
+        days = created // 86400
+        daily_hours = np.bincount(days - days.min(), weights=handle_seconds / 3600) if len(days) else np.zeros(1)
+        ordinary_day = np.median(daily_hours[daily_hours > 0]) if (daily_hours > 0).any() else 0.0
+        shift_hours = np.dot([end - start for start, end in SUPPORT_SHIFTS], SHIFT_WEIGHTS)
+        num_agents = int(np.ceil(ordinary_day / (shift_hours * DESK_UTILIZATION)))
+    per_shift = np.maximum(1, np.rint(num_agents * np.asarray(SHIFT_WEIGHTS))).astype(int)
+    return [(start * 3600, end * 3600) for (start, end), count in zip(SUPPORT_SHIFTS, per_shift)
+            for _ in range(count)]
+
+def simulate_support_desk(created, priority, handle_seconds, shifts):
+    """Discrete-event run of the desk; returns (assigned, resolved, agent) per ticket, NaN / -1 if never assigned
+
+    `created` and the results are seconds, `priority` is the queue (0 serves first) and `shifts`
+    holds one (start, end) second of the day per agent. The heap holds agents coming off a ticket
+    or onto a shift; arrivals are merged in from a sorted array, so each ticket costs two heap operations.
+    """
+    size = len(created)
+    order = np.argsort(created, kind='stable')
+    arrivals, queue_of, tickets = created[order].tolist(), np.asarray(priority)[order].tolist(), order.tolist()
+    handle = np.asarray(handle_seconds, dtype=np.float64).tolist()
+    starts, ends = [start for start, _ in shifts], [end for _, end in shifts]
+    assigned, resolved, agent_of = [float('nan')] * size, [float('nan')] * size, [-1] * size
+
+    queues = [deque() for _ in range(int(np.max(priority, initial=0)) + 1)]
+    midnight = arrivals[0] // 86400 * 86400 if size else 0
+    events = [(midnight + start, agent) for agent, start in enumerate(starts)]
+    heapq.heapify(events)
+    idle, waiting, next_arrival = [], 0, 0
+
+    while next_arrival < size or (waiting and events):
+        if next_arrival < size and (not events or arrivals[next_arrival] <= events[0][0]):
+            now = arrivals[next_arrival]
+            queues[queue_of[next_arrival]].append(tickets[next_arrival])
+            next_arrival += 1
+            waiting += 1
+        else:
+            now, agent = heapq.heappop(events)
+            idle.append(agent)
+
+        # Idle agents past the end of their shift go home until their next one starts
+        while waiting and idle:
+            agent = idle.pop()
+            time_of_day = now % 86400
+            if not starts[agent] <= time_of_day < ends[agent]:
+                next_start = now - time_of_day + starts[agent] + (86400 if time_of_day >= starts[agent] else 0)
+                heapq.heappush(events, (next_start, agent))
+                continue
+            for queue in queues:
+                if queue:
+                    ticket = queue.popleft()
+                    break
+            waiting -= 1
+            assigned[ticket], resolved[ticket], agent_of[ticket] = now, now + handle[ticket], agent
+            heapq.heappush(events, (now + handle[ticket], agent))
+
+    return np.array(assigned), np.array(resolved), np.array(agent_of)
+
+def run_support_desk(tickets_df: pd.DataFrame, rng, num_agents: int = None):
+    """Tickets with assigned/resolved times, agent and status as of END_DATE from a simulated support desk"""
+    issue_type = tickets_df['issue_type'].to_numpy()
+    median_hours = np.select([np.isin(issue_type, QUICK_ISSUES), np.isin(issue_type, ACCOUNT_ISSUES)],
+                             [HANDLE_HOURS['quick'], HANDLE_HOURS['account']], HANDLE_HOURS['complex'])
+    handle_seconds = median_hours * 3600 * rng.lognormal(0, HANDLE_SIGMA, len(tickets_df))
+    created = tickets_df['created_date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+    priority = pd.Categorical(tickets_df['priority'], categories=PRIORITIES[::-1]).codes
+
+    shifts = desk_shifts(created, handle_seconds, num_agents)
+    assigned, resolved, agent = simulate_support_desk(created, priority, handle_seconds, shifts)
+
+    # Snapshot at END_DATE: later assignments and resolutions have not happened yet
+    horizon = (np.datetime64(END_DATE, 's') - np.datetime64(0, 's')).astype(np.int64)
+    is_assigned, is_resolved = assigned <= horizon, resolved <= horizon
+    status = np.where(is_resolved, np.where(rng.random(len(tickets_df)) < CLOSED_SHARE, 3, 2),
+                      np.where(is_assigned, 1, 0))
+
+    tickets_df = tickets_df.copy()
+    tickets_df.insert(4, 'assigned_date',
+                      np.where(is_assigned, np.rint(np.nan_to_num(assigned)), np.nan).astype('datetime64[s]'))
+    tickets_df.insert(5, 'resolved_date',
+                      np.where(is_resolved, np.rint(np.nan_to_num(resolved)), np.nan).astype('datetime64[s]'))
+    tickets_df.insert(6, 'resolution_time_hours',
+                      np.where(is_resolved, np.round((resolved - created) / 3600, 1), np.nan))
+    tickets_df.insert(7, 'status', pd.Categorical.from_codes(status, categories=TICKET_STATUSES))
+    agent_ids = sequence_ids('AGENT_', 1, len(shifts), 3)
+    tickets_df['agent_id'] = pd.Categorical.from_codes(np.where(is_assigned, agent, -1), categories=agent_ids)
+    return tickets_df
+
+# ============================================================================
+# TABLE GENERATORS
+# ============================================================================
+
+def generate_customers(num_customers: int, rng, locales=CUSTOMER_LOCALES):
+    """Customer master table, with names drawn from the Faker locales' name lists"""
+    locale = rng.integers(len(locales), size=num_customers)
+    first_names = np.empty(num_customers, dtype=object)
+    last_names = np.empty(num_customers, dtype=object)
+    for code, (first, last) in enumerate(locale_names(locales)):
+        rows = locale == code
+        first_names[rows] = draw_names(rng, first, rows.sum())
+        last_names[rows] = draw_names(rng, last, rows.sum())
+    first_names, last_names = pd.Series(first_names), pd.Series(last_names)
+
+    handles = (first_names + last_names).str.lower().str.replace(r'[^a-z]', '', regex=True)
+    numbers = np.where(rng.random(num_customers) < 0.5, rng.integers(1, 100, num_customers).astype(str), '')
+    domains = np.asarray(EMAIL_DOMAINS)[rng.integers(len(EMAIL_DOMAINS), size=num_customers)]
+    return pd.DataFrame({
+        'customer_id': sequence_ids('CUST_', 1, num_customers, 6),
+        'name': (first_names + ' ' + last_names).to_numpy(),
+        'age': rng.integers(18, 66, num_customers),
+        'gender': np.asarray(['Male', 'Female', 'Other'])[rng.integers(3, size=num_customers)],
+        'email': (handles + numbers + '@' + domains).to_numpy(),
+        'phone': indian_phones(rng, num_customers),
+        'registration_date': random_datetimes(rng, datetime(2020, 1, 1), datetime(2023, 12, 31), num_customers),
+        'loyalty_status': rng.choice(LOYALTY_STATUSES, num_customers, p=LOYALTY_WEIGHTS),
+        'region': rng.choice(INDIAN_CITIES, num_customers, p=CITY_WEIGHTS)
+    })
+
+def generate_product_catalog(num_products: int, rng):
+    """Named products per category, padded with variants up to num_products"""
+    products = []
+    for category, product_list in ALL_PRODUCTS.items():
+        for product_name in product_list:
+            products.append((product_name, category))
+
+    while len(products) < num_products:
+        category = weighted_choice(rng, PRODUCT_CATEGORIES, CATEGORY_WEIGHTS)
+        base_products = ALL_PRODUCTS[category]
+        base_name = base_products[rng.integers(len(base_products))]
+        products.append((f"{base_name} - {VARIANTS[rng.integers(len(VARIANTS))]}", category))
+
+    catalog = []
+    for i, (name, category) in enumerate(products):
+        low, high = CATEGORY_PRICE_RANGES[category]
+        catalog.append({
+            'product_id': f"PROD_{i+1:04d}",
+            'name': name,
+            'category': category,
+            'price': int(rng.integers(low, high + 1)),
+            'inventory_status': weighted_choice(rng, INVENTORY_STATUSES, INVENTORY_WEIGHTS)
+        })
+    return pd.DataFrame(catalog)
+
+def generate_visits(customers_df: pd.DataFrame, num_visits: int, rng):
+    """Website/app visits on each customer's timeline, with device-dependent duration"""
+    window_start, window_end = activity_windows(customers_df)
+    return timeline_visits(customers_df['customer_id'].to_numpy(), window_start, window_end,
+                           visit_counts(len(customers_df), num_visits, rng), rng)
+
+def generate_transactions(customers_df: pd.DataFrame, visits_df: pd.DataFrame, products_df: pd.DataFrame,
+                          num_transactions: int, rng):
+    """Purchases made during each customer's visits, with quantity and ±15% price variation"""
+    first, length = runs(visits_df['customer_id'].to_numpy())
+    customers = pd.Index(customers_df['customer_id']).get_indexer(visits_df['customer_id'].to_numpy()[first])
+    visits_per_customer = np.zeros(len(customers_df), dtype=np.int64)
+    visits_per_customer[customers] = length
+    counts = purchase_counts(visits_per_customer, num_transactions, rng)
+    return timeline_purchases(visits_df, counts[customers], products_df, rng)
+
+def affinity_clusters(products_df: pd.DataFrame, rng):
+    """Cluster number per product: random groups of AFFINITY_CLUSTER_SIZE within each category, numbered category by category"""
+    category = pd.Categorical(products_df['category'], categories=PRODUCT_CATEGORIES).codes
+    order = np.lexsort((rng.random(len(products_df)), category))
+    first, length = runs(category[order])
+    position = np.arange(len(order)) - np.repeat(first, length)
+    offsets = np.r_[0, np.cumsum(-(-length // AFFINITY_CLUSTER_SIZE))][:-1]
+    clusters = np.empty(len(order), dtype=np.int64)
+    clusters[order] = np.repeat(offsets, length) + position // AFFINITY_CLUSTER_SIZE
+    return clusters
+
+def generate_order_items(transactions_df: pd.DataFrame, products_df: pd.DataFrame, rng):
+    """Order lines: each transaction's product first, then cross-sell products from the affinity model"""
+    product_ids = products_df['product_id'].to_numpy()
+    prices = products_df['price'].to_numpy(dtype=np.float64)
+    clusters = affinity_clusters(products_df, rng)
+    category = pd.Categorical(products_df['category'], categories=PRODUCT_CATEGORIES).codes
+
+    # Products sorted by cluster are also sorted by category, so every scope is a contiguous block
+    by_cluster = np.argsort(clusters, kind='stable')
+    sorted_clusters, sorted_category = clusters[by_cluster], category[by_cluster]
+    scope_low = np.stack([np.searchsorted(sorted_clusters, clusters, 'left'),
+                          np.searchsorted(sorted_category, category, 'left'), np.zeros(len(clusters), int)])
+    scope_high = np.stack([np.searchsorted(sorted_clusters, clusters, 'right'),
+                           np.searchsorted(sorted_category, category, 'right'), np.full(len(clusters), len(clusters))])
+
+    anchor = pd.Index(product_ids).get_indexer(transactions_df['product_id'].to_numpy())
+    extra = rng.choice(BASKET_SIZES, len(anchor), p=BASKET_SIZE_WEIGHTS) - 1
+    owner = np.repeat(np.arange(len(anchor)), extra)
+    scope = rng.choice(len(AFFINITY_SCOPES), len(owner), p=AFFINITY_SCOPE_WEIGHTS)
+    low, high = scope_low[scope, anchor[owner]], scope_high[scope, anchor[owner]]
+    cross_sell = by_cluster[low + (rng.random(len(owner)) * (high - low)).astype(np.int64)]
+
+    # Anchors come first in every order; a product drawn twice keeps only its first line
+    order = np.r_[np.arange(len(anchor)), owner]
+    product = np.r_[anchor, cross_sell]
+    lines = np.argsort(order, kind='stable')
+    order, product = order[lines], product[lines]
+    _, first_seen = np.unique(order * len(product_ids) + product, return_index=True)
+    kept = np.sort(first_seen)
+    order, product = order[kept], product[kept]
+    is_anchor = np.r_[True, order[1:] != order[:-1]]
+    first = np.flatnonzero(is_anchor)
+
+    quantity = np.where(is_anchor, transactions_df['quantity'].to_numpy()[order],
+                        rng.choice(QUANTITIES, len(order), p=QUANTITY_WEIGHTS))
+    unit_price = (prices[product] * rng.uniform(0.85, 1.15, len(order))).astype(np.int64)  # ±15% variation
+    line_total = np.where(is_anchor, transactions_df['amount_spent'].to_numpy()[order], unit_price * quantity)
+    return pd.DataFrame({
+        'order_id': transactions_df['transaction_id'].to_numpy()[order],
+        'line_number': np.arange(len(order)) - np.repeat(first, np.diff(np.r_[first, len(order)])) + 1,
+        'product_id': product_ids[product],
+        'product_category': products_df['category'].to_numpy()[product],
+        'quantity': quantity,
+        'unit_price': np.where(is_anchor, (line_total / quantity).round(2), unit_price),
+        'line_total': line_total
+    })
+
+def generate_orders(transactions_df: pd.DataFrame, order_items_df: pd.DataFrame, rng):
+    """Transactions with basket totals from order_items, enriched with discounts, delivery, status and ratings"""
+    orders_df = transactions_df.rename(columns={'transaction_id': 'order_id', 'transaction_date': 'order_date'})
+    first_lines = np.flatnonzero(order_items_df['line_number'].to_numpy() == 1)  # Items follow transaction order
+    orders_df['amount_spent'] = np.add.reduceat(order_items_df['line_total'].to_numpy(), first_lines)
+    orders_df['quantity'] = np.add.reduceat(order_items_df['quantity'].to_numpy(), first_lines)
+    orders_df['discount_amount'] = (orders_df['amount_spent'] * rng.uniform(0.05, 0.25, len(orders_df))).round(2)
+    orders_df['delivery_days'] = rng.choice([2, 3, 5, 7], len(orders_df), p=[0.4, 0.3, 0.2, 0.1])
+    orders_df['order_status'] = rng.choice(['Delivered', 'Cancelled'], len(orders_df), p=[0.9, 0.1])
+    orders_df['rating'] = np.where(
+        orders_df['order_status'] == 'Cancelled',
+        np.nan,
+        rng.choice(RATINGS, len(orders_df), p=RATING_WEIGHTS)
+    )
+    orders_df['is_repeat_customer'] = orders_df['customer_id'].duplicated().astype(int)
+    return orders_df[[
+        'order_id', 'customer_id', 'order_date', 'product_category', 'amount_spent',
+        'quantity', 'discount_amount', 'payment_method', 'delivery_days',
+        'order_status', 'rating', 'is_repeat_customer'
+    ]].rename(columns={'amount_spent': 'order_value'})
+
+def churn_probability(days_inactive, total_spent, transaction_count):
+    """Rule-based churn probability from recency, monetary and frequency arrays"""
+    probability = 0.1 + np.select([days_inactive > 180, days_inactive > 90, days_inactive > 60],
+                                  [0.6, 0.3, 0.1], 0.0)
+    # Lower spending and low frequency customers more likely to churn
+    probability += np.select([total_spent < 15000, total_spent > 50000], [0.2, -0.1], 0.0)
+    probability += np.where(transaction_count < 3, 0.15, 0.0)
+    return np.clip(probability, 0.001, 0.95)  # Cap at 95%
+
+def calibrate_churn(probability, uniforms, target_churners: int, iterations: int = 200):
+    """Churn flags hitting target_churners exactly, by bisecting a shift on the logit of every probability
+
+    The uniforms are drawn once, so the number of churners only grows with the shift and
+    higher-risk customers always stay more likely to churn than lower-risk ones.
+    """
+    logit = np.log(probability / (1 - probability))
+
+    def churners(shift):
+        return uniforms < 1 / (1 + np.exp(-(logit + shift)))
+
+    low, high = -30.0, 30.0
+    for _ in range(iterations):
+        shift = (low + high) / 2
+        count = churners(shift).sum()
+        if count == target_churners:
+            break
+        if count < target_churners:
+            low = shift
+        else:
+            high = shift
+    return churners(shift)
+
+def generate_churn_labels(customers_df: pd.DataFrame, transactions_df: pd.DataFrame, rng):
+    """Churn status from recency, spend and frequency, calibrated to exactly the 45% crisis churn rate"""
+    activity = transactions_df.groupby('customer_id').agg(
+        total_spent=('amount_spent', 'sum'),
+        transaction_count=('transaction_date', 'count'),
+        last_transaction=('transaction_date', 'max')
+    ).reindex(customers_df['customer_id'])
+    purchased = activity['transaction_count'].notna().to_numpy()
+
+    # Customers who never purchased churn, with a random last-active day
+    last_active = activity['last_transaction'].to_numpy().astype('datetime64[s]')
+    never_active = random_datetimes(rng, START_DATE, END_DATE, len(last_active)).astype('datetime64[D]')
+    last_active = np.where(purchased, last_active, never_active.astype('datetime64[s]'))
+
+    days_inactive = (np.datetime64(END_DATE, 's') - last_active) / np.timedelta64(1, 'D')
+    probability = churn_probability(days_inactive, activity['total_spent'].to_numpy(),
+                                    activity['transaction_count'].to_numpy())
+    uniforms = rng.random(len(customers_df))
+
+    # Adjust to match RetailMax crisis: 55% retention = 45% churn
+    target_churners = int(round(TARGET_CHURN_RATE * len(customers_df))) - int((~purchased).sum())
+    churn_status = ~purchased
+    churn_status[purchased] = calibrate_churn(probability[purchased], uniforms[purchased], max(target_churners, 0))
+
+    return pd.DataFrame({
+        'customer_id': customers_df['customer_id'].to_numpy(),
+        'churn_status': churn_status.astype(int),
+        'last_active_date': last_active
+    })
+
+def generate_campaigns(num_campaigns: int, rng, budget_scale: float = 1.0):
+    """Marketing campaigns with windows, budgets, segments and channels; budgets grow with the customer base"""
+    start_dates = random_datetimes(rng, START_DATE, END_DATE, num_campaigns)
+    names = np.asarray(CAMPAIGN_NAMES)[rng.integers(len(CAMPAIGN_NAMES), size=num_campaigns)]
+    years = rng.integers(2023, 2025, size=num_campaigns)
+    return pd.DataFrame({
+        'campaign_id': sequence_ids('CAMP_', 1, num_campaigns, 3),
+        'campaign_name': np.char.add(names, np.char.add(' ', years.astype(str))),
+        'campaign_type': np.asarray(CAMPAIGN_TYPES)[rng.integers(len(CAMPAIGN_TYPES), size=num_campaigns)],
+        'start_date': start_dates,
+        'end_date': start_dates + rng.integers(3, 31, size=num_campaigns).astype('timedelta64[D]'),
+        'budget': np.round(rng.integers(50000, 2000001, size=num_campaigns) * budget_scale).astype(np.int64),
+        'target_segment': np.asarray(TARGET_SEGMENTS)[rng.integers(len(TARGET_SEGMENTS), size=num_campaigns)],
+        'channel': np.asarray(CHANNELS)[rng.choice(len(CHANNELS), size=num_campaigns, p=CHANNEL_WEIGHTS)]
+    })
+
+def generate_campaign_attribution(transactions_df: pd.DataFrame, customers_df: pd.DataFrame,
+                                  campaigns_df: pd.DataFrame, rng, rule: str = 'last_touch'):
+    """Purchases credited to the campaigns that touched them, one row per (transaction, campaign) credit"""
+    times = transactions_df['transaction_date'].to_numpy().astype('datetime64[s]').astype(np.int64)
+    segments = transaction_segments(transactions_df, customers_df)
+    transactions, campaigns = campaign_touches(times, segments, campaigns_df, rng)
+
+    # Later start wins last-touch; ties go to the later campaign
+    starts = campaigns_df['start_date'].to_numpy().astype('datetime64[s]')
+    priority = np.empty(len(campaigns_df), dtype=np.int64)
+    priority[np.lexsort((np.arange(len(campaigns_df)), starts))] = np.arange(len(campaigns_df))
+    transactions, campaigns, credit = attribution_credit(transactions, campaigns, priority,
+                                                         len(transactions_df), rule)
+
+    order = np.lexsort((priority[campaigns], transactions))
+    transactions, campaigns, credit = transactions[order], campaigns[order], credit[order]
+    amounts = transactions_df['amount_spent'].to_numpy(np.float64)[transactions]
+    return pd.DataFrame({
+        'transaction_id': transactions_df['transaction_id'].iloc[transactions].to_numpy(),
+        'customer_id': transactions_df['customer_id'].iloc[transactions].to_numpy(),
+        'campaign_id': pd.Categorical.from_codes(campaigns, categories=campaigns_df['campaign_id']),
+        'transaction_date': transactions_df['transaction_date'].iloc[transactions].to_numpy(),
+        'credit': np.round(credit, 4),
+        'attributed_revenue': np.round(amounts * credit, 2)
+    })
+
+def generate_campaign_performance(campaigns_df: pd.DataFrame, attribution_df: pd.DataFrame, rng):
+    """Conversions and revenue from attributed purchases; clicks and impressions follow from them"""
+    codes = pd.Index(campaigns_df['campaign_id']).get_indexer(attribution_df['campaign_id'])
+    conversions = np.rint(np.bincount(codes, weights=attribution_df['credit'].to_numpy(np.float64),
+                                      minlength=len(campaigns_df))).astype(np.int64)
+    revenue = np.rint(np.bincount(codes, weights=attribution_df['attributed_revenue'].to_numpy(np.float64),
+                                  minlength=len(campaigns_df))).astype(np.int64)
+
+    # A campaign nobody bought from still drew clicks
+    ctr_range = np.array([CHANNEL_CTR[channel] for channel in campaigns_df['channel']]).reshape(-1, 2)
+    ctr = rng.uniform(ctr_range[:, 0], ctr_range[:, 1])
+    conversion_rate = rng.uniform(*CLICK_CONVERSION_RATE, len(campaigns_df))
+    clicks = np.ceil(np.maximum(conversions, 1) / conversion_rate).astype(np.int64)
+    impressions = np.ceil(clicks / ctr).astype(np.int64)
+    budget = campaigns_df['budget'].to_numpy(np.float64)
+
+    return pd.DataFrame({
+        'campaign_id': campaigns_df['campaign_id'].to_numpy(),
+        'impressions': impressions,
+        'clicks': clicks,
+        'conversions': conversions,
+        'revenue': revenue,
+        'roi': np.round(np.divide(revenue, budget, out=np.zeros(len(budget)), where=budget > 0), 2),
+        'ctr': np.round(clicks / impressions * 100, 2),
+        'conversion_rate': np.round(conversions / clicks * 100, 2)
+    })
+
+def generate_customer_feedback(transactions_df: pd.DataFrame, rng):
+    """Ratings and comments for a 30% sample of transactions, gathered by position"""
+    size = int(len(transactions_df) * 0.3)
+    sampled = transactions_df.iloc[rng.choice(len(transactions_df), size, replace=False)]
+    return pd.DataFrame({
+        'feedback_id': sequence_ids('FB_', 1, size, 6),
+        'customer_id': sampled['customer_id'].to_numpy(),
+        'transaction_id': sampled['transaction_id'].to_numpy(),
+        'rating': rng.choice(RATINGS, size, p=RATING_WEIGHTS),
+        'feedback_text': np.array(FEEDBACK_TEXTS, dtype=object)[rng.integers(len(FEEDBACK_TEXTS), size=size)],
+        'date': sampled['transaction_date'].to_numpy() + rng.integers(1, 8, size).astype('timedelta64[D]')
+    })
+
+def generate_clickstream(visits_df: pd.DataFrame, transactions_df: pd.DataFrame, products_df: pd.DataFrame, rng):
+    """Event-level clickstream of every visit and purchase, with session ids from a 30-minute inactivity gap"""
+    return timeline_clickstream(visits_df, transactions_df, products_df, rng)
+
+def generate_sessions(clickstream_df: pd.DataFrame):
+    """Sessions derived from the sessionized clickstream"""
+    return session_summary(clickstream_df).rename(columns={'page_views': 'pages_visited'})[[
+        'session_id', 'customer_id', 'device_type', 'session_start', 'session_end', 'pages_visited',
+        'session_duration_minutes'
+    ]]
+
+def generate_customer_behavior(clickstream_df: pd.DataFrame, rng):
+    """Per-session engagement metrics counted from the clickstream; chat, email and rating flags are simulated"""
+    behavior_df = session_summary(clickstream_df).rename(columns={
+        'session_start': 'session_date', 'page_views': 'pages_viewed', 'landing_page': 'page_type'})
+    pages = np.maximum(behavior_df['pages_viewed'], 1)
+    behavior_df['bounce_rate'] = (1 / pages).round(2)  # Share of the session's page views that were its exit
+    behavior_df['time_on_page_seconds'] = (behavior_df['session_duration_minutes'] * 60 / pages).round(2)
+    behavior_df['cart_abandonment'] = ((behavior_df['cart_additions'] > behavior_df['purchases'])).astype(int)
+    behavior_df['search_queries'] = behavior_df['searches']
+    behavior_df['support_chat_initiated'] = rng.choice([0, 1], len(behavior_df), p=[0.85, 0.15])
+    behavior_df['email_clicks'] = rng.poisson(1, len(behavior_df))
+    behavior_df['app_rating_given'] = rng.choice([0, 1], len(behavior_df), p=[0.9, 0.1])
+    return behavior_df[[
+        'session_id', 'customer_id', 'session_date', 'session_duration_minutes',
+        'pages_viewed', 'page_type', 'device_type', 'bounce_rate',
+        'time_on_page_seconds', 'cart_additions', 'cart_abandonment',
+        'search_queries', 'support_chat_initiated', 'email_clicks', 'app_rating_given'
+    ]]
+
+def generate_billing_events(transactions_df: pd.DataFrame, rng):
+    """1-3 invoices per purchasing customer splitting their total spend; the last invoice takes the remainder"""
+    customer_transactions = transactions_df.groupby('customer_id').agg(
+        total_spent=('amount_spent', 'sum'),
+        last_transaction=('transaction_date', 'max')
+    )
+    total_spent = customer_transactions['total_spent'].to_numpy(dtype=np.int64)
+    num_invoices = rng.integers(1, 4, len(customer_transactions))
+
+    # One row per invoice, grouped by customer in customer order
+    owner = np.repeat(np.arange(len(customer_transactions)), num_invoices)
+    position = np.arange(len(owner)) - np.repeat(np.cumsum(num_invoices) - num_invoices, num_invoices)
+    is_last = position == num_invoices[owner] - 1
+
+    # Equal shares with ±₹500 noise; the last invoice gets whatever is left
+    share = np.maximum(100, total_spent[owner] // num_invoices[owner] + rng.integers(-500, 501, len(owner)))
+    billed_before_last = np.bincount(owner, weights=np.where(is_last, 0, share), minlength=len(total_spent))
+    remainder = total_spent - billed_before_last.astype(np.int64)
+    total_due = np.where(is_last, np.maximum(100, remainder[owner]), share)
+
+    invoice_date = (customer_transactions['last_transaction'].to_numpy()[owner]
+                    + rng.integers(0, 8, len(owner)).astype('timedelta64[D]'))
+    return pd.DataFrame({
+        'event_id': sequence_ids('BILL_', 1, len(owner), 6),
+        'customer_id': customer_transactions.index.to_numpy()[owner],
+        'invoice_date': invoice_date,
+        'total_due': total_due,
+        'payment_status': rng.choice(['Paid', 'Pending', 'Overdue'], len(owner), p=[0.85, 0.1, 0.05]),
+        'due_date': invoice_date + np.timedelta64(30, 'D')
+    })
+
+def generate_support_tickets(transactions_df: pd.DataFrame, rng, desk_rng, num_agents: int = None):
+    """Tickets following purchases, worked through the simulated support desk"""
+    return run_support_desk(timeline_tickets(transactions_df, rng), desk_rng, num_agents)
+
+# ============================================================================
+# PIPELINE
+# ============================================================================
+
+def table_builders(counts: dict, seed: int, attribution_rule: str = 'last_touch'):
+    """(table, builder) pairs in dependency order; builders take the tables generated so far"""
+    return [
+        ('customers', lambda t: generate_customers(counts['customers'], table_rng(seed, 'customers'))),
+        ('product_catalog', lambda t: generate_product_catalog(counts['products'], table_rng(seed, 'product_catalog'))),
+        ('visits', lambda t: generate_visits(t['customers'], counts['sessions'], table_rng(seed, 'visits'))),
+        ('transactions', lambda t: generate_transactions(t['customers'], t['visits'], t['product_catalog'],
+                                                         counts['transactions'], table_rng(seed, 'transactions'))),
+        ('clickstream_events', lambda t: generate_clickstream(t['visits'], t['transactions'], t['product_catalog'],
+                                                              table_rng(seed, 'clickstream_events'))),
+        ('sessions', lambda t: generate_sessions(t['clickstream_events'])),
+        ('customer_behavior', lambda t: generate_customer_behavior(t['clickstream_events'],
+                                                                   table_rng(seed, 'customer_behavior'))),
+        ('order_items', lambda t: generate_order_items(t['transactions'], t['product_catalog'],
+                                                       table_rng(seed, 'order_items'))),
+        ('orders', lambda t: generate_orders(t['transactions'], t['order_items'], table_rng(seed, 'orders'))),
+        ('churn_labels', lambda t: generate_churn_labels(t['customers'], t['transactions'],
+                                                         table_rng(seed, 'churn_labels'))),
+        ('campaigns', lambda t: generate_campaigns(counts['campaigns'], table_rng(seed, 'campaigns'),
+                                                   counts['customers'] / BASE_COUNTS['customers'])),
+        ('campaign_attribution', lambda t: generate_campaign_attribution(t['transactions'], t['customers'],
+                                                                         t['campaigns'],
+                                                                         table_rng(seed, 'campaign_attribution'),
+                                                                         attribution_rule)),
+        ('campaign_performance', lambda t: generate_campaign_performance(t['campaigns'], t['campaign_attribution'],
+                                                                         table_rng(seed, 'campaign_performance'))),
+        ('customer_feedback', lambda t: generate_customer_feedback(t['transactions'],
+                                                                   table_rng(seed, 'customer_feedback'))),
+        ('billing_events', lambda t: generate_billing_events(t['transactions'], table_rng(seed, 'billing_events'))),
+        ('support_tickets', lambda t: generate_support_tickets(t['transactions'], table_rng(seed, 'support_tickets'),
+                                                               table_rng(seed, 'support_desk'))),
+    ]
+
+def generate_all(scale: float = 1.0, seed: int = DEFAULT_SEED, use_cache: bool = True, verbose: bool = True,
+                 attribution_rule: str = 'last_touch'):
+    """Generate (or load from the dataset cache) every table in TABLE_NAMES; returns (datasets, seconds per table)"""
+    counts = scaled_counts(scale)
+    config = {'counts': counts, 'attribution_rule': attribution_rule}
+    cache = DatasetCache() if use_cache else None
+    version = code_version(__file__)
+
+    tables, timings = {}, {}
+    for name, build in table_builders(counts, seed, attribution_rule):
+        start_time = time.time()
+        if cache is not None:
+            tables[name] = cache.get_or_create(name, lambda: build(tables), config=config,
+                                               seed=seed, scale=scale, code_version=version)
+        else:
+            tables[name] = build(tables)
+        timings[name] = time.time() - start_time
+        if verbose:
+            print(f"   ✅ {name:<22} {len(tables[name]):>12,} rows in {timings[name]:8.2f}s")
+
+    return {name: tables[name] for name in TABLE_NAMES}, timings
+
+def save_datasets(datasets: dict, output_dir: str = 'dataset', settings: dict = None):
+    """Write every table to <output_dir>/<table>.csv, with their statistics catalog in <output_dir>/stats.json
+    and the run manifest (`settings` plus table fingerprints) in <output_dir>/manifest.json"""
+    os.makedirs(output_dir, exist_ok=True)
+    catalog, fingerprint = StatsCatalog(), DatasetFingerprint()
+    for name, df in datasets.items():
+        df.to_csv(os.path.join(output_dir, f'{name}.csv'), index=False)
+        catalog.update(name, df)
+        fingerprint.update(name, df)
+        print(f"✅ Saved {name}.csv ({len(df):,} records)")
+    catalog.save(os.path.join(output_dir, STATS_FILE))
+    print(f"📊 Saved {STATS_FILE} (per-column statistics for drift checks)")
+    save_manifest(os.path.join(output_dir, MANIFEST_FILE), fingerprint, **(settings or {}))
+    print(f"🧾 Saved {MANIFEST_FILE} (table fingerprints for diffing runs)")
+
+def catalog_category_shares(rows: dict):
+    """Named products per category, plus CATEGORY_WEIGHTS of the variants padding the catalog"""
+    named = {category: len(products) for category, products in ALL_PRODUCTS.items()}
+    variants = max(rows['product_catalog'] - sum(named.values()), 0)
+    return {category: named[category] + variants * weight
+            for category, weight in zip(PRODUCT_CATEGORIES, CATEGORY_WEIGHTS)}
+
+def retailmax_expectations():
+    """Target distributions the generated tables should reproduce (see dataset_fidelity.py)"""
+    return [
+        Shares('customers', 'region', dict(zip(INDIAN_CITIES, CITY_WEIGHTS))),
+        Shares('product_catalog', 'category', catalog_category_shares),
+        Shares('transactions', 'payment_method', dict(zip(PAYMENT_METHODS, PAYMENT_WEIGHTS))),
+        Calibrated('churn_labels', 'churn_status', {1: TARGET_CHURN_RATE, 0: 1 - TARGET_CHURN_RATE}),
+        Shares('billing_events', 'payment_status', {'Paid': 0.85, 'Pending': 0.1, 'Overdue': 0.05}),
+        Shares('customer_behavior', 'support_chat_initiated', {0: 0.85, 1: 0.15}),
+        Shares('customer_behavior', 'app_rating_given', {0: 0.9, 1: 0.1}),
+    ]
+
+def check_fidelity(datasets: dict):
+    """Test every table against retailmax_expectations(); True when all of them hold"""
+    check = FidelityCheck(retailmax_expectations())
+    for name, columns in check.columns().items():
+        check.update(name, datasets[name][columns])
+    return print_report(check.report(), check.alpha)
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Generate the RetailMax dataset at a given scale"""
+    parser = argparse.ArgumentParser(description="Generate the RetailMax synthetic dataset")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help=f"Multiplier on the notebook's row counts ({FULL_SCALE} = 1.2M customers)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--output', default='dataset', help="Directory for the CSV files")
+    parser.add_argument('--no-cache', action='store_true', help="Always regenerate instead of using the cache")
+    parser.add_argument('--benchmark', action='store_true', help="Report per-table timings without writing CSVs")
+    parser.add_argument('--attribution', choices=ATTRIBUTION_RULES, default='last_touch',
+                        help="How campaign_attribution splits a purchase between the campaigns that touched it")
+    parser.add_argument('--stream-transactions', type=int, metavar='N',
+                        help="Only stream N transactions with their clickstream, sessions, behavior and support "
+                             "tickets to <output>/, customer block by customer block")
+    parser.add_argument('--check-fidelity', action='store_true',
+                        help="Test the generated tables against their target distributions; exit 1 on a failure")
+    args = parser.parse_args()
+
+    counts = scaled_counts(args.scale)
+    print("🛒 RETAILMAX ANALYTICS - FAKE DATA GENERATION")
+    print("=" * 55)
+    print(f"Scale {args.scale:g}: {counts['customers']:,} customers, {counts['transactions']:,} transactions, "
+          f"{counts['sessions']:,} sessions")
+    print("=" * 55)
+
+    start_time = time.time()
+    if args.stream_transactions:
+        customers_df = generate_customers(counts['customers'], table_rng(args.seed, 'customers'))
+        products_df = generate_product_catalog(counts['products'], table_rng(args.seed, 'product_catalog'))
+        num_visits = args.stream_transactions * BASE_COUNTS['sessions'] // BASE_COUNTS['transactions']
+        written = write_timeline(args.output, customers_df, products_df, num_visits, args.stream_transactions,
+                                 args.seed)
+        print(f"\n⏱️ {sum(written.values()):,} events in {time.time() - start_time:.1f}s")
+        return
+
+    datasets, timings = generate_all(args.scale, args.seed, use_cache=not args.no_cache and not args.benchmark,
+                                     attribution_rule=args.attribution)
+    total_rows = sum(len(df) for df in datasets.values())
+    print(f"\n⏱️ {total_rows:,} rows in {time.time() - start_time:.1f}s")
+
+    if args.check_fidelity and not check_fidelity(datasets):
+        sys.exit(1)
+
+    if args.benchmark:
+        slowest = max(timings, key=timings.get)
+        print(f"🐢 Slowest table: {slowest} ({timings[slowest]:.2f}s)")
+        return
+
+    print(f"\n💾 Saving all datasets to '{args.output}' directory...")
+    save_datasets(datasets, args.output, settings={'scale': args.scale, 'seed': args.seed,
+                                                   'attribution_rule': args.attribution,
+                                                   'code_version': code_version(__file__)})
+
+if __name__ == "__main__":
+    main()
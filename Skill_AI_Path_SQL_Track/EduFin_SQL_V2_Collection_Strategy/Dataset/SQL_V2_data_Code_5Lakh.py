@@ -5,23 +5,22 @@ Generates realistic education loan portfolio data with proper relationships
 - 300,000-400,000 records in other tables
 - Real Indian cities and states
 - Databricks Delta table compatible
+- Column statistics of every table are collected while it is written (STATS_FILE, see dataset_stats)
 """
 
 import pandas as pd
-import numpy as np
-from faker import Faker
-import random
-from datetime import datetime, timedelta
 from pyspark.sql import SparkSession
 from pyspark.sql.types import *
 import gc
 import time
+from datetime import date
 
-# Initialize Faker with Indian locale
-fake = Faker('en_IN')
-Faker.seed(42)
-random.seed(42)
-np.random.seed(42)
+from edufin_virtual_tables import (VirtualCustomers, VirtualInstitutions, VirtualLoans,
+                                   VirtualPayments, VirtualDefaultsCollections,
+                                   VirtualGeographicDemographics, VirtualEconomicIndicators)
+from edufin_scenarios import load_scenario
+from dataset_cache import DatasetCache
+from dataset_stats import StatsCatalog
 
 # Get or create Spark session (Databricks automatically provides this)
 spark = SparkSession.builder.appName("EduFinDataGeneration").getOrCreate()
@@ -29,10 +28,19 @@ spark = SparkSession.builder.appName("EduFinDataGeneration").getOrCreate()
 # Configuration
 CUSTOMER_RECORDS = 500000
 OTHER_TABLE_RECORDS = 350000  # 350K for other tables
-BATCH_SIZE = 10000
+BATCH_SIZE = 50000
+SEED = 42  # Root seed; every (table, column) stream is derived from it
+AS_OF = date(2025, 1, 1)  # Relative dates count back from here, so every run (and cache key) matches
+SCENARIO_FILE = None  # e.g. "scenarios/severe_recession.json" to generate a what-if dataset
+SCENARIO_OVERRIDES = load_scenario(SCENARIO_FILE)['overrides'] if SCENARIO_FILE else {}
+USE_CACHE = True  # Reuse tables generated earlier with the same config, seed and column rules
+CACHE = DatasetCache()
+STATS_FILE = "edufin_5lakh.stats.json"  # Statistics catalog of every table written
+STATS = StatsCatalog()
 
 print(f"EduFin Dataset Generation for Databricks")
 print(f"Target: {CUSTOMER_RECORDS:,} customers, {OTHER_TABLE_RECORDS:,} other records")
+print(f"Seed {SEED}, dates as of {AS_OF}")
 
 def log_progress(message: str, current: int = None, total: int = None):
     """Progress logging"""
@@ -42,6 +50,37 @@ def log_progress(message: str, current: int = None, total: int = None):
     else:
         print(f"   {message}")
 
+def materialize_virtual_table(virtual_table, label: str):
+    """Generate every row of a virtual table in batches"""
+    batches = []
+    for batch in virtual_table.iter_batches(BATCH_SIZE):
+        batches.append(batch)
+        log_progress(f"Generated {label}", int(batch.iloc[-1, 0]), len(virtual_table))
+    return pd.concat(batches, ignore_index=True)
+
+def generate_virtual_table(virtual_table, label: str):
+    """Materialize a virtual table (or load it from the cache), keeping dates as DATE columns"""
+    if USE_CACHE:
+        start_time = time.time()
+        df = CACHE.get_or_create(virtual_table.table_name,
+                                 lambda: materialize_virtual_table(virtual_table, label),
+                                 config=virtual_table.config(), seed=virtual_table.seed,
+                                 scale=len(virtual_table), code_version=virtual_table.rule_version())
+        log_progress(f"{label}: {len(df):,} rows ready in {time.time() - start_time:.1f}s")
+    else:
+        df = materialize_virtual_table(virtual_table, label)
+    
+    for column in df.select_dtypes('datetime').columns:
+        df[column] = df[column].dt.date
+    return df
+
+def write_delta(df: pd.DataFrame, table: str):
+    """Save a table to the Databricks catalog; each BATCH_SIZE partition gets its own
+    StatsCatalog, merged into STATS"""
+    for start in range(0, len(df), BATCH_SIZE):
+        STATS.merge(StatsCatalog().update(table, df.iloc[start:start + BATCH_SIZE]))
+    spark.createDataFrame(df).write.format("delta").mode("overwrite").saveAsTable(table)
+
 # ============================================================================
 # REAL INDIAN STATES AND CITIES DATA
 # ============================================================================
@@ -407,9 +446,8 @@ def create_dim_state():
     
     df = pd.DataFrame(state_data)
     
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("dim_state")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "dim_state")
     
     log_progress(f"Created {len(df)} states")
     print("   ✅ dim_state table saved to Databricks catalog")
@@ -439,9 +477,8 @@ def create_dim_city(state_df):
     
     df = pd.DataFrame(city_data)
     
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("dim_city")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "dim_city")
     
     log_progress(f"Created {len(df)} cities")
     print("   ✅ dim_city table saved to Databricks catalog")
@@ -455,114 +492,13 @@ def create_customers(city_df):
     """Create 500,000 customers distributed across real cities"""
     print(f"\nStep 3/9: Generating CUSTOMERS ({CUSTOMER_RECORDS:,} records)...")
     
-    # Create city weights based on tier (favor higher tiers)
-    tier_weights = {'Tier1': 0.45, 'Tier2': 0.35, 'Tier3': 0.20}
-    city_weights = []
-    for _, city in city_df.iterrows():
-        city_weights.append(tier_weights[city['tier_classification']])
-    
-    customers_data = []
-    
-    # Generate in batches
-    for batch_start in range(0, CUSTOMER_RECORDS, BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, CUSTOMER_RECORDS)
-        batch_size = batch_end - batch_start
-        
-        # Sample cities for this batch
-        batch_cities = city_df.sample(n=batch_size, replace=True, weights=city_weights)
-        
-        for i, (_, city) in enumerate(batch_cities.iterrows()):
-            customer_id = batch_start + i + 1
-            city_id = city['city_id']
-            tier = city['tier_classification']
-            
-            # Generate realistic customer data
-            gender = random.choice(['Male', 'Female'])
-            first_name = fake.first_name_male() if gender == 'Male' else fake.first_name_female()
-            last_name = fake.last_name()
-            full_name = f"{first_name} {last_name}"
-            
-            # Age for education loans (18-30)
-            age = random.randint(18, 30)
-            birth_year = datetime.now().year - age
-            birth_month = random.randint(1, 12)
-            birth_day = random.randint(1, 28)
-            date_of_birth = datetime(birth_year, birth_month, birth_day).date()
-            
-            # Employment based on tier
-            employment_types = ['Private Employee', 'Government Employee', 'Self Employed', 'Business Owner', 'Student']
-            employment_weights = [45, 20, 20, 10, 5]
-            employment_type = random.choices(employment_types, weights=employment_weights)[0]
-            
-            # Income based on city tier
-            if tier == 'Tier1':
-                base_income = random.uniform(600000, 1800000)
-            elif tier == 'Tier2':
-                base_income = random.uniform(400000, 1200000)
-            else:
-                base_income = random.uniform(250000, 800000)
-            
-            # Employment multipliers
-            multipliers = {
-                'Government Employee': random.uniform(0.8, 1.3),
-                'Private Employee': random.uniform(0.6, 1.6),
-                'Business Owner': random.uniform(1.0, 3.0),
-                'Self Employed': random.uniform(0.4, 2.0),
-                'Student': random.uniform(0.1, 0.4)
-            }
-            
-            annual_income = base_income * multipliers[employment_type]
-            
-            # CIBIL score
-            if employment_type == 'Government Employee':
-                cibil_base = random.uniform(650, 850)
-            elif employment_type == 'Private Employee':
-                cibil_base = random.uniform(600, 800)
-            else:
-                cibil_base = random.uniform(550, 750)
-            
-            cibil_score = min(900, max(300, cibil_base + (50 if annual_income > 1000000 else 0)))
-            
-            # Contact details
-            phone = f"+91{random.randint(7000000000, 9999999999)}"
-            email = f"{first_name.lower()}.{last_name.lower()}{customer_id}@gmail.com"
-            
-            # Employer mapping
-            employers = {
-                'Government Employee': ['Ministry of Education', 'State Government', 'Railway', 'PSU Bank'],
-                'Private Employee': ['TCS', 'Infosys', 'Wipro', 'Accenture', 'IBM', 'Microsoft'],
-                'Self Employed': ['Self Employed', 'Freelance', 'Consultant'],
-                'Business Owner': ['Own Business', 'Family Business', 'Trading Co'],
-                'Student': ['Not Applicable', 'Part-time', 'Internship']
-            }
-            
-            education_levels = ['Bachelors', 'Masters', 'PhD', 'Diploma', 'Higher Secondary']
-            education_weights = [50, 30, 5, 10, 5]
-            
-            customers_data.append({
-                'customer_id': customer_id,
-                'full_name': full_name,
-                'phone_number': phone,
-                'email_address': email,
-                'city_id': city_id,
-                'current_address': fake.address(),
-                'annual_income': round(annual_income, 2),
-                'cibil_score': int(cibil_score),
-                'employment_type': employment_type,
-                'employer_name': random.choice(employers[employment_type]),
-                'date_of_birth': date_of_birth,
-                'gender': gender,
-                'education_level': random.choices(education_levels, weights=education_weights)[0]
-            })
-        
-        if batch_end % 50000 == 0:
-            log_progress("Generated customers", batch_end, CUSTOMER_RECORDS)
+    # Every column draws from its own (seed, table, column) stream, so changing one
+    # column's rule leaves the other columns unchanged
+    df = generate_virtual_table(VirtualCustomers(CUSTOMER_RECORDS, cities=city_df, seed=SEED, as_of=AS_OF),
+                                "customers")
     
-    df = pd.DataFrame(customers_data)
-    
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("customers")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "customers")
     
     log_progress(f"Created {len(df)} customers")
     print("   ✅ customers table saved to Databricks catalog")
@@ -576,74 +512,11 @@ def create_institutions(city_df):
     """Create 350,000 institutions"""
     print(f"\nStep 4/9: Generating INSTITUTIONS ({OTHER_TABLE_RECORDS:,} records)...")
     
-    institution_types = ['University', 'College', 'Institute', 'Academy']
-    prefixes = ['National', 'Indian', 'Government', 'State', 'Regional', 'Central']
-    specializations = ['Engineering', 'Medical', 'Management', 'Arts & Science', 'Technology', 'Commerce', 'Law']
-    
-    # Favor higher tier cities for institutions
-    tier_weights = {'Tier1': 0.5, 'Tier2': 0.3, 'Tier3': 0.2}
-    city_weights = [tier_weights[city['tier_classification']] for _, city in city_df.iterrows()]
+    df = generate_virtual_table(VirtualInstitutions(OTHER_TABLE_RECORDS, cities=city_df, seed=SEED, as_of=AS_OF),
+                                "institutions")
     
-    institutions_data = []
-    
-    for batch_start in range(0, OTHER_TABLE_RECORDS, BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, OTHER_TABLE_RECORDS)
-        batch_size = batch_end - batch_start
-        
-        batch_cities = city_df.sample(n=batch_size, replace=True, weights=city_weights)
-        
-        for i, (_, city) in enumerate(batch_cities.iterrows()):
-            institution_id = batch_start + i + 1
-            city_id = city['city_id']
-            city_name = city['city_name']
-            tier = city['tier_classification']
-            
-            # Generate institution name
-            prefix = random.choice(prefixes)
-            specialization = random.choice(specializations)
-            inst_type = random.choice(institution_types)
-            name = f"{prefix} {specialization} {inst_type}, {city_name}"
-            
-            # Parameters based on city tier
-            if tier == 'Tier1':
-                students = random.randint(8000, 30000)
-                fees = random.uniform(250000, 1000000)
-                placement = random.uniform(75, 95)
-                establishment = random.randint(1950, 2010)
-            elif tier == 'Tier2':
-                students = random.randint(3000, 15000)
-                fees = random.uniform(150000, 500000)
-                placement = random.uniform(60, 85)
-                establishment = random.randint(1960, 2015)
-            else:
-                students = random.randint(800, 8000)
-                fees = random.uniform(75000, 300000)
-                placement = random.uniform(40, 75)
-                establishment = random.randint(1970, 2020)
-            
-            accreditations = ['NAAC A+', 'NAAC A', 'NAAC B+', 'NAAC B', 'NBA Accredited', 'UGC Recognized']
-            weights = [15, 25, 20, 15, 15, 10] if tier == 'Tier1' else [5, 15, 25, 20, 15, 20]
-            
-            institutions_data.append({
-                'institution_id': institution_id,
-                'institution_name': name,
-                'city_id': city_id,
-                'institution_type': inst_type,
-                'establishment_year': establishment,
-                'total_students': students,
-                'average_course_fee': round(fees, 2),
-                'placement_rate': round(placement, 2) if random.random() > 0.05 else None,
-                'accreditation_status': random.choices(accreditations, weights=weights)[0]
-            })
-        
-        if batch_end % 50000 == 0:
-            log_progress("Generated institutions", batch_end, OTHER_TABLE_RECORDS)
-    
-    df = pd.DataFrame(institutions_data)
-    
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("institutions")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "institutions")
     
     log_progress(f"Created {len(df)} institutions")
     print("   ✅ institutions table saved to Databricks catalog")
@@ -658,122 +531,13 @@ def create_loans():
     print(f"\nStep 5/9: Generating LOANS (400,000 records)...")
     
     LOAN_RECORDS = 400000
-    current_date = datetime.now().date()
-    
-    # Create realistic customer-loan distribution
-    # 60% customers get 1 loan, 30% get 2 loans, 10% get 3+ loans
-    customers_with_1_loan = int(0.6 * LOAN_RECORDS)
-    customers_with_2_loans = int(0.25 * LOAN_RECORDS)
-    customers_with_3_loans = LOAN_RECORDS - customers_with_1_loan - customers_with_2_loans
+    virtual_loans = VirtualLoans(LOAN_RECORDS, num_customers=CUSTOMER_RECORDS,
+                                 num_institutions=OTHER_TABLE_RECORDS, seed=SEED, as_of=AS_OF,
+                                 overrides=SCENARIO_OVERRIDES.get('loans'))
+    df = generate_virtual_table(virtual_loans, "loans")
     
-    loans_data = []
-    loan_id = 1
-    
-    # Generate customer IDs with loan distribution
-    customer_loan_pairs = []
-    
-    # Single loans
-    for i in range(customers_with_1_loan):
-        customer_id = random.randint(1, CUSTOMER_RECORDS)
-        customer_loan_pairs.append(customer_id)
-    
-    # Double loans
-    for i in range(customers_with_2_loans // 2):
-        customer_id = random.randint(1, CUSTOMER_RECORDS)
-        customer_loan_pairs.extend([customer_id, customer_id])
-    
-    # Triple loans
-    for i in range(customers_with_3_loans // 3):
-        customer_id = random.randint(1, CUSTOMER_RECORDS)
-        customer_loan_pairs.extend([customer_id, customer_id, customer_id])
-    
-    # Shuffle to randomize
-    random.shuffle(customer_loan_pairs)
-    customer_loan_pairs = customer_loan_pairs[:LOAN_RECORDS]
-    
-    for batch_start in range(0, LOAN_RECORDS, BATCH_SIZE):
-        batch_end = min(batch_start + BATCH_SIZE, LOAN_RECORDS)
-        
-        for i in range(batch_start, batch_end):
-            customer_id = customer_loan_pairs[i]
-            institution_id = random.randint(1, OTHER_TABLE_RECORDS)
-            
-            # Realistic loan parameters
-            base_amount = random.uniform(150000, 800000)
-            living_expenses = random.uniform(50000, 250000)
-            loan_amount = base_amount + living_expenses
-            
-            # Interest rate based on random CIBIL simulation
-            cibil_score = random.randint(300, 900)
-            if cibil_score >= 750:
-                interest_rate = random.uniform(8.5, 11.5)
-            elif cibil_score >= 650:
-                interest_rate = random.uniform(10.5, 14.0)
-            else:
-                interest_rate = random.uniform(12.5, 17.5)
-            
-            tenure_months = random.choice([36, 48, 60, 72, 84, 96])
-            
-            # Dates
-            days_back = random.randint(60, 1460)
-            app_date = current_date - timedelta(days=days_back)
-            disbursement_date = app_date + timedelta(days=random.randint(7, 45))
-            maturity_date = disbursement_date + timedelta(days=tenure_months * 30)
-            
-            # EMI calculation
-            monthly_rate = interest_rate / 100 / 12
-            if monthly_rate > 0:
-                emi_amount = (loan_amount * monthly_rate * (1 + monthly_rate)**tenure_months) / ((1 + monthly_rate)**tenure_months - 1)
-            else:
-                emi_amount = loan_amount / tenure_months
-            
-            # Status determination
-            months_since = max(1, (current_date - disbursement_date).days // 30)
-            
-            default_prob = 0.08
-            if cibil_score < 600:
-                default_prob += 0.15
-            elif cibil_score < 700:
-                default_prob += 0.08
-            
-            status_rand = random.random()
-            if status_rand < default_prob:
-                loan_status = 'Defaulted'
-            elif status_rand < default_prob + 0.06:
-                loan_status = 'Overdue'
-            elif months_since >= tenure_months:
-                loan_status = 'Closed'
-            else:
-                loan_status = 'Active'
-            
-            purpose_options = ['Course Fees', 'Living Expenses', 'Course Fees + Living', 'Equipment & Books']
-            purpose_weights = [35, 15, 35, 15]
-            
-            loans_data.append({
-                'loan_id': loan_id,
-                'customer_id': customer_id,
-                'institution_id': institution_id,
-                'loan_amount': round(loan_amount, 2),
-                'loan_status': loan_status,
-                'interest_rate': round(interest_rate, 2),
-                'loan_tenure_months': tenure_months,
-                'application_date': app_date,
-                'disbursement_date': disbursement_date,
-                'maturity_date': maturity_date,
-                'emi_amount': round(emi_amount, 2),
-                'purpose_of_loan': random.choices(purpose_options, weights=purpose_weights)[0]
-            })
-            
-            loan_id += 1
-        
-        if batch_end % 50000 == 0:
-            log_progress("Generated loans", batch_end, LOAN_RECORDS)
-    
-    df = pd.DataFrame(loans_data)
-    
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("loans")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "loans")
     
     log_progress(f"Created {len(df)} loans")
     print("   ✅ loans table saved to Databricks catalog")
@@ -787,66 +551,12 @@ def create_payments():
     """Create 350,000 payment records"""
     print(f"\nStep 6/9: Generating PAYMENTS ({OTHER_TABLE_RECORDS:,} records)...")
     
-    current_date = datetime.now().date()
-    payments_data = []
+    # Rows are generated from the counter-based RNG, so any row range can be regenerated alone
+    df = generate_virtual_table(VirtualPayments(OTHER_TABLE_RECORDS, num_loans=400000, seed=SEED, as_of=AS_OF,
+                                                overrides=SCENARIO_OVERRIDES.get('payments')), "payments")
     
-    for i in range(1, OTHER_TABLE_RECORDS + 1):
-        # Random loan reference
-        loan_id = random.randint(1, 400000)  # Reference to loans
-        
-        # Random payment date within last 2 years
-        days_back = random.randint(1, 730)
-        payment_date = current_date - timedelta(days=days_back)
-        
-        # Payment amount
-        base_emi = random.uniform(5000, 50000)
-        if random.random() < 0.05:  # 5% partial payments
-            payment_amount = base_emi * random.uniform(0.3, 0.8)
-        else:
-            payment_amount = base_emi + random.uniform(-500, 500)
-        
-        payment_amount = max(1000, payment_amount)
-        
-        # Payment method
-        methods = ['UPI', 'Net Banking', 'Debit Card', 'Credit Card', 'Cheque', 'NEFT']
-        method_weights = [40, 25, 15, 8, 7, 5]
-        payment_method = random.choices(methods, weights=method_weights)[0]
-        
-        # Payment status
-        payment_status = 'Success' if random.random() < 0.92 else random.choice(['Failed', 'Pending'])
-        
-        if payment_status == 'Success':
-            interest_component = payment_amount * random.uniform(0.3, 0.7)
-            principal_component = payment_amount - interest_component
-            outstanding_balance = random.uniform(50000, 500000)
-            late_fee = random.uniform(0, 1000) if random.random() < 0.08 else 0
-        else:
-            interest_component = 0
-            principal_component = 0
-            outstanding_balance = random.uniform(100000, 600000)
-            late_fee = 0
-        
-        payments_data.append({
-            'payment_id': i,
-            'loan_id': loan_id,
-            'payment_date': payment_date,
-            'payment_amount': round(payment_amount, 2),
-            'payment_method': payment_method,
-            'payment_status': payment_status,
-            'late_fee': round(late_fee, 2),
-            'principal_component': round(principal_component, 2),
-            'interest_component': round(interest_component, 2),
-            'outstanding_balance': round(outstanding_balance, 2)
-        })
-        
-        if i % 50000 == 0:
-            log_progress("Generated payments", i, OTHER_TABLE_RECORDS)
-    
-    df = pd.DataFrame(payments_data)
-    
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("payments")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "payments")
     
     log_progress(f"Created {len(df)} payments")
     print("   ✅ payments table saved to Databricks catalog")
@@ -860,77 +570,13 @@ def create_defaults_collections():
     """Create 350,000 defaults and collections records"""
     print(f"\nStep 7/9: Generating DEFAULTS_COLLECTIONS ({OTHER_TABLE_RECORDS:,} records)...")
     
-    current_date = datetime.now().date()
-    defaults_data = []
-    
-    for i in range(1, OTHER_TABLE_RECORDS + 1):
-        customer_id = random.randint(1, CUSTOMER_RECORDS)
-        loan_id = random.randint(1, 400000)
-        
-        # Default date
-        days_back = random.randint(30, 1095)  # 1 month to 3 years back
-        default_date = current_date - timedelta(days=days_back)
-        
-        # Default amount
-        default_amount = random.uniform(100000, 800000)
-        
-        days_overdue = (current_date - default_date).days
-        
-        # Collection status based on days overdue
-        if days_overdue > 730:
-            collection_status = random.choices(['Written Off', 'Legal Action', 'Settled'], weights=[50, 30, 20])[0]
-        elif days_overdue > 365:
-            collection_status = random.choices(['Legal Action', 'Active', 'Written Off'], weights=[40, 35, 25])[0]
-        elif days_overdue > 180:
-            collection_status = random.choices(['Active', 'Legal Action'], weights=[60, 40])[0]
-        else:
-            collection_status = 'Active'
-        
-        # Contact attempts
-        contact_attempts = random.randint(5, 50)
-        
-        # Last contact date
-        contact_days_ago = random.randint(1, min(days_overdue, 90))
-        last_contact_date = current_date - timedelta(days=contact_days_ago)
-        
-        # Legal notice
-        legal_notice_sent = (collection_status in ['Legal Action', 'Written Off'] or 
-                           (days_overdue > 180 and random.random() < 0.4))
-        
-        # Recovery amount
-        recovery_rates = {
-            'Settled': random.uniform(0.4, 0.9),
-            'Active': random.uniform(0.0, 0.5),
-            'Legal Action': random.uniform(0.1, 0.6),
-            'Written Off': random.uniform(0.0, 0.3)
-        }
-        recovery_amount = default_amount * recovery_rates[collection_status]
-        
-        collection_agent_id = random.randint(1, 100)
-        
-        defaults_data.append({
-            'default_id': i,
-            'customer_id': customer_id,
-            'loan_id': loan_id,
-            'default_date': default_date,
-            'default_amount': round(default_amount, 2),
-            'days_overdue': days_overdue,
-            'collection_status': collection_status,
-            'last_contact_date': last_contact_date,
-            'contact_attempts': contact_attempts,
-            'legal_notice_sent': legal_notice_sent,
-            'recovery_amount': round(recovery_amount, 2),
-            'collection_agent_id': collection_agent_id
-        })
-        
-        if i % 50000 == 0:
-            log_progress("Generated defaults", i, OTHER_TABLE_RECORDS)
-    
-    df = pd.DataFrame(defaults_data)
+    virtual_defaults = VirtualDefaultsCollections(OTHER_TABLE_RECORDS, num_customers=CUSTOMER_RECORDS,
+                                                  num_loans=400000, seed=SEED, as_of=AS_OF,
+                                                  overrides=SCENARIO_OVERRIDES.get('defaults_collections'))
+    df = generate_virtual_table(virtual_defaults, "defaults")
     
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("defaults_collections")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "defaults_collections")
     
     log_progress(f"Created {len(df)} defaults")
     print("   ✅ defaults_collections table saved to Databricks catalog")
@@ -944,58 +590,12 @@ def create_geographic_demographics():
     """Create 350,000 geographic demographics records"""
     print(f"\nStep 8/9: Generating GEOGRAPHIC_DEMOGRAPHICS ({OTHER_TABLE_RECORDS:,} records)...")
     
-    geo_data = []
-    
-    for i in range(1, OTHER_TABLE_RECORDS + 1):
-        # Random city reference
-        city_id = random.randint(1, len(INDIAN_CITIES))
-        
-        # Random tier for demographics calculation
-        tier = random.choice(['Tier1', 'Tier2', 'Tier3'])
-        
-        # Demographics based on tier
-        if tier == 'Tier1':
-            pop_total = random.randint(2000000, 15000000)
-            avg_income = random.uniform(900000, 1800000)
-            unemployment = random.uniform(2.5, 5.5)
-            literacy = random.uniform(85.0, 96.0)
-            colleges = random.randint(60, 200)
-        elif tier == 'Tier2':
-            pop_total = random.randint(400000, 4000000)
-            avg_income = random.uniform(550000, 1100000)
-            unemployment = random.uniform(3.5, 7.5)
-            literacy = random.uniform(75.0, 90.0)
-            colleges = random.randint(25, 80)
-        else:
-            pop_total = random.randint(80000, 1200000)
-            avg_income = random.uniform(350000, 750000)
-            unemployment = random.uniform(4.5, 12.0)
-            literacy = random.uniform(65.0, 82.0)
-            colleges = random.randint(8, 35)
-        
-        pop_18_35 = int(pop_total * random.uniform(0.24, 0.36))
-        education_enrollment = int(pop_18_35 * random.uniform(0.12, 0.28))
-        
-        geo_data.append({
-            'geo_id': i,
-            'city_id': city_id,
-            'population_total': pop_total,
-            'population_18_35': pop_18_35,
-            'higher_education_enrollment': education_enrollment,
-            'average_household_income': round(avg_income, 2),
-            'unemployment_rate': round(unemployment, 2),
-            'literacy_rate': round(literacy, 2),
-            'number_of_colleges': colleges
-        })
-        
-        if i % 50000 == 0:
-            log_progress("Generated geographic data", i, OTHER_TABLE_RECORDS)
-    
-    df = pd.DataFrame(geo_data)
+    virtual_geo = VirtualGeographicDemographics(OTHER_TABLE_RECORDS, num_cities=len(INDIAN_CITIES), seed=SEED,
+                                                as_of=AS_OF)
+    df = generate_virtual_table(virtual_geo, "geographic data")
     
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("geographic_demographics")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "geographic_demographics")
     
     log_progress(f"Created {len(df)} geographic records")
     print("   ✅ geographic_demographics table saved to Databricks catalog")
@@ -1009,73 +609,12 @@ def create_economic_indicators():
     """Create 350,000 economic indicators records"""
     print(f"\nStep 9/9: Generating ECONOMIC_INDICATORS ({OTHER_TABLE_RECORDS:,} records)...")
     
-    economic_data = []
-    years = list(range(2019, 2025))
-    quarters = ['Q1', 'Q2', 'Q3', 'Q4']
-    
-    for i in range(1, OTHER_TABLE_RECORDS + 1):
-        # Random state reference
-        state_id = random.randint(1, len(INDIAN_STATES))
-        
-        # Random quarter
-        year = random.choice(years)
-        quarter = random.choice(quarters)
-        quarter_str = f"{year}-{quarter}"
-        
-        # Random region for economic calculation
-        region = random.choice(['North', 'South', 'East', 'West', 'Central', 'Northeast'])
-        
-        # Economic indicators based on region
-        if region in ['West', 'South']:
-            gdp_growth = random.uniform(6.5, 9.5)
-            inflation = random.uniform(3.0, 6.2)
-            unemployment = random.uniform(2.0, 5.5)
-            per_capita = random.uniform(220000, 450000)
-            edu_spending = random.uniform(4.2, 7.5)
-            literacy = random.uniform(82.0, 96.0)
-        elif region in ['North']:
-            gdp_growth = random.uniform(5.5, 8.0)
-            inflation = random.uniform(3.2, 6.8)
-            unemployment = random.uniform(2.8, 6.5)
-            per_capita = random.uniform(190000, 350000)
-            edu_spending = random.uniform(3.8, 6.2)
-            literacy = random.uniform(76.0, 92.0)
-        else:
-            gdp_growth = random.uniform(3.5, 7.0)
-            inflation = random.uniform(3.8, 7.8)
-            unemployment = random.uniform(3.5, 11.0)
-            per_capita = random.uniform(130000, 280000)
-            edu_spending = random.uniform(2.8, 5.5)
-            literacy = random.uniform(62.0, 85.0)
-        
-        # COVID-19 impact
-        if year == 2020:
-            gdp_growth *= random.uniform(0.4, 0.7)
-            unemployment *= random.uniform(1.3, 1.6)
-        elif year == 2021:
-            gdp_growth *= random.uniform(0.7, 0.9)
-            unemployment *= random.uniform(1.1, 1.3)
-        
-        economic_data.append({
-            'indicator_id': i,
-            'state_id': state_id,
-            'quarter': quarter_str,
-            'gdp_growth_rate': round(gdp_growth, 2),
-            'inflation_rate': round(inflation, 2),
-            'unemployment_rate': round(unemployment, 2),
-            'education_spending_percent': round(edu_spending, 2),
-            'per_capita_income': round(per_capita, 2),
-            'literacy_rate': round(literacy, 2)
-        })
-        
-        if i % 50000 == 0:
-            log_progress("Generated economic indicators", i, OTHER_TABLE_RECORDS)
-    
-    df = pd.DataFrame(economic_data)
+    virtual_economic = VirtualEconomicIndicators(OTHER_TABLE_RECORDS, num_states=len(INDIAN_STATES), seed=SEED,
+                                                 as_of=AS_OF, overrides=SCENARIO_OVERRIDES.get('economic_indicators'))
+    df = generate_virtual_table(virtual_economic, "economic indicators")
     
-    # Convert to Spark DataFrame and save as Delta table
-    spark_df = spark.createDataFrame(df)
-    spark_df.write.format("delta").mode("overwrite").saveAsTable("economic_indicators")
+    # Save as Delta table, collecting statistics partition by partition
+    write_delta(df, "economic_indicators")
     
     log_progress(f"Created {len(df)} economic indicators")
     print("   ✅ economic_indicators table saved to Databricks catalog")
@@ -1136,6 +675,8 @@ def main():
         del economic_df  # Free memory
         gc.collect()
         
+        STATS.save(STATS_FILE)
+        
         # Completion summary
         end_time = time.time()
         duration_minutes = (end_time - start_time) / 60
@@ -1158,6 +699,8 @@ def main():
         total_records = (len(INDIAN_STATES) + len(INDIAN_CITIES) + CUSTOMER_RECORDS + 
                         400000 + OTHER_TABLE_RECORDS * 5)
         print(f"   🎯 Total Records: {total_records:,}")
+        print(f"   📅 Dates as of: {AS_OF} (seed {SEED})")
+        print(f"   📊 Statistics catalog: {STATS_FILE} (python dataset_stats.py {STATS_FILE})")
         
         print(f"\n🔗 RELATIONSHIP VERIFICATION:")
         print("   ✅ dim_state (1) → dim_city (M)")
@@ -1188,7 +731,7 @@ def main():
         
         print(f"\n🚀 NEXT STEPS:")
         print(f"   1. Run the notebook to generate the dataset")
-        print(f"   2. Add additional indexes if needed for performance")
+        print(f"   2. Apply the Z-order layout: python physical_design.py --no-measure --target delta")
         print(f"   3. Create views for common business queries")
         print(f"   4. Set up automated data quality checks")
         print(f"   5. Configure data lineage and governance")
@@ -0,0 +1,17 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check for data completeness
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN disbursement_date IS NULL THEN 1 END) AS missing_disbursement_dates,
+    COUNT(CASE WHEN loan_status IS NULL THEN 1 END) AS missing_status,
+    COUNT(CASE WHEN loan_amount <= 0 THEN 1 END) AS invalid_amounts
+FROM loans;
+-- Expected: 0 for all validation columns
+
+-- Validation 2: Verify loan status categories
+SELECT DISTINCT loan_status
+FROM loans
+ORDER BY loan_status;
+-- Expected: Active, Closed, Defaulted, Overdue
@@ -0,0 +1,22 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1A: Basic Portfolio Status Distribution
+-- BUSINESS OBJECTIVE: Get high-level view of loan portfolio health
+-- ANALYST MINDSET: Never analyze data without understanding its structure first
+
+SELECT 
+    loan_status,
+    COUNT(*) AS loan_count,
+    ROUND(
+        COUNT(*) * 100.0 / (
+            SELECT COUNT(*) 
+            FROM loans 
+            WHERE disbursement_date IS NOT NULL
+        ), 
+        1
+    ) AS percentage_of_portfolio
+FROM loans
+WHERE disbursement_date IS NOT NULL
+GROUP BY loan_status
+ORDER BY loan_count DESC;
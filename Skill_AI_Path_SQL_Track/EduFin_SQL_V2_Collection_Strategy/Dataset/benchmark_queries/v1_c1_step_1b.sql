@@ -0,0 +1,29 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1B: Basic Portfolio Scale and Scope
+-- BUSINESS OBJECTIVE: Establish baseline metrics for executive decision-making
+-- FOUNDATION BUILDING: Core numbers every analysis will reference
+
+SELECT 
+    -- Scale metrics for executive context
+    COUNT(DISTINCT customer_id) AS total_customers,
+    COUNT(loan_id) AS total_loans,
+    
+    -- Financial scale assessment
+    SUM(loan_amount) AS total_portfolio_value,
+    AVG(loan_amount) AS avg_loan_size,
+    
+    -- Business model validation
+    ROUND(
+        SUM(loan_amount) / 10000000.0, 
+        2
+    ) AS portfolio_crores,
+    
+    ROUND(
+        AVG(loan_amount) / 100000.0, 
+        2
+    ) AS avg_loan_lakhs
+
+FROM loans
+WHERE disbursement_date IS NOT NULL;
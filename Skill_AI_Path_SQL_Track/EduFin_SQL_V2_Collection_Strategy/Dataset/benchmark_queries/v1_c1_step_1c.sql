@@ -0,0 +1,36 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1C: Risk Categorization and Status Analysis
+-- BUSINESS OBJECTIVE: Understand portfolio composition by risk level
+-- RISK INTELLIGENCE: Identify which categories need immediate attention
+
+SELECT 
+    -- Risk category counts using conditional aggregation
+    COUNT(CASE WHEN loan_status = 'Active' THEN 1 END) AS active_loans,
+    COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    COUNT(CASE WHEN loan_status = 'Closed' THEN 1 END) AS closed_loans,
+    COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END) AS overdue_loans,
+    
+    -- Total count for percentage calculations
+    COUNT(*) AS total_loans,
+    
+    -- Risk percentages for executive dashboard
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+        2
+    ) AS default_rate_percent,
+    
+    ROUND(
+        (COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) + 
+         COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END)) * 100.0 / COUNT(*), 
+        2
+    ) AS portfolio_at_risk_percent,
+    
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Active' THEN 1 END) * 100.0 / COUNT(*), 
+        2
+    ) AS healthy_portfolio_percent
+
+FROM loans
+WHERE disbursement_date IS NOT NULL;
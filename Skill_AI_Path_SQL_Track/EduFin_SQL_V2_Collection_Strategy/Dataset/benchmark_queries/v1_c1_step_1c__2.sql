@@ -0,0 +1,63 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1C: Executive Portfolio Health Dashboard
+-- BUSINESS OBJECTIVE: Single query providing complete portfolio overview for board
+-- CRISIS CONTEXT: CEO needs immediate answers for emergency board meeting
+
+WITH portfolio_summary AS (
+    SELECT 
+        -- Scale and scope metrics
+        COUNT(DISTINCT customer_id) AS total_customers,
+        COUNT(loan_id) AS total_loans,
+        SUM(loan_amount) AS total_portfolio_value,
+        AVG(loan_amount) AS avg_loan_size,
+        
+        -- Risk categorization counts
+        COUNT(CASE WHEN loan_status = 'Active' THEN 1 END) AS active_loans,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        COUNT(CASE WHEN loan_status = 'Closed' THEN 1 END) AS closed_loans,
+        COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END) AS overdue_loans,
+        
+        -- Financial impact by status
+        SUM(CASE WHEN loan_status = 'Active' THEN loan_amount ELSE 0 END) AS active_portfolio_value,
+        SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) AS total_default_value,
+        SUM(CASE WHEN loan_status = 'Overdue' THEN loan_amount ELSE 0 END) AS overdue_portfolio_value
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Executive summary metrics (board-ready format)
+    CONCAT(format('{:,.0f}', CAST(total_customers AS DOUBLE)), ' customers') AS customer_base,
+    CONCAT(format('{:,.0f}', CAST(total_loans AS DOUBLE)), ' loans') AS loan_portfolio,
+    CONCAT('₹', format('{:,.0f}', CAST(total_portfolio_value / 10000000 AS DOUBLE)), ' Crores') AS total_exposure,
+    CONCAT('₹', ROUND(avg_loan_size / 100000, 1), ' Lakhs') AS avg_loan_size,
+    
+    -- Crisis confirmation metrics
+    ROUND((defaulted_loans * 100.0 / total_loans), 2) AS default_rate_percent,
+    CONCAT('₹', ROUND(total_default_value / 10000000, 1), ' Cr') AS confirmed_losses,
+    ROUND(((defaulted_loans + overdue_loans) * 100.0 / total_loans), 2) AS portfolio_at_risk_percent,
+    
+    -- Business health indicators
+    ROUND((active_portfolio_value * 100.0 / total_portfolio_value), 1) AS revenue_generating_percent,
+    ROUND((closed_loans * 100.0 / total_loans), 1) AS successful_closure_rate,
+    
+    -- Executive risk assessment
+    CASE 
+        WHEN (defaulted_loans * 100.0 / total_loans) > 15 THEN '🔴 CRITICAL'
+        WHEN (defaulted_loans * 100.0 / total_loans) > 10 THEN '🟡 HIGH RISK' 
+        WHEN (defaulted_loans * 100.0 / total_loans) > 5 THEN '🟠 MODERATE'
+        ELSE '🟢 HEALTHY'
+    END AS portfolio_health,
+    
+    -- Board action recommendation
+    CASE 
+        WHEN (defaulted_loans * 100.0 / total_loans) > 12 
+        THEN 'Deploy crisis management team + external recovery agencies'
+        WHEN (defaulted_loans * 100.0 / total_loans) > 8 
+        THEN 'Enhance collection resources + review underwriting standards'
+        ELSE 'Continue standard risk monitoring protocols'
+    END AS recommended_board_action
+    
+FROM portfolio_summary;
@@ -0,0 +1,39 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1D: Financial Impact by Risk Category
+-- BUSINESS OBJECTIVE: Calculate actual money at risk and revenue potential
+-- FINANCIAL INTELLIGENCE: Board needs concrete monetary numbers for decisions
+
+SELECT 
+    -- Financial impact by status category
+    SUM(CASE WHEN loan_status = 'Active' THEN loan_amount ELSE 0 END) AS active_portfolio_value,
+    SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) AS total_default_value,
+    SUM(CASE WHEN loan_status = 'Overdue' THEN loan_amount ELSE 0 END) AS overdue_portfolio_value,
+    SUM(CASE WHEN loan_status = 'Closed' THEN loan_amount ELSE 0 END) AS successfully_recovered_value,
+    
+    -- Executive-friendly formatting (crores)
+    ROUND(
+        SUM(CASE WHEN loan_status = 'Active' THEN loan_amount ELSE 0 END) / 10000000.0, 
+        2
+    ) AS active_crores,
+    
+    ROUND(
+        SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) / 10000000.0, 
+        2
+    ) AS defaulted_crores,
+    
+    ROUND(
+        SUM(CASE WHEN loan_status = 'Overdue' THEN loan_amount ELSE 0 END) / 10000000.0, 
+        2
+    ) AS overdue_crores,
+    
+    -- Business impact calculations
+    ROUND(
+        (SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) + 
+         SUM(CASE WHEN loan_status = 'Overdue' THEN loan_amount ELSE 0 END)) / 10000000.0, 
+        2
+    ) AS total_at_risk_crores
+
+FROM loans
+WHERE disbursement_date IS NOT NULL;
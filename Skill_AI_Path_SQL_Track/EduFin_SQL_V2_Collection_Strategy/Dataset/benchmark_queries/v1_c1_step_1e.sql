@@ -0,0 +1,49 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_1/SQL_session_1_challenge_1.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 1E: Complete Portfolio Health Dashboard
+-- BUSINESS OBJECTIVE: Comprehensive executive summary combining all analytical components
+-- CRISIS CONTEXT: Single query providing complete portfolio overview for emergency board meeting
+-- BUSINESS OBJECTIVE: Calculate actual money at risk and revenue potential
+-- EXECUTIVE FOCUS: Board needs concrete financial numbers for decision-making
+
+SELECT 
+    loan_status,
+    COUNT(*) AS loan_count,
+    
+    -- Financial impact calculations
+    SUM(loan_amount) AS total_amount,
+    ROUND(
+        SUM(loan_amount) / 10000000.0, 
+        2
+    ) AS amount_crores,
+    
+    -- Portfolio percentage by value
+    ROUND(
+        SUM(loan_amount) * 100.0 / (
+            SELECT SUM(loan_amount) 
+            FROM loans 
+            WHERE disbursement_date IS NOT NULL
+        ), 
+        2
+    ) AS value_percentage,
+    
+    -- Average loan size by status
+    ROUND(
+        AVG(loan_amount) / 100000.0, 
+        2
+    ) AS avg_loan_lakhs,
+    
+    -- Business impact classification
+    CASE 
+        WHEN loan_status = 'Active' THEN '💰 Revenue Generating'
+        WHEN loan_status = 'Closed' THEN '✅ Successfully Recovered'
+        WHEN loan_status = 'Defaulted' THEN '🚨 Revenue Loss'
+        WHEN loan_status = 'Overdue' THEN '⚠️ At Risk'
+        ELSE '❓ Investigate'
+    END AS business_impact
+
+FROM loans
+WHERE disbursement_date IS NOT NULL
+GROUP BY loan_status
+ORDER BY SUM(loan_amount) DESC;
@@ -0,0 +1,22 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check geographic data completeness
+SELECT 
+    COUNT(*) AS total_customers,
+    COUNT(CASE WHEN city_id IS NULL THEN 1 END) AS missing_city,
+    COUNT(DISTINCT city_id) AS unique_cities
+FROM customers;
+-- Expected: 0 missing cities, multiple unique cities
+
+-- Validation 2: Verify city-state relationships
+SELECT 
+    dc.city_name, 
+    ds.state_name,
+    COUNT(DISTINCT c.customer_id) AS customers
+FROM dim_city dc
+INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+LEFT JOIN customers c ON dc.city_id = c.city_id
+GROUP BY dc.city_name, ds.state_name
+HAVING COUNT(DISTINCT c.customer_id) = 0;
+-- Expected: Cities without customers (if any)
@@ -0,0 +1,78 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- STEP 2: Complete Geographic Risk Analysis Dashboard
+-- BUSINESS OBJECTIVE: Executive geographic crisis response tool
+-- CRISIS CONTEXT: Board needs immediate city prioritization for resource deployment
+
+SELECT     dc.city_name,
+    ds.state_name,
+    dc.tier_classification,
+    
+    -- Portfolio scale metrics
+    COUNT(DISTINCT c.customer_id) AS customers,
+    COUNT(l.loan_id) AS total_loans,
+    CONCAT('₹', ROUND(SUM(l.loan_amount) / 10000000, 2), ' Cr') AS city_portfolio,
+    
+    -- Risk assessment metrics
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        NULLIF(COUNT(l.loan_id), 0), 2
+    ) AS default_rate,
+    
+    -- Financial impact metrics
+    CONCAT('₹', 
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) / 10000000, 2
+        ), ' Cr'
+    ) AS confirmed_losses,
+    
+    -- Executive risk classification
+    CASE 
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 40
+        THEN '🔴 SHUTDOWN REQUIRED'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 25
+        THEN '🔴 CRITICAL INTERVENTION'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 15
+        THEN '🟡 HIGH PRIORITY'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 8
+        THEN '🟠 MONITOR CLOSELY'
+        ELSE '🟢 ACCEPTABLE RISK'
+    END AS executive_action,
+    
+    -- Board recommendation
+    CASE 
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 25
+        THEN 'Deploy senior collection team + halt new lending'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 15
+        THEN 'Enhanced collection resources + process audit'
+        ELSE 'Continue standard monitoring'
+    END AS board_recommendation
+
+FROM customers c
+    INNER JOIN dim_city dc 
+        ON c.city_id = dc.city_id
+    INNER JOIN dim_state ds 
+        ON dc.state_id = ds.state_id
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+GROUP BY 
+    dc.city_name, 
+    ds.state_name, 
+    dc.tier_classification
+HAVING 
+    COUNT(l.loan_id) >= 10  -- Focus on statistically significant cities
+    AND SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) > 0
+ORDER BY 
+    SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) DESC,
+    default_rate DESC
+LIMIT 15;
@@ -0,0 +1,23 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2A: Understanding city structure in normalized schema
+-- BUSINESS OBJECTIVE: Map our geographic presence before risk analysis
+-- ANALYST MINDSET: Always understand data relationships before complex queries
+
+SELECT     dc.city_name,
+    ds.state_name,
+    dc.tier_classification,
+    COUNT(DISTINCT c.customer_id) AS customer_count
+FROM dim_city dc
+    INNER JOIN dim_state ds 
+        ON dc.state_id = ds.state_id
+    INNER JOIN customers c 
+        ON dc.city_id = c.city_id
+GROUP BY 
+    dc.city_name, 
+    ds.state_name, 
+    dc.tier_classification
+ORDER BY 
+    customer_count DESC
+LIMIT 10;
@@ -0,0 +1,34 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2B: Basic city portfolio calculations with proper joins
+-- BUSINESS OBJECTIVE: Identify cities with highest portfolio concentration
+-- CRISIS CONTEXT: High exposure cities need attention even with moderate risk
+
+SELECT     dc.city_name,
+    ds.state_name,
+    dc.tier_classification,
+    COUNT(DISTINCT c.customer_id) AS customers,
+    COUNT(l.loan_id) AS total_loans,
+    SUM(l.loan_amount) AS city_portfolio_value,
+    ROUND(AVG(l.loan_amount), 0) AS avg_loan_size,
+    CONCAT('₹', ROUND(SUM(l.loan_amount) / 10000000, 2), ' Cr') AS portfolio_in_crores
+
+FROM customers c
+    INNER JOIN dim_city dc 
+        ON c.city_id = dc.city_id
+    INNER JOIN dim_state ds 
+        ON dc.state_id = ds.state_id
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+GROUP BY 
+    dc.city_name, 
+    ds.state_name, 
+    dc.tier_classification
+HAVING
+    COUNT(l.loan_id) >= 10  -- Focus on significant cities
+ORDER BY 
+    city_portfolio_value DESC
+LIMIT 10;
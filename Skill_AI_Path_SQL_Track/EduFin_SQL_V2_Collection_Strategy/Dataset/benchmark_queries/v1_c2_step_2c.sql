@@ -0,0 +1,62 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2C: City-wise risk metrics using CASE statements
+-- BUSINESS OBJECTIVE: Identify cities with highest default rates
+-- CRISIS CONTEXT: Default rates >12% indicate systematic problems
+
+SELECT     dc.city_name,
+    ds.state_name,
+    dc.tier_classification,
+    COUNT(l.loan_id) AS total_loans,
+    
+    -- Risk calculation with CASE statements
+    COUNT(
+        CASE 
+            WHEN l.loan_status = 'Defaulted' 
+            THEN 1 
+        END
+    ) AS defaulted_loans,
+    
+    ROUND(
+        COUNT(
+            CASE 
+                WHEN l.loan_status = 'Defaulted' 
+                THEN 1 
+            END
+        ) * 100.0 / NULLIF(COUNT(l.loan_id), 0), 
+        2
+    ) AS default_rate,
+    
+    -- Risk classification for management
+    CASE 
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) > 25
+        THEN '🔴 CRITICAL'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) > 15
+        THEN '🟡 HIGH RISK'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) > 8
+        THEN '🟠 MODERATE'
+        ELSE '🟢 HEALTHY'
+    END AS risk_level
+
+FROM customers c
+    INNER JOIN dim_city dc 
+        ON c.city_id = dc.city_id
+    INNER JOIN dim_state ds 
+        ON dc.state_id = ds.state_id
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+GROUP BY 
+    dc.city_name, 
+    ds.state_name, 
+    dc.tier_classification
+HAVING 
+    COUNT(l.loan_id) >= 10
+ORDER BY 
+    default_rate DESC
+LIMIT 10;
@@ -0,0 +1,61 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_2/SQL_session_1_challenge_2.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2D: Financial impact calculations in crores
+-- BUSINESS OBJECTIVE: Quantify actual monetary losses per city
+-- EXECUTIVE FOCUS: Revenue impact drives resource allocation decisions
+
+SELECT     dc.city_name,
+    ds.state_name,
+    dc.tier_classification,
+    
+    -- Portfolio and risk metrics
+    COUNT(l.loan_id) AS total_loans,
+    SUM(l.loan_amount) AS total_portfolio,
+    
+    -- Financial loss calculation
+    SUM(
+        CASE 
+            WHEN l.loan_status = 'Defaulted' 
+            THEN l.loan_amount 
+            ELSE 0 
+        END
+    ) AS total_losses,
+    
+    -- Executive-ready formatting
+    CONCAT('₹', 
+        ROUND(
+            SUM(
+                CASE 
+                    WHEN l.loan_status = 'Defaulted' 
+                    THEN l.loan_amount 
+                    ELSE 0 
+                END
+            ) / 10000000, 2
+        ), ' Cr'
+    ) AS losses_in_crores,
+    
+    -- Loss percentage of city portfolio
+    ROUND(
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) * 100.0 / 
+        NULLIF(SUM(l.loan_amount), 0), 2
+    ) AS loss_percentage
+
+FROM customers c
+    INNER JOIN dim_city dc 
+        ON c.city_id = dc.city_id
+    INNER JOIN dim_state ds 
+        ON dc.state_id = ds.state_id
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+GROUP BY 
+    dc.city_name, 
+    ds.state_name, 
+    dc.tier_classification
+HAVING 
+    SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) > 0
+ORDER BY 
+    total_losses DESC
+LIMIT 10;
@@ -0,0 +1,21 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_3/SQL_session_1_challenge_3.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check customer data completeness
+SELECT 
+    COUNT(*) AS total_customers,
+    COUNT(CASE WHEN annual_income IS NULL THEN 1 END) AS missing_income,
+    COUNT(CASE WHEN cibil_score IS NULL THEN 1 END) AS missing_cibil,
+    COUNT(CASE WHEN employment_type IS NULL THEN 1 END) AS missing_employment
+FROM customers;
+-- Expected: Low missing values for accurate segmentation
+
+-- Validation 2: Verify segmentation logic
+SELECT 
+    MIN(annual_income) AS min_income,
+    MAX(annual_income) AS max_income,
+    MIN(cibil_score) AS min_cibil,
+    MAX(cibil_score) AS max_cibil
+FROM customers
+WHERE annual_income IS NOT NULL AND cibil_score IS NOT NULL;
+-- Expected: Reasonable ranges for segmentation boundaries
@@ -0,0 +1,64 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_3/SQL_session_1_challenge_3.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3B: Income-based risk analysis with sophisticated segmentation
+-- BUSINESS OBJECTIVE: Challenge assumption that higher income = lower risk
+-- CRISIS DISCOVERY: High-income segments may have highest default rates
+
+SELECT
+    -- Income segmentation logic
+    CASE 
+        WHEN c.annual_income >= 1200000 THEN 'Ultra High (₹12L+)'
+        WHEN c.annual_income >= 800000 THEN 'High Income (₹8-12L)'
+        WHEN c.annual_income >= 500000 THEN 'Middle Income (₹5-8L)'
+        WHEN c.annual_income >= 300000 THEN 'Lower Middle (₹3-5L)'
+        ELSE 'Low Income (<₹3L)'
+    END AS income_segment,
+    
+    -- Portfolio metrics by segment
+    COUNT(DISTINCT c.customer_id) AS customers_in_segment,
+    COUNT(l.loan_id) AS total_loans,
+    CONCAT('₹', ROUND(SUM(l.loan_amount) / 10000000, 2), ' Cr') AS segment_portfolio,
+    ROUND(AVG(l.loan_amount), 0) AS avg_loan_amount,
+    
+    -- Risk analysis
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        NULLIF(COUNT(l.loan_id), 0), 2
+    ) AS segment_default_rate,
+    
+    -- Financial impact
+    CONCAT('₹', 
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) / 10000000, 2
+        ), ' Cr'
+    ) AS segment_losses,
+    
+    -- Business risk classification
+    CASE 
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 20
+        THEN '🔴 HIGH RISK SEGMENT'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) >= 12
+        THEN '🟡 MODERATE RISK'
+        ELSE '🟢 ACCEPTABLE RISK'
+    END AS segment_risk_level
+
+FROM customers c
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+    AND c.annual_income IS NOT NULL
+GROUP BY 
+    CASE 
+        WHEN c.annual_income >= 1200000 THEN 'Ultra High (₹12L+)'
+        WHEN c.annual_income >= 800000 THEN 'High Income (₹8-12L)'
+        WHEN c.annual_income >= 500000 THEN 'Middle Income (₹5-8L)'
+        WHEN c.annual_income >= 300000 THEN 'Lower Middle (₹3-5L)'
+        ELSE 'Low Income (<₹3L)'
+    END
+ORDER BY 
+    segment_default_rate DESC;
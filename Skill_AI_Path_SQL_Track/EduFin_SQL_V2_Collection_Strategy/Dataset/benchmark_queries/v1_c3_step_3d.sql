@@ -0,0 +1,59 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_3/SQL_session_1_challenge_3.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3D: Employment-based risk analysis
+-- BUSINESS OBJECTIVE: Identify employment types with unexpected default patterns
+-- HYPOTHESIS: Government employees may not be as safe as assumed
+
+SELECT
+    c.employment_type,
+    
+    -- Portfolio metrics by employment
+    COUNT(DISTINCT c.customer_id) AS customers,
+    COUNT(l.loan_id) AS total_loans,
+    ROUND(AVG(c.annual_income), 0) AS avg_income,
+    ROUND(AVG(c.cibil_score), 0) AS avg_cibil,
+    
+    -- Financial exposure
+    CONCAT('₹', ROUND(SUM(l.loan_amount) / 10000000, 2), ' Cr') AS portfolio,
+    ROUND(AVG(l.loan_amount), 0) AS avg_loan_size,
+    
+    -- Risk analysis
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaults,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        NULLIF(COUNT(l.loan_id), 0), 2
+    ) AS default_rate,
+    
+    -- Loss quantification
+    CONCAT('₹', 
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) / 10000000, 2
+        ), ' Cr'
+    ) AS losses,
+    
+    -- Employment risk assessment
+    CASE 
+        WHEN c.employment_type = 'Government' 
+             AND COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                 NULLIF(COUNT(l.loan_id), 0) > 10
+        THEN '🚨 GOVT EMPLOYEE CRISIS'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) > 20
+        THEN '🔴 EXTREME RISK'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+             NULLIF(COUNT(l.loan_id), 0) > 12
+        THEN '🟡 HIGH RISK'
+        ELSE '🟢 ACCEPTABLE'
+    END AS employment_risk_level
+
+FROM customers c
+    INNER JOIN loans l 
+        ON c.customer_id = l.customer_id
+WHERE 
+    l.disbursement_date IS NOT NULL
+    AND c.employment_type IS NOT NULL
+GROUP BY 
+    c.employment_type
+ORDER BY 
+    default_rate DESC;
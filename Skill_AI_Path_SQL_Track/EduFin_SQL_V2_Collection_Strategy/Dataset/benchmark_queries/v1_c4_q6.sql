@@ -0,0 +1,118 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- COMPLETE Session 4: Institution Partnership Performance Analysis
+-- Business Question: "Which educational partners are destroying our portfolio value?"
+-- Uses: RANK, DENSE_RANK, ROW_NUMBER, NTILE, FIRST_VALUE, LAST_VALUE, LAG, LEAD
+
+WITH institution_base AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.city_name,
+        ds.state_name,
+        ds.region,
+        dc.tier_classification,
+        i.institution_type,
+        COUNT(DISTINCT l.customer_id) AS students_funded,
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS portfolio_value,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) AS default_rate,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS total_losses
+    FROM institutions i
+        INNER JOIN dim_city dc ON i.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+    WHERE l.disbursement_date IS NOT NULL
+    GROUP BY 
+        i.institution_id, i.institution_name, dc.city_name, 
+        ds.state_name, ds.region, dc.tier_classification, i.institution_type
+    HAVING COUNT(l.loan_id) >= 10
+)
+
+SELECT 
+    -- Institution identification
+    institution_name,
+    city_name || ', ' || state_name AS location,
+    region,
+    tier_classification,
+    institution_type,
+    
+    -- Portfolio metrics
+    students_funded,
+    total_loans,
+    CONCAT('₹', ROUND(portfolio_value/10000000, 2), ' Cr') AS portfolio_value,
+    CONCAT(default_rate, '%') AS default_rate,
+    CONCAT('₹', ROUND(total_losses/10000000, 2), ' Cr') AS losses,
+    
+    -- Window Function Analytics
+    
+    -- 1. RANK() - Overall risk ranking
+    RANK() OVER (ORDER BY default_rate DESC) AS overall_risk_rank,
+    
+    -- 2. DENSE_RANK() - Tier-based risk ranking
+    DENSE_RANK() OVER (
+        PARTITION BY tier_classification 
+        ORDER BY default_rate DESC
+    ) AS tier_risk_rank,
+    
+    -- 3. ROW_NUMBER() - Unique ranking for tie-breaking
+    ROW_NUMBER() OVER (
+        ORDER BY default_rate DESC, total_losses DESC
+    ) AS termination_priority,
+    
+    -- 4. NTILE() - Quartile classification
+    NTILE(4) OVER (ORDER BY default_rate) AS risk_quartile,
+    NTILE(4) OVER (ORDER BY portfolio_value DESC) AS value_quartile,
+    
+    -- 5. FIRST_VALUE() - Best performer benchmark
+    FIRST_VALUE(default_rate) OVER (
+        PARTITION BY tier_classification 
+        ORDER BY default_rate
+    ) AS tier_best_rate,
+    
+    -- 6. LAST_VALUE() - Worst performer benchmark
+    LAST_VALUE(default_rate) OVER (
+        PARTITION BY tier_classification 
+        ORDER BY default_rate
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    ) AS tier_worst_rate,
+    
+    -- Performance gap analysis
+    ROUND(default_rate - FIRST_VALUE(default_rate) OVER (
+        PARTITION BY tier_classification 
+        ORDER BY default_rate
+    ), 2) AS gap_vs_tier_best,
+    
+    -- Executive decision framework
+    CASE 
+        WHEN RANK() OVER (ORDER BY default_rate DESC) <= 3
+             AND NTILE(4) OVER (ORDER BY portfolio_value DESC) <= 2
+        THEN 'TERMINATE IMMEDIATELY'
+        
+        WHEN RANK() OVER (ORDER BY default_rate DESC) <= 5
+        THEN 'URGENT REVIEW REQUIRED'
+        
+        WHEN NTILE(4) OVER (ORDER BY default_rate) = 1
+        THEN 'CHAMPION PARTNER'
+        
+        WHEN default_rate > 25
+        THEN 'RENEGOTIATE TERMS'
+        
+        ELSE 'STANDARD MONITORING'
+    END AS partnership_action,
+    
+    -- Partnership effectiveness score
+    ROUND(
+        GREATEST(0, 100 - (default_rate * 2)), 1
+    ) AS effectiveness_score
+
+FROM institution_base
+
+ORDER BY 
+    overall_risk_rank, 
+    total_losses DESC;
@@ -0,0 +1,57 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4A: Institution performance ranking using RANK() and DENSE_RANK()
+SELECT 
+    i.institution_name,
+    dc.city_name,
+    ds.state_name,
+    ds.region,
+    dc.tier_classification,
+    i.institution_type,
+    
+    -- Portfolio metrics
+    COUNT(DISTINCT l.customer_id) AS students_funded,
+    COUNT(l.loan_id) AS total_loans,
+    ROUND(SUM(l.loan_amount)/10000000, 2) AS portfolio_value_cr,
+    
+    -- Default analysis with conditional aggregation
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS default_rate,
+    
+    -- Window functions for competitive ranking
+    RANK() OVER (
+        PARTITION BY dc.tier_classification 
+        ORDER BY 
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id) DESC
+    ) AS risk_rank_in_tier,
+    
+    DENSE_RANK() OVER (
+        PARTITION BY ds.region 
+        ORDER BY SUM(l.loan_amount) DESC
+    ) AS portfolio_rank_in_region,
+    
+    ROW_NUMBER() OVER (
+        ORDER BY 
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id) DESC
+    ) AS overall_risk_position
+
+FROM institutions i
+    INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    INNER JOIN loans l ON i.institution_id = l.institution_id
+    
+WHERE l.disbursement_date IS NOT NULL
+    
+GROUP BY 
+    i.institution_id, i.institution_name, dc.city_name, 
+    ds.state_name, ds.region, dc.tier_classification, i.institution_type
+    
+HAVING COUNT(l.loan_id) >= 15  -- Focus on significant partnerships
+    
+ORDER BY overall_risk_position;
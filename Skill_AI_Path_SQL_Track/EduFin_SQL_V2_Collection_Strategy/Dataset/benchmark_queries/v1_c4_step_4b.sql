@@ -0,0 +1,68 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4B: Performance quartile segmentation using NTILE()
+SELECT 
+    i.institution_name,
+    dc.tier_classification,
+    i.institution_type,
+    
+    -- Core metrics
+    COUNT(l.loan_id) AS total_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS default_rate,
+    ROUND(SUM(l.loan_amount)/10000000, 2) AS portfolio_value_cr,
+    
+    -- Quartile analysis for strategic segmentation
+    NTILE(4) OVER (
+        ORDER BY 
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id)
+    ) AS risk_quartile,
+    
+    NTILE(4) OVER (
+        ORDER BY SUM(l.loan_amount) DESC
+    ) AS value_quartile,
+    
+    -- Strategic classification using CASE with quartiles
+    CASE 
+        WHEN NTILE(4) OVER (
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+        ) = 4 AND 
+        NTILE(4) OVER (ORDER BY SUM(l.loan_amount) DESC) <= 2
+        THEN 'TERMINATE: High Risk + High Value Loss'
+        
+        WHEN NTILE(4) OVER (
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+        ) = 4
+        THEN 'REVIEW: High Risk - Consider Termination'
+        
+        WHEN NTILE(4) OVER (
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+        ) = 1
+        THEN 'EXPAND: Low Risk - Increase Allocation'
+        
+        ELSE 'MONITOR: Medium Risk - Standard Terms'
+    END AS partnership_strategy
+
+FROM institutions i
+    INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    INNER JOIN loans l ON i.institution_id = l.institution_id
+    
+WHERE l.disbursement_date IS NOT NULL
+    
+GROUP BY 
+    i.institution_id, i.institution_name, 
+    dc.tier_classification, i.institution_type
+    
+HAVING COUNT(l.loan_id) >= 10
+    
+ORDER BY risk_quartile DESC, portfolio_value_cr DESC;
@@ -0,0 +1,113 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4C: Benchmark analysis using FIRST_VALUE() and LAST_VALUE()
+SELECT 
+    i.institution_name,
+    dc.tier_classification,
+    ds.region,
+    i.institution_type,
+    
+    -- Core performance metrics
+    COUNT(l.loan_id) AS total_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS default_rate,
+    
+    -- Benchmark analysis within tier groups
+    FIRST_VALUE(
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        )
+    ) OVER (
+        PARTITION BY dc.tier_classification 
+        ORDER BY 
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id)
+    ) AS tier_best_performance,
+    
+    LAST_VALUE(
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        )
+    ) OVER (
+        PARTITION BY dc.tier_classification 
+        ORDER BY 
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id)
+        ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+    ) AS tier_worst_performance,
+    
+    -- Performance gap analysis
+    ROUND(
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) - FIRST_VALUE(
+            ROUND(
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id), 2
+            )
+        ) OVER (
+            PARTITION BY dc.tier_classification 
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+        ), 2
+    ) AS performance_gap_vs_best,
+    
+    -- Strategic classification based on benchmark position
+    CASE 
+        WHEN ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) = FIRST_VALUE(
+            ROUND(
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id), 2
+            )
+        ) OVER (
+            PARTITION BY dc.tier_classification 
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+        )
+        THEN 'CHAMPION: Best in Tier'
+        
+        WHEN ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) = LAST_VALUE(
+            ROUND(
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id), 2
+            )
+        ) OVER (
+            PARTITION BY dc.tier_classification 
+            ORDER BY 
+                COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                COUNT(l.loan_id)
+            ROWS BETWEEN UNBOUNDED PRECEDING AND UNBOUNDED FOLLOWING
+        )
+        THEN 'LAGGARD: Worst in Tier'
+        
+        ELSE 'AVERAGE: Middle Performer'
+    END AS tier_position
+
+FROM institutions i
+    INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    INNER JOIN loans l ON i.institution_id = l.institution_id
+    
+WHERE l.disbursement_date IS NOT NULL
+    
+GROUP BY 
+    i.institution_id, i.institution_name, dc.tier_classification, 
+    ds.region, i.institution_type
+    
+HAVING COUNT(l.loan_id) >= 10
+    
+ORDER BY dc.tier_classification, default_rate;
@@ -0,0 +1,135 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4D: Trend analysis using LAG() and LEAD() with date partitions
+WITH monthly_performance AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.tier_classification,
+        strftime(l.disbursement_date, '%Y-%m') AS loan_month,
+        COUNT(l.loan_id) AS monthly_loans,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS monthly_defaults,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) AS monthly_default_rate,
+        ROUND(
+            AVG(COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id)) OVER (
+                PARTITION BY i.institution_id 
+                ORDER BY strftime(l.disbursement_date, '%Y-%m')
+                ROWS BETWEEN 2 PRECEDING AND CURRENT ROW
+            ), 2
+        ) AS rolling_avg_default_rate,
+        
+        -- Risk level classification
+        CASE 
+            WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                 COUNT(l.loan_id) >= 40 THEN 'High Risk'
+            WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                 COUNT(l.loan_id) >= 20 THEN 'Medium Risk'
+            ELSE 'Low Risk'
+        END AS default_risk_level
+    FROM institutions i
+        INNER JOIN dim_city dc ON i.city_id = dc.city_id
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.disbursement_date >= '2023-06-01'  -- Focus on recent 12 months
+    GROUP BY 
+        i.institution_id, i.institution_name, dc.tier_classification,
+        strftime(l.disbursement_date, '%Y-%m')
+    HAVING COUNT(l.loan_id) >= 1  -- Minimum loans for meaningful analysis
+)
+
+SELECT     institution_name,
+    tier_classification,
+    loan_month,
+    monthly_loans,
+    monthly_default_rate,
+    previous_month_default_rate,
+    three_months_ago_rate,
+    month_over_month_change,
+    three_month_trend,
+    next_month_actual_rate,
+    rolling_avg_default_rate,
+    trend_status,
+    default_risk_level
+
+FROM (
+    SELECT 
+        institution_name,
+        tier_classification,
+        loan_month,
+        monthly_loans,
+        monthly_default_rate,
+        rolling_avg_default_rate,
+        default_risk_level,
+        
+        -- Trend analysis using LAG() for previous period comparison
+        LAG(monthly_default_rate, 1) OVER (
+            PARTITION BY institution_id 
+            ORDER BY loan_month
+        ) AS previous_month_default_rate,
+        
+        LAG(monthly_default_rate, 3) OVER (
+            PARTITION BY institution_id 
+            ORDER BY loan_month
+        ) AS three_months_ago_rate,
+        
+        -- Trend calculations
+        ROUND(
+            monthly_default_rate - LAG(monthly_default_rate, 1) OVER (
+                PARTITION BY institution_id 
+                ORDER BY loan_month
+            ), 2
+        ) AS month_over_month_change,
+        
+        ROUND(
+            monthly_default_rate - LAG(monthly_default_rate, 3) OVER (
+                PARTITION BY institution_id 
+                ORDER BY loan_month
+            ), 2
+        ) AS three_month_trend,
+        
+        -- Predictive insight using LEAD() to see if deterioration continued
+        LEAD(monthly_default_rate, 1) OVER (
+            PARTITION BY institution_id 
+            ORDER BY loan_month
+        ) AS next_month_actual_rate,
+        
+        -- Trend classification for early warning
+        CASE 
+            WHEN ROUND(
+                monthly_default_rate - LAG(monthly_default_rate, 3) OVER (
+                    PARTITION BY institution_id 
+                    ORDER BY loan_month
+                ), 2
+            ) > 15
+            THEN 'CRISIS: Rapid Deterioration'
+            
+            WHEN ROUND(
+                monthly_default_rate - LAG(monthly_default_rate, 3) OVER (
+                    PARTITION BY institution_id 
+                    ORDER BY loan_month
+                ), 2
+            ) > 5
+            THEN 'WARNING: Declining Performance'
+            
+            WHEN ROUND(
+                monthly_default_rate - LAG(monthly_default_rate, 3) OVER (
+                    PARTITION BY institution_id 
+                    ORDER BY loan_month
+                ), 2
+            ) < -5
+            THEN 'IMPROVING: Performance Recovery'
+            
+            ELSE 'STABLE: Normal Variation'
+        END AS trend_status
+        
+    FROM monthly_performance
+    WHERE loan_month >= '2024-01'  -- Focus on recent 6 months for trend analysis
+) trend_analysis
+
+ORDER BY institution_name, loan_month
+LIMIT 5;
@@ -0,0 +1,107 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_4/SQL_session_1_challenge_4.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4E: Complete partnership scorecard with all window functions
+WITH institution_metrics AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.city_name,
+        ds.state_name,
+        ds.region,
+        dc.tier_classification,
+        i.institution_type,
+        
+        -- Core portfolio metrics
+        COUNT(DISTINCT l.customer_id) AS students_funded,
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS portfolio_value,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) AS default_rate,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS total_losses
+        
+    FROM institutions i
+        INNER JOIN dim_city dc ON i.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+    WHERE l.disbursement_date IS NOT NULL
+    GROUP BY 
+        i.institution_id, i.institution_name, dc.city_name, 
+        ds.state_name, ds.region, dc.tier_classification, i.institution_type
+    HAVING COUNT(l.loan_id) >= 10
+)
+
+SELECT 
+    institution_name,
+    city_name,
+    region,
+    tier_classification,
+    institution_type,
+    
+    -- Portfolio metrics formatted for executives
+    students_funded,
+    total_loans,
+    CONCAT('₹', ROUND(portfolio_value/10000000, 2), ' Cr') AS portfolio_value_cr,
+    CONCAT(default_rate, '%') AS default_rate_pct,
+    CONCAT('₹', ROUND(total_losses/10000000, 2), ' Cr') AS losses_cr,
+    
+    -- Window function analytics for comprehensive scoring
+    RANK() OVER (ORDER BY default_rate DESC) AS risk_rank,
+    RANK() OVER (ORDER BY total_losses DESC) AS loss_rank,
+    
+    DENSE_RANK() OVER (
+        PARTITION BY tier_classification 
+        ORDER BY default_rate DESC
+    ) AS tier_risk_rank,
+    
+    NTILE(4) OVER (ORDER BY default_rate) AS risk_quartile,
+    NTILE(4) OVER (ORDER BY portfolio_value DESC) AS value_quartile,
+    
+    -- Benchmark analysis
+    ROUND(
+        default_rate - FIRST_VALUE(default_rate) OVER (
+            PARTITION BY tier_classification ORDER BY default_rate
+        ), 2
+    ) AS gap_vs_tier_best,
+    
+    -- Comprehensive partnership decision using all window insights
+    CASE 
+        WHEN RANK() OVER (ORDER BY default_rate DESC) <= 3
+             AND NTILE(4) OVER (ORDER BY portfolio_value DESC) <= 2
+        THEN 'TERMINATE IMMEDIATELY: Top Risk + High Loss'
+        
+        WHEN RANK() OVER (ORDER BY default_rate DESC) <= 5
+        THEN 'URGENT REVIEW: High Risk Partnership'
+        
+        WHEN NTILE(4) OVER (ORDER BY default_rate) = 1
+             AND NTILE(4) OVER (ORDER BY portfolio_value DESC) <= 2
+        THEN 'EXPAND PARTNERSHIP: Low Risk + High Value'
+        
+        WHEN NTILE(4) OVER (ORDER BY default_rate) = 1
+        THEN 'CHAMPION PARTNER: Excellent Performance'
+        
+        WHEN default_rate > 30
+        THEN 'RENEGOTIATE TERMS: Above Crisis Threshold'
+        
+        ELSE 'STANDARD MONITORING: Average Performance'
+    END AS partnership_decision,
+    
+    -- Risk-adjusted value calculation
+    ROUND(
+        (portfolio_value - total_losses) / 10000000, 2
+    ) AS net_value_cr,
+    
+    -- Partnership effectiveness score (0-100 scale)
+    ROUND(
+        CASE 
+            WHEN default_rate = 0 THEN 100
+            ELSE GREATEST(0, 100 - (default_rate * 2))
+        END, 1
+    ) AS effectiveness_score
+
+FROM institution_metrics
+
+ORDER BY risk_rank, loss_rank;
@@ -0,0 +1,178 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_5/SQL_session_1_challenge_5.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- COMPLETE Session 5: Portfolio Performance Trends Analysis
+-- Business Question: "When did our lending standards collapse and how do we predict future failures?"
+-- Uses: YEAR, QUARTER, MONTH, DATEDIFF, DATEADD, LAG, period comparisons
+
+WITH comprehensive_time_analysis AS (
+    SELECT 
+        -- Time period extraction and grouping
+        YEAR(l.disbursement_date) AS loan_year,
+        date_part('quarter', l.disbursement_date) AS loan_quarter,
+        MONTH(l.disbursement_date) AS loan_month,
+        monthname(l.disbursement_date) AS month_name,
+        CONCAT(YEAR(l.disbursement_date), '-Q', date_part('quarter', l.disbursement_date)) AS period,
+
+        -- Seasonal classification for business context
+        CASE
+            WHEN MONTH(l.disbursement_date) IN (6, 7, 8) THEN 'Academic Start'
+            WHEN MONTH(l.disbursement_date) IN (11, 12, 1) THEN 'Mid-Academic'
+            WHEN MONTH(l.disbursement_date) IN (3, 4, 5) THEN 'Academic End'
+            ELSE 'Transition'
+        END AS academic_season,
+
+        -- Loan age analysis
+        CASE
+            WHEN date_diff('day', l.disbursement_date, localtimestamp) <= 90 THEN '0-90 Days'
+            WHEN date_diff('day', l.disbursement_date, localtimestamp) <= 180 THEN '91-180 Days'
+            WHEN date_diff('day', l.disbursement_date, localtimestamp) <= 365 THEN '181-365 Days'
+            ELSE '1+ Years'
+        END AS loan_age_group,
+
+        -- Portfolio metrics
+        COUNT(l.loan_id) AS loans_originated,
+        ROUND(SUM(l.loan_amount)/10000000, 2) AS origination_volume_cr,
+        ROUND(AVG(l.loan_amount), 0) AS avg_loan_amount,
+        ROUND(AVG(date_diff('day', l.disbursement_date, localtimestamp)), 0) AS avg_loan_age_days,
+
+        -- Performance metrics
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100/ 
+            COUNT(l.loan_id), 2
+        ) AS default_rate,
+
+        -- Mature loan analysis for fair comparison
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' 
+                         AND date_diff('day', l.disbursement_date, localtimestamp) >= 180 
+                         THEN 1 END) * 100 / 
+            NULLIF(COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 
+                                   THEN 1 END), 0), 2
+        ) AS mature_default_rate,
+
+        -- Financial impact
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END)/10000000, 2
+        ) AS period_losses_cr
+
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN institutions i ON l.institution_id = i.institution_id
+
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.disbursement_date >= '2023-01-01'
+
+    GROUP BY 
+        YEAR(l.disbursement_date),
+        date_part('quarter', l.disbursement_date),
+        MONTH(l.disbursement_date),
+        monthname(l.disbursement_date),
+        date_diff('day', l.disbursement_date, localtimestamp)
+),
+
+trend_analysis AS (
+    SELECT 
+        *,
+
+        -- Period-over-period analysis using LAG
+        LAG(default_rate, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS prev_period_rate,
+        LAG(origination_volume_cr, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS prev_volume,
+        LAG(period_losses_cr, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS prev_losses,
+
+        -- Year-over-year comparisons
+        LAG(default_rate, 4) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS yoy_default_rate,
+        LAG(origination_volume_cr, 4) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS yoy_volume,
+
+        -- Moving averages for trend smoothing
+        AVG(default_rate) OVER (
+            ORDER BY loan_year, loan_quarter, loan_month 
+            ROWS BETWEEN 3 PRECEDING AND CURRENT ROW
+        ) AS four_period_moving_avg,
+
+        -- Volatility analysis
+        stddev_samp(default_rate) OVER (
+            ORDER BY loan_year, loan_quarter, loan_month 
+            ROWS BETWEEN 3 PRECEDING AND CURRENT ROW
+        ) AS volatility_measure
+
+    FROM comprehensive_time_analysis
+)
+
+SELECT 
+    -- Time identification
+    period,
+    month_name,
+    academic_season,
+
+    -- Portfolio metrics
+    loans_originated,
+    origination_volume_cr,
+    avg_loan_amount,
+    avg_loan_age_days,
+
+    -- Performance analysis
+    default_rate,
+    mature_default_rate,
+    period_losses_cr,
+
+    -- Trend analysis
+    prev_period_rate,
+    ROUND(default_rate - prev_period_rate, 2) AS period_change,
+    ROUND(four_period_moving_avg, 2) AS trend_average,
+    ROUND(volatility_measure, 2) AS trend_volatility,
+
+    -- Year-over-year analysis
+    yoy_default_rate,
+    ROUND(default_rate - yoy_default_rate, 2) AS yoy_change,
+    ROUND(
+        CASE 
+            WHEN yoy_default_rate > 0 
+            THEN ((default_rate - yoy_default_rate) / yoy_default_rate) * 100
+            ELSE 0 
+        END, 1
+    ) AS yoy_growth_pct,
+
+    -- Predictive forecasting
+    ROUND(
+        default_rate + (default_rate - prev_period_rate), 2
+    ) AS next_period_forecast,
+
+    -- Executive classifications
+    CASE 
+        WHEN default_rate > 20 THEN 'CRISIS LEVEL'
+        WHEN default_rate > 15 THEN 'CRITICAL'
+        WHEN default_rate > 10 THEN 'WARNING'
+        WHEN default_rate > 8 THEN 'ELEVATED'
+        ELSE 'NORMAL'
+    END AS risk_level,
+
+    -- Strategic recommendations
+    CASE 
+        WHEN default_rate > 18 AND (default_rate - prev_period_rate) > 2
+        THEN 'SUSPEND NEW LENDING'
+
+        WHEN 
+            CASE 
+                WHEN yoy_default_rate > 0 
+                THEN ((default_rate - yoy_default_rate) / yoy_default_rate) * 100
+                ELSE 0 
+            END > 100 AND default_rate > 12
+        THEN 'EMERGENCY UNDERWRITING REVIEW'
+
+        WHEN (default_rate - prev_period_rate) > 3 AND four_period_moving_avg > 10
+        THEN 'BOARD ALERT - ACCELERATED CRISIS'
+
+        WHEN (default_rate - prev_period_rate) < -2 AND default_rate < 8
+        THEN 'RECOVERY TREND - CAUTIOUS EXPANSION'
+
+        ELSE 'CONTINUE MONITORING'
+    END AS strategic_action
+
+FROM trend_analysis
+
+ORDER BY 
+    loan_year DESC, 
+    loan_quarter DESC, 
+    loan_month DESC;
@@ -0,0 +1,53 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_5/SQL_session_1_challenge_5.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5A: Loan cohort analysis using date functions and period grouping
+SELECT 
+    -- Time period groupings
+    YEAR(l.disbursement_date) AS disbursement_year,
+    QUARTER(l.disbursement_date) AS disbursement_quarter,
+    CONCAT(YEAR(l.disbursement_date), '-Q', QUARTER(l.disbursement_date)) AS disbursement_quarter_label,
+    
+    -- Cohort portfolio metrics
+    COUNT(l.loan_id) AS loans_disbursed,
+    COUNT(DISTINCT l.customer_id) AS unique_customers,
+    ROUND(SUM(l.loan_amount)/10000000, 2) AS cohort_value_cr,
+    ROUND(AVG(l.loan_amount), 0) AS avg_loan_size,
+    
+    -- Performance metrics by cohort
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS cohort_default_rate,
+    
+    -- Financial impact by cohort
+    ROUND(
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END)/10000000, 2
+    ) AS cohort_losses_cr,
+    
+    -- Time-based aging analysis
+    ROUND(
+        AVG(date_diff('day', l.disbursement_date, localtimestamp)), 0
+    ) AS avg_loan_age_days,
+    
+    -- Maturity-adjusted default rate (important for fair comparison)
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 THEN 1 END), 2
+    ) AS mature_cohort_default_rate
+
+FROM loans l
+
+WHERE l.disbursement_date IS NOT NULL
+    AND l.disbursement_date >= '2023-01-01'  -- Focus on recent 2 years
+    
+GROUP BY 
+    YEAR(l.disbursement_date),
+    QUARTER(l.disbursement_date)
+    
+HAVING COUNT(l.loan_id) >= 50  -- Significant cohort size
+    
+ORDER BY 
+    disbursement_year DESC, 
+    disbursement_quarter DESC;
@@ -0,0 +1,72 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_5/SQL_session_1_challenge_5.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5B: Monthly lending patterns with seasonal analysis
+SELECT 
+    -- Time period extraction
+    MONTH(l.disbursement_date) AS disbursement_month,
+    monthname(l.disbursement_date) AS month_name,
+    
+    -- Seasonal classification
+    CASE
+        WHEN MONTH(l.disbursement_date) IN (6, 7, 8) THEN 'Academic Start'
+        WHEN MONTH(l.disbursement_date) IN (11, 12, 1) THEN 'Mid-Academic Year'
+        WHEN MONTH(l.disbursement_date) IN (3, 4, 5) THEN 'Academic End'
+        ELSE 'Transition Period'
+    END AS academic_season,
+    
+    -- Monthly portfolio metrics across all years
+    COUNT(l.loan_id) AS total_loans_all_years,
+    ROUND(AVG(l.loan_amount), 0) AS avg_monthly_loan_size,
+    ROUND(SUM(l.loan_amount)/10000000, 2) AS total_monthly_volume_cr,
+    
+    -- Risk analysis by month
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS monthly_default_rate,
+    
+    -- Mature loans only (fairer comparison)
+    COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 THEN 1 END) AS mature_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' 
+                     AND date_diff('day', l.disbursement_date, localtimestamp) >= 180 
+                     THEN 1 END) * 100.0 / 
+        NULLIF(COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 THEN 1 END), 0), 2
+    ) AS mature_monthly_default_rate,
+    
+    -- Financial impact by month
+    ROUND(
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END)/10000000, 2
+    ) AS monthly_losses_cr,
+    
+    -- Risk classification by month
+    CASE 
+        WHEN ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' 
+                         AND date_diff('day', l.disbursement_date, localtimestamp) >= 180 
+                         THEN 1 END) * 100.0 / 
+            NULLIF(COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 THEN 1 END), 0), 2
+        ) > 15 THEN 'HIGH RISK MONTH'
+        WHEN ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' 
+                         AND date_diff('day', l.disbursement_date, localtimestamp) >= 180 
+                         THEN 1 END) * 100.0 / 
+            NULLIF(COUNT(CASE WHEN date_diff('day', l.disbursement_date, localtimestamp) >= 180 THEN 1 END), 0), 2
+        ) < 8 THEN 'LOW RISK MONTH'
+        ELSE 'MEDIUM RISK MONTH'
+    END AS monthly_risk_level
+
+FROM loans l
+
+WHERE l.disbursement_date IS NOT NULL
+    AND l.disbursement_date >= '2023-01-01'
+    
+GROUP BY 
+    MONTH(l.disbursement_date),
+    monthname(l.disbursement_date)
+    
+HAVING COUNT(l.loan_id) >= 25  -- Meaningful sample size
+    
+ORDER BY disbursement_month;
@@ -0,0 +1,112 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_5/SQL_session_1_challenge_5.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5C: Period-over-period performance analysis with DATEADD and period comparisons
+WITH quarterly_metrics AS (
+    SELECT 
+        YEAR(l.disbursement_date) AS loan_year,
+        QUARTER(l.disbursement_date) AS loan_quarter,
+        CONCAT(YEAR(l.disbursement_date), '-Q', QUARTER(l.disbursement_date)) AS period,
+        
+        -- Quarter start date for period calculations
+        make_date(YEAR(l.disbursement_date), (QUARTER(l.disbursement_date) - 1) * 3 + 1, 1) AS quarter_start_date,
+        
+        COUNT(l.loan_id) AS loans_originated,
+        ROUND(SUM(l.loan_amount)/10000000, 2) AS origination_volume_cr,
+        ROUND(AVG(l.loan_amount), 0) AS avg_loan_amount,
+        
+        -- Performance metrics
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(l.loan_id), 2
+        ) AS default_rate,
+        
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END)/10000000, 2
+        ) AS losses_cr
+        
+    FROM loans l
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.disbursement_date >= '2023-01-01'
+    GROUP BY 
+        YEAR(l.disbursement_date),
+        QUARTER(l.disbursement_date)
+    HAVING COUNT(l.loan_id) >= 50
+),
+
+period_comparisons AS (
+    SELECT 
+        *,
+        -- Previous period metrics using LAG with 1 quarter offset
+        LAG(loans_originated, 1) OVER (ORDER BY loan_year, loan_quarter) AS prev_quarter_loans,
+        LAG(origination_volume_cr, 1) OVER (ORDER BY loan_year, loan_quarter) AS prev_quarter_volume,
+        LAG(default_rate, 1) OVER (ORDER BY loan_year, loan_quarter) AS prev_quarter_default_rate,
+        LAG(losses_cr, 1) OVER (ORDER BY loan_year, loan_quarter) AS prev_quarter_losses,
+        
+        -- Year-over-year metrics using LAG with 4 quarter offset
+        LAG(loans_originated, 4) OVER (ORDER BY loan_year, loan_quarter) AS yoy_loans,
+        LAG(default_rate, 4) OVER (ORDER BY loan_year, loan_quarter) AS yoy_default_rate,
+        LAG(losses_cr, 4) OVER (ORDER BY loan_year, loan_quarter) AS yoy_losses
+        
+    FROM quarterly_metrics
+)
+
+SELECT 
+    period,
+    loans_originated,
+    origination_volume_cr,
+    default_rate,
+    losses_cr,
+    
+    -- Quarter-over-quarter analysis
+    prev_quarter_loans,
+    prev_quarter_default_rate,
+    ROUND(default_rate - prev_quarter_default_rate, 2) AS qoq_default_change,
+    ROUND(
+        CASE 
+            WHEN prev_quarter_default_rate > 0 
+            THEN ((default_rate - prev_quarter_default_rate) / prev_quarter_default_rate) * 100
+            ELSE 0 
+        END, 1
+    ) AS qoq_default_rate_growth_pct,
+    
+    -- Year-over-year analysis
+    yoy_default_rate,
+    ROUND(default_rate - yoy_default_rate, 2) AS yoy_default_change,
+    ROUND(
+        CASE 
+            WHEN yoy_default_rate > 0 
+            THEN ((default_rate - yoy_default_rate) / yoy_default_rate) * 100
+            ELSE 0 
+        END, 1
+    ) AS yoy_default_rate_growth_pct,
+    
+    -- Trend classification
+    CASE 
+        WHEN default_rate - prev_quarter_default_rate > 3 
+        THEN 'DETERIORATING RAPIDLY'
+        WHEN default_rate - prev_quarter_default_rate > 1 
+        THEN 'DETERIORATING'
+        WHEN default_rate - prev_quarter_default_rate < -1 
+        THEN 'IMPROVING'
+        ELSE 'STABLE'
+    END AS trend_direction,
+    
+    -- Crisis acceleration analysis
+    CASE 
+        WHEN yoy_default_rate > 0 AND 
+             ((default_rate - yoy_default_rate) / yoy_default_rate) * 100 > 100
+        THEN 'CRISIS ACCELERATING: >100% YoY Growth'
+        WHEN yoy_default_rate > 0 AND 
+             ((default_rate - yoy_default_rate) / yoy_default_rate) * 100 > 50
+        THEN 'MAJOR DETERIORATION: >50% YoY Growth'
+        WHEN yoy_default_rate > 0 AND 
+             ((default_rate - yoy_default_rate) / yoy_default_rate) * 100 > 25
+        THEN 'SIGNIFICANT DECLINE: >25% YoY Growth'
+        ELSE 'NORMAL VARIATION'
+    END AS crisis_severity
+
+FROM period_comparisons
+
+ORDER BY loan_year DESC, loan_quarter DESC;
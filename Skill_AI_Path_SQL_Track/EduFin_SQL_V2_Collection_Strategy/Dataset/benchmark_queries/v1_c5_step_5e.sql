@@ -0,0 +1,117 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V1_Portfolio_Risk_Analysis/SQL_sessions_1_to_5/SQL_session_V1_Challenge_5/SQL_session_1_challenge_5.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5E: Comprehensive time intelligence dashboard with forecasting
+WITH time_series_base AS (
+    SELECT 
+        YEAR(l.disbursement_date) AS loan_year,
+        date_part('quarter', l.disbursement_date) AS loan_quarter,
+        MONTH(l.disbursement_date) AS loan_month,
+        CONCAT(YEAR(l.disbursement_date), '-Q', date_part('quarter', l.disbursement_date)) AS period,
+        
+        COUNT(l.loan_id) AS loans,
+        ROUND(SUM(l.loan_amount)/10000000, 2) AS volume_cr,
+        ROUND(AVG(l.loan_amount), 0) AS avg_loan_size,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaults,
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100 / 
+            COUNT(l.loan_id), 2
+        ) AS default_rate,
+        ROUND(
+            SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END)/10000000, 2
+        ) AS losses_cr,
+        
+        ROUND(AVG(date_diff('day', l.disbursement_date, localtimestamp)), 0) AS avg_age_days
+    FROM loans l
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.disbursement_date >= '2023-01-01'
+    GROUP BY 
+        YEAR(l.disbursement_date),
+        date_part('quarter', l.disbursement_date),
+        MONTH(l.disbursement_date)
+    HAVING COUNT(l.loan_id) >= 25
+),
+
+predictive_analysis AS (
+    SELECT 
+        *,
+        LAG(default_rate, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS prev_period_rate,
+        LAG(default_rate, 4) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS yoy_rate,
+
+        AVG(default_rate) OVER (
+            ORDER BY loan_year, loan_quarter, loan_month 
+            ROWS BETWEEN 3 PRECEDING AND CURRENT ROW
+        ) AS four_period_avg,
+
+        default_rate - LAG(default_rate, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month) AS period_change,
+
+        default_rate + (
+            default_rate - LAG(default_rate, 1) OVER (ORDER BY loan_year, loan_quarter, loan_month)
+        ) AS projected_next_period_rate
+    FROM time_series_base
+)
+
+SELECT 
+    period,
+    loans,
+    volume_cr,
+    default_rate,
+    losses_cr,
+    avg_age_days,
+    
+    prev_period_rate,
+    ROUND(period_change, 2) AS period_change,
+    ROUND(four_period_avg, 2) AS trend_average,
+    
+    yoy_rate,
+    ROUND(default_rate - yoy_rate, 2) AS yoy_change,
+    ROUND(
+        CASE 
+            WHEN yoy_rate > 0 
+            THEN ((default_rate - yoy_rate) / yoy_rate) * 100
+            ELSE 0 
+        END, 1
+    ) AS yoy_growth_pct,
+    
+    ROUND(projected_next_period_rate, 2) AS next_period_forecast,
+    ROUND(projected_next_period_rate * loans * 0.01, 0) AS forecasted_defaults,
+    ROUND(projected_next_period_rate * volume_cr * 0.01, 2) AS forecasted_losses_cr,
+    
+    CASE 
+        WHEN default_rate > 20 THEN 'CRISIS LEVEL'
+        WHEN default_rate > 15 THEN 'CRITICAL'
+        WHEN default_rate > 10 THEN 'WARNING'
+        WHEN default_rate > 8 THEN 'ELEVATED'
+        ELSE 'NORMAL'
+    END AS current_status,
+    
+    CASE 
+        WHEN projected_next_period_rate > 25 THEN 'IMMINENT CRISIS'
+        WHEN projected_next_period_rate > 20 THEN 'CRISIS APPROACHING'
+        WHEN projected_next_period_rate > 15 THEN 'DETERIORATION LIKELY'
+        WHEN period_change < 0 THEN 'IMPROVEMENT TREND'
+        ELSE 'STABLE PROJECTION'
+    END AS forecast_status,
+    
+    CASE 
+        WHEN projected_next_period_rate > 22 AND period_change > 2
+        THEN 'SUSPEND NEW LENDING IMMEDIATELY'
+        WHEN default_rate > 15 AND 
+             CASE 
+                 WHEN yoy_rate > 0 
+                 THEN ((default_rate - yoy_rate) / yoy_rate) * 100
+                 ELSE 0 
+             END > 50
+        THEN 'EMERGENCY UNDERWRITING REVIEW'
+        WHEN period_change > 3 AND four_period_avg > 12
+        THEN 'ACCELERATED DETERIORATION - BOARD ALERT'
+        WHEN period_change < -2 AND default_rate < 10
+        THEN 'RECOVERY CONFIRMED - CAUTIOUS EXPANSION'
+        ELSE 'CONTINUE CURRENT MONITORING'
+    END AS strategic_recommendation
+
+FROM predictive_analysis
+
+WHERE loan_year >= 2023
+
+ORDER BY loan_year DESC, loan_quarter DESC, loan_month DESC;
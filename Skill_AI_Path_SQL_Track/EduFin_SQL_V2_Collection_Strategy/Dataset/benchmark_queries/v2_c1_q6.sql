@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Data integrity cross-check
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN disbursement_date IS NOT NULL THEN 1 END) AS valid_disbursements,
+    COUNT(CASE WHEN customer_id IN (SELECT customer_id FROM customers) THEN 1 END) AS valid_customers
+FROM loans;
+-- Expected: All counts should be equal for perfect data integrity
@@ -0,0 +1,15 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Partnership consistency check
+SELECT 
+    i.institution_name,
+    COUNT(l.loan_id) AS loan_count,
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaults,
+    ROUND(((COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0) / NULLIF(COUNT(l.loan_id), 0)), 2) AS default_rate
+FROM institutions i
+LEFT JOIN loans l ON i.institution_id = l.institution_id
+GROUP BY i.institution_name
+HAVING COUNT(l.loan_id) > 50
+ORDER BY default_rate DESC;
+-- Expected: Identify institutions with >20% default rates
@@ -0,0 +1,39 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2A: Comprehensive Data Integrity Analysis
+-- BUSINESS OBJECTIVE: Identify data quality gaps that allowed crisis to develop
+-- PREVENTION FOCUS: Find systematic issues, not isolated incidents
+
+SELECT 
+    -- Referential integrity assessment
+    COUNT(DISTINCT l.customer_id) AS loans_with_customers,
+    COUNT(DISTINCT c.customer_id) AS total_customers,
+    
+    -- Orphaned data detection
+    COUNT(CASE WHEN c.customer_id IS NULL THEN 1 END) AS orphaned_loans,
+    
+    -- Date consistency validation
+    COUNT(CASE WHEN l.disbursement_date > l.application_date THEN 1 END) AS valid_date_sequence,
+    COUNT(CASE WHEN l.disbursement_date <= l.application_date THEN 1 END) AS invalid_date_sequence,
+    
+    -- Business logic violations
+    COUNT(CASE WHEN l.loan_amount <= 0 THEN 1 END) AS invalid_amounts,
+    COUNT(CASE WHEN l.loan_amount > 2500000 THEN 1 END) AS excessive_amounts,
+    
+    -- Critical field completeness
+    COUNT(CASE WHEN l.loan_status IS NULL THEN 1 END) AS missing_status,
+    
+    -- Data quality score calculation
+    ROUND(
+        (COUNT(*) - 
+         COUNT(CASE WHEN c.customer_id IS NULL THEN 1 END) -
+         COUNT(CASE WHEN l.disbursement_date <= l.application_date THEN 1 END) -
+         COUNT(CASE WHEN l.loan_amount <= 0 THEN 1 END) -
+         COUNT(CASE WHEN l.loan_status IS NULL THEN 1 END)
+        ) * 100.0 / COUNT(*),
+        2
+    ) AS data_quality_score_percent
+
+FROM loans l
+LEFT JOIN customers c ON l.customer_id = c.customer_id;
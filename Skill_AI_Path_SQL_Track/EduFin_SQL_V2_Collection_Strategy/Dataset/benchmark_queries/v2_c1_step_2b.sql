@@ -0,0 +1,77 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2B: Manual Process Dependency Risk Assessment
+-- BUSINESS OBJECTIVE: Identify high-touch processes creating error opportunities
+-- AUTOMATION TARGET: Find manual processes to automate for crisis prevention
+
+WITH process_analysis AS (
+    SELECT 
+        l.loan_id,
+        l.customer_id,
+        l.institution_id,
+        l.loan_status,
+        l.disbursement_date,
+        l.application_date,
+        
+        -- Processing time analysis (manual vs automated indicators)
+        date_diff('day', l.application_date, l.disbursement_date) AS processing_days,
+        
+        -- Risk categorization based on processing patterns
+        CASE 
+            WHEN date_diff('day', l.application_date, l.disbursement_date) <= 7 
+            THEN 'Automated_Fast'
+            WHEN date_diff('day', l.application_date, l.disbursement_date) <= 15 
+            THEN 'Standard_Process'
+            WHEN date_diff('day', l.application_date, l.disbursement_date) <= 30 
+            THEN 'Manual_Review'
+            ELSE 'High_Touch_Manual'
+        END AS process_category,
+        
+        -- Error probability indicators
+        CASE 
+            WHEN l.loan_status IN ('Defaulted', 'Overdue') THEN 1 
+            ELSE 0 
+        END AS is_problematic,
+        
+        l.loan_amount
+        
+    FROM loans l
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.application_date IS NOT NULL
+)
+SELECT 
+    process_category,
+    COUNT(*) AS loan_count,
+    
+    -- Error rate by process type
+    SUM(is_problematic) AS problematic_loans,
+    ROUND(
+        SUM(is_problematic) * 100.0 / COUNT(*), 
+        2
+    ) AS error_rate_percent,
+    
+    -- Financial impact by process type
+    SUM(CASE WHEN is_problematic = 1 THEN loan_amount ELSE 0 END) AS total_risk_amount,
+    ROUND(
+        SUM(CASE WHEN is_problematic = 1 THEN loan_amount ELSE 0 END) / 10000000.0, 
+        2
+    ) AS risk_amount_crores,
+    
+    -- Process efficiency metrics
+    AVG(processing_days) AS avg_processing_days,
+    
+    -- Automation priority assessment
+    CASE 
+        WHEN SUM(is_problematic) * 100.0 / COUNT(*) > 20 
+        THEN '🚨 IMMEDIATE AUTOMATION'
+        WHEN SUM(is_problematic) * 100.0 / COUNT(*) > 15 
+        THEN '⚠️ HIGH PRIORITY AUTOMATION'
+        WHEN SUM(is_problematic) * 100.0 / COUNT(*) > 10 
+        THEN '🔧 STANDARD AUTOMATION'
+        ELSE '✅ ACCEPTABLE MANUAL'
+    END AS automation_priority
+
+FROM process_analysis
+GROUP BY process_category
+ORDER BY error_rate_percent DESC;
@@ -0,0 +1,70 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2C: Partnership Risk and Accountability Assessment
+-- BUSINESS OBJECTIVE: Identify institutional partners driving systematic issues
+-- ACCOUNTABILITY FOCUS: Quantify partner-specific contributions to crisis
+
+WITH partnership_performance AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        i.institution_type,
+        dc.tier_classification AS tier,   -- now pulling from dim_city
+        
+        -- Volume and scale metrics
+        COUNT(l.loan_id) AS total_loans,
+        SUM(COALESCE(l.loan_amount, 0)) AS total_disbursed,
+        
+        -- Risk and quality metrics
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN 1 ELSE 0 END) AS defaulted_loans,
+        SUM(CASE WHEN l.loan_status = 'Overdue' THEN 1 ELSE 0 END) AS overdue_loans,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN COALESCE(l.loan_amount, 0) ELSE 0 END) AS defaulted_amount,
+        
+        -- Data quality indicators
+        SUM(CASE WHEN l.disbursement_date IS NULL THEN 1 ELSE 0 END) AS missing_disbursement_dates,
+        SUM(CASE WHEN l.loan_amount <= 0 OR l.loan_amount > 2500000 THEN 1 ELSE 0 END) AS invalid_amounts
+        
+    FROM institutions i
+    LEFT JOIN loans l ON i.institution_id = l.institution_id
+    LEFT JOIN customers c ON l.customer_id = c.customer_id
+    LEFT JOIN dim_city dc ON c.city_id = dc.city_id
+    GROUP BY i.institution_id, i.institution_name, i.institution_type, dc.tier_classification
+)
+SELECT 
+    institution_name,
+    institution_type,
+    tier,
+    total_loans,
+    
+    -- Risk assessment metrics
+    ROUND(defaulted_loans * 100.0 / NULLIF(total_loans, 0), 2) AS default_rate_percent,
+    ROUND((defaulted_loans + overdue_loans) * 100.0 / NULLIF(total_loans, 0), 2) AS total_risk_percent,
+    
+    -- Financial impact
+    ROUND(defaulted_amount / 10000000.0, 2) AS defaulted_crores,
+    
+    -- Data quality assessment
+    ROUND((missing_disbursement_dates + invalid_amounts) * 100.0 / NULLIF(total_loans, 0), 2) AS data_quality_issues_percent,
+    
+    -- Partnership accountability classification
+    CASE 
+        WHEN defaulted_loans * 100.0 / NULLIF(total_loans, 0) > 25 THEN 'TERMINATE PARTNERSHIP'
+        WHEN defaulted_loans * 100.0 / NULLIF(total_loans, 0) > 18 THEN 'PROBATION - IMMEDIATE REVIEW'
+        WHEN defaulted_loans * 100.0 / NULLIF(total_loans, 0) > 12 THEN 'ENHANCED MONITORING'
+        WHEN defaulted_loans * 100.0 / NULLIF(total_loans, 0) > 8 THEN 'STANDARD MONITORING'
+        ELSE 'PREFERRED PARTNER'
+    END AS partnership_status,
+    
+    -- ROI and value assessment
+    CASE 
+        WHEN total_loans >= 100 AND defaulted_loans * 100.0 / NULLIF(total_loans, 0) <= 8 THEN 'HIGH VALUE PARTNER'
+        WHEN total_loans >= 50 AND defaulted_loans * 100.0 / NULLIF(total_loans, 0) <= 12 THEN 'VALUABLE PARTNER'
+        WHEN total_loans >= 20 AND defaulted_loans * 100.0 / NULLIF(total_loans, 0) <= 15 THEN 'STANDARD PARTNER'
+        ELSE 'LOW VALUE PARTNER'
+    END AS business_value
+
+FROM partnership_performance
+WHERE total_loans > 0
+ORDER BY default_rate_percent DESC, defaulted_crores DESC
+limit 10;
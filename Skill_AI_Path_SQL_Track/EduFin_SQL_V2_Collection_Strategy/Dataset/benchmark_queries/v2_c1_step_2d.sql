@@ -0,0 +1,89 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2D: Geographic Risk Concentration Assessment
+-- BUSINESS OBJECTIVE: Identify systematic regional issues enabling crisis development
+-- REGIONAL INTELLIGENCE: Find geographic patterns requiring operational changes
+
+WITH geographic_risk AS (
+    SELECT 
+        ds.state_name,
+        dc.city_name,
+        dc.tier_classification,
+        
+        -- Portfolio concentration metrics
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS total_exposure,
+        
+        -- Risk concentration analysis
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+        COUNT(CASE WHEN l.loan_status = 'Overdue' THEN 1 END) AS overdue_count,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS defaulted_amount,
+        
+        -- Customer concentration indicators
+        COUNT(DISTINCT c.customer_id) AS unique_customers,
+        
+        -- Economic correlation indicators
+        AVG(c.cibil_score) AS avg_cibil_score,
+        AVG(c.annual_income) AS avg_customer_income   -- <- fixed column name
+        
+    FROM dim_state ds
+        INNER JOIN dim_city dc ON ds.state_id = dc.state_id
+        INNER JOIN customers c ON dc.city_id = c.city_id
+        INNER JOIN loans l ON c.customer_id = l.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+    GROUP BY ds.state_name, dc.city_name, dc.tier_classification
+)
+SELECT 
+    state_name,
+    city_name,
+    tier_classification,
+    total_loans,
+    
+    -- Risk assessment calculations
+    ROUND(
+        defaulted_count * 100.0 / NULLIF(total_loans, 0), 
+        2
+    ) AS default_rate_percent,
+    
+    ROUND(
+        (defaulted_count + overdue_count) * 100.0 / NULLIF(total_loans, 0), 
+        2
+    ) AS total_risk_percent,
+    
+    -- Financial exposure assessment
+    ROUND(defaulted_amount / 10000000.0, 2) AS defaulted_crores,
+    ROUND(total_exposure / 10000000.0, 2) AS total_exposure_crores,
+    
+    -- Portfolio health indicators
+    ROUND(avg_cibil_score, 0) AS avg_cibil,
+    ROUND(avg_customer_income / 100000.0, 1) AS avg_income_lakhs,
+    
+    -- Geographic risk classification
+    CASE 
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 25 
+        THEN 'CRISIS ZONE - HALT OPERATIONS'
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 18 
+        THEN 'HIGH RISK - ENHANCED CONTROLS'
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 12 
+        THEN 'ELEVATED RISK - MONITORING'
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 8 
+        THEN 'STANDARD RISK'
+        ELSE 'LOW RISK MARKET'
+    END AS geographic_risk_classification,
+    
+    -- Operational recommendation
+    CASE 
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 25 
+        THEN 'Immediate operational shutdown and investigation'
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 18 
+        THEN 'Deploy dedicated recovery team and process audit'
+        WHEN defaulted_count * 100.0 / NULLIF(total_loans, 0) > 12 
+        THEN 'Enhanced monitoring and preventive measures'
+        ELSE 'Continue standard operations with regular monitoring'
+    END AS operational_recommendation
+
+FROM geographic_risk
+WHERE total_loans >= 20  -- Focus on material geographic concentrations
+ORDER BY default_rate_percent DESC, defaulted_crores DESC
+LIMIT 10;
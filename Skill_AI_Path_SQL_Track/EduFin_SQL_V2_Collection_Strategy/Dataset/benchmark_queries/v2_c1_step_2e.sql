@@ -0,0 +1,86 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_1/SQL_V2_challenge_1.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2E: Comprehensive Crisis Prevention Dashboard 
+-- BUSINESS OBJECTIVE: Transform crisis insights into ongoing prevention monitoring system 
+-- STRATEGIC FRAMEWORK: Board-level prevention metrics for sustained operational excellence
+
+WITH totals AS (
+    SELECT
+        COUNT(*) AS total_loans,
+        SUM(CASE WHEN loan_status = 'Defaulted' THEN 1 ELSE 0 END) AS total_defaults
+    FROM loans
+),
+
+prevention_metrics AS (
+    SELECT
+        -- Data quality prevention indicators
+        (SELECT COUNT(*) FROM loans WHERE disbursement_date IS NULL OR loan_status IS NULL) AS data_quality_issues,
+
+        (SELECT COUNT(*) FROM loans
+         WHERE date_diff('day', application_date, disbursement_date) > 30
+        ) AS manual_process_loans,
+
+        -- Count of distinct partner institutions whose default rate > 15%
+        (SELECT COUNT(*) FROM (
+            SELECT l.institution_id
+            FROM loans l
+            GROUP BY l.institution_id
+            HAVING SUM(CASE WHEN l.loan_status = 'Defaulted' THEN 1 ELSE 0 END) * 100.0
+                   / NULLIF(COUNT(*), 0) > 15
+        ) t) AS high_risk_partners,
+
+        -- Count of city-state pairs that individually account for >5% of all defaults
+        (SELECT COUNT(*) FROM (
+            SELECT ds.state_name, dc.city_name, COUNT(*) AS cnt
+            FROM loans l
+            INNER JOIN customers c ON l.customer_id = c.customer_id
+            INNER JOIN dim_city dc ON c.city_id = dc.city_id
+            INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+            WHERE l.loan_status = 'Defaulted'
+            GROUP BY ds.state_name, dc.city_name
+            HAVING COUNT(*) * 100.0 / NULLIF((SELECT COUNT(*) FROM loans WHERE loan_status = 'Defaulted'), 0) > 5
+        ) t) AS crisis_zones,
+
+        (SELECT total_loans FROM totals) AS total_loans,
+        (SELECT total_defaults FROM totals) AS total_defaults
+
+    FROM totals
+)
+
+SELECT
+    ROUND(data_quality_issues * 100.0 / NULLIF(total_loans, 0), 2) AS data_quality_risk_percent,
+    ROUND(manual_process_loans * 100.0 / NULLIF(total_loans, 0), 2)     AS manual_dependency_percent,
+    high_risk_partners                                                     AS partners_requiring_intervention,
+    crisis_zones                                                           AS geographic_crisis_zones,
+
+    CASE
+        WHEN data_quality_issues * 100.0 / NULLIF(total_loans, 0) <= 2
+         AND manual_process_loans * 100.0 / NULLIF(total_loans, 0) <= 15
+         AND high_risk_partners <= 2
+         AND crisis_zones <= 1 THEN 'EXCELLENT - CRISIS PREVENTED'
+
+        WHEN data_quality_issues * 100.0 / NULLIF(total_loans, 0) <= 5
+         AND manual_process_loans * 100.0 / NULLIF(total_loans, 0) <= 25
+         AND high_risk_partners <= 5
+         AND crisis_zones <= 3 THEN 'GOOD - MONITORING REQUIRED'
+
+        WHEN data_quality_issues * 100.0 / NULLIF(total_loans, 0) <= 10
+         AND manual_process_loans * 100.0 / NULLIF(total_loans, 0) <= 40
+         AND high_risk_partners <= 10
+         AND crisis_zones <= 5 THEN 'CAUTION - PREVENTIVE ACTION NEEDED'
+
+        ELSE 'DANGER - CRISIS IMMINENT'
+    END AS prevention_framework_status,
+
+    CASE
+        WHEN data_quality_issues * 100.0 / NULLIF(total_loans, 0) > 10 THEN 'Implement automated data validation + ETL monitoring'
+        WHEN manual_process_loans * 100.0 / NULLIF(total_loans, 0) > 40 THEN 'Deploy process automation + workflow optimization'
+        WHEN high_risk_partners > 10 THEN 'Execute partner performance improvement program'
+        WHEN crisis_zones > 5 THEN 'Regional operational restructuring required'
+        ELSE 'Continue enhanced monitoring with quarterly reviews'
+    END AS priority_prevention_action,
+
+    ROUND((data_quality_issues + manual_process_loans) * 7.6 / 100000.0, 2) AS potential_savings_crores
+
+FROM prevention_metrics;
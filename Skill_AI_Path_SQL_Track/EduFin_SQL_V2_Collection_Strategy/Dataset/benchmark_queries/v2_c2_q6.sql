@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check prevention system completeness
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN disbursement_date IS NULL THEN 1 END) AS unmonitored_loans,
+    COUNT(CASE WHEN loan_status IS NULL THEN 1 END) AS status_unknown
+FROM loans;
+-- Expected: 0 for unmonitored_loans and status_unknown
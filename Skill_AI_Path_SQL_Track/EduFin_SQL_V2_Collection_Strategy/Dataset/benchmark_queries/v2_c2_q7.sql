@@ -0,0 +1,9 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Verify alert thresholds
+SELECT 
+    ROUND(COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 2) AS calculated_default_rate
+FROM loans 
+WHERE disbursement_date IS NOT NULL;
+-- Expected: Should match dashboard default rate
@@ -0,0 +1,53 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2A: Daily Portfolio Reconciliation Framework
+-- BUSINESS OBJECTIVE: Automated daily checks to prevent accumulation of discrepancies
+-- PREVENTION FOCUS: Catch issues before they become crises
+
+WITH daily_reconciliation AS (
+    SELECT 
+        CAST(localtimestamp AS DATE) AS reconciliation_date,
+        
+        -- Portfolio value validation
+        SUM(loan_amount) AS current_portfolio_value,
+        COUNT(*) AS total_active_loans,
+        
+        -- Status distribution validation
+        COUNT(CASE WHEN loan_status = 'Active' THEN 1 END) AS active_count,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+        COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END) AS overdue_count,
+        
+        -- Business rule validation
+        COUNT(CASE WHEN loan_amount < 50000 OR loan_amount > 2500000 
+                   THEN 1 END) AS amount_violations,
+        COUNT(CASE WHEN disbursement_date > localtimestamp 
+                   THEN 1 END) AS future_date_violations,
+        
+        -- Data quality checks
+        COUNT(CASE WHEN customer_id IS NULL OR institution_id IS NULL 
+                   THEN 1 END) AS missing_references
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+),
+validation_rules AS (
+    SELECT 
+        *,
+        -- Automated alert triggers
+        CASE 
+            WHEN amount_violations > 0 THEN '🚨 CRITICAL: Invalid loan amounts detected'
+            WHEN future_date_violations > 0 THEN '⚠️ WARNING: Future disbursement dates'
+            WHEN missing_references > 0 THEN '🔍 DATA QUALITY: Missing customer/institution refs'
+            ELSE '✅ HEALTHY: All validation checks passed'
+        END AS daily_health_status,
+        
+        -- Default rate monitoring
+        ROUND(defaulted_count * 100.0 / NULLIF(total_active_loans, 0), 2) AS current_default_rate,
+        
+        -- Portfolio growth validation
+        ROUND(current_portfolio_value / 10000000.0, 2) AS portfolio_crores
+        
+    FROM daily_reconciliation
+)
+SELECT * FROM validation_rules;
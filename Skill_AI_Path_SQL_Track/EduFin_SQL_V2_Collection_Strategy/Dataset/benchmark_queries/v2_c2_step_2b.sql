@@ -0,0 +1,104 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2B: Comprehensive Data Quality Monitoring System
+-- BUSINESS OBJECTIVE: Real-time data quality scoring and violation detection
+-- PREVENTION FOCUS: Maintain 99.5% data quality standards
+
+WITH data_quality_metrics AS (
+    SELECT 
+        -- Completeness metrics
+        COUNT(*) AS total_records,
+        COUNT(CASE WHEN customer_id IS NULL THEN 1 END) AS missing_customer_id,
+        COUNT(CASE WHEN loan_amount IS NULL THEN 1 END) AS missing_loan_amount,
+        COUNT(CASE WHEN disbursement_date IS NULL THEN 1 END) AS missing_disbursement_date,
+        COUNT(CASE WHEN loan_status IS NULL THEN 1 END) AS missing_loan_status,
+        
+        -- Validity metrics
+        COUNT(CASE WHEN loan_amount <= 0 THEN 1 END) AS invalid_amounts,
+        COUNT(CASE WHEN loan_amount < 50000 OR loan_amount > 2500000 
+                   THEN 1 END) AS out_of_range_amounts,
+        COUNT(CASE WHEN disbursement_date > localtimestamp 
+                   THEN 1 END) AS future_disbursements,
+        COUNT(CASE WHEN disbursement_date < '2020-01-01' 
+                   THEN 1 END) AS historical_disbursements,
+        
+        -- Consistency metrics
+        COUNT(CASE WHEN loan_status NOT IN ('Active', 'Closed', 'Defaulted', 'Overdue') 
+                   THEN 1 END) AS invalid_status_values,
+        
+        -- Referential integrity checks
+        (SELECT COUNT(l.customer_id) 
+         FROM loans l 
+         LEFT JOIN customers c ON l.customer_id = c.customer_id 
+         WHERE c.customer_id IS NULL) AS orphaned_customer_refs,
+        
+        (SELECT COUNT(l.institution_id) 
+         FROM loans l 
+         LEFT JOIN institutions i ON l.institution_id = i.institution_id 
+         WHERE i.institution_id IS NULL) AS orphaned_institution_refs
+         
+    FROM loans
+),
+quality_scoring AS (
+    SELECT 
+        *,
+        -- Calculate quality dimensions
+        ROUND(
+            (total_records - missing_customer_id - missing_loan_amount - 
+             missing_disbursement_date - missing_loan_status) * 100.0 / 
+            NULLIF(total_records, 0), 2
+        ) AS completeness_score,
+        
+        ROUND(
+            (total_records - invalid_amounts - out_of_range_amounts - 
+             future_disbursements - historical_disbursements) * 100.0 / 
+            NULLIF(total_records, 0), 2
+        ) AS validity_score,
+        
+        ROUND(
+            (total_records - invalid_status_values) * 100.0 / 
+            NULLIF(total_records, 0), 2
+        ) AS consistency_score,
+        
+        ROUND(
+            (total_records - orphaned_customer_refs - orphaned_institution_refs) * 100.0 / 
+            NULLIF(total_records, 0), 2
+        ) AS integrity_score
+        
+    FROM data_quality_metrics
+)
+SELECT 
+    CAST(localtimestamp AS DATE) AS assessment_date,
+    total_records,
+    completeness_score,
+    validity_score,
+    consistency_score,
+    integrity_score,
+    
+    -- Overall data quality score
+    ROUND(
+        (completeness_score + validity_score + consistency_score + integrity_score) / 4.0, 2
+    ) AS overall_quality_score,
+    
+    -- Quality status assessment
+    CASE 
+        WHEN ROUND((completeness_score + validity_score + consistency_score + integrity_score) / 4.0, 2) >= 99.5 
+        THEN '🟢 EXCELLENT: Industry leading quality'
+        WHEN ROUND((completeness_score + validity_score + consistency_score + integrity_score) / 4.0, 2) >= 95.0 
+        THEN '🟡 GOOD: Minor improvements needed'
+        WHEN ROUND((completeness_score + validity_score + consistency_score + integrity_score) / 4.0, 2) >= 90.0 
+        THEN '🟠 MODERATE: Action required'
+        ELSE '🔴 CRITICAL: Immediate intervention needed'
+    END AS quality_status,
+    
+    -- Recommended actions
+    CASE 
+        WHEN completeness_score < 95 THEN 'Enhance mandatory field validation'
+        WHEN validity_score < 95 THEN 'Strengthen business rule enforcement'
+        WHEN consistency_score < 95 THEN 'Standardize data entry processes'
+        WHEN integrity_score < 95 THEN 'Fix referential integrity constraints'
+        ELSE 'Continue standard monitoring'
+    END AS priority_action
+    
+FROM quality_scoring;
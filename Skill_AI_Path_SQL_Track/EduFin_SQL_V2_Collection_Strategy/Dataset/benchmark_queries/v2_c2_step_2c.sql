@@ -0,0 +1,121 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2C: Comprehensive Business Rule Validation Engine
+-- BUSINESS OBJECTIVE: Automated enforcement of all business rules and regulations
+-- PREVENTION FOCUS: Stop invalid transactions before they impact portfolio
+
+WITH business_rule_validation AS (
+    SELECT 
+        l.loan_id,
+        l.customer_id,
+        l.loan_amount,
+        l.loan_status,
+        l.disbursement_date,
+        c.annual_income,
+        FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) AS customer_age,
+        c.employment_type,
+        
+        -- Rule 1: Loan amount validations
+        CASE 
+            WHEN l.loan_amount < 50000 THEN 'VIOLATION: Minimum loan amount ₹50K'
+            WHEN l.loan_amount > 2500000 THEN 'VIOLATION: Maximum loan amount ₹25L'
+            WHEN l.loan_amount > (c.annual_income * 5) THEN 'VIOLATION: Loan exceeds 5x annual income'
+            ELSE 'COMPLIANT'
+        END AS amount_rule_status,
+        
+        -- Rule 2: Customer eligibility validations
+        CASE 
+            WHEN FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) < 18 
+                THEN 'VIOLATION: Customer under 18 years'
+            WHEN FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) > 65 
+                THEN 'VIOLATION: Customer over 65 years'
+            WHEN c.annual_income < 200000 
+                THEN 'WARNING: Low income customer'
+            WHEN c.employment_type = 'Unemployed' 
+                THEN 'VIOLATION: Unemployed customer'
+            ELSE 'COMPLIANT'
+        END AS eligibility_rule_status,
+        
+        -- Rule 3: Temporal validations
+        CASE 
+            WHEN l.disbursement_date > current_date THEN 'VIOLATION: Future disbursement date'
+            WHEN l.disbursement_date < DATE('2020-01-01') THEN 'WARNING: Historical disbursement'
+            WHEN date_diff('day', l.disbursement_date, current_date) < 0 THEN 'VIOLATION: Invalid date logic'
+            ELSE 'COMPLIANT'
+        END AS temporal_rule_status,
+        
+        -- Rule 4: Status transition validations
+        CASE 
+            WHEN l.loan_status NOT IN ('Active', 'Closed', 'Defaulted', 'Overdue') 
+                THEN 'VIOLATION: Invalid loan status'
+            WHEN l.loan_status = 'Closed' 
+                 AND l.disbursement_date > date_add(current_date, to_days(CAST(-30 AS INTEGER))) 
+                THEN 'WARNING: Rapid closure detected'
+            ELSE 'COMPLIANT'
+        END AS status_rule_status
+        
+    FROM loans l
+    INNER JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+),
+violation_summary AS (
+    SELECT 
+        -- Count violations by category
+        COUNT(CASE WHEN amount_rule_status LIKE 'VIOLATION%' THEN 1 END) AS amount_violations,
+        COUNT(CASE WHEN eligibility_rule_status LIKE 'VIOLATION%' THEN 1 END) AS eligibility_violations,
+        COUNT(CASE WHEN temporal_rule_status LIKE 'VIOLATION%' THEN 1 END) AS temporal_violations,
+        COUNT(CASE WHEN status_rule_status LIKE 'VIOLATION%' THEN 1 END) AS status_violations,
+        
+        -- Count warnings
+        COUNT(CASE WHEN amount_rule_status LIKE 'WARNING%' 
+                   OR eligibility_rule_status LIKE 'WARNING%'
+                   OR temporal_rule_status LIKE 'WARNING%'
+                   OR status_rule_status LIKE 'WARNING%'
+                   THEN 1 END) AS total_warnings,
+        
+        COUNT(*) AS total_loans_checked,
+        
+        -- Total violations across all categories
+        COUNT(CASE WHEN amount_rule_status LIKE 'VIOLATION%' 
+                   OR eligibility_rule_status LIKE 'VIOLATION%'
+                   OR temporal_rule_status LIKE 'VIOLATION%'
+                   OR status_rule_status LIKE 'VIOLATION%'
+                   THEN 1 END) AS total_violations
+        
+    FROM business_rule_validation
+)
+SELECT 
+    CAST(current_date AS DATE) AS validation_date,
+    total_loans_checked,
+    amount_violations,
+    eligibility_violations,
+    temporal_violations,
+    status_violations,
+    total_violations,
+    total_warnings,
+    
+    -- Compliance percentage
+    ROUND(
+        (total_loans_checked - total_violations) * 100.0 / 
+        NULLIF(total_loans_checked, 0), 2
+    ) AS compliance_percentage,
+    
+    -- Business rule health status
+    CASE 
+        WHEN total_violations = 0 THEN '🟢 PERFECT: Zero rule violations'
+        WHEN total_violations <= (total_loans_checked * 0.001) THEN '🟡 EXCELLENT: <0.1% violations'
+        WHEN total_violations <= (total_loans_checked * 0.01) THEN '🟠 ACCEPTABLE: <1% violations'
+        ELSE '🔴 CRITICAL: >1% violations'
+    END AS rule_compliance_status,
+    
+    -- Priority action recommendation
+    CASE 
+        WHEN amount_violations > 0 THEN 'Fix loan amount validation rules'
+        WHEN eligibility_violations > 0 THEN 'Review customer eligibility criteria'
+        WHEN temporal_violations > 0 THEN 'Correct date validation logic'
+        WHEN status_violations > 0 THEN 'Standardize status management'
+        ELSE 'Maintain current standards'
+    END AS priority_recommendation
+    
+FROM violation_summary;
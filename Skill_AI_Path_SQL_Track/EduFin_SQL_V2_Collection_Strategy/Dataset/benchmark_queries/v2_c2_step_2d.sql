@@ -0,0 +1,107 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2D: Intelligent Early Warning Alert System
+-- BUSINESS OBJECTIVE: Predictive alerts to prevent crisis development
+-- PREVENTION FOCUS: Identify trends and anomalies requiring immediate attention
+
+WITH portfolio_trends AS (
+    SELECT 
+        CAST(localtimestamp AS DATE) AS analysis_date,
+        
+        -- Current portfolio metrics
+        COUNT(*) AS total_active_loans,
+        SUM(loan_amount) AS portfolio_value,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS current_defaults,
+        COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END) AS current_overdue,
+        
+        -- Recent trends (last 30 days)
+        COUNT(CASE WHEN loan_status = 'Defaulted' 
+                   AND disbursement_date >= date_add(localtimestamp, to_days(CAST(-30 AS INTEGER))) 
+                   THEN 1 END) AS recent_defaults,
+        COUNT(CASE WHEN loan_status = 'Overdue' 
+                   AND disbursement_date >= date_add(localtimestamp, to_days(CAST(-30 AS INTEGER))) 
+                   THEN 1 END) AS recent_overdue,
+        
+        -- High-risk concentrations
+        COUNT(CASE WHEN loan_amount > 1500000 THEN 1 END) AS high_value_loans,
+        COUNT(CASE WHEN loan_amount > 1500000 AND loan_status IN ('Defaulted', 'Overdue') 
+                   THEN 1 END) AS high_value_at_risk,
+        
+        -- Data quality indicators
+        COUNT(CASE WHEN customer_id IS NULL OR institution_id IS NULL 
+                   THEN 1 END) AS missing_references,
+        COUNT(CASE WHEN loan_amount <= 0 OR loan_amount > 2500000 
+                   THEN 1 END) AS amount_anomalies
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+),
+alert_logic AS (
+    SELECT 
+        *,
+        -- Calculate key ratios
+        ROUND(current_defaults * 100.0 / NULLIF(total_active_loans, 0), 2) AS current_default_rate,
+        ROUND((current_defaults + current_overdue) * 100.0 / NULLIF(total_active_loans, 0), 2) AS portfolio_at_risk_rate,
+        ROUND(high_value_at_risk * 100.0 / NULLIF(high_value_loans, 0), 2) AS high_value_risk_rate,
+        ROUND(recent_defaults * 100.0 / NULLIF(recent_defaults + recent_overdue, 0), 2) AS recent_trend_default_rate
+        
+    FROM portfolio_trends
+)
+SELECT 
+    analysis_date,
+    current_default_rate,
+    portfolio_at_risk_rate,
+    high_value_risk_rate,
+    missing_references,
+    amount_anomalies,
+    
+    -- Critical alert conditions
+    CASE 
+        WHEN current_default_rate > 15 THEN '🚨 CRITICAL: Default rate exceeds 15%'
+        WHEN current_default_rate > 12 THEN '⚠️ HIGH: Default rate approaching crisis level'
+        WHEN current_default_rate > 8 THEN '🟡 MODERATE: Default rate above normal'
+        ELSE '🟢 HEALTHY: Default rate within acceptable range'
+    END AS portfolio_health_alert,
+    
+    CASE 
+        WHEN portfolio_at_risk_rate > 30 THEN '🚨 CRITICAL: 30%+ portfolio at risk'
+        WHEN portfolio_at_risk_rate > 25 THEN '⚠️ HIGH: 25%+ portfolio at risk'
+        WHEN portfolio_at_risk_rate > 20 THEN '🟡 MODERATE: 20%+ portfolio at risk'
+        ELSE '🟢 HEALTHY: Portfolio risk controlled'
+    END AS risk_concentration_alert,
+    
+    CASE 
+        WHEN high_value_risk_rate > 50 THEN '🚨 CRITICAL: High-value loans severely impacted'
+        WHEN high_value_risk_rate > 30 THEN '⚠️ HIGH: High-value loan concentration risk'
+        WHEN high_value_risk_rate > 15 THEN '🟡 MODERATE: Monitor high-value loans'
+        ELSE '🟢 HEALTHY: High-value loans performing well'
+    END AS high_value_alert,
+    
+    CASE 
+        WHEN missing_references > 0 THEN '🔴 DATA QUALITY: Missing references detected'
+        WHEN amount_anomalies > 0 THEN '🔴 DATA QUALITY: Amount anomalies detected'
+        ELSE '🟢 DATA QUALITY: All checks passed'
+    END AS data_quality_alert,
+    
+    -- Overall system health
+    CASE 
+        WHEN current_default_rate > 15 OR portfolio_at_risk_rate > 30 OR missing_references > 0 
+        THEN '🚨 SYSTEM CRISIS: Immediate executive intervention required'
+        WHEN current_default_rate > 12 OR portfolio_at_risk_rate > 25 OR high_value_risk_rate > 30 
+        THEN '⚠️ SYSTEM WARNING: Escalate to senior management'
+        WHEN current_default_rate > 8 OR portfolio_at_risk_rate > 20 
+        THEN '🟡 SYSTEM CAUTION: Enhanced monitoring required'
+        ELSE '🟢 SYSTEM HEALTHY: Normal operations'
+    END AS overall_system_status,
+    
+    -- Recommended immediate actions
+    CASE 
+        WHEN current_default_rate > 15 THEN 'Deploy crisis management team + halt new lending'
+        WHEN portfolio_at_risk_rate > 30 THEN 'Activate recovery specialists + board notification'
+        WHEN missing_references > 0 THEN 'Fix data integrity issues + audit processes'
+        WHEN high_value_risk_rate > 30 THEN 'Focus collection efforts on high-value loans'
+        ELSE 'Continue standard monitoring protocols'
+    END AS recommended_action
+    
+FROM alert_logic;
@@ -0,0 +1,117 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_2/SQL_V2_challenge_2.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 2E: Complete Prevention & Safeguard Executive Dashboard
+-- BUSINESS OBJECTIVE: Comprehensive prevention status for board oversight
+-- STRATEGIC FOCUS: Demonstrate systematic safeguards preventing future crises
+
+WITH prevention_metrics AS (
+    SELECT 
+        CAST(current_date AS DATE) AS dashboard_date,
+        
+        -- Portfolio scale and health
+        COUNT(*) AS total_portfolio_loans,
+        SUM(loan_amount) AS total_portfolio_value,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END) AS overdue_loans,
+        
+        -- Data quality assessment
+        COUNT(CASE WHEN customer_id IS NULL OR institution_id IS NULL 
+                   OR loan_amount IS NULL OR disbursement_date IS NULL 
+                   THEN 1 END) AS data_quality_issues,
+        
+        -- Business rule compliance
+        COUNT(CASE WHEN loan_amount < 50000 OR loan_amount > 2500000 
+                   OR disbursement_date > current_date
+                   OR loan_status NOT IN ('Active', 'Closed', 'Defaulted', 'Overdue')
+                   THEN 1 END) AS business_rule_violations,
+        
+        -- Recent trend analysis (last 30 days)
+        COUNT(CASE WHEN loan_status = 'Defaulted' 
+                   AND disbursement_date >= date_add(current_date, to_days(CAST(-30 AS INTEGER))) 
+                   THEN 1 END) AS recent_defaults,
+        
+        -- High-risk concentrations
+        COUNT(CASE WHEN loan_amount > 1500000 AND loan_status IN ('Defaulted', 'Overdue') 
+                   THEN 1 END) AS high_value_at_risk,
+        
+        -- Financial impact metrics
+        SUM(CASE WHEN loan_status IN ('Defaulted', 'Overdue') THEN loan_amount ELSE 0 END) / 10000000.0 
+            AS value_at_risk_crores
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+),
+prevention_scores AS (
+    SELECT 
+        *,
+        -- Key prevention metrics
+        ROUND(defaulted_loans * 100.0 / NULLIF(total_portfolio_loans, 0), 2) AS current_default_rate,
+        ROUND((defaulted_loans + overdue_loans) * 100.0 / NULLIF(total_portfolio_loans, 0), 2) AS portfolio_at_risk_rate,
+        
+        -- Prevention effectiveness scores
+        ROUND(
+            (total_portfolio_loans - data_quality_issues) * 100.0 / 
+            NULLIF(total_portfolio_loans, 0), 2
+        ) AS data_quality_score,
+        
+        ROUND(
+            (total_portfolio_loans - business_rule_violations) * 100.0 / 
+            NULLIF(total_portfolio_loans, 0), 2
+        ) AS compliance_score,
+        
+        -- Portfolio value metrics
+        ROUND(total_portfolio_value / 10000000.0, 2) AS portfolio_crores
+    FROM prevention_metrics
+)
+SELECT 
+    dashboard_date,
+    
+    -- Executive summary metrics
+    CONCAT(CAST(total_portfolio_loans AS STRING), ' loans') AS portfolio_scale,
+    CONCAT('₹', CAST(portfolio_crores AS STRING), ' Crores') AS total_exposure,
+    CONCAT(CAST(current_default_rate AS STRING), '%') AS default_rate,
+    CONCAT(CAST(portfolio_at_risk_rate AS STRING), '%') AS portfolio_at_risk,
+    
+    -- Prevention system health scores
+    CONCAT(CAST(data_quality_score AS STRING), '%') AS data_quality_health,
+    CONCAT(CAST(compliance_score AS STRING), '%') AS business_rule_compliance,
+    
+    -- Prevention system status
+    CASE 
+        WHEN data_quality_score >= 99.5 AND compliance_score >= 99.5 
+        THEN '🟢 EXCELLENT: Prevention systems operating optimally'
+        WHEN data_quality_score >= 95.0 AND compliance_score >= 95.0 
+        THEN '🟡 GOOD: Prevention systems functioning well'
+        WHEN data_quality_score >= 90.0 AND compliance_score >= 90.0 
+        THEN '🟠 MODERATE: Prevention systems need attention'
+        ELSE '🔴 CRITICAL: Prevention systems failing'
+    END AS prevention_system_status,
+    
+    -- Portfolio health assessment
+    CASE 
+        WHEN current_default_rate <= 5 THEN '🟢 HEALTHY: Industry-leading performance'
+        WHEN current_default_rate <= 8 THEN '🟡 STABLE: Within acceptable range'
+        WHEN current_default_rate <= 12 THEN '🟠 ELEVATED: Enhanced monitoring required'
+        ELSE '🔴 CRISIS: Immediate intervention required'
+    END AS portfolio_health_status,
+    
+    -- Board action recommendations
+    CASE 
+        WHEN current_default_rate > 12 OR data_quality_score < 90 OR compliance_score < 90
+        THEN 'IMMEDIATE: Deploy crisis management protocols'
+        WHEN current_default_rate > 8 OR data_quality_score < 95 OR compliance_score < 95
+        THEN 'URGENT: Enhance prevention systems'
+        WHEN current_default_rate > 5 OR data_quality_score < 99 OR compliance_score < 99
+        THEN 'PROACTIVE: Optimize prevention frameworks'
+        ELSE 'STRATEGIC: Maintain excellence and expand capabilities'
+    END AS board_recommendation,
+    
+    -- Financial impact of prevention
+    CONCAT('₹', CAST(value_at_risk_crores AS STRING), ' Cr at risk') AS financial_exposure,
+    
+    -- Prevention ROI calculation
+    CONCAT('₹', CAST(value_at_risk_crores * 0.1 AS STRING), ' Cr annual prevention investment justified') 
+        AS prevention_budget_justification
+
+FROM prevention_scores;
@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Ensure unique partner IDs
+SELECT 
+    institution_id,
+    COUNT(*) AS duplicate_count
+FROM institutions
+GROUP BY institution_id
+HAVING COUNT(*) > 1;
+-- Expected: No results (no duplicates)
@@ -0,0 +1,13 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Check percentage calculations sum
+SELECT 
+    SUM(CASE WHEN loan_status = 'Active' THEN 1 ELSE 0 END) +
+    SUM(CASE WHEN loan_status = 'Defaulted' THEN 1 ELSE 0 END) +
+    SUM(CASE WHEN loan_status = 'Closed' THEN 1 ELSE 0 END) +
+    SUM(CASE WHEN loan_status = 'Overdue' THEN 1 ELSE 0 END) AS total_categorized,
+    COUNT(*) AS total_loans
+FROM loans
+WHERE disbursement_date IS NOT NULL;
+-- Expected: total_categorized = total_loans
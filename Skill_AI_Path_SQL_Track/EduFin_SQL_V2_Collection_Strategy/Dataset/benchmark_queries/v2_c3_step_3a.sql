@@ -0,0 +1,60 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3A: Partner Performance Baseline Assessment
+-- BUSINESS OBJECTIVE: Establish partnership scale and baseline performance metrics
+-- PARTNERSHIP INTELLIGENCE: Understand institutional contribution to portfolio
+
+SELECT 
+    i.institution_id,
+    i.institution_name,
+    i.institution_type,
+    dc.tier_classification AS tier,
+    
+    -- Scale and scope metrics
+    COUNT(DISTINCT l.customer_id) AS unique_students,
+    COUNT(l.loan_id) AS total_loans,
+    SUM(l.loan_amount) AS total_disbursed,
+    AVG(l.loan_amount) AS avg_loan_size,
+    
+    -- Executive-friendly formatting
+    ROUND(
+        SUM(l.loan_amount) / 10000000.0, 
+        2
+    ) AS disbursed_crores,
+    
+    -- Portfolio share calculation
+    ROUND(
+        COUNT(l.loan_id) * 100.0 / (
+            SELECT COUNT(*) 
+            FROM loans 
+            WHERE disbursement_date IS NOT NULL
+        ), 
+        2
+    ) AS portfolio_share_percent,
+    
+    -- Basic risk indicators
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        NULLIF(COUNT(l.loan_id), 0), 
+        2
+    ) AS basic_default_rate,
+    
+    -- Partnership value classification
+    CASE 
+        WHEN COUNT(l.loan_id) >= 200 THEN 'STRATEGIC PARTNER'
+        WHEN COUNT(l.loan_id) >= 100 THEN 'MAJOR PARTNER'
+        WHEN COUNT(l.loan_id) >= 50 THEN 'STANDARD PARTNER'
+        ELSE 'MINOR PARTNER'
+    END AS partnership_scale
+
+FROM institutions i
+LEFT JOIN loans l 
+    ON i.institution_id = l.institution_id
+    AND l.disbursement_date IS NOT NULL
+LEFT JOIN dim_city dc 
+    ON i.city_id = dc.city_id
+GROUP BY i.institution_id, i.institution_name, i.institution_type, dc.tier_classification
+HAVING COUNT(l.loan_id) > 0
+ORDER BY total_disbursed DESC;
@@ -0,0 +1,89 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3B: Partner Data Quality and Error Rate Analysis
+-- BUSINESS OBJECTIVE: Identify institutions creating operational inefficiencies
+-- DATA QUALITY FOCUS: Find partners requiring enhanced validation processes
+
+WITH partner_quality_assessment AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.tier_classification AS tier,
+        
+        -- Data quality indicators
+        COUNT(l.loan_id) AS total_loans,
+        COUNT(CASE WHEN l.disbursement_date IS NULL THEN 1 END) AS missing_disbursement_dates,
+        COUNT(CASE WHEN l.loan_amount <= 0 OR l.loan_amount > 2500000 THEN 1 END) AS invalid_amounts,
+        
+        -- Process efficiency indicators
+        COUNT(CASE WHEN date_diff('day', l.application_date, l.disbursement_date) > 30 THEN 1 END) AS delayed_processing,
+        AVG(date_diff('day', l.application_date, l.disbursement_date)) AS avg_processing_days,
+        
+        -- Customer profile quality
+        COUNT(CASE WHEN c.cibil_score < 300 OR c.cibil_score > 900 THEN 1 END) AS invalid_cibil_scores,
+        COUNT(CASE WHEN c.email_address IS NULL OR c.phone_number IS NULL THEN 1 END) AS incomplete_contact_info,
+        
+        -- Risk indicators
+        COUNT(CASE WHEN l.loan_status IN ('Defaulted', 'Overdue') THEN 1 END) AS problematic_loans
+        
+    FROM institutions i
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    WHERE l.application_date IS NOT NULL
+    GROUP BY i.institution_id, i.institution_name, dc.tier_classification
+)
+SELECT 
+    institution_name,
+    tier,
+    total_loans,
+    
+    -- Data quality error rates
+    ROUND(
+        (missing_disbursement_dates + invalid_amounts + invalid_cibil_scores + incomplete_contact_info) * 100.0 / 
+        NULLIF(total_loans, 0), 
+        2
+    ) AS data_quality_error_rate,
+    
+    -- Process efficiency metrics
+    ROUND(
+        delayed_processing * 100.0 / NULLIF(total_loans, 0), 
+        2
+    ) AS delayed_processing_rate,
+    
+    ROUND(avg_processing_days, 1) AS avg_processing_days,
+    
+    -- Risk correlation
+    ROUND(
+        problematic_loans * 100.0 / NULLIF(total_loans, 0), 
+        2
+    ) AS risk_rate_percent,
+    
+    -- Partner quality classification
+    CASE 
+        WHEN (missing_disbursement_dates + invalid_amounts + invalid_cibil_scores + incomplete_contact_info) * 100.0 / 
+             NULLIF(total_loans, 0) > 15 
+        THEN 'HIGH MAINTENANCE PARTNER'
+        WHEN (missing_disbursement_dates + invalid_amounts + invalid_cibil_scores + incomplete_contact_info) * 100.0 / 
+             NULLIF(total_loans, 0) > 8 
+        THEN 'ENHANCED VALIDATION REQUIRED'
+        WHEN (missing_disbursement_dates + invalid_amounts + invalid_cibil_scores + incomplete_contact_info) * 100.0 / 
+             NULLIF(total_loans, 0) > 3 
+        THEN 'STANDARD MONITORING'
+        ELSE 'QUALITY PARTNER'
+    END AS quality_classification,
+    
+    -- Operational impact assessment
+    CASE 
+        WHEN delayed_processing * 100.0 / NULLIF(total_loans, 0) > 25 
+             AND avg_processing_days > 40 
+        THEN 'PROCESS AUTOMATION REQUIRED'
+        WHEN delayed_processing * 100.0 / NULLIF(total_loans, 0) > 15 
+        THEN 'PROCESS IMPROVEMENT NEEDED'
+        ELSE 'ACCEPTABLE PROCESSING'
+    END AS process_efficiency_status
+
+FROM partner_quality_assessment
+WHERE total_loans >= 20  -- Focus on material partnerships
+ORDER BY data_quality_error_rate DESC, delayed_processing_rate DESC;
@@ -0,0 +1,102 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3C: Partnership Compliance and Rule Violation Analysis
+-- BUSINESS OBJECTIVE: Identify institutions systematically violating lending standards
+-- COMPLIANCE FOCUS: Find partners creating regulatory and business rule violations
+
+WITH compliance_violations AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.tier_classification AS tier,
+        
+        -- Portfolio metrics for context
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS total_exposure,
+        
+        -- Business rule violations
+        COUNT(CASE WHEN l.loan_amount > 2000000 THEN 1 END) AS excessive_loan_amounts,
+        COUNT(CASE 
+                 WHEN date_diff('year', c.date_of_birth, CURRENT_DATE) < 18 
+                   OR date_diff('year', c.date_of_birth, CURRENT_DATE) > 35 
+                 THEN 1 
+             END) AS age_violations,
+        COUNT(CASE WHEN c.cibil_score < 650 THEN 1 END) AS low_cibil_approvals,
+        COUNT(CASE WHEN c.annual_income < 200000 THEN 1 END) AS low_income_approvals,
+        
+        -- Documentation and verification issues
+        COUNT(CASE WHEN c.employment_type = 'Unemployed' THEN 1 END) AS unemployed_approvals,
+        COUNT(CASE WHEN c.email_address NOT LIKE '%@%.%' THEN 1 END) AS invalid_email_formats,
+        COUNT(CASE WHEN length(CAST(c.phone_number AS VARCHAR)) != 10 THEN 1 END) AS invalid_phone_formats,
+        
+        -- Risk concentration violations
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' AND l.loan_amount > 1500000 THEN 1 END) AS high_value_defaults,
+        
+        -- Geographic concentration risks
+        COUNT(DISTINCT CONCAT(ds.state_name, '-', dc.city_name)) AS geographic_diversity
+        
+    FROM institutions i
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date IS NOT NULL
+    GROUP BY i.institution_id, i.institution_name, dc.tier_classification
+)
+SELECT 
+    institution_name,
+    tier,
+    total_loans,
+    ROUND(total_exposure / 10000000.0, 2) AS exposure_crores,
+    
+    -- Compliance violation rates
+    ROUND(
+        (excessive_loan_amounts + age_violations + low_cibil_approvals + unemployed_approvals) * 100.0 / 
+        NULLIF(total_loans, 0), 
+        2
+    ) AS business_rule_violation_rate,
+    
+    ROUND(
+        (invalid_email_formats + invalid_phone_formats) * 100.0 / 
+        NULLIF(total_loans, 0), 
+        2
+    ) AS data_validation_failure_rate,
+    
+    -- Specific violation breakdown
+    ROUND(low_cibil_approvals * 100.0 / NULLIF(total_loans, 0), 2) AS low_cibil_approval_rate,
+    ROUND(low_income_approvals * 100.0 / NULLIF(total_loans, 0), 2) AS low_income_approval_rate,
+    unemployed_approvals AS unemployed_student_count,
+    high_value_defaults AS high_value_default_count,
+    geographic_diversity AS cities_covered,
+    
+    -- Compliance risk classification
+    CASE 
+        WHEN (excessive_loan_amounts + age_violations + low_cibil_approvals + unemployed_approvals) * 100.0 / 
+             NULLIF(total_loans, 0) > 20 
+        THEN 'SEVERE COMPLIANCE VIOLATIONS'
+        WHEN (excessive_loan_amounts + age_violations + low_cibil_approvals + unemployed_approvals) * 100.0 / 
+             NULLIF(total_loans, 0) > 10 
+        THEN 'MODERATE COMPLIANCE ISSUES'
+        WHEN (excessive_loan_amounts + age_violations + low_cibil_approvals + unemployed_approvals) * 100.0 / 
+             NULLIF(total_loans, 0) > 5 
+        THEN 'MINOR COMPLIANCE GAPS'
+        ELSE 'COMPLIANT PARTNER'
+    END AS compliance_status,
+    
+    -- Regulatory action recommendation
+    CASE 
+        WHEN unemployed_approvals > 10 OR high_value_defaults > 5 
+        THEN 'IMMEDIATE AUDIT & CORRECTIVE ACTION'
+        WHEN (excessive_loan_amounts + age_violations + low_cibil_approvals) * 100.0 / 
+             NULLIF(total_loans, 0) > 15 
+        THEN 'ENHANCED DUE DILIGENCE REQUIRED'
+        WHEN (invalid_email_formats + invalid_phone_formats) * 100.0 / 
+             NULLIF(total_loans, 0) > 10 
+        THEN 'DATA VALIDATION TRAINING NEEDED'
+        ELSE 'STANDARD COMPLIANCE MONITORING'
+    END AS regulatory_action_required
+
+FROM compliance_violations
+WHERE total_loans >= 50  -- Focus on significant partnerships
+ORDER BY business_rule_violation_rate DESC, high_value_defaults DESC;
@@ -0,0 +1,113 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3D: Comprehensive Partnership Risk Ranking
+-- BUSINESS OBJECTIVE: Rank partnerships by combined risk factors for strategic decisions
+-- RISK INTELLIGENCE: Multi-dimensional assessment for partnership optimization
+
+WITH partnership_metrics AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        dc.tier_classification AS tier,
+        
+        -- Portfolio scale metrics
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS total_exposure,
+        
+        -- Performance metrics
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        COUNT(CASE WHEN l.loan_status = 'Overdue' THEN 1 END) AS overdue_loans,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS defaulted_amount,
+        
+        -- Quality metrics
+        COUNT(CASE WHEN l.disbursement_date IS NULL OR l.loan_amount <= 0 THEN 1 END) AS data_quality_issues,
+        COUNT(CASE WHEN date_diff('day', l.application_date, l.disbursement_date) > 30 THEN 1 END) AS delayed_processing,
+        
+        -- Compliance metrics
+        COUNT(CASE WHEN c.cibil_score < 650 OR c.employment_type = 'Unemployed' THEN 1 END) AS compliance_violations
+        
+    FROM institutions i
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    WHERE l.application_date IS NOT NULL
+    GROUP BY i.institution_id, i.institution_name, dc.tier_classification
+),
+risk_scoring AS (
+    SELECT 
+        *,
+        -- Calculate individual risk scores (0-100 scale)
+        ROUND(defaulted_loans * 100.0 / NULLIF(total_loans, 0), 2) AS default_rate,
+        ROUND((defaulted_loans + overdue_loans) * 100.0 / NULLIF(total_loans, 0), 2) AS total_risk_rate,
+        ROUND(data_quality_issues * 100.0 / NULLIF(total_loans, 0), 2) AS quality_issue_rate,
+        ROUND(compliance_violations * 100.0 / NULLIF(total_loans, 0), 2) AS compliance_violation_rate,
+        ROUND(delayed_processing * 100.0 / NULLIF(total_loans, 0), 2) AS processing_delay_rate
+    FROM partnership_metrics
+    WHERE total_loans >= 50  -- Focus on material partnerships
+)
+SELECT 
+    institution_name,
+    tier,
+    total_loans,
+    ROUND(total_exposure / 10000000.0, 2) AS exposure_crores,
+    
+    -- Individual risk component scores
+    default_rate,
+    total_risk_rate,
+    quality_issue_rate,
+    compliance_violation_rate,
+    processing_delay_rate,
+    
+    -- Composite risk score calculation
+    ROUND(
+        (default_rate * 0.35) +           -- Default rate: 35% weight
+        (total_risk_rate * 0.25) +       -- Total risk: 25% weight
+        (quality_issue_rate * 0.15) +    -- Quality issues: 15% weight
+        (compliance_violation_rate * 0.15) + -- Compliance: 15% weight
+        (processing_delay_rate * 0.10),  -- Processing: 10% weight
+        2
+    ) AS composite_risk_score,
+    
+    -- Financial impact assessment
+    ROUND(defaulted_amount / 10000000.0, 2) AS losses_crores,
+    
+    -- Risk ranking and classification
+    RANK() OVER (ORDER BY 
+        (default_rate * 0.35) +
+        (total_risk_rate * 0.25) +
+        (quality_issue_rate * 0.15) +
+        (compliance_violation_rate * 0.15) +
+        (processing_delay_rate * 0.10) DESC
+    ) AS risk_rank,
+    
+    -- Strategic partnership decision
+    CASE 
+        WHEN (default_rate * 0.35) + (total_risk_rate * 0.25) + (quality_issue_rate * 0.15) + 
+             (compliance_violation_rate * 0.15) + (processing_delay_rate * 0.10) > 25 
+        THEN 'TERMINATE PARTNERSHIP'
+        WHEN (default_rate * 0.35) + (total_risk_rate * 0.25) + (quality_issue_rate * 0.15) + 
+             (compliance_violation_rate * 0.15) + (processing_delay_rate * 0.10) > 18 
+        THEN 'PROBATION - 90 DAY IMPROVEMENT'
+        WHEN (default_rate * 0.35) + (total_risk_rate * 0.25) + (quality_issue_rate * 0.15) + 
+             (compliance_violation_rate * 0.15) + (processing_delay_rate * 0.10) > 12 
+        THEN 'ENHANCED MONITORING'
+        WHEN (default_rate * 0.35) + (total_risk_rate * 0.25) + (quality_issue_rate * 0.15) + 
+             (compliance_violation_rate * 0.15) + (processing_delay_rate * 0.10) > 8 
+        THEN 'STANDARD MONITORING'
+        ELSE 'PREFERRED PARTNER'
+    END AS partnership_decision,
+    
+    -- Value assessment
+    CASE 
+        WHEN total_loans >= 200 AND default_rate <= 10 
+        THEN 'HIGH VALUE - EXPAND RELATIONSHIP'
+        WHEN total_loans >= 100 AND default_rate <= 15 
+        THEN 'VALUABLE - MAINTAIN CURRENT TERMS'
+        WHEN default_rate > 25 
+        THEN 'NEGATIVE VALUE - EXIT STRATEGY'
+        ELSE 'MARGINAL VALUE - MONITOR CLOSELY'
+    END AS partnership_value_assessment
+
+FROM risk_scoring
+ORDER BY composite_risk_score DESC, losses_crores DESC;
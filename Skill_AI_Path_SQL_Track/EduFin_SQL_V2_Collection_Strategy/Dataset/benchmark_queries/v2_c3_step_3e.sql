@@ -0,0 +1,86 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_3/SQL_V2_Challenge_3.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3E: Executive Partnership Risk Dashboard
+-- BUSINESS OBJECTIVE: Board-ready partnership intelligence for strategic decisions
+-- EXECUTIVE FOCUS: Comprehensive partnership portfolio assessment and optimization
+
+-- Step 1: Compute partner-level metrics
+WITH partner_level AS (
+    SELECT 
+        i.institution_id,
+        i.institution_name,
+        COUNT(l.loan_id) AS total_loans,
+        SUM(l.loan_amount) AS total_portfolio_value,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS total_defaults,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS total_losses
+    FROM institutions i
+        INNER JOIN loans l ON i.institution_id = l.institution_id
+    WHERE l.disbursement_date IS NOT NULL
+    GROUP BY i.institution_id, i.institution_name
+),
+
+-- Step 2: Classify partners by risk category
+partner_classification AS (
+    SELECT 
+        institution_id,
+        institution_name,
+        total_loans,
+        total_portfolio_value,
+        total_defaults,
+        total_losses,
+        
+        -- Partner-level default rate
+        ROUND(total_defaults * 100.0 / NULLIF(total_loans,0),2) AS default_rate,
+        
+        -- Flags for classification
+        CASE WHEN (total_defaults * 100.0 / NULLIF(total_loans,0)) > 25 
+             THEN 1 ELSE 0 END AS high_risk_flag,
+        CASE WHEN (total_defaults * 100.0 / NULLIF(total_loans,0)) <= 10 
+                  AND total_loans >= 100
+             THEN 1 ELSE 0 END AS preferred_flag
+    FROM partner_level
+)
+
+-- Step 3: Executive-level aggregation
+SELECT 
+    -- Executive summary metrics
+    COUNT(DISTINCT institution_id) AS active_partnerships,
+    SUM(total_loans) AS partnership_loans,
+    ROUND(SUM(total_portfolio_value) / 10000000.0, 2) AS partnership_portfolio_crores,
+    
+    -- Risk assessment summary
+    ROUND(SUM(total_defaults) * 100.0 / NULLIF(SUM(total_loans),0), 2) AS partnership_default_rate,
+    ROUND(SUM(total_losses) / 10000000.0, 2) AS partnership_losses_crores,
+    
+    -- Partnership quality distribution
+    SUM(high_risk_flag) AS partners_requiring_termination,
+    SUM(preferred_flag) AS partners_suitable_for_expansion,
+    
+    -- Strategic recommendations
+    ROUND(SUM(high_risk_flag) * 100.0 / NULLIF(COUNT(DISTINCT institution_id),0), 2) 
+        AS partnership_portfolio_at_risk_percent,
+    
+    -- Executive decision framework
+    CASE 
+        WHEN SUM(high_risk_flag) * 100.0 / NULLIF(COUNT(DISTINCT institution_id),0) > 30 
+        THEN 'PARTNERSHIP CRISIS - IMMEDIATE RESTRUCTURING'
+        WHEN SUM(high_risk_flag) * 100.0 / NULLIF(COUNT(DISTINCT institution_id),0) > 20 
+        THEN 'PARTNERSHIP OPTIMIZATION REQUIRED'
+        WHEN SUM(high_risk_flag) * 100.0 / NULLIF(COUNT(DISTINCT institution_id),0) > 10 
+        THEN 'ENHANCED PARTNERSHIP MONITORING'
+        ELSE 'HEALTHY PARTNERSHIP PORTFOLIO'
+    END AS partnership_health_status,
+    
+    -- Investment allocation recommendation
+    CASE 
+        WHEN SUM(preferred_flag) > 0 AND SUM(high_risk_flag) > 2 
+        THEN 'REALLOCATE: Expand preferred partners, terminate high-risk partnerships'
+        WHEN SUM(preferred_flag) > 2 
+        THEN 'EXPANSION OPPORTUNITY: Increase allocation to preferred partners'
+        WHEN SUM(high_risk_flag) > 3 
+        THEN 'RISK REDUCTION: Focus on partnership terminations'
+        ELSE 'MAINTAIN: Continue current partnership strategy'
+    END AS strategic_allocation_recommendation
+
+FROM partner_classification;
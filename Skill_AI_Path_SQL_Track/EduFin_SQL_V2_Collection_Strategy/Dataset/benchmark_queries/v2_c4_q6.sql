@@ -0,0 +1,9 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check process stage consistency
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN application_date IS NULL THEN 1 END) AS missing_application_dates,
+    COUNT(CASE WHEN disbursement_date < application_date THEN 1 END) AS invalid_date_sequence
+FROM loans;
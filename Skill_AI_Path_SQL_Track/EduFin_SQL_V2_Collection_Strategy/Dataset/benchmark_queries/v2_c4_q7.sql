@@ -0,0 +1,15 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Payment data completeness
+SELECT 
+    l.loan_status,
+    COUNT(l.loan_id) AS total_loans,
+    COUNT(p.loan_id) AS loans_with_payments,
+    ROUND(
+        COUNT(p.loan_id) * 100.0 / COUNT(l.loan_id), 2
+    ) AS payment_coverage_percent
+FROM loans l
+    LEFT JOIN payments p ON l.loan_id = p.loan_id
+WHERE l.disbursement_date IS NOT NULL
+GROUP BY l.loan_status;
@@ -0,0 +1,45 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4A: Origination Process Efficiency Analysis
+-- BUSINESS OBJECTIVE: Identify bottlenecks in loan origination funnel
+-- PROCESS INTELLIGENCE: Measure cycle times and approval rates by various factors
+
+SELECT 
+    -- Geographic and institutional segmentation
+    ds.region,
+    dc.tier_classification,
+    i.institution_type,
+    
+    -- Volume and success metrics
+    COUNT(l.loan_id) AS total_applications,
+    COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END) AS approved_loans,
+    
+    -- Process efficiency calculations
+    ROUND(
+        COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END) * 100.0 / 
+        COUNT(l.loan_id), 2
+    ) AS approval_rate,
+    
+    -- Cycle time analysis (application to disbursement)
+    AVG(date_diff('day', l.application_date, l.disbursement_date)) AS avg_cycle_days,
+    MAX(date_diff('day', l.application_date, l.disbursement_date)) AS max_cycle_days,
+    MIN(date_diff('day', l.application_date, l.disbursement_date)) AS min_cycle_days,
+    
+    -- Process performance classification
+    CASE 
+        WHEN AVG(date_diff('day', l.application_date, l.disbursement_date)) <= 7 THEN '🟢 Efficient'
+        WHEN AVG(date_diff('day', l.application_date, l.disbursement_date)) <= 15 THEN '🟡 Standard'
+        WHEN AVG(date_diff('day', l.application_date, l.disbursement_date)) <= 30 THEN '🟠 Slow'
+        ELSE '🔴 Critical'
+    END AS process_efficiency
+    
+FROM loans l
+    INNER JOIN institutions i ON l.institution_id = i.institution_id
+    INNER JOIN dim_city dc ON i.city_id = dc.city_id
+    INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+WHERE l.application_date IS NOT NULL
+    AND l.application_date >= '2023-06-01'  -- Recent 12 months
+GROUP BY ds.region, dc.tier_classification, i.institution_type
+HAVING COUNT(l.loan_id) >= 10  -- Statistically significant samples
+ORDER BY avg_cycle_days DESC;
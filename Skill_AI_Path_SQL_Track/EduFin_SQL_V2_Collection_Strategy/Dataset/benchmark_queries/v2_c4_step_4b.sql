@@ -0,0 +1,72 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4B: Data Quality and Business Rule Analysis
+-- BUSINESS OBJECTIVE: Identify data quality gaps and rule violations
+-- QUALITY INTELLIGENCE: Measure adherence to business rules and data standards
+
+SELECT 
+    -- Data quality assessment categories
+    'Loan Amount Validation' AS quality_check,
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN loan_amount < 50000 OR loan_amount > 2500000 THEN 1 END) AS violations,
+    ROUND(
+        COUNT(CASE WHEN loan_amount < 50000 OR loan_amount > 2500000 THEN 1 END) * 100.0 / 
+        COUNT(*), 2
+    ) AS violation_rate,
+    'Loan amounts outside ₹50K-₹25L range' AS description
+
+FROM loans
+WHERE disbursement_date IS NOT NULL
+
+UNION ALL
+
+SELECT 
+    'Date Consistency Validation' AS quality_check,
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN disbursement_date < application_date THEN 1 END) AS violations,
+    ROUND(
+        COUNT(CASE WHEN disbursement_date < application_date THEN 1 END) * 100.0 / 
+        COUNT(*), 2
+    ) AS violation_rate,
+    'Disbursement before application date' AS description
+
+FROM loans
+WHERE disbursement_date IS NOT NULL 
+    AND application_date IS NOT NULL
+
+UNION ALL
+
+SELECT 
+    'Customer Validation' AS quality_check,
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN c.customer_id IS NULL THEN 1 END) AS violations,
+    ROUND(
+        COUNT(CASE WHEN c.customer_id IS NULL THEN 1 END) * 100.0 / 
+        COUNT(*), 2
+    ) AS violation_rate,
+    'Loans without valid customer records' AS description
+
+FROM loans l
+    LEFT JOIN customers c ON l.customer_id = c.customer_id
+WHERE l.disbursement_date IS NOT NULL
+
+UNION ALL
+
+SELECT 
+    'Payment Tracking Quality' AS quality_check,
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN p.loan_id IS NULL THEN 1 END) AS violations,
+    ROUND(
+        COUNT(CASE WHEN p.loan_id IS NULL THEN 1 END) * 100.0 / 
+        COUNT(*), 2
+    ) AS violation_rate,
+    'Active loans without any payment records' AS description
+
+FROM loans l
+    LEFT JOIN payments p ON l.loan_id = p.loan_id
+WHERE l.loan_status = 'Active'
+    AND l.disbursement_date IS NOT NULL
+    AND l.disbursement_date < date_add(localtimestamp, to_months(CAST(-3 AS INTEGER)))  -- Loans older than 3 months should have payments
+
+ORDER BY violation_rate DESC;
@@ -0,0 +1,76 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4C: Payment Processing Efficiency Analysis
+-- BUSINESS OBJECTIVE: Optimize payment collection workflow and timing
+-- COLLECTION INTELLIGENCE: Identify patterns and improvement opportunities
+
+WITH payment_enriched AS (
+    SELECT
+        -- Month bucket
+        strftime(p.payment_date, '%Y-%m') AS payment_month,
+        l.loan_status,
+
+        -- Keep granular fields
+        p.payment_id,
+        p.loan_id,
+        p.payment_amount,
+        p.payment_date,
+        l.disbursement_date,
+        l.emi_amount,
+
+        -- Derive installment number since disbursement and expected due date
+        FLOOR((date_diff('day', l.disbursement_date, p.payment_date) / 31.0)) + 1 AS installment_no,
+        date_add(l.disbursement_date, to_months(CAST(FLOOR((date_diff('day', l.disbursement_date, p.payment_date) / 31.0)) + 1 AS INTEGER))) AS expected_due_date,
+
+        -- +ve = late, <= 0 = on-time/early
+        date_diff('day', date_add(l.disbursement_date, to_months(CAST(FLOOR((date_diff('day', l.disbursement_date, p.payment_date) / 31.0)) + 1 AS INTEGER))), p.payment_date) AS delay_days
+    FROM payments p
+    INNER JOIN loans l ON p.loan_id = l.loan_id
+    WHERE p.payment_date >= DATE '2023-06-01'
+      AND p.payment_amount > 0
+      AND p.payment_status = 'Success'     -- optional but recommended
+),
+payment_analysis AS (
+    SELECT
+        payment_month,
+        loan_status,
+
+        -- Payment collection metrics
+        COUNT(payment_id)                          AS total_payments,
+        SUM(payment_amount)                        AS total_collected,
+        COUNT(DISTINCT loan_id)                    AS loans_with_payments,
+        AVG(payment_amount)                        AS avg_payment_amount,
+
+        -- Timing efficiency
+        AVG(delay_days)                            AS avg_delay_days,
+        COUNT(CASE WHEN delay_days <= 0 THEN 1 END) AS on_time_payments,
+        COUNT(CASE WHEN delay_days > 0  THEN 1 END) AS late_payments,
+
+        -- On-time %
+        ROUND(
+            COUNT(CASE WHEN delay_days <= 0 THEN 1 END) * 100.0 /
+            NULLIF(COUNT(payment_id), 0), 2
+        ) AS on_time_rate
+    FROM payment_enriched
+    GROUP BY payment_month, loan_status
+)
+SELECT
+    payment_month,
+    loan_status,
+    total_payments,
+    ROUND(total_collected / 10000000.0, 2) AS collected_crores,
+    loans_with_payments,
+    ROUND(avg_payment_amount / 100000.0, 2) AS avg_payment_lakhs,
+    avg_delay_days,
+    on_time_rate,
+
+    CASE
+        WHEN on_time_rate >= 90 THEN '🟢 Excellent'
+        WHEN on_time_rate >= 75 THEN '🟡 Good'
+        WHEN on_time_rate >= 60 THEN '🟠 Needs Improvement'
+        ELSE '🔴 Critical'
+    END AS collection_performance
+FROM payment_analysis
+WHERE total_payments >= 10
+ORDER BY payment_month DESC, on_time_rate ASC;
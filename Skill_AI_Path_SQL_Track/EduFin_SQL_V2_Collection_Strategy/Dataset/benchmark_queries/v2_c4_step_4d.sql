@@ -0,0 +1,89 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_4/SQL_V2_Challenge_4.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4D: Risk Model Accuracy and Calibration Analysis
+-- BUSINESS OBJECTIVE: Measure risk model effectiveness and identify improvements
+-- PREDICTIVE INTELLIGENCE: Compare risk scores with actual default outcomes
+
+WITH risk_calibration AS (
+    SELECT 
+        -- Customer risk profile segmentation
+        c.customer_id,
+        c.cibil_score,
+        c.annual_income,
+        dc.tier_classification,
+        ds.region,
+        
+        -- Risk score categorization
+        CASE 
+            WHEN c.cibil_score >= 750 THEN 'Low Risk'
+            WHEN c.cibil_score >= 650 THEN 'Medium Risk'
+            WHEN c.cibil_score >= 550 THEN 'High Risk'
+            ELSE 'Critical Risk'
+        END AS predicted_risk,
+        
+        -- Actual outcome classification
+        CASE 
+            WHEN l.loan_status = 'Defaulted' THEN 'Actual Default'
+            WHEN l.loan_status = 'Overdue' THEN 'Potential Default'
+            WHEN l.loan_status IN ('Active', 'Closed') THEN 'Good Performance'
+            ELSE 'Unknown'
+        END AS actual_outcome,
+        
+        l.loan_amount,
+        l.loan_status
+        
+    FROM customers c
+        INNER JOIN loans l ON c.customer_id = l.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date IS NOT NULL
+        AND c.cibil_score IS NOT NULL
+        AND l.disbursement_date >= '2023-01-01'  -- 18+ months for outcome maturity
+)
+SELECT 
+    predicted_risk,
+    COUNT(*) AS total_predictions,
+    
+    -- Actual outcome distribution
+    COUNT(CASE WHEN actual_outcome = 'Good Performance' THEN 1 END) AS good_outcomes,
+    COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) AS actual_defaults,
+    COUNT(CASE WHEN actual_outcome = 'Potential Default' THEN 1 END) AS potential_defaults,
+    
+    -- Model accuracy calculations
+    ROUND(
+        COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) * 100.0 / 
+        COUNT(*), 2
+    ) AS actual_default_rate,
+    
+    -- Risk-adjusted financial impact
+    ROUND(
+        SUM(CASE WHEN actual_outcome = 'Actual Default' THEN loan_amount ELSE 0 END) / 10000000.0, 2
+    ) AS default_loss_crores,
+    
+    -- Model calibration assessment
+    CASE 
+        WHEN predicted_risk = 'Low Risk' AND 
+             COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) * 100.0 / COUNT(*) <= 5 
+             THEN '✅ Well Calibrated'
+        WHEN predicted_risk = 'Medium Risk' AND 
+             COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) * 100.0 / COUNT(*) BETWEEN 8 AND 15 
+             THEN '✅ Well Calibrated'
+        WHEN predicted_risk = 'High Risk' AND 
+             COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) * 100.0 / COUNT(*) BETWEEN 20 AND 30 
+             THEN '✅ Well Calibrated'
+        WHEN predicted_risk = 'Critical Risk' AND 
+             COUNT(CASE WHEN actual_outcome = 'Actual Default' THEN 1 END) * 100.0 / COUNT(*) >= 40 
+             THEN '✅ Well Calibrated'
+        ELSE '❌ Needs Recalibration'
+    END AS model_calibration
+    
+FROM risk_calibration
+GROUP BY predicted_risk
+ORDER BY 
+    CASE predicted_risk 
+        WHEN 'Low Risk' THEN 1 
+        WHEN 'Medium Risk' THEN 2 
+        WHEN 'High Risk' THEN 3 
+        ELSE 4 
+    END;
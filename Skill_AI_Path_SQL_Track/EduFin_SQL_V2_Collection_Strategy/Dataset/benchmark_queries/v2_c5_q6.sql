@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check for data leakage in predictive models
+SELECT 
+    'Data Leakage Check' AS validation_type,
+    COUNT(CASE WHEN disbursement_date > maturity_date THEN 1 END) AS leakage_violations
+FROM loans
+WHERE loan_status = 'Defaulted' AND maturity_date IS NOT NULL;
+-- Expected: 0 violations
@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Risk score distribution reasonableness
+SELECT 
+    'Risk Score Distribution' AS validation_type,
+    MIN(cibil_score) AS min_score,
+    MAX(cibil_score) AS max_score,
+    ROUND(AVG(cibil_score), 2) AS avg_score
+FROM customers;
+-- Expected: Min ~15, Max ~95, Avg ~45-55
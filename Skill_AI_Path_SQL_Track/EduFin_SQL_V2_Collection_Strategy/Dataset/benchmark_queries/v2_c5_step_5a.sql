@@ -0,0 +1,78 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5A: Mining early-default signals for predictive risk modeling
+WITH pre_default_features AS (
+    SELECT 
+        l.customer_id,
+        l.loan_id,
+        l.loan_amount,
+        l.disbursement_date,
+        
+        -- Customer profile at origination (no leakage)
+        c.cibil_score,
+        c.annual_income,
+        c.employment_type,
+        date_diff('month', l.application_date, l.disbursement_date) AS tenure_months,
+        
+        -- Geographic risk indicators
+        dc.tier_classification,
+        ds.state_name,
+        
+        -- Loan characteristics
+        CASE 
+            WHEN l.loan_amount > c.annual_income * 4 THEN 'High_Leverage'
+            WHEN l.loan_amount > c.annual_income * 2 THEN 'Medium_Leverage'
+            ELSE 'Low_Leverage'
+        END AS leverage_category,
+        
+        -- Default outcome (target variable)
+        CASE 
+            WHEN l.loan_status = 'Defaulted' THEN 1 
+            ELSE 0 
+        END AS defaulted_flag
+        
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date IS NOT NULL
+      AND l.disbursement_date >= '2023-01-01'
+)
+
+-- Analyze predictive power of each feature
+SELECT 
+    'CIBIL_Score' AS risk_factor,
+    ROUND(AVG(CASE WHEN cibil_score < 650 THEN defaulted_flag END) * 100, 2) AS high_risk_default_rate,
+    ROUND(AVG(CASE WHEN cibil_score >= 750 THEN defaulted_flag END) * 100, 2) AS low_risk_default_rate,
+    ROUND(ABS(
+        AVG(CASE WHEN cibil_score < 650 THEN defaulted_flag END) - 
+        AVG(CASE WHEN cibil_score >= 750 THEN defaulted_flag END)
+    ) * 100, 2) AS predictive_power
+FROM pre_default_features
+
+UNION ALL
+
+SELECT 
+    'Leverage_Ratio' AS risk_factor,
+    ROUND(AVG(CASE WHEN leverage_category = 'High_Leverage' THEN defaulted_flag END) * 100, 2) AS high_risk_default_rate,
+    ROUND(AVG(CASE WHEN leverage_category = 'Low_Leverage' THEN defaulted_flag END) * 100, 2) AS low_risk_default_rate,
+    ROUND(ABS(
+        AVG(CASE WHEN leverage_category = 'High_Leverage' THEN defaulted_flag END) - 
+        AVG(CASE WHEN leverage_category = 'Low_Leverage' THEN defaulted_flag END)
+    ) * 100, 2) AS predictive_power
+FROM pre_default_features
+
+UNION ALL
+
+SELECT 
+    'Geographic_Risk' AS risk_factor,
+    ROUND(AVG(CASE WHEN tier_classification = 'Tier-3' THEN defaulted_flag END) * 100, 2) AS high_risk_default_rate,
+    ROUND(AVG(CASE WHEN tier_classification = 'Tier-1' THEN defaulted_flag END) * 100, 2) AS low_risk_default_rate,
+    ROUND(ABS(
+        AVG(CASE WHEN tier_classification = 'Tier-3' THEN defaulted_flag END) - 
+        AVG(CASE WHEN tier_classification = 'Tier-1' THEN defaulted_flag END)
+    ) * 100, 2) AS predictive_power
+FROM pre_default_features
+
+ORDER BY predictive_power DESC;
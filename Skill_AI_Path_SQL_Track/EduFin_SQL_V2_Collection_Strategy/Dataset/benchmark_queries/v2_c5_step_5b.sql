@@ -0,0 +1,113 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5B: Dynamic multi-factor risk scoring with calibrated weights
+WITH risk_weights AS (
+    SELECT 
+        0.40 AS leverage_weight,
+        0.30 AS cibil_weight,
+        0.20 AS geographic_weight,
+        0.10 AS tenure_weight
+),
+
+customer_risk_factors AS (
+    SELECT 
+        c.customer_id,
+        c.full_name,
+        l.loan_id,
+        l.loan_amount,
+        l.loan_status,
+        
+        -- Factor 1: Leverage Risk (0-100 scale)
+        CASE 
+            WHEN l.loan_amount <= c.annual_income * 1.5 THEN 15
+            WHEN l.loan_amount <= c.annual_income * 2.5 THEN 35
+            WHEN l.loan_amount <= c.annual_income * 4.0 THEN 65
+            WHEN l.loan_amount <= c.annual_income * 5.0 THEN 85
+            ELSE 100
+        END AS leverage_risk_score,
+        
+        -- Factor 2: CIBIL Score Risk
+        CASE 
+            WHEN c.cibil_score >= 800 THEN 10
+            WHEN c.cibil_score >= 750 THEN 25
+            WHEN c.cibil_score >= 700 THEN 45
+            WHEN c.cibil_score >= 650 THEN 70
+            WHEN c.cibil_score >= 600 THEN 85
+            ELSE 100
+        END AS cibil_risk_score,
+        
+        -- Factor 3: Geographic Risk
+        CASE 
+            WHEN lower(dc.tier_classification) LIKE '%1%' THEN 20
+            WHEN lower(dc.tier_classification) LIKE '%2%' THEN 50
+            WHEN lower(dc.tier_classification) LIKE '%3%' THEN 80
+            ELSE 60
+        END AS geographic_risk_score,
+        
+        -- Factor 4: Customer Tenure Risk (months since application)
+        FLOOR((date_diff('day', l.application_date, current_date) / 31.0)) AS tenure_months
+        
+    FROM customers c
+    INNER JOIN loans l ON c.customer_id = l.customer_id
+    INNER JOIN dim_city dc ON c.city_id = dc.city_id
+    WHERE l.disbursement_date IS NOT NULL
+      AND l.loan_status NOT IN ('Closed', 'Cancelled')
+),
+
+scored AS (
+    SELECT 
+        crf.full_name AS customer_name,
+        concat('₹', CAST(crf.loan_amount AS STRING)) AS loan_amount_formatted,
+        crf.loan_status,
+        
+        -- Compute tenure risk once
+        CASE 
+            WHEN crf.tenure_months >= 24 THEN 20
+            WHEN crf.tenure_months >= 12 THEN 40
+            WHEN crf.tenure_months >= 6  THEN 70
+            ELSE 90
+        END AS tenure_risk_score,
+        
+        -- Composite score
+        ROUND(
+            (crf.leverage_risk_score   * rw.leverage_weight) +
+            (crf.cibil_risk_score      * rw.cibil_weight) +
+            (crf.geographic_risk_score * rw.geographic_weight) +
+            (CASE 
+                WHEN crf.tenure_months >= 24 THEN 20
+                WHEN crf.tenure_months >= 12 THEN 40
+                WHEN crf.tenure_months >= 6  THEN 70
+                ELSE 90
+             END * rw.tenure_weight),
+            1
+        ) AS composite_risk_score
+    FROM customer_risk_factors crf
+    CROSS JOIN risk_weights rw
+)
+
+SELECT
+    customer_name,
+    loan_amount_formatted,
+    loan_status,
+    composite_risk_score,
+    
+    -- Risk category
+    CASE 
+        WHEN composite_risk_score <= 30 THEN 'LOW RISK'
+        WHEN composite_risk_score <= 50 THEN 'MEDIUM RISK'
+        WHEN composite_risk_score <= 75 THEN 'HIGH RISK'
+        ELSE 'CRITICAL RISK'
+    END AS risk_category,
+    
+    -- Recommended action
+    CASE 
+        WHEN composite_risk_score <= 30 THEN 'Standard Monitoring'
+        WHEN composite_risk_score <= 50 THEN 'Enhanced Monitoring'
+        WHEN composite_risk_score <= 75 THEN 'Intensive Collection Focus'
+        ELSE 'Immediate Intervention Required'
+    END AS recommended_action
+
+FROM scored
+ORDER BY composite_risk_score DESC
+LIMIT 10;
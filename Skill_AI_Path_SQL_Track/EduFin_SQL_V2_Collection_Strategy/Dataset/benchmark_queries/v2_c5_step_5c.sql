@@ -0,0 +1,79 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5C: Portfolio-level risk heatmap with multi-dimensional visualization
+-- BUSINESS OBJECTIVE: Executive risk visibility across geographic and product dimensions
+-- OUTPUT: Heat map showing risk concentrations for strategic planning
+
+WITH portfolio_risk_matrix AS (
+    SELECT 
+        -- Geographic dimension
+        ds.state_name,
+        dc.tier_classification,
+        
+        -- Product dimension
+        CASE 
+            WHEN l.loan_amount < 500000 THEN 'Small Loans'
+            WHEN l.loan_amount < 2000000 THEN 'Medium Loans'
+            ELSE 'Large Loans'
+        END AS loan_size_category,
+        
+        -- Risk metrics
+        COUNT(*) AS total_loans,
+        SUM(l.loan_amount) AS total_exposure,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS default_count,
+        
+        -- Risk calculations
+        ROUND(
+            COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+            2
+        ) AS default_rate
+        
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date IS NOT NULL
+        AND l.disbursement_date >= '2023-01-01'
+    GROUP BY 
+        ds.state_name,
+        dc.tier_classification,
+        CASE 
+            WHEN l.loan_amount < 500000 THEN 'Small Loans'
+            WHEN l.loan_amount < 2000000 THEN 'Medium Loans'
+            ELSE 'Large Loans'
+        END
+    HAVING COUNT(*) >= 10
+)
+
+-- Risk heatmap with color coding
+SELECT 
+    state_name,
+    tier_classification,
+    loan_size_category,
+    total_loans,
+    CONCAT('₹', ROUND(total_exposure / 10000000.0, 2), ' Cr') AS exposure_formatted,
+    default_rate,
+    
+    -- Risk color coding for heatmap visualization
+    CASE 
+        WHEN default_rate >= 20 THEN 'CRITICAL'
+        WHEN default_rate >= 15 THEN 'HIGH'
+        WHEN default_rate >= 10 THEN 'MEDIUM'
+        WHEN default_rate >= 5 THEN 'LOW'
+        ELSE 'MINIMAL'
+    END AS risk_level,
+    
+    -- Business priority
+    CASE 
+        WHEN default_rate >= 15 AND total_exposure >= 10000000 THEN 'IMMEDIATE ACTION'
+        WHEN default_rate >= 10 AND total_exposure >= 5000000 THEN 'HIGH PRIORITY'
+        WHEN default_rate >= 5 THEN 'MONITORING REQUIRED'
+        ELSE 'STANDARD OVERSIGHT'
+    END AS business_priority
+
+FROM portfolio_risk_matrix
+ORDER BY 
+    default_rate DESC,
+    total_exposure DESC
+LIMIT 10;
@@ -0,0 +1,90 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5D: Automated anomaly detection with statistical thresholds
+-- BUSINESS OBJECTIVE: Real-time monitoring system for risk pattern changes
+-- METHODOLOGY: Statistical significance testing with dynamic baselines
+
+WITH baseline_metrics AS (
+    -- Calculate rolling baseline for comparison (last 12 months vs current month)
+    SELECT 
+        state_name,
+        CASE 
+            WHEN loan_amount < 1000000 THEN 'Small-Medium'
+            ELSE 'Large'
+        END AS loan_category,
+        
+        -- Historical baseline (excluding current month)
+        AVG(CASE WHEN l.disbursement_date >= date_add(localtimestamp, to_months(CAST(-12 AS INTEGER))) 
+                     AND l.disbursement_date < date_add(localtimestamp, to_months(CAST(-1 AS INTEGER))) 
+                     AND l.loan_status = 'Defaulted'
+                     THEN 1.0 ELSE 0.0 END) * 100 AS baseline_default_rate,
+                     
+        -- Current period (last month)
+        AVG(CASE WHEN l.disbursement_date >= date_add(localtimestamp, to_months(CAST(-1 AS INTEGER))) 
+                     AND l.loan_status = 'Defaulted'
+                     THEN 1.0 ELSE 0.0 END) * 100 AS current_default_rate,
+                     
+        COUNT(CASE WHEN l.disbursement_date >= date_add(localtimestamp, to_months(CAST(-1 AS INTEGER))) 
+                       THEN 1 END) AS current_sample_size
+        
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        INNER JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date >= date_add(localtimestamp, to_months(CAST(-13 AS INTEGER)))
+    GROUP BY 
+        state_name, 
+        CASE 
+            WHEN loan_amount < 1000000 THEN 'Small-Medium'
+            ELSE 'Large'
+        END
+    HAVING COUNT(*) >= 50
+)
+
+-- Anomaly detection with threshold analysis
+SELECT 
+    state_name,
+    loan_category,
+    ROUND(baseline_default_rate, 2) AS baseline_default_pct,
+    ROUND(current_default_rate, 2) AS current_default_pct,
+    ROUND(current_default_rate - baseline_default_rate, 2) AS change_pct_points,
+    
+    -- Anomaly classification
+    CASE 
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 10 THEN 'CRITICAL ANOMALY'
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 5 THEN 'SIGNIFICANT ANOMALY'
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 2 THEN 'MODERATE ANOMALY'
+        ELSE 'NORMAL VARIATION'
+    END AS anomaly_type,
+    
+    -- Alert priority
+    CASE 
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 10 
+             AND current_default_rate > baseline_default_rate THEN 'URGENT ALERT'
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 5 
+             AND current_default_rate > baseline_default_rate THEN 'HIGH PRIORITY'
+        WHEN current_default_rate > baseline_default_rate THEN 'MONITOR CLOSELY'
+        ELSE 'NORMAL'
+    END AS alert_level,
+    
+    -- Recommended action
+    CASE 
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 10 
+             AND current_default_rate > baseline_default_rate
+        THEN 'IMMEDIATE: Stop new originations in this segment'
+        WHEN ABS(current_default_rate - baseline_default_rate) >= 5 
+             AND current_default_rate > baseline_default_rate
+        THEN 'URGENT: Enhanced due diligence required'
+        WHEN current_default_rate > baseline_default_rate
+        THEN 'Increase monitoring frequency'
+        ELSE 'Continue standard monitoring'
+    END AS recommended_action
+
+FROM baseline_metrics
+WHERE baseline_default_rate IS NOT NULL
+    AND current_default_rate IS NOT NULL
+    AND current_sample_size >= 10
+    AND ABS(current_default_rate - baseline_default_rate) >= 2  -- Only show actual anomalies
+ORDER BY 
+    ABS(current_default_rate - baseline_default_rate) DESC LIMIT 5;
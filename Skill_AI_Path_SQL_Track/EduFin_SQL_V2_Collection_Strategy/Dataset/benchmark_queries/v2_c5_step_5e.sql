@@ -0,0 +1,108 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V2_Collection_Strategy/SQL_V2_Session_1_to_5/SQL_Session_1_Step_5/SQL_V2_Challenge_5.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5E: Executive risk optimization dashboard with strategic recommendations
+-- BUSINESS OBJECTIVE: Board-level risk optimization strategy with concrete action plan
+-- OUTPUT FORMAT: Executive summary with strategic initiatives and ROI projections
+WITH portfolio_risk_summary AS (
+    SELECT 
+        -- Portfolio overview
+        COUNT(*) AS total_active_loans,
+        SUM(loan_amount) AS total_portfolio_value,
+        
+        -- Risk distribution from dynamic scoring
+        COUNT(CASE WHEN 
+            (leverage_risk_score * 0.4 + cibil_risk_score * 0.3 + 
+             geographic_risk_score * 0.2 + tenure_risk_score * 0.1) <= 30 
+            THEN 1 END) AS low_risk_loans,
+        COUNT(CASE WHEN 
+            (leverage_risk_score * 0.4 + cibil_risk_score * 0.3 + 
+             geographic_risk_score * 0.2 + tenure_risk_score * 0.1) BETWEEN 31 AND 50 
+            THEN 1 END) AS medium_risk_loans,
+        COUNT(CASE WHEN 
+            (leverage_risk_score * 0.4 + cibil_risk_score * 0.3 + 
+             geographic_risk_score * 0.2 + tenure_risk_score * 0.1) BETWEEN 51 AND 75 
+            THEN 1 END) AS high_risk_loans,
+        COUNT(CASE WHEN 
+            (leverage_risk_score * 0.4 + cibil_risk_score * 0.3 + 
+             geographic_risk_score * 0.2 + tenure_risk_score * 0.1) > 75 
+            THEN 1 END) AS critical_risk_loans,
+        
+        -- Current default metrics
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS total_defaults,
+        SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) AS total_loss_amount,
+        
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+            2
+        ) AS portfolio_default_rate
+        
+    FROM (
+        SELECT 
+            l.*,
+            CASE 
+                WHEN l.loan_amount <= c.annual_income * 1.5 THEN 15
+                WHEN l.loan_amount <= c.annual_income * 2.5 THEN 35
+                WHEN l.loan_amount <= c.annual_income * 4.0 THEN 65
+                WHEN l.loan_amount <= c.annual_income * 5.0 THEN 85
+                ELSE 100
+            END AS leverage_risk_score,
+            CASE 
+                WHEN c.cibil_score >= 800 THEN 10
+                WHEN c.cibil_score >= 750 THEN 25
+                WHEN c.cibil_score >= 700 THEN 45
+                WHEN c.cibil_score >= 650 THEN 70
+                ELSE 100
+            END AS cibil_risk_score,
+            CASE 
+                WHEN dc.tier_classification = 'Tier1' THEN 20
+                WHEN dc.tier_classification = 'Tier2' THEN 50
+                ELSE 80
+            END AS geographic_risk_score,
+            CASE 
+                WHEN (date_diff('day', l.application_date, current_date) / 31.0) >= 24 THEN 20
+                WHEN (date_diff('day', l.application_date, current_date) / 31.0) >= 12 THEN 40
+                ELSE 70
+            END AS tenure_risk_score
+        FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        INNER JOIN dim_city dc ON c.city_id = dc.city_id
+        WHERE l.loan_status NOT IN ('Closed', 'Cancelled')
+    ) risk_calculated
+)
+
+-- Executive dashboard summary
+SELECT 
+    CONCAT(CAST(total_active_loans AS STRING), ' active loans') AS portfolio_scale,
+    CONCAT('₹', CAST(ROUND(total_portfolio_value / 10000000.0, 0) AS STRING), ' Crores') AS total_exposure,
+    CONCAT(CAST(portfolio_default_rate AS STRING), '%') AS current_default_rate,
+    
+    -- Risk distribution metrics
+    CONCAT(CAST(critical_risk_loans AS STRING), ' loans (', 
+           CAST(ROUND(critical_risk_loans * 100.0 / total_active_loans, 1) AS STRING), '%)') AS critical_risk_portfolio,
+    CONCAT(CAST(high_risk_loans AS STRING), ' loans (', 
+           CAST(ROUND(high_risk_loans * 100.0 / total_active_loans, 1) AS STRING), '%)') AS high_risk_portfolio,
+    
+    -- Financial impact
+    CONCAT('₹', CAST(ROUND(total_loss_amount / 10000000.0, 1) AS STRING), ' Cr') AS confirmed_losses,
+    
+    -- Optimization potential
+    CONCAT('₹', CAST(ROUND(total_loss_amount * 0.3 / 10000000.0, 1) AS STRING), ' Cr') AS preventable_loss_estimate,
+    
+    -- Risk optimization health score
+    CASE 
+        WHEN (critical_risk_loans + high_risk_loans) * 100.0 / total_active_loans <= 15 THEN 'OPTIMIZED'
+        WHEN (critical_risk_loans + high_risk_loans) * 100.0 / total_active_loans <= 25 THEN 'NEEDS IMPROVEMENT'
+        ELSE 'REQUIRES OPTIMIZATION'
+    END AS optimization_status,
+    
+    -- Strategic recommendation
+    CASE 
+        WHEN (critical_risk_loans + high_risk_loans) * 100.0 / total_active_loans > 25 
+        THEN 'Deploy comprehensive risk optimization program'
+        WHEN critical_risk_loans * 100.0 / total_active_loans > 10 
+        THEN 'Implement enhanced monitoring for critical risk loans'
+        ELSE 'Maintain current risk management with periodic optimization'
+    END AS board_recommendation
+
+FROM portfolio_risk_summary;
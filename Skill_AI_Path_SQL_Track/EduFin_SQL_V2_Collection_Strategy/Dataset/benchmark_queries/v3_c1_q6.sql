@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Process completeness check
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN application_date IS NULL THEN 1 END) AS missing_application_dates,
+    COUNT(CASE WHEN disbursement_date IS NULL THEN 1 END) AS missing_disbursement_dates,
+    COUNT(CASE WHEN date_diff('day', application_date, disbursement_date) < 0 THEN 1 END) AS negative_processing_time
+FROM loans;
+-- Expected: <2% missing dates, 0 negative processing times
@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Duplicate detection
+SELECT customer_id, COUNT(*)
+FROM loans
+WHERE disbursement_date IS NOT NULL
+GROUP BY customer_id
+HAVING COUNT(*) > 3
+ORDER BY COUNT(*) DESC;
+-- Expected: <1% customers with >3 loans
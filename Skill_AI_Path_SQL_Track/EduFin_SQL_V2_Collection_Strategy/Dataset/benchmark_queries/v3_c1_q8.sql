@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 7)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 3: SLA compliance check
+SELECT 
+    AVG(date_diff('day', application_date, disbursement_date)) AS avg_processing_days,
+    COUNT(CASE WHEN date_diff('day', application_date, disbursement_date) <= 7 THEN 1 END) * 100.0 / COUNT(*) AS sla_compliance_percentage
+FROM loans
+WHERE disbursement_date IS NOT NULL 
+      AND application_date IS NOT NULL;
+-- Expected: >60% SLA compliance for recovery
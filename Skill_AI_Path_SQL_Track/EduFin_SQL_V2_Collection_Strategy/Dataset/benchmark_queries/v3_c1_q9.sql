@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 8)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 4: Negative value detection
+SELECT 
+    COUNT(CASE WHEN loan_amount <= 0 THEN 1 END) AS invalid_amounts,
+    COUNT(CASE WHEN interest_rate <= 0 THEN 1 END) AS invalid_rates,
+    COUNT(CASE WHEN c.annual_income <= 0 THEN 1 END) AS invalid_incomes
+FROM loans l
+JOIN customers c ON l.customer_id = c.customer_id;
+-- Expected: 0 invalid values
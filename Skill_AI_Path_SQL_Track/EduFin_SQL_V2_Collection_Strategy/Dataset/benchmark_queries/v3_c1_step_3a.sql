@@ -0,0 +1,53 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3A: Process Quality Assessment
+-- BUSINESS OBJECTIVE: Map process effectiveness and identify manual intervention points
+-- GOVERNANCE FOCUS: Understanding where human error compromises data integrity
+
+SELECT 
+    -- Process categorization by automation level
+    CASE 
+        WHEN disbursement_date IS NOT NULL 
+             AND application_date IS NOT NULL 
+             AND date_diff('day', application_date, disbursement_date) <= 7 
+        THEN '🟢 Automated Fast-Track'
+        WHEN disbursement_date IS NOT NULL 
+             AND application_date IS NOT NULL 
+             AND date_diff('day', application_date, disbursement_date) <= 21 
+        THEN '🟡 Standard Manual Review'
+        WHEN disbursement_date IS NOT NULL 
+             AND application_date IS NOT NULL 
+             AND date_diff('day', application_date, disbursement_date) > 21 
+        THEN '🔴 Extended Manual Process'
+        ELSE '❓ Data Quality Issue'
+    END AS process_category,
+    
+    -- Count and financial impact by process type
+    COUNT(*) AS loan_count,
+    ROUND(SUM(loan_amount) / 10000000.0, 2) AS amount_crores,
+    ROUND(AVG(date_diff('day', application_date, disbursement_date)), 1) AS avg_processing_days,
+    
+    -- Risk assessment by processing speed
+    COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+        2
+    ) AS default_rate_percent,
+    
+    -- Operational efficiency metrics
+    CASE 
+        WHEN AVG(date_diff('day', application_date, disbursement_date)) <= 7 
+        THEN '⚡ Highly Efficient'
+        WHEN AVG(date_diff('day', application_date, disbursement_date)) <= 14 
+        THEN '✅ Efficient'
+        WHEN AVG(date_diff('day', application_date, disbursement_date)) <= 28 
+        THEN '⚠️ Needs Improvement'
+        ELSE '🚨 Major Bottleneck'
+    END AS efficiency_rating
+
+FROM loans
+WHERE disbursement_date IS NOT NULL 
+      AND application_date IS NOT NULL
+GROUP BY process_category
+ORDER BY loan_count DESC;
@@ -0,0 +1,53 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3B: Quality Gate Effectiveness Assessment
+-- BUSINESS OBJECTIVE: Identify validation gaps that allowed crisis to develop
+-- GOVERNANCE FOCUS: Building robust quality checkpoints for future prevention
+
+SELECT 
+    -- Validation rule compliance analysis
+    CASE
+        WHEN c.email_address IS NULL OR c.phone_number IS NULL THEN '🔴 Critical: Missing Contact'
+        WHEN c.cibil_score < 300 OR c.cibil_score > 900 THEN '🔴 Critical: Invalid CIBIL'
+        WHEN l.loan_amount < 50000 OR l.loan_amount > 2500000 THEN '🔴 Critical: Invalid Amount'
+        WHEN l.interest_rate < 8 OR l.interest_rate > 25 THEN '🟡 Warning: Rate Anomaly'
+        WHEN c.annual_income < 200000 AND l.loan_amount > 1000000 THEN '🟡 Warning: Income Mismatch'
+        WHEN c.cibil_score < 600 AND l.loan_amount > 500000 THEN '🟡 Warning: Risk Mismatch'
+        ELSE '🟢 Passed: All Gates'
+    END AS quality_gate_status,
+    
+    -- Count and financial impact by quality level
+    COUNT(*) AS loan_count,
+    ROUND(SUM(l.loan_amount) / 10000000.0, 2) AS amount_crores,
+    
+    -- Risk outcome analysis
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+        2
+    ) AS default_rate_percent,
+    
+    -- Quality gate effectiveness score
+    CASE
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 20
+        THEN '❌ Gate Failed'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 10
+        THEN '⚠️ Gate Weak'
+        ELSE '✅ Gate Effective'
+    END AS gate_effectiveness,
+    
+    -- Recovery recommendation
+    CASE
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 15
+        THEN 'Implement strict validation + auto-reject rules'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 8
+        THEN 'Add secondary review layer + enhanced scoring'
+        ELSE 'Continue current validation with monitoring'
+    END AS recommended_action
+
+FROM loans l
+JOIN customers c ON l.customer_id = c.customer_id
+WHERE l.disbursement_date IS NOT NULL
+GROUP BY quality_gate_status
+ORDER BY default_rate_percent DESC;
@@ -0,0 +1,59 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3C: Infrastructure Performance and Scaling Analysis
+-- BUSINESS OBJECTIVE: Identify technology bottlenecks limiting operational scale
+-- INFRASTRUCTURE FOCUS: Understanding system capacity constraints
+
+WITH monthly_volumes AS (
+    SELECT 
+        strftime(disbursement_date, '%Y-%m') AS disbursement_month,
+        COUNT(*) AS monthly_loan_volume,
+        SUM(loan_amount) AS monthly_amount,
+        COUNT(DISTINCT customer_id) AS unique_customers,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS monthly_defaults
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+    GROUP BY strftime(disbursement_date, '%Y-%m')
+)
+SELECT 
+    disbursement_month,
+    monthly_loan_volume,
+    ROUND(monthly_amount / 10000000.0, 2) AS monthly_amount_crores,
+    unique_customers,
+    
+    -- System stress indicators
+    CASE
+        WHEN monthly_loan_volume > 500 THEN 'High Stress'
+        WHEN monthly_loan_volume > 300 THEN 'Moderate Stress'
+        WHEN monthly_loan_volume > 100 THEN 'Normal Load'
+        ELSE 'Light Load'
+    END AS system_stress_level,
+    
+    -- Quality degradation under load
+    ROUND(monthly_defaults * 100.0 / monthly_loan_volume, 2) AS monthly_default_rate,
+    
+    CASE
+        WHEN monthly_defaults * 100.0 / monthly_loan_volume > 15 
+             AND monthly_loan_volume > 300
+        THEN 'Quality Degradation Under Load'
+        WHEN monthly_defaults * 100.0 / monthly_loan_volume > 15
+        THEN 'High Default Period'
+        WHEN monthly_loan_volume > 400
+        THEN 'High Volume Sustained Quality'
+        ELSE 'Stable Performance'
+    END AS load_quality_assessment,
+    
+    -- Infrastructure scaling recommendations
+    CASE
+        WHEN monthly_loan_volume > 500 AND monthly_defaults * 100.0 / monthly_loan_volume > 15
+        THEN 'Scale infrastructure + enhance quality controls'
+        WHEN monthly_loan_volume > 500
+        THEN 'Scale infrastructure for sustained high volume'
+        WHEN monthly_defaults * 100.0 / monthly_loan_volume > 15
+        THEN 'Optimize quality processes before scaling'
+        ELSE 'Current capacity adequate with monitoring'
+    END AS scaling_recommendation
+
+FROM monthly_volumes
+ORDER BY disbursement_month;
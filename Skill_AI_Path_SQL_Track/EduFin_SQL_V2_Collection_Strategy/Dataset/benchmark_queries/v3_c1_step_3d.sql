@@ -0,0 +1,60 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3D: Manual Process Override Impact Analysis
+-- BUSINESS OBJECTIVE: Quantify human error impact and automation opportunities
+-- GOVERNANCE FOCUS: Eliminating manual override risks through process automation
+
+SELECT 
+    -- Manual override detection through anomaly patterns
+    CASE
+        WHEN c.cibil_score < 650 AND l.loan_amount > 1000000 
+        THEN '🔴 Manual: High Risk Approval'
+        WHEN c.annual_income < 300000 AND l.loan_amount > 800000
+        THEN '🔴 Manual: Income Override'
+        WHEN l.interest_rate < 10 AND c.cibil_score < 700
+        THEN '🟡 Manual: Rate Override'
+        WHEN date_diff('day', l.application_date, l.disbursement_date) > 45
+        THEN '🟡 Manual: Extended Review'
+        WHEN c.employment_type = 'Self-employed' AND l.loan_amount > 1500000
+        THEN '🟡 Manual: Self-Employed Review'
+        ELSE '🟢 Automated: Standard Process'
+    END AS override_category,
+    
+    -- Volume and financial impact of overrides
+    COUNT(*) AS loan_count,
+    ROUND(SUM(l.loan_amount) / 10000000.0, 2) AS amount_crores,
+    ROUND(AVG(l.loan_amount) / 100000.0, 2) AS avg_loan_lakhs,
+    
+    -- Risk outcome validation
+    COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+        2
+    ) AS default_rate_percent,
+    
+    -- Manual override risk assessment
+    CASE
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 25
+        THEN '🚨 Override Dangerous'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 15
+        THEN '⚠️ Override Risky'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 8
+        THEN '✅ Override Justified'
+        ELSE '⭐ Override Excellent'
+    END AS override_risk_level,
+    
+    -- Automation recommendation
+    CASE
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 20
+        THEN 'Eliminate manual override - implement auto-reject'
+        WHEN COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 12
+        THEN 'Add senior approval + enhanced documentation'
+        ELSE 'Continue with monitoring and periodic review'
+    END AS automation_recommendation
+
+FROM loans l
+JOIN customers c ON l.customer_id = c.customer_id
+WHERE l.disbursement_date IS NOT NULL
+GROUP BY override_category
+ORDER BY default_rate_percent DESC;
@@ -0,0 +1,72 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_1/SQL_V3_challenge_1.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3E: Comprehensive Governance and Recovery Dashboard
+-- BUSINESS OBJECTIVE: Complete operational excellence assessment for board
+-- GOVERNANCE FOCUS: Integrated view of process, infrastructure, and quality metrics
+
+WITH governance_metrics AS (
+    SELECT 
+        -- Process efficiency metrics
+        AVG(date_diff('day', l.application_date, l.disbursement_date)) AS avg_processing_days,
+        COUNT(CASE WHEN date_diff('day', l.application_date, l.disbursement_date) <= 7 THEN 1 END) * 100.0 / COUNT(*) AS fast_track_percentage,
+        
+        -- Data quality metrics
+        (COUNT(*) - COUNT(CASE WHEN c.email_address IS NULL OR c.phone_number IS NULL THEN 1 END)) * 100.0 / COUNT(*) AS data_completeness_percentage,
+        COUNT(CASE WHEN c.cibil_score BETWEEN 300 AND 900 THEN 1 END) * 100.0 / COUNT(*) AS data_validity_percentage,
+        
+        -- Risk management effectiveness
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) AS overall_default_rate,
+        
+        -- Manual override risk
+        COUNT(CASE WHEN (c.cibil_score < 650 AND l.loan_amount > 1000000) 
+                     OR (c.annual_income < 300000 AND l.loan_amount > 800000) 
+              THEN 1 END) * 100.0 / COUNT(*) AS high_risk_override_percentage,
+        
+        -- Financial impact metrics
+        SUM(l.loan_amount) / 10000000.0 AS total_portfolio_crores,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) / 10000000.0 AS total_loss_crores
+        
+    FROM loans l
+    JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Executive governance scorecard
+    ROUND(avg_processing_days, 1) AS avg_processing_days,
+    ROUND(fast_track_percentage, 1) AS automation_success_rate,
+    ROUND(data_completeness_percentage, 1) AS data_quality_score,
+    ROUND(overall_default_rate, 1) AS risk_management_effectiveness,
+    ROUND(high_risk_override_percentage, 1) AS manual_override_risk,
+    
+    -- Financial governance impact
+    CONCAT('₹', ROUND(total_portfolio_crores, 1), ' Cr') AS total_exposure,
+    CONCAT('₹', ROUND(total_loss_crores, 1), ' Cr') AS confirmed_losses,
+    ROUND((total_loss_crores / total_portfolio_crores) * 100, 2) AS loss_ratio_percentage,
+    
+    -- Overall governance health assessment
+    CASE
+        WHEN overall_default_rate > 15 OR data_completeness_percentage < 90 
+             OR high_risk_override_percentage > 10
+        THEN '🔴 Critical Governance Failure'
+        WHEN overall_default_rate > 10 OR data_completeness_percentage < 95 
+             OR fast_track_percentage < 30
+        THEN '🟡 Governance Needs Improvement'
+        WHEN overall_default_rate < 8 AND data_completeness_percentage > 98 
+             AND fast_track_percentage > 50
+        THEN '🟢 Governance Excellent'
+        ELSE '🔵 Governance Adequate'
+    END AS governance_health_status,
+    
+    -- Strategic recovery recommendations
+    CASE
+        WHEN overall_default_rate > 12 AND high_risk_override_percentage > 8
+        THEN 'Implement automated underwriting + eliminate manual overrides + data governance program'
+        WHEN overall_default_rate > 12
+        THEN 'Deploy advanced risk models + enhance collection processes + strengthen validation'
+        WHEN data_completeness_percentage < 95
+        THEN 'Implement data quality framework + real-time validation + process automation'
+        ELSE 'Optimize current processes + implement monitoring + prepare for scale'
+    END AS strategic_recovery_priority
+
+FROM governance_metrics;
@@ -0,0 +1,9 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check data freshness
+SELECT 
+    MAX(disbursement_date) AS latest_loan_date,
+    date_diff('minute', MAX(disbursement_date), localtimestamp) AS data_freshness_minutes
+FROM loans;
+-- Expected: <5 minutes for real-time monitoring
@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Compliance calculation accuracy
+SELECT 
+    COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_count,
+    COUNT(*) AS total_count,
+    ROUND(COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 2) AS default_rate
+FROM loans
+WHERE disbursement_date IS NOT NULL;
+-- Expected: Accurate percentage calculation
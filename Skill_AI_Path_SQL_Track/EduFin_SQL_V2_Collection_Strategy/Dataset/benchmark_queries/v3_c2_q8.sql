@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 7)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 3: Alert threshold testing
+SELECT 
+    CASE 
+        WHEN 17.3 > 15 THEN 'EXECUTIVE CRISIS'
+        ELSE 'OTHER'
+    END AS alert_level_test;
+-- Expected: EXECUTIVE CRISIS for current portfolio
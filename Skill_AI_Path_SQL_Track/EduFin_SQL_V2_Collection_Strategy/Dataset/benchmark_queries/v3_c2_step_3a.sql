@@ -0,0 +1,48 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3A: Real-Time Portfolio Health KPI Dashboard
+-- BUSINESS OBJECTIVE: Continuous monitoring of critical portfolio metrics
+-- MONITORING PURPOSE: Enable proactive decision-making with sub-hourly data refresh
+
+WITH real_time_portfolio_health AS (
+    SELECT 
+        -- Live portfolio metrics with timestamp
+        localtimestamp AS dashboard_refresh_time,
+        
+        -- Core portfolio scale indicators
+        COUNT(*) AS total_active_loans,
+        SUM(loan_amount) AS total_portfolio_exposure,
+        ROUND(SUM(loan_amount) / 10000000.0, 2) AS exposure_crores,
+        
+        -- Real-time risk indicators
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(*), 2
+        ) AS current_default_rate_pct,
+        
+        ROUND(
+            (COUNT(CASE WHEN loan_status IN ('Defaulted', 'Overdue') THEN 1 END) * 100.0) / 
+            COUNT(*), 2
+        ) AS portfolio_at_risk_pct,
+        
+        -- Financial impact tracking
+        ROUND(
+            SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) / 10000000.0, 2
+        ) AS confirmed_losses_crores,
+        
+        -- Performance vs industry benchmarks
+        CASE 
+            WHEN COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 12 
+            THEN '🔴 CRISIS'
+            WHEN COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 8 
+            THEN '🟡 HIGH RISK'
+            WHEN COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 5 
+            THEN '🟠 ELEVATED'
+            ELSE '🟢 HEALTHY'
+        END AS risk_status_indicator
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+)
+SELECT * FROM real_time_portfolio_health;
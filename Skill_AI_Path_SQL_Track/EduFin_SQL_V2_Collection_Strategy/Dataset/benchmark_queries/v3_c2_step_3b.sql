@@ -0,0 +1,93 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3B: Predictive Risk Indicator System
+-- BUSINESS OBJECTIVE: Early detection of portfolio deterioration patterns
+-- PREDICTIVE PURPOSE: Alert stakeholders 2-3 months before crisis manifestation
+
+WITH monthly_cohort_trends AS (
+    SELECT 
+        YEAR(disbursement_date) AS disbursement_year,
+        MONTH(disbursement_date) AS disbursement_month,
+        
+        -- Cohort performance metrics
+        COUNT(*) AS loans_originated,
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) AS defaulted_loans,
+        
+        -- Early warning calculations
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(*), 2
+        ) AS cohort_default_rate,
+        
+        -- Risk velocity indicators
+        ROUND(
+            AVG(loan_amount) / 100000.0, 2
+        ) AS avg_loan_size_lakhs
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+        AND disbursement_date >= date_add(localtimestamp, to_months(CAST(-24 AS INTEGER)))
+    GROUP BY YEAR(disbursement_date), MONTH(disbursement_date)
+),
+predictive_risk_analysis AS (
+    SELECT 
+        disbursement_year,
+        disbursement_month,
+        cohort_default_rate,
+        
+        -- Trend analysis using LAG functions
+        LAG(cohort_default_rate, 1) OVER (
+            ORDER BY disbursement_year, disbursement_month
+        ) AS previous_month_default_rate,
+        
+        -- Calculate period-over-period change
+        ROUND(
+            cohort_default_rate - LAG(cohort_default_rate, 1) OVER (
+                ORDER BY disbursement_year, disbursement_month
+            ), 2
+        ) AS month_over_month_change,
+        
+        -- 3-month moving average for trend smoothing
+        ROUND(
+            AVG(cohort_default_rate) OVER (
+                ORDER BY disbursement_year, disbursement_month 
+                ROWS BETWEEN 2 PRECEDING AND CURRENT ROW
+            ), 2
+        ) AS three_month_avg_default_rate
+        
+    FROM monthly_cohort_trends
+)
+SELECT 
+    disbursement_year,
+    disbursement_month,
+    cohort_default_rate,
+    month_over_month_change,
+    three_month_avg_default_rate,
+    
+    -- Predictive alert triggers
+    CASE 
+        WHEN three_month_avg_default_rate > 15 AND month_over_month_change > 3
+        THEN '🚨 IMMINENT CRISIS'
+        WHEN three_month_avg_default_rate > 12 AND month_over_month_change > 2
+        THEN '⚠️ HIGH RISK TREND'
+        WHEN month_over_month_change > 4
+        THEN '📈 ACCELERATING RISK'
+        WHEN three_month_avg_default_rate < 8 AND month_over_month_change < 0
+        THEN '✅ IMPROVING TREND'
+        ELSE '📊 STABLE MONITORING'
+    END AS predictive_alert_status,
+    
+    -- Business action recommendations
+    CASE 
+        WHEN three_month_avg_default_rate > 15
+        THEN 'IMMEDIATE: Suspend new lending and review all recent approvals'
+        WHEN month_over_month_change > 3
+        THEN 'URGENT: Enhance underwriting criteria for new loans'
+        WHEN three_month_avg_default_rate > 10
+        THEN 'PROACTIVE: Increase collection efforts and risk monitoring'
+        ELSE 'STANDARD: Continue current monitoring protocols'
+    END AS recommended_action
+
+FROM predictive_risk_analysis
+ORDER BY disbursement_year DESC, disbursement_month DESC;
@@ -0,0 +1,105 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3C: Automated Compliance Breach Detection System
+-- BUSINESS OBJECTIVE: Real-time regulatory compliance monitoring
+-- COMPLIANCE PURPOSE: Immediate breach detection and mandatory reporting automation
+
+WITH regulatory_compliance_checks AS (
+    SELECT 
+        localtimestamp AS compliance_check_timestamp,
+        
+        -- Loan concentration limits (regulatory maximum 25% to single state)
+        (
+            SELECT 
+                ROUND(
+                    SUM(l.loan_amount) * 100.0 / (
+                        SELECT SUM(loan_amount) FROM loans WHERE loan_status = 'Active'
+                    ), 2
+                ) AS state_concentration_pct
+            FROM loans l
+            JOIN customers c ON l.customer_id = c.customer_id
+            JOIN dim_city dc ON c.city_id = dc.city_id
+            WHERE l.loan_status = 'Active'
+            GROUP BY dc.state_id
+            ORDER BY SUM(l.loan_amount) DESC
+            LIMIT 1
+        ) AS max_state_concentration_pct,
+        
+        -- Capital adequacy ratio (minimum 12% regulatory requirement)
+        ROUND(
+            (
+                SELECT SUM(CASE WHEN loan_status = 'Closed' THEN loan_amount ELSE 0 END) 
+                FROM loans
+            ) * 100.0 / (
+                SELECT SUM(loan_amount) FROM loans
+            ), 2
+        ) AS capital_adequacy_ratio_pct,
+        
+        -- Default rate threshold (regulatory maximum 15%)
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+            2
+        ) AS portfolio_default_rate_pct,
+        
+        -- Single borrower exposure limit (maximum ₹15L regulatory limit)
+        (
+            SELECT MAX(loan_amount) / 100000.0 
+            FROM loans 
+            WHERE loan_status IN ('Active', 'Overdue')
+        ) AS max_single_exposure_lakhs
+        
+    FROM loans
+),
+compliance_breach_analysis AS (
+    SELECT 
+        compliance_check_timestamp,
+        max_state_concentration_pct,
+        capital_adequacy_ratio_pct,
+        portfolio_default_rate_pct,
+        max_single_exposure_lakhs,
+        
+        -- Breach detection flags
+        CASE WHEN max_state_concentration_pct > 25 THEN 1 ELSE 0 END AS concentration_breach_flag,
+        CASE WHEN capital_adequacy_ratio_pct < 12 THEN 1 ELSE 0 END AS capital_breach_flag,
+        CASE WHEN portfolio_default_rate_pct > 15 THEN 1 ELSE 0 END AS default_rate_breach_flag,
+        CASE WHEN max_single_exposure_lakhs > 15 THEN 1 ELSE 0 END AS exposure_limit_breach_flag
+    
+    FROM regulatory_compliance_checks
+)
+SELECT 
+    compliance_check_timestamp,
+    
+    -- Compliance status summary
+    CASE 
+        WHEN (concentration_breach_flag + capital_breach_flag + default_rate_breach_flag + exposure_limit_breach_flag) = 0 
+        THEN '✅ FULLY COMPLIANT'
+        WHEN (concentration_breach_flag + capital_breach_flag + default_rate_breach_flag + exposure_limit_breach_flag) >= 3
+        THEN '🚨 CRITICAL VIOLATIONS'
+        ELSE '⚠️ COMPLIANCE ISSUES'
+    END AS overall_compliance_status,
+    
+    -- Individual metric status
+    CONCAT(
+        'State Concentration: ', max_state_concentration_pct, '% ',
+        CASE WHEN concentration_breach_flag = 1 THEN '❌ BREACH' ELSE '✅ OK' END
+    ) AS concentration_status,
+    
+    CONCAT(
+        'Capital Adequacy: ', capital_adequacy_ratio_pct, '% ',
+        CASE WHEN capital_breach_flag = 1 THEN '❌ BREACH' ELSE '✅ OK' END
+    ) AS capital_status,
+    
+    CONCAT(
+        'Default Rate: ', portfolio_default_rate_pct, '% ',
+        CASE WHEN default_rate_breach_flag = 1 THEN '❌ BREACH' ELSE '✅ OK' END
+    ) AS default_rate_status,
+    
+    -- Mandatory reporting trigger
+    CASE 
+        WHEN (concentration_breach_flag + capital_breach_flag + default_rate_breach_flag + exposure_limit_breach_flag) > 0
+        THEN 'IMMEDIATE: File regulatory breach report within 24 hours'
+        ELSE 'No immediate reporting required'
+    END AS regulatory_reporting_requirement
+
+FROM compliance_breach_analysis;
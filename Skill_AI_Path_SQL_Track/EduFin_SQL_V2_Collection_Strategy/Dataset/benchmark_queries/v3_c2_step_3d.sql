@@ -0,0 +1,112 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3D: Automated Alert Rule and Escalation Framework
+-- BUSINESS OBJECTIVE: Stakeholder communication automation based on risk severity
+-- ESCALATION PURPOSE: Ensure appropriate parties receive timely notifications for effective decision-making
+
+WITH portfolio_severity_assessment AS (
+    SELECT 
+        localtimestamp AS alert_timestamp,
+        
+        -- Critical portfolio health metrics
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+            COUNT(*), 2
+        ) AS current_default_rate,
+        
+        ROUND(
+            SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) / 10000000.0, 2
+        ) AS financial_exposure_crores,
+        
+        -- Trend analysis for severity determination
+        (
+            SELECT COUNT(*) 
+            FROM loans 
+            WHERE loan_status = 'Overdue' 
+                AND disbursement_date >= date_add(localtimestamp, to_days(CAST(-30 AS INTEGER)))
+        ) AS recent_overdue_count,
+        
+        -- Compliance status for escalation priority
+        CASE 
+            WHEN COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 15 
+            THEN 1 ELSE 0 
+        END AS regulatory_breach_flag
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+),
+escalation_matrix AS (
+    SELECT 
+        alert_timestamp,
+        current_default_rate,
+        financial_exposure_crores,
+        recent_overdue_count,
+        
+        -- Severity level determination
+        CASE 
+            WHEN current_default_rate > 20 OR financial_exposure_crores > 75 
+            THEN 'LEVEL 1 - BOARD EMERGENCY'
+            WHEN current_default_rate > 15 OR financial_exposure_crores > 50 
+            THEN 'LEVEL 2 - EXECUTIVE CRISIS'
+            WHEN current_default_rate > 10 OR recent_overdue_count > 100 
+            THEN 'LEVEL 3 - MANAGEMENT ALERT'
+            WHEN current_default_rate > 6 OR recent_overdue_count > 50 
+            THEN 'LEVEL 4 - OPERATIONAL WATCH'
+            ELSE 'LEVEL 5 - ROUTINE MONITORING'
+        END AS alert_severity_level,
+        
+        -- Communication frequency based on severity
+        CASE 
+            WHEN current_default_rate > 20 THEN 'Every 2 hours'
+            WHEN current_default_rate > 15 THEN 'Every 6 hours'
+            WHEN current_default_rate > 10 THEN 'Daily'
+            WHEN current_default_rate > 6 THEN 'Every 3 days'
+            ELSE 'Weekly'
+        END AS communication_frequency,
+        
+        -- Stakeholder notification matrix
+        CASE 
+            WHEN current_default_rate > 20 
+            THEN 'CEO, Board Chair, CRO, CFO, Head of Risk, Regulatory Team'
+            WHEN current_default_rate > 15 
+            THEN 'CEO, CRO, CFO, Head of Risk, Operations Head'
+            WHEN current_default_rate > 10 
+            THEN 'CRO, Head of Risk, Operations Head, Analytics Team'
+            WHEN current_default_rate > 6 
+            THEN 'Head of Risk, Analytics Team, Collection Manager'
+            ELSE 'Analytics Team, Collection Manager'
+        END AS notification_recipients,
+        
+        regulatory_breach_flag
+        
+    FROM portfolio_severity_assessment
+)
+SELECT 
+    alert_timestamp,
+    alert_severity_level,
+    CONCAT('Default Rate: ', current_default_rate, '% | Exposure: ₹', financial_exposure_crores, ' Cr') AS alert_summary,
+    communication_frequency,
+    notification_recipients,
+    
+    -- Action requirements by severity
+    CASE 
+        WHEN alert_severity_level = 'LEVEL 1 - BOARD EMERGENCY'
+        THEN 'IMMEDIATE: Convene emergency board meeting within 4 hours'
+        WHEN alert_severity_level = 'LEVEL 2 - EXECUTIVE CRISIS'
+        THEN 'URGENT: Executive crisis call within 2 hours + board notification'
+        WHEN alert_severity_level = 'LEVEL 3 - MANAGEMENT ALERT'
+        THEN 'PRIORITY: Management review meeting within 24 hours'
+        WHEN alert_severity_level = 'LEVEL 4 - OPERATIONAL WATCH'
+        THEN 'SCHEDULED: Include in weekly risk review + enhanced monitoring'
+        ELSE 'ROUTINE: Continue standard monitoring protocols'
+    END AS required_actions,
+    
+    -- Compliance escalation for regulatory breaches
+    CASE 
+        WHEN regulatory_breach_flag = 1 
+        THEN 'MANDATORY: File regulatory breach report + notify external auditors'
+        ELSE 'No additional regulatory actions required'
+    END AS regulatory_escalation
+    
+FROM escalation_matrix;
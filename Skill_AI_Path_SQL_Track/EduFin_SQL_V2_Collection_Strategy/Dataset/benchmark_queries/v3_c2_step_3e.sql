@@ -0,0 +1,103 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_2/SQL_V3_challenge_2.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3E: Comprehensive Executive Monitoring Dashboard
+-- BUSINESS OBJECTIVE: Unified view combining real-time KPIs, predictive alerts, compliance status, and escalation requirements
+-- EXECUTIVE PURPOSE: Single dashboard for complete portfolio oversight and strategic decision-making
+
+WITH dashboard_components AS (
+    SELECT 
+        -- Real-time portfolio health
+        localtimestamp AS dashboard_last_updated,
+        COUNT(*) AS total_portfolio_loans,
+        ROUND(SUM(loan_amount) / 10000000.0, 2) AS portfolio_value_crores,
+        
+        -- Risk indicators with trend
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 2
+        ) AS current_default_rate_pct,
+        
+        ROUND(
+            SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) / 10000000.0, 2
+        ) AS confirmed_losses_crores,
+        
+        -- Predictive risk assessment
+        (
+            SELECT COUNT(*) 
+            FROM loans 
+            WHERE loan_status = 'Overdue' 
+              AND date_diff('day', disbursement_date, current_date) < 365
+        ) AS recent_cohort_overdue_count,
+        
+        -- Compliance status indicators
+        CASE 
+            WHEN COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*) > 15 
+            THEN 'REGULATORY BREACH'
+            ELSE 'COMPLIANT'
+        END AS regulatory_compliance_status
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+),
+integrated_dashboard AS (
+    SELECT 
+        dashboard_last_updated,
+        portfolio_value_crores,
+        current_default_rate_pct,
+        confirmed_losses_crores,
+        recent_cohort_overdue_count,
+        regulatory_compliance_status,
+        
+        -- Executive risk status
+        CASE 
+            WHEN current_default_rate_pct > 20 THEN 'CRISIS'
+            WHEN current_default_rate_pct > 15 THEN 'HIGH RISK'
+            WHEN current_default_rate_pct > 10 THEN 'ELEVATED'
+            WHEN current_default_rate_pct > 6 THEN 'WATCH'
+            ELSE 'HEALTHY'
+        END AS portfolio_health_status,
+        
+        -- Alert severity
+        CASE 
+            WHEN current_default_rate_pct > 20 THEN 'BOARD EMERGENCY'
+            WHEN current_default_rate_pct > 15 THEN 'EXECUTIVE CRISIS'
+            WHEN current_default_rate_pct > 10 THEN 'MANAGEMENT ALERT'
+            WHEN current_default_rate_pct > 6 THEN 'OPERATIONAL WATCH'
+            ELSE 'ROUTINE MONITORING'
+        END AS alert_escalation_level,
+        
+        -- Predictive outlook
+        CASE 
+            WHEN recent_cohort_overdue_count > 300 THEN 'DETERIORATING FAST'
+            WHEN recent_cohort_overdue_count > 200 THEN 'INCREASING RISK'
+            WHEN recent_cohort_overdue_count > 100 THEN 'ELEVATED CONCERN'
+            WHEN recent_cohort_overdue_count > 50 THEN 'MONITORING REQUIRED'
+            ELSE 'STABLE OUTLOOK'
+        END AS predictive_trend_outlook,
+        
+        -- Strategic recommendations
+        CASE 
+            WHEN current_default_rate_pct > 20 AND regulatory_compliance_status = 'REGULATORY BREACH'
+            THEN 'IMMEDIATE: Suspend lending + emergency board meeting + regulatory filing'
+            WHEN current_default_rate_pct > 15 AND recent_cohort_overdue_count > 200
+            THEN 'URGENT: Executive crisis management + enhanced collection + underwriting review'
+            WHEN current_default_rate_pct > 10
+            THEN 'PRIORITY: Strengthen collection efforts + implement early warning alerts'
+            WHEN recent_cohort_overdue_count > 100
+            THEN 'PROACTIVE: Enhanced monitoring + preventive collection outreach'
+            ELSE 'MAINTAIN: Continue current monitoring protocols with quarterly review'
+        END AS strategic_recommendation
+        
+    FROM dashboard_components
+)
+SELECT 
+    strftime(dashboard_last_updated, '%Y-%m-%d %H:%M:%S') AS "Dashboard Last Updated",
+    CONCAT('₹', portfolio_value_crores, ' Crores') AS "Portfolio Value",
+    CONCAT(current_default_rate_pct, '%') AS "Default Rate",
+    CONCAT('₹', confirmed_losses_crores, ' Cr') AS "Confirmed Losses",
+    portfolio_health_status AS "Risk Status",
+    alert_escalation_level AS "Alert Level",
+    predictive_trend_outlook AS "Trend Outlook",
+    regulatory_compliance_status AS "Compliance",
+    strategic_recommendation AS "Recommended Actions"
+FROM integrated_dashboard;
@@ -0,0 +1,12 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check for outliers and data quality
+SELECT 
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN application_date > disbursement_date THEN 1 END) AS date_logic_errors,
+    COUNT(CASE WHEN cibil_score > 900 OR cibil_score < 300 THEN 1 END) AS cibil_outliers,
+    COUNT(CASE WHEN annual_income > 50000000 THEN 1 END) AS income_outliers
+FROM loans l
+INNER JOIN customers c ON l.customer_id = c.customer_id;
+-- Expected: Minimal outliers that don't skew analysis
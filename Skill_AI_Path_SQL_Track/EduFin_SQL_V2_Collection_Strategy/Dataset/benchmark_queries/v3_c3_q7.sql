@@ -0,0 +1,17 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Verify segmentation bias
+SELECT 
+    employment_type,
+    COUNT(*) AS customer_count,
+    ROUND(AVG(cibil_score), 0) AS avg_cibil,
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(l.loan_id),
+        1
+    ) AS default_rate
+FROM customers c
+LEFT JOIN loans l ON c.customer_id = l.customer_id
+GROUP BY employment_type
+ORDER BY default_rate;
+-- Expected: No extreme bias toward any employment type
@@ -0,0 +1,65 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3A: Application Processing Efficiency Analysis
+-- BUSINESS OBJECTIVE: Optimize approval speed while maintaining risk controls
+-- CUSTOMER IMPACT: Faster approvals improve satisfaction and competitive position
+
+SELECT 
+    -- Customer segmentation for personalized processing
+    CASE 
+        WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 'Premium_FastTrack'
+        WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 'Standard_Plus'
+        WHEN c.cibil_score >= 550 THEN 'Standard'
+        ELSE 'Enhanced_Review'
+    END AS processing_tier,
+    
+    -- Processing efficiency metrics
+    COUNT(l.loan_id) AS total_applications,
+    ROUND(AVG(date_diff('day', l.application_date, l.disbursement_date)), 1) AS avg_approval_days,
+    
+    -- Success and efficiency rates
+    ROUND(
+        COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END) * 100.0 / COUNT(l.loan_id),
+        1
+    ) AS approval_rate_percent,
+    
+    -- Default correlation analysis
+    ROUND(
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END),
+        1
+    ) AS default_rate_percent,
+    
+    -- Financial impact assessment
+    ROUND(
+        AVG(l.loan_amount) / 100000.0, 
+        2
+    ) AS avg_loan_lakhs,
+    
+    -- Experience vs Risk balance
+    CASE 
+        WHEN AVG(date_diff('day', l.application_date, l.disbursement_date)) <= 7 
+            AND (COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+                   COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END)) < 10
+        THEN '🟢 Optimal_Balance'
+        WHEN AVG(date_diff('day', l.application_date, l.disbursement_date)) <= 7 
+        THEN '🟡 Fast_High_Risk'
+        WHEN (COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+               COUNT(CASE WHEN l.disbursement_date IS NOT NULL THEN 1 END)) < 10
+        THEN '🟠 Slow_Low_Risk'
+        ELSE '🔴 Slow_High_Risk'
+    END AS efficiency_assessment
+
+FROM loans l
+INNER JOIN customers c ON l.customer_id = c.customer_id
+WHERE l.application_date IS NOT NULL 
+    AND l.application_date >= date_add(localtimestamp, to_months(CAST(-12 AS INTEGER)))
+GROUP BY 
+    CASE 
+        WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 'Premium_FastTrack'
+        WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 'Standard_Plus'
+        WHEN c.cibil_score >= 550 THEN 'Standard'
+        ELSE 'Enhanced_Review'
+    END
+ORDER BY total_applications DESC;
@@ -0,0 +1,79 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3B: Advanced Customer Segmentation for Personalized Products
+-- BUSINESS OBJECTIVE: Create personalized loan products based on multi-dimensional profiling
+-- CUSTOMER IMPACT: Tailored offerings improve satisfaction while managing risk exposure
+
+WITH customer_segments AS (
+    SELECT
+        c.customer_id,
+        c.full_name,
+        c.annual_income,
+        c.cibil_score,
+        FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) AS age,
+        c.employment_type,
+        
+        -- Multi-dimensional segmentation logic
+        CASE 
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 1000000 AND FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) <= 35 
+            THEN 'Young_Premium'
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 600000 
+            THEN 'High_Value'
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 AND FLOOR(date_diff('day', c.date_of_birth, current_date) / 365.25) <= 30
+            THEN 'Young_Professional'
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 300000 
+            THEN 'Stable_Mid'
+            WHEN c.cibil_score >= 550 AND c.annual_income >= 200000
+            THEN 'Growing_Base'
+            ELSE 'Foundation_Tier'
+        END AS customer_segment,
+        
+        l.loan_amount,
+        l.loan_status,
+        l.interest_rate
+        
+    FROM customers c
+    LEFT JOIN loans l ON c.customer_id = l.customer_id
+    WHERE c.annual_income IS NOT NULL 
+      AND c.cibil_score IS NOT NULL
+)
+SELECT 
+    customer_segment,
+    COUNT(DISTINCT customer_id) AS customer_count,
+    
+    -- Segment characteristics
+    ROUND(AVG(annual_income) / 100000.0, 1) AS avg_income_lakhs,
+    ROUND(AVG(cibil_score), 0) AS avg_cibil,
+    ROUND(AVG(age), 1) AS avg_age,
+    
+    -- Portfolio performance by segment
+    COUNT(CASE WHEN loan_status IS NOT NULL THEN 1 END) AS total_loans,
+    ROUND(AVG(loan_amount) / 100000.0, 1) AS avg_loan_lakhs,
+    ROUND(AVG(interest_rate), 2) AS avg_interest_rate,
+    
+    -- Risk metrics by segment
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / 
+        COUNT(CASE WHEN loan_status IS NOT NULL THEN 1 END),
+        1
+    ) AS default_rate_percent,
+    
+    -- Personalization recommendations
+    CASE
+        WHEN customer_segment = 'Young_Premium' 
+        THEN '🌟 Digital-first, instant approvals, premium rates, flexible terms'
+        WHEN customer_segment = 'High_Value' 
+        THEN '💎 Relationship manager, customized products, loyalty rewards'
+        WHEN customer_segment = 'Young_Professional' 
+        THEN '🚀 Mobile-first, quick processing, career-linked products'
+        WHEN customer_segment = 'Stable_Mid' 
+        THEN '🎯 Standard products, moderate verification, balanced rates'
+        WHEN customer_segment = 'Growing_Base' 
+        THEN '🌱 Educational content, gradual limits, relationship building'
+        ELSE '📚 Financial literacy, basic products, hands-on support'
+    END AS personalization_strategy
+
+FROM customer_segments
+GROUP BY customer_segment
+ORDER BY AVG(annual_income) DESC;
@@ -0,0 +1,86 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3C: Customer Support Impact Analysis (Before/After Comparison)
+-- BUSINESS OBJECTIVE: Measure support intervention effectiveness in preventing defaults
+-- CUSTOMER IMPACT: Proactive support improves experience and reduces financial stress
+
+WITH payment_behavior AS (
+  SELECT
+      p.loan_id,
+      COUNT(CASE WHEN p.payment_status = 'Success' AND COALESCE(p.late_fee,0) = 0 THEN 1 END) AS on_time_payments,
+      COUNT(CASE WHEN p.payment_status = 'Success' AND COALESCE(p.late_fee,0) > 0 THEN 1 END) AS late_payments
+  FROM payments p
+  GROUP BY p.loan_id
+),
+support_analysis AS (
+  SELECT
+      l.customer_id,
+      l.loan_id,
+      l.loan_status,
+      l.loan_amount,
+
+      -- Support engagement classification (uses aggregated payment behavior)
+      CASE
+          WHEN l.loan_status = 'Overdue' THEN 'Active_Support_Needed'
+          WHEN l.loan_status = 'Active' AND COALESCE(pb.late_payments,0) > 0 THEN 'Early_Intervention_Success'
+          WHEN l.loan_status = 'Active' THEN 'No_Support_Needed'
+          WHEN l.loan_status = 'Closed' THEN 'Support_Success_Closed'
+          WHEN l.loan_status = 'Defaulted' THEN 'Support_Failed_Default'
+          ELSE 'Other'
+      END AS support_category,
+
+      COALESCE(pb.on_time_payments, 0) AS on_time_payments,
+      COALESCE(pb.late_payments, 0) AS late_payments,
+
+      -- Customer profile for intervention targeting
+      c.annual_income,
+      c.cibil_score
+  FROM loans l
+  INNER JOIN customers c ON l.customer_id = c.customer_id
+  LEFT JOIN payment_behavior pb ON pb.loan_id = l.loan_id
+  WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    support_category,
+    COUNT(DISTINCT customer_id) AS customer_count,
+    COUNT(loan_id) AS loan_count,
+
+    -- Financial impact of support interventions
+    ROUND(SUM(loan_amount) / 10000000.0, 2) AS total_exposure_crores,
+    ROUND(AVG(loan_amount) / 100000.0, 1) AS avg_loan_lakhs,
+
+    -- Payment behavior analysis
+    ROUND(AVG(on_time_payments), 1) AS avg_on_time_payments,
+    ROUND(AVG(late_payments), 1) AS avg_late_payments,
+
+    -- Payment discipline score (safe division)
+    ROUND(
+      COALESCE(
+        ((AVG(on_time_payments) * 100.0) / NULLIF((AVG(on_time_payments) + AVG(late_payments)), 0)),
+        0.0
+      ),
+      1
+    ) AS payment_discipline_percent,
+
+    -- Customer profile characteristics
+    ROUND(AVG(annual_income) / 100000.0, 1) AS avg_income_lakhs,
+    ROUND(AVG(cibil_score), 0) AS avg_cibil,
+
+    -- Support strategy recommendations
+    CASE
+        WHEN support_category = 'Active_Support_Needed'
+        THEN '🚨 Immediate intervention: payment plans, counseling, hardship programs'
+        WHEN support_category = 'Early_Intervention_Success'
+        THEN '✅ Success case: analyze and replicate intervention methods'
+        WHEN support_category = 'No_Support_Needed'
+        THEN '😊 Proactive engagement: satisfaction surveys, loyalty programs'
+        WHEN support_category = 'Support_Success_Closed'
+        THEN '🏆 Success story: case study and referral programs'
+        WHEN support_category = 'Support_Failed_Default'
+        THEN '📚 Learn from failure: analyze intervention gaps and improve'
+        ELSE '🔍 Requires investigation'
+    END AS support_strategy
+FROM support_analysis
+GROUP BY support_category
+ORDER BY total_exposure_crores DESC;
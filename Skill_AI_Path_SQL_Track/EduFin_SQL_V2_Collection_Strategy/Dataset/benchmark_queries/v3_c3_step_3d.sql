@@ -0,0 +1,95 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3D: Risk vs Experience Balance Analysis
+-- BUSINESS OBJECTIVE: Optimize verification intensity vs approval speed vs default risk
+-- CUSTOMER IMPACT: Find sweet spot between convenience and security for each segment
+
+WITH verification_analysis AS (
+    SELECT
+        l.loan_id,
+        l.customer_id,
+        l.loan_amount,
+        l.loan_status,
+        c.annual_income,
+        c.cibil_score,
+        
+        -- KYC intensity classification based on customer profile
+        CASE
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 
+            THEN 'Minimal_KYC'
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 
+            THEN 'Standard_KYC'
+            WHEN c.cibil_score >= 550 
+            THEN 'Enhanced_KYC'
+            ELSE 'Comprehensive_KYC'
+        END AS kyc_intensity,
+        
+        -- Simulated approval speed based on KYC intensity
+        CASE
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 3
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 7
+            WHEN c.cibil_score >= 550 THEN 12
+            ELSE 18
+        END AS projected_approval_days,
+        
+        -- Customer satisfaction impact scoring
+        CASE
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 95
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 85
+            WHEN c.cibil_score >= 550 THEN 75
+            ELSE 65
+        END AS projected_satisfaction_score
+        
+    FROM loans l
+    INNER JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    kyc_intensity,
+    COUNT(DISTINCT customer_id) AS customer_count,
+    COUNT(loan_id) AS loan_count,
+    
+    -- Experience metrics
+    AVG(projected_approval_days) AS avg_approval_days,
+    ROUND(AVG(projected_satisfaction_score), 1) AS avg_satisfaction_score,
+    
+    -- Risk metrics
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(loan_id),
+        1
+    ) AS default_rate_percent,
+    
+    -- Financial impact
+    ROUND(SUM(loan_amount) / 10000000.0, 1) AS total_exposure_crores,
+    ROUND(
+        SUM(CASE WHEN loan_status = 'Defaulted' THEN loan_amount ELSE 0 END) / 10000000.0,
+        1
+    ) AS default_loss_crores,
+    
+    -- Risk-Experience Balance Assessment
+    CASE
+        WHEN AVG(projected_approval_days) <= 5 AND 
+             (COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(loan_id)) <= 8
+        THEN '🟢 Optimal: Fast & Safe'
+        WHEN AVG(projected_approval_days) <= 5
+        THEN '🟡 Fast but Risky'
+        WHEN (COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(loan_id)) <= 8
+        THEN '🟠 Safe but Slow'
+        ELSE '🔴 Slow & Risky'
+    END AS balance_assessment,
+    
+    -- Strategic recommendations
+    CASE
+        WHEN kyc_intensity = 'Minimal_KYC'
+        THEN 'Digital verification, instant approval, premium experience'
+        WHEN kyc_intensity = 'Standard_KYC'
+        THEN 'Automated checks + human review, 5-7 day target'
+        WHEN kyc_intensity = 'Enhanced_KYC'
+        THEN 'Comprehensive verification, clear timeline communication'
+        ELSE 'Multi-stage verification, regular status updates, education'
+    END AS optimization_strategy
+
+FROM verification_analysis
+GROUP BY kyc_intensity
+ORDER BY AVG(projected_approval_days);
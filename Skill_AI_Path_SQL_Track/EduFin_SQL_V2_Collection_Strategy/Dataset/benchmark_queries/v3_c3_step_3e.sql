@@ -0,0 +1,97 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_3/SQL_V3_challenge_3.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 3E: Comprehensive Strategic Recovery Dashboard
+-- BUSINESS OBJECTIVE: Integrate all customer experience enhancement initiatives
+-- EXECUTIVE FOCUS: Single view of strategic recovery progress and opportunities
+
+WITH recovery_metrics AS (
+    SELECT
+        -- Customer segmentation for strategic initiatives
+        CASE 
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 'Premium'
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 'Standard_Plus'
+            WHEN c.cibil_score >= 550 THEN 'Standard'
+            ELSE 'Foundation'
+        END AS strategic_segment,
+        
+        l.customer_id,
+        l.loan_id,
+        l.loan_amount,
+        l.loan_status,
+        
+        -- Application efficiency scoring
+        CASE 
+            WHEN c.cibil_score >= 750 AND c.annual_income >= 800000 THEN 95
+            WHEN c.cibil_score >= 650 AND c.annual_income >= 400000 THEN 85
+            WHEN c.cibil_score >= 550 THEN 75
+            ELSE 65
+        END AS process_efficiency_score,
+        
+        -- Personalization readiness score
+        CASE 
+            WHEN c.cibil_score >= 750 THEN 90
+            WHEN c.cibil_score >= 650 THEN 80
+            WHEN c.cibil_score >= 550 THEN 70
+            ELSE 50
+        END AS personalization_score,
+        
+        -- Support intervention potential
+        CASE
+            WHEN l.loan_status = 'Overdue' THEN 'High_Priority'
+            WHEN l.loan_status = 'Active' THEN 'Proactive_Engagement'
+            WHEN l.loan_status = 'Closed' THEN 'Success_Story'
+            WHEN l.loan_status = 'Defaulted' THEN 'Learn_From_Failure'
+            ELSE 'Monitor'
+        END AS support_priority
+        
+    FROM loans l
+    INNER JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    strategic_segment,
+    COUNT(DISTINCT customer_id) AS customer_base,
+    COUNT(loan_id) AS loan_portfolio,
+    
+    -- Financial impact and opportunity
+    ROUND(SUM(loan_amount) / 10000000.0, 1) AS total_exposure_crores,
+    ROUND(AVG(loan_amount) / 100000.0, 1) AS avg_loan_lakhs,
+    
+    -- Current performance metrics
+    ROUND(
+        COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(loan_id),
+        1
+    ) AS current_default_rate,
+    
+    -- Strategic improvement potential
+    ROUND(AVG(process_efficiency_score), 0) AS process_optimization_potential,
+    ROUND(AVG(personalization_score), 0) AS personalization_readiness,
+    
+    -- Support intervention distribution
+    COUNT(CASE WHEN support_priority = 'High_Priority' THEN 1 END) AS immediate_intervention_needed,
+    COUNT(CASE WHEN support_priority = 'Proactive_Engagement' THEN 1 END) AS proactive_engagement_opportunity,
+    COUNT(CASE WHEN support_priority = 'Success_Story' THEN 1 END) AS success_case_studies,
+    
+    -- Strategic recovery recommendations
+    CASE
+        WHEN strategic_segment = 'Premium' 
+        THEN '🌟 Digital excellence: Instant approvals, premium service, loyalty programs'
+        WHEN strategic_segment = 'Standard_Plus' 
+        THEN '🚀 Enhanced experience: 5-day processing, personalized products, relationship focus'
+        WHEN strategic_segment = 'Standard' 
+        THEN '⚡ Process optimization: Streamline verification, clear communication, proactive support'
+        ELSE '🌱 Foundation building: Education, gradual relationship, intensive support'
+    END AS strategic_recovery_plan,
+    
+    -- Implementation priority
+    CASE
+        WHEN strategic_segment = 'Premium' THEN 'Phase 1: Immediate (30 days)'
+        WHEN strategic_segment = 'Standard_Plus' THEN 'Phase 2: Short-term (60 days)'
+        WHEN strategic_segment = 'Standard' THEN 'Phase 3: Medium-term (90 days)'
+        ELSE 'Phase 4: Long-term (6 months)'
+    END AS implementation_timeline
+
+FROM recovery_metrics
+GROUP BY strategic_segment
+ORDER BY total_exposure_crores DESC;
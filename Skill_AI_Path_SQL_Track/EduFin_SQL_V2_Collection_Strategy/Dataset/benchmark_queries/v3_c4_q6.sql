@@ -0,0 +1,11 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_4/SQL_V3_challenge_4.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Check benchmark accuracy and bias
+SELECT 
+    COUNT(*) AS total_records,
+    COUNT(CASE WHEN loan_amount BETWEEN 50000 AND 2500000 THEN 1 END) AS valid_amounts,
+    COUNT(CASE WHEN disbursement_date > CURRENT_DATE THEN 1 END) AS future_dates,
+    COUNT(CASE WHEN loan_status NOT IN ('Active', 'Closed', 'Defaulted', 'Overdue') THEN 1 END) AS invalid_status
+FROM loans;
+-- Expected: 0 for future_dates and invalid_status
@@ -0,0 +1,7 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_4/SQL_V3_challenge_4.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Verify competitive benchmarks are realistic
+SELECT 
+    'Industry benchmarks validation' AS check_type,
+    CASE WHEN 5.0 < 8.0 THEN '✅ Default rate targets realistic' ELSE '❌ Check targets' END AS validation_result;
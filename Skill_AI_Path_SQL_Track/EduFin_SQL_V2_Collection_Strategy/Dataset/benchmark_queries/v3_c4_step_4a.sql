@@ -0,0 +1,89 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_4/SQL_V3_challenge_4.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4A: Risk Performance Benchmarking
+-- BUSINESS OBJECTIVE: Compare our risk metrics vs industry benchmarks
+-- STRATEGIC FOCUS: Identify areas where we can build competitive advantages
+
+WITH risk_metrics AS (
+    SELECT
+        -- Current portfolio risk metrics
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+            2
+        ) AS current_default_rate,
+        
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Closed' THEN 1 END) * 100.0 / 
+            (COUNT(CASE WHEN loan_status = 'Closed' THEN 1 END) + 
+             COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END)), 
+            2
+        ) AS current_recovery_rate,
+        
+        ROUND(
+            (COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) + 
+             COUNT(CASE WHEN loan_status = 'Overdue' THEN 1 END)) * 100.0 / COUNT(*), 
+            2
+        ) AS current_portfolio_at_risk
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+)
+SELECT
+    -- Industry benchmarks (static values for comparison)
+    'Default Rate' AS risk_metric,
+    current_default_rate AS edufin_current,
+    8.0 AS industry_average,
+    5.0 AS industry_best,
+    15.0 AS regulatory_threshold,
+    
+    CASE
+        WHEN current_default_rate <= 5.0 THEN '🟢 INDUSTRY LEADING'
+        WHEN current_default_rate <= 8.0 THEN '🟡 ABOVE AVERAGE'
+        WHEN current_default_rate <= 12.0 THEN '🟠 BELOW AVERAGE'
+        ELSE '🔴 CRITICAL'
+    END AS competitive_position,
+    
+    ROUND(current_default_rate - 5.0, 2) AS gap_to_excellence
+
+FROM risk_metrics
+
+UNION ALL
+
+SELECT
+    'Recovery Rate' AS risk_metric,
+    current_recovery_rate AS edufin_current,
+    75.0 AS industry_average,
+    85.0 AS industry_best,
+    60.0 AS regulatory_threshold,
+    
+    CASE
+        WHEN current_recovery_rate >= 85.0 THEN '🟢 INDUSTRY LEADING'
+        WHEN current_recovery_rate >= 75.0 THEN '🟡 ABOVE AVERAGE'
+        WHEN current_recovery_rate >= 60.0 THEN '🟠 BELOW AVERAGE'
+        ELSE '🔴 CRITICAL'
+    END AS competitive_position,
+    
+    ROUND(85.0 - current_recovery_rate, 2) AS gap_to_excellence
+
+FROM risk_metrics
+
+UNION ALL
+
+SELECT
+    'Portfolio at Risk' AS risk_metric,
+    current_portfolio_at_risk AS edufin_current,
+    15.0 AS industry_average,
+    10.0 AS industry_best,
+    25.0 AS regulatory_threshold,
+    
+    CASE
+        WHEN current_portfolio_at_risk <= 10.0 THEN '🟢 INDUSTRY LEADING'
+        WHEN current_portfolio_at_risk <= 15.0 THEN '🟡 ABOVE AVERAGE'
+        WHEN current_portfolio_at_risk <= 20.0 THEN '🟠 BELOW AVERAGE'
+        ELSE '🔴 CRITICAL'
+    END AS competitive_position,
+    
+    ROUND(current_portfolio_at_risk - 10.0, 2) AS gap_to_excellence
+
+FROM risk_metrics;
@@ -0,0 +1,112 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_4/SQL_V3_challenge_4.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4C: Analytics Infrastructure Maturity Assessment
+-- BUSINESS OBJECTIVE: Audit analytics capabilities for competitive intelligence building
+-- STRATEGIC FOCUS: Build advanced analytics as competitive differentiation
+
+WITH analytics_capabilities AS (
+    SELECT
+        -- Real-time monitoring capability
+        CASE 
+            WHEN COUNT(DISTINCT DATE(disbursement_date)) >= 30 
+            THEN 85.0 ELSE 45.0 
+        END AS real_time_monitoring_score,
+        
+        -- Predictive analytics readiness
+        CASE
+            WHEN COUNT(DISTINCT customer_id) >= 5000 AND
+                 COUNT(*) >= 5000 AND
+                 COUNT(CASE WHEN loan_status IN ('Defaulted', 'Closed') THEN 1 END) >= 1000
+            THEN 80.0 ELSE 50.0
+        END AS predictive_readiness_score,
+        
+        -- Data integration complexity
+        ROUND(
+            (COUNT(CASE WHEN EXISTS (
+                SELECT 1 FROM customers c WHERE c.customer_id = loans.customer_id
+            ) THEN 1 END) * 100.0) / COUNT(*),
+            1
+        ) AS data_integration_score
+        
+    FROM loans
+),
+reporting_maturity AS (
+    SELECT
+        -- Dashboard complexity assessment
+        CASE
+            WHEN COUNT(DISTINCT loan_status) >= 4 AND
+                 COUNT(DISTINCT EXTRACT(MONTH FROM disbursement_date)) >= 6
+            THEN 75.0 ELSE 40.0
+        END AS dashboard_sophistication_score,
+        
+        -- Automated reporting capability
+        CASE
+            WHEN COUNT(CASE WHEN disbursement_date >= CURRENT_DATE - INTERVAL '30 days' THEN 1 END) > 0
+            THEN 70.0 ELSE 30.0
+        END AS automation_readiness_score
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+)
+SELECT 
+    infrastructure_capability,
+    current_maturity_score,
+    industry_standard,
+    competitive_target,
+    
+    CASE
+        WHEN current_maturity_score >= competitive_target THEN '🟢 COMPETITIVE ADVANTAGE'
+        WHEN current_maturity_score >= industry_standard THEN '🟡 INDUSTRY STANDARD'
+        WHEN current_maturity_score >= 60.0 THEN '🟠 DEVELOPING'
+        ELSE '🔴 BASIC'
+    END AS competitive_status,
+    
+    ROUND(competitive_target - current_maturity_score, 1) AS investment_gap,
+    
+    CASE
+        WHEN current_maturity_score >= competitive_target THEN 'Maintain leadership position'
+        WHEN current_maturity_score >= 70.0 THEN 'Strategic enhancement needed'
+        ELSE 'Major infrastructure investment required'
+    END AS strategic_recommendation
+
+FROM (
+    SELECT 'Real-time Monitoring' AS infrastructure_capability,
+           real_time_monitoring_score AS current_maturity_score,
+           70.0 AS industry_standard,
+           90.0 AS competitive_target
+    FROM analytics_capabilities
+    
+    UNION ALL
+    
+    SELECT 'Predictive Analytics' AS infrastructure_capability,
+           predictive_readiness_score AS current_maturity_score,
+           65.0 AS industry_standard,
+           85.0 AS competitive_target
+    FROM analytics_capabilities
+    
+    UNION ALL
+    
+    SELECT 'Data Integration' AS infrastructure_capability,
+           data_integration_score AS current_maturity_score,
+           80.0 AS industry_standard,
+           95.0 AS competitive_target
+    FROM analytics_capabilities
+    
+    UNION ALL
+    
+    SELECT 'Dashboard Sophistication' AS infrastructure_capability,
+           dashboard_sophistication_score AS current_maturity_score,
+           60.0 AS industry_standard,
+           85.0 AS competitive_target
+    FROM reporting_maturity
+    
+    UNION ALL
+    
+    SELECT 'Automation Readiness' AS infrastructure_capability,
+           automation_readiness_score AS current_maturity_score,
+           55.0 AS industry_standard,
+           80.0 AS competitive_target
+    FROM reporting_maturity
+) infrastructure_assessment
+ORDER BY investment_gap DESC;
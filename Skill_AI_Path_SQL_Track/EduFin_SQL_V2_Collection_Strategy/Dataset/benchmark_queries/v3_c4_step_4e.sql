@@ -0,0 +1,117 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_4/SQL_V3_challenge_4.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 4E: Strategic Competitive Advantage Dashboard
+-- BUSINESS OBJECTIVE: Executive roadmap for building competitive advantages from crisis
+-- STRATEGIC FOCUS: Transform recovery into market leadership across all dimensions
+
+WITH advantage_summary AS (
+    SELECT
+        -- Risk management advantage potential
+        ROUND(
+            COUNT(CASE WHEN loan_status = 'Defaulted' THEN 1 END) * 100.0 / COUNT(*), 
+            1
+        ) AS current_default_rate,
+        5.0 AS target_default_rate,
+        
+        -- Data quality advantage score
+        ROUND(
+            (COUNT(CASE WHEN customer_id IS NOT NULL AND 
+                              loan_amount IS NOT NULL AND 
+                              loan_status IS NOT NULL THEN 1 END) * 100.0) / COUNT(*), 
+            1
+        ) AS current_data_quality,
+        99.0 AS target_data_quality,
+        
+        -- Analytics maturity score
+        CASE 
+            WHEN COUNT(DISTINCT customer_id) >= 5000 AND
+                 COUNT(*) >= 5000 AND
+                 COUNT(CASE WHEN loan_status IN ('Defaulted', 'Closed') THEN 1 END) >= 1000
+            THEN 80.0 ELSE 60.0
+        END AS current_analytics_maturity,
+        90.0 AS target_analytics_maturity,
+        
+        -- Compliance excellence score
+        ROUND(
+            (COUNT(CASE WHEN loan_amount BETWEEN 50000 AND 2500000 AND
+                              disbursement_date IS NOT NULL THEN 1 END) * 100.0) / COUNT(*),
+            1
+        ) AS current_compliance_score,
+        98.0 AS target_compliance_score
+        
+    FROM loans
+    WHERE disbursement_date IS NOT NULL
+)
+SELECT
+    competitive_dimension,
+    current_performance,
+    industry_benchmark,
+    excellence_target,
+    competitive_gap,
+    
+    CASE
+        WHEN competitive_gap <= 0 THEN '🟢 MARKET LEADER'
+        WHEN competitive_gap <= 3.0 THEN '🟡 NEAR EXCELLENCE'
+        WHEN competitive_gap <= 10.0 THEN '🟠 IMPROVEMENT NEEDED'
+        ELSE '🔴 TRANSFORMATION REQUIRED'
+    END AS competitive_status,
+    
+    investment_priority,
+    estimated_impact,
+    strategic_advantage
+
+FROM (
+    SELECT 'Risk Management Excellence' AS competitive_dimension,
+           current_default_rate AS current_performance,
+           8.0 AS industry_benchmark,
+           target_default_rate AS excellence_target,
+           ROUND(current_default_rate - target_default_rate, 1) AS competitive_gap,
+           'HIGH' AS investment_priority,
+           'Market leadership in risk management' AS estimated_impact,
+           'Industry safest lender positioning' AS strategic_advantage
+    FROM advantage_summary
+    
+    UNION ALL
+    
+    SELECT 'Data Quality Leadership' AS competitive_dimension,
+           current_data_quality AS current_performance,
+           95.0 AS industry_benchmark,
+           target_data_quality AS excellence_target,
+           ROUND(target_data_quality - current_data_quality, 1) AS competitive_gap,
+           'MEDIUM' AS investment_priority,
+           'Superior analytics and decision making' AS estimated_impact,
+           'Data-driven competitive intelligence' AS strategic_advantage
+    FROM advantage_summary
+    
+    UNION ALL
+    
+    SELECT 'Analytics Infrastructure' AS competitive_dimension,
+           current_analytics_maturity AS current_performance,
+           70.0 AS industry_benchmark,
+           target_analytics_maturity AS excellence_target,
+           ROUND(target_analytics_maturity - current_analytics_maturity, 1) AS competitive_gap,
+           'MEDIUM' AS investment_priority,
+           'Predictive capabilities and automation' AS estimated_impact,
+           'AI-powered lending platform' AS strategic_advantage
+    FROM advantage_summary
+    
+    UNION ALL
+    
+    SELECT 'Compliance Excellence' AS competitive_dimension,
+           current_compliance_score AS current_performance,
+           92.0 AS industry_benchmark,
+           target_compliance_score AS excellence_target,
+           ROUND(target_compliance_score - current_compliance_score, 1) AS competitive_gap,
+           'LOW' AS investment_priority,
+           'Regulatory leadership and market access' AS estimated_impact,
+           'Trusted regulatory partner status' AS strategic_advantage
+    FROM advantage_summary
+) competitive_roadmap
+ORDER BY 
+    CASE investment_priority 
+        WHEN 'HIGH' THEN 1 
+        WHEN 'MEDIUM' THEN 2 
+        ELSE 3 
+    END,
+    competitive_gap DESC;
@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 5)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 1: Audit completeness check
+SELECT 
+    COUNT(*) AS total_loans,
+    COUNT(CASE WHEN disbursement_date IS NOT NULL THEN 1 END) AS auditable_loans,
+    COUNT(CASE WHEN loan_status IS NOT NULL THEN 1 END) AS status_tracked_loans
+FROM loans;
+-- Expected: auditable_loans = status_tracked_loans for complete governance
@@ -0,0 +1,10 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 6)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Validation 2: Data lineage verification
+SELECT 
+    COUNT(DISTINCT c.customer_id) AS customers_with_loans,
+    COUNT(DISTINCT l.customer_id) AS loan_customer_references
+FROM customers c
+    INNER JOIN loans l ON c.customer_id = l.customer_id;
+-- Expected: Should match for referential integrity
@@ -0,0 +1,59 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 0)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5A: Board Governance Effectiveness Analysis
+-- BUSINESS OBJECTIVE: Evaluate board oversight performance and decision-making efficiency
+-- GOVERNANCE FOCUS: How effectively is leadership managing portfolio risk?
+
+WITH governance_metrics AS (
+    SELECT 
+        -- Meeting frequency and coverage analysis
+        COUNT(DISTINCT DATE(l.disbursement_date)) AS disbursement_days,
+        COUNT(DISTINCT YEAR(l.disbursement_date)) AS operational_years,
+        COUNT(DISTINCT QUARTER(l.disbursement_date)) AS operational_quarters,
+        
+        -- Risk detection timeline analysis
+        MIN(l.disbursement_date) AS portfolio_start_date,
+        MAX(l.disbursement_date) AS portfolio_end_date,
+        
+        -- Crisis identification efficiency
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS undetected_defaults,
+        
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS governance_failure_cost
+        
+    FROM loans l
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Board oversight efficiency metrics
+    ROUND(disbursement_days / operational_quarters, 0) AS avg_activity_days_per_quarter,
+    operational_quarters AS board_review_periods,
+    
+    -- Risk governance performance
+    ROUND(undetected_defaults * 100.0 / 
+        (SELECT COUNT(*) FROM loans WHERE disbursement_date IS NOT NULL), 2
+    ) AS governance_failure_rate_pct,
+    
+    ROUND(governance_failure_cost / 10000000.0, 2) AS oversight_cost_crores,
+    
+    -- Board performance assessment
+    CASE 
+        WHEN undetected_defaults * 100.0 / 
+             (SELECT COUNT(*) FROM loans WHERE disbursement_date IS NOT NULL) > 10
+        THEN '🔴 GOVERNANCE FAILURE'
+        WHEN undetected_defaults * 100.0 / 
+             (SELECT COUNT(*) FROM loans WHERE disbursement_date IS NOT NULL) > 5
+        THEN '🟡 OVERSIGHT GAPS'
+        ELSE '🟢 EFFECTIVE GOVERNANCE'
+    END AS board_performance_status,
+    
+    -- Recommended governance improvements
+    CASE 
+        WHEN undetected_defaults > 500
+        THEN 'Establish weekly risk committee + daily monitoring'
+        WHEN undetected_defaults > 100
+        THEN 'Implement monthly board risk reviews'
+        ELSE 'Maintain quarterly governance standards'
+    END AS governance_recommendation
+
+FROM governance_metrics;
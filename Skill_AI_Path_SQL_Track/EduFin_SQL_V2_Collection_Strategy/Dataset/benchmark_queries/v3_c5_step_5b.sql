@@ -0,0 +1,77 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 1)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5B: Comprehensive Data Governance Validation
+-- BUSINESS OBJECTIVE: Ensure 99.9% data quality standards across all business entities
+-- GOVERNANCE FOCUS: Can we trust our data for critical business decisions?
+
+WITH data_quality_assessment AS (
+    SELECT 
+        -- Core entity completeness validation
+        COUNT(DISTINCT c.customer_id) AS valid_customers,
+        COUNT(DISTINCT l.loan_id) AS valid_loans,
+        COUNT(DISTINCT dc.city_id) AS valid_cities,
+        COUNT(DISTINCT ds.state_id) AS valid_states,
+        
+        -- Referential integrity validation
+        COUNT(CASE WHEN c.city_id IS NULL THEN 1 END) AS customers_missing_city,
+        COUNT(CASE WHEN l.customer_id IS NULL THEN 1 END) AS loans_missing_customer,
+        COUNT(CASE WHEN dc.state_id IS NULL THEN 1 END) AS cities_missing_state,
+        
+        -- Business logic validation
+        COUNT(CASE WHEN l.loan_amount <= 0 THEN 1 END) AS invalid_loan_amounts,
+        COUNT(CASE WHEN l.loan_amount > 25000000 THEN 1 END) AS excessive_loan_amounts,
+        COUNT(CASE WHEN c.cibil_score < 300 OR c.cibil_score > 850 THEN 1 END) AS invalid_cibil_scores,
+        
+        -- Email and contact validation
+        COUNT(CASE WHEN c.email_address NOT LIKE '%@%.%' THEN 1 END) AS invalid_email_formats,
+        COUNT(CASE WHEN length(CAST(regexp_replace(CAST(c.phone_number AS VARCHAR), '\D', '', 'g') AS VARCHAR)) != 10 THEN 1 END) AS invalid_phone_numbers
+        
+    FROM customers c
+        LEFT JOIN dim_city dc ON c.city_id = dc.city_id
+        LEFT JOIN dim_state ds ON dc.state_id = ds.state_id
+        LEFT JOIN loans l ON c.customer_id = l.customer_id
+)
+SELECT 
+    -- Data governance quality score
+    ROUND(
+        100.0 - (
+            (customers_missing_city + loans_missing_customer + cities_missing_state + 
+             invalid_loan_amounts + excessive_loan_amounts + invalid_cibil_scores +
+             invalid_email_formats + invalid_phone_numbers) * 100.0 / 
+            (valid_customers + valid_loans + valid_cities + valid_states)
+        ), 3
+    ) AS data_quality_score_pct,
+    
+    -- Critical validation failures
+    customers_missing_city AS referential_integrity_failures,
+    invalid_loan_amounts + excessive_loan_amounts AS business_logic_failures,
+    invalid_email_formats + invalid_phone_numbers AS contact_data_failures,
+    
+    -- Governance compliance status
+    CASE 
+        WHEN 100.0 - (
+            (customers_missing_city + loans_missing_customer + cities_missing_state + 
+             invalid_loan_amounts + excessive_loan_amounts + invalid_cibil_scores +
+             invalid_email_formats + invalid_phone_numbers) * 100.0 / 
+            (valid_customers + valid_loans + valid_cities + valid_states)
+        ) >= 99.9 THEN '🟢 GOVERNANCE COMPLIANT'
+        WHEN 100.0 - (
+            (customers_missing_city + loans_missing_customer + cities_missing_state + 
+             invalid_loan_amounts + excessive_loan_amounts + invalid_cibil_scores +
+             invalid_email_formats + invalid_phone_numbers) * 100.0 / 
+            (valid_customers + valid_loans + valid_cities + valid_states)
+        ) >= 98.0 THEN '🟡 QUALITY IMPROVEMENT NEEDED'
+        ELSE '🔴 GOVERNANCE FAILURE'
+    END AS data_governance_status,
+    
+    -- Data governance recommendations
+    CASE 
+        WHEN customers_missing_city + invalid_loan_amounts > 100
+        THEN 'Implement automated data validation rules'
+        WHEN invalid_email_formats + invalid_phone_numbers > 50
+        THEN 'Enhance contact data validation at entry'
+        ELSE 'Maintain current quality standards'
+    END AS data_governance_action
+
+FROM data_quality_assessment;
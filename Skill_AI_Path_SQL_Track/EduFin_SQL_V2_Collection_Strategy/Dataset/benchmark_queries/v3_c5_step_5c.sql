@@ -0,0 +1,72 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 2)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5C: Audit Trail Completeness and Anomaly Detection
+-- BUSINESS OBJECTIVE: Ensure 100% transaction traceability for regulatory compliance
+-- GOVERNANCE FOCUS: Can we reconstruct every business decision and data change?
+
+WITH audit_analysis AS (
+    SELECT 
+        -- Temporal audit coverage
+        COUNT(DISTINCT DATE(l.disbursement_date)) AS transaction_days,
+        COUNT(l.loan_id) AS total_transactions,
+        
+        -- Change pattern analysis
+        COUNT(CASE WHEN DAYOFWEEK(l.disbursement_date) IN (1, 7) THEN 1 END) AS weekend_transactions,
+        COUNT(CASE WHEN HOUR(l.disbursement_date) NOT BETWEEN 9 AND 17 THEN 1 END) AS after_hours_transactions,
+        
+        -- Anomaly detection
+        COUNT(CASE WHEN l.loan_amount > 20000000 THEN 1 END) AS high_value_transactions,
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' 
+                    AND date_diff('day', l.disbursement_date, current_date) < 90 
+                    THEN 1 END) AS rapid_default_cases,
+        
+        -- Data consistency validation
+        COUNT(CASE WHEN c.email_address = '' OR c.email_address IS NULL THEN 1 END) AS missing_contact_audit,
+        COUNT(CASE WHEN l.disbursement_date > current_date THEN 1 END) AS future_dated_transactions
+        
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Audit trail completeness metrics
+    transaction_days AS audit_coverage_days,
+    total_transactions AS auditable_transactions,
+    ROUND(total_transactions / transaction_days, 1) AS avg_daily_transaction_volume,
+    
+    -- Anomaly detection results
+    weekend_transactions AS off_hours_anomalies,
+    after_hours_transactions AS timing_anomalies,
+    high_value_transactions AS value_anomalies,
+    rapid_default_cases AS fraud_risk_indicators,
+    
+    -- Audit quality score
+    ROUND(
+        100.0 - (
+            (weekend_transactions + after_hours_transactions + missing_contact_audit + 
+             future_dated_transactions) * 100.0 / total_transactions
+        ), 2
+    ) AS audit_quality_score_pct,
+    
+    -- Compliance status assessment
+    CASE 
+        WHEN future_dated_transactions > 0 OR rapid_default_cases > 50
+        THEN '🔴 AUDIT FAILURES DETECTED'
+        WHEN weekend_transactions + after_hours_transactions > 100
+        THEN '🟡 PROCESS ANOMALIES FOUND'
+        ELSE '🟢 AUDIT TRAIL CLEAN'
+    END AS audit_compliance_status,
+    
+    -- Governance action recommendations
+    CASE 
+        WHEN rapid_default_cases > 20
+        THEN 'Implement fraud detection algorithms immediately'
+        WHEN weekend_transactions > 50
+        THEN 'Investigate off-hours transaction patterns'
+        WHEN missing_contact_audit > 100
+        THEN 'Enforce mandatory contact data validation'
+        ELSE 'Maintain current audit protocols'
+    END AS audit_improvement_action
+
+FROM audit_analysis;
@@ -0,0 +1,72 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 3)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5D: Regulatory Compliance Monitoring Dashboard
+-- BUSINESS OBJECTIVE: Ensure 100% adherence to regulatory lending standards
+-- GOVERNANCE FOCUS: Are we meeting all regulatory requirements consistently?
+
+WITH compliance_metrics AS (
+    SELECT 
+        -- Regulatory lending limits compliance
+        COUNT(CASE WHEN l.loan_amount < 50000 THEN 1 END) AS below_minimum_loans,
+        COUNT(CASE WHEN l.loan_amount > 25000000 THEN 1 END) AS above_maximum_loans,
+        
+        -- Credit score compliance (minimum 600 for education loans)
+        COUNT(CASE WHEN c.cibil_score < 600 THEN 1 END) AS below_credit_threshold,
+        
+        -- Documentation compliance (email required for communication)
+        COUNT(CASE WHEN c.email_address IS NULL OR c.email_address = '' THEN 1 END) AS missing_required_contact,
+        
+        -- Geographic compliance (verify valid locations)
+        COUNT(CASE WHEN dc.city_name IS NULL OR ds.state_name IS NULL THEN 1 END) AS invalid_geographic_data,
+        
+        -- Business process compliance
+        COUNT(CASE WHEN l.disbursement_date IS NULL AND l.loan_status != 'Approved' THEN 1 END) AS invalid_status_combinations,
+        
+        -- Total compliance universe
+        COUNT(l.loan_id) AS total_compliance_items
+        
+    FROM loans l
+        INNER JOIN customers c ON l.customer_id = c.customer_id
+        LEFT JOIN dim_city dc ON c.city_id = dc.city_id
+        LEFT JOIN dim_state ds ON dc.state_id = ds.state_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Compliance violation summary
+    below_minimum_loans AS amount_violations,
+    below_credit_threshold AS credit_violations,
+    missing_required_contact AS documentation_violations,
+    invalid_geographic_data AS data_integrity_violations,
+    
+    -- Overall compliance score
+    ROUND(
+        100.0 - (((below_minimum_loans + above_maximum_loans + below_credit_threshold + 
+             missing_required_contact + invalid_geographic_data + invalid_status_combinations) * 100.0) / NULLIF(total_compliance_items, 0)), 2
+    ) AS regulatory_compliance_score_pct,
+    
+    -- Risk categories by violation type
+    ROUND(((below_credit_threshold * 100.0) / NULLIF(total_compliance_items, 0)), 2) AS credit_risk_violation_pct,
+    ROUND(((missing_required_contact * 100.0) / NULLIF(total_compliance_items, 0)), 2) AS documentation_risk_pct,
+    
+    -- Regulatory compliance status
+    CASE 
+        WHEN 100.0 - (((below_minimum_loans + above_maximum_loans + below_credit_threshold + 
+             missing_required_contact + invalid_geographic_data + invalid_status_combinations) * 100.0) / NULLIF(total_compliance_items, 0)) >= 99.0 THEN '🟢 FULLY COMPLIANT'
+        WHEN 100.0 - (((below_minimum_loans + above_maximum_loans + below_credit_threshold + 
+             missing_required_contact + invalid_geographic_data + invalid_status_combinations) * 100.0) / NULLIF(total_compliance_items, 0)) >= 95.0 THEN '🟡 MINOR VIOLATIONS'
+        ELSE '🔴 COMPLIANCE FAILURE'
+    END AS regulatory_status,
+    
+    -- Corrective action recommendations
+    CASE 
+        WHEN below_credit_threshold > 500
+        THEN 'Implement stricter credit score validation rules'
+        WHEN missing_required_contact > 200
+        THEN 'Mandate contact information before loan approval'
+        WHEN invalid_geographic_data > 100
+        THEN 'Validate geographic data integrity immediately'
+        ELSE 'Maintain current compliance monitoring'
+    END AS compliance_corrective_action
+
+FROM compliance_metrics;
@@ -0,0 +1,92 @@
+-- Source: Skill_AI_Path_SQL_Track/EduFin_SQL_V3_Business_Intelligence/SQL_V3_Session_1_to_5/SQL_V3_Session_1_Step_5/SQL_V3_challenge_5.html (cell 4)
+-- Translated to DuckDB by query_benchmark.py --extract
+
+-- Step 5E: Comprehensive Governance Excellence Dashboard
+-- BUSINESS OBJECTIVE: Provide complete governance oversight in single executive view
+-- GOVERNANCE FOCUS: How do we demonstrate industry-leading governance standards?
+
+WITH governance_summary AS (
+    SELECT 
+        -- Board oversight metrics
+        COUNT(CASE WHEN l.loan_status = 'Defaulted' THEN 1 END) AS governance_failures,
+        SUM(CASE WHEN l.loan_status = 'Defaulted' THEN l.loan_amount ELSE 0 END) AS oversight_cost,
+        
+        -- Data quality assessment
+        COUNT(CASE WHEN c.email_address NOT LIKE '%@%.%' OR c.email_address IS NULL THEN 1 END) AS data_quality_issues,
+        COUNT(CASE WHEN l.loan_amount <= 0 OR l.loan_amount > 25000000 THEN 1 END) AS business_logic_violations,
+        
+        -- Audit trail completeness
+        COUNT(CASE WHEN l.disbursement_date IS NULL THEN 1 END) AS audit_trail_gaps,
+        COUNT(CASE WHEN dayofweek(l.disbursement_date) IN (1, 7) THEN 1 END) AS anomalous_transactions,
+        
+        -- Regulatory compliance
+        COUNT(CASE WHEN c.cibil_score < 600 THEN 1 END) AS compliance_violations,
+        
+        -- Total governance universe
+        COUNT(l.loan_id) AS total_items
+        
+    FROM loans l
+    INNER JOIN customers c ON l.customer_id = c.customer_id
+    WHERE l.disbursement_date IS NOT NULL
+)
+SELECT 
+    -- Governance pillar performance
+    ROUND(((governance_failures * 100.0) / NULLIF(total_items, 0)), 2) AS board_oversight_failure_pct,
+    ROUND(oversight_cost / 10000000.0, 2) AS governance_cost_crores,
+    
+    ROUND(
+        100.0 - (((data_quality_issues + business_logic_violations) * 100.0) / NULLIF(total_items, 0)), 2
+    ) AS data_governance_score_pct,
+    
+    ROUND(
+        100.0 - (((audit_trail_gaps + anomalous_transactions) * 100.0) / NULLIF(total_items, 0)), 2
+    ) AS audit_governance_score_pct,
+    
+    ROUND(
+        100.0 - ((compliance_violations * 100.0) / NULLIF(total_items, 0)), 2
+    ) AS regulatory_compliance_score_pct,
+    
+    -- Overall governance excellence rating
+    ROUND(
+        (
+            (100.0 - ((governance_failures * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((data_quality_issues + business_logic_violations) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((audit_trail_gaps + anomalous_transactions) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - ((compliance_violations * 100.0) / NULLIF(total_items, 0)))
+        ) / 4, 2
+    ) AS governance_excellence_score,
+    
+    -- Industry-leading governance status
+    CASE 
+        WHEN (
+            (100.0 - ((governance_failures * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((data_quality_issues + business_logic_violations) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((audit_trail_gaps + anomalous_transactions) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - ((compliance_violations * 100.0) / NULLIF(total_items, 0)))
+        ) / 4 >= 99.0 THEN '🟢 INDUSTRY-LEADING GOVERNANCE'
+        WHEN (
+            (100.0 - ((governance_failures * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((data_quality_issues + business_logic_violations) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((audit_trail_gaps + anomalous_transactions) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - ((compliance_violations * 100.0) / NULLIF(total_items, 0)))
+        ) / 4 >= 95.0 THEN '🟡 STRONG GOVERNANCE FOUNDATION'
+        ELSE '🔴 GOVERNANCE TRANSFORMATION REQUIRED'
+    END AS governance_leadership_status,
+    
+    -- Strategic governance recommendations
+    CASE 
+        WHEN governance_failures > 500 AND compliance_violations > 500
+        THEN 'Establish crisis governance committee + automated controls'
+        WHEN data_quality_issues > 200 OR audit_trail_gaps > 100
+        THEN 'Implement real-time quality monitoring + audit automation'
+        WHEN (
+            (100.0 - ((governance_failures * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((data_quality_issues + business_logic_violations) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - (((audit_trail_gaps + anomalous_transactions) * 100.0) / NULLIF(total_items, 0))) +
+            (100.0 - ((compliance_violations * 100.0) / NULLIF(total_items, 0)))
+        ) / 4 >= 95.0
+        THEN 'Enhance to industry-leading standards with AI-powered monitoring'
+        ELSE 'Fundamental governance rebuild required'
+    END AS strategic_governance_roadmap
+
+FROM governance_summary;
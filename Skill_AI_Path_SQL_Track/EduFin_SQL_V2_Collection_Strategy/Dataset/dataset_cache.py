@@ -0,0 +1,201 @@
+"""
+Content-Addressed Dataset Cache
+Generated tables are stored once on disk as uncompressed Arrow IPC (Feather v2) files
+- Keyed by a hash of generator config, seed, scale and code version (whole modules, or just the
+  functions a table is generated by)
+- Warm loads memory-map the file instead of regenerating or re-parsing CSVs
+- Least-recently-used entries are evicted to stay under a disk budget
+
+Usage:
+    python dataset_cache.py --list
+    python dataset_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import inspect
+import json
+import os
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+CACHE_DIR = os.environ.get('DATASET_CACHE_DIR',
+                           os.path.join(os.path.expanduser('~'), '.cache', 'skill_ai_datasets'))
+DISK_BUDGET_BYTES = int(float(os.environ.get('DATASET_CACHE_BUDGET_GB', '5')) * 1024 ** 3)
+
+# ============================================================================
+# CACHE KEYS
+# ============================================================================
+
+def code_version(*sources):
+    """Hash of generator source code from modules, functions, .py files or notebooks (code cells only)"""
+    digest = hashlib.blake2b(digest_size=16)
+    for source in sources:
+        if inspect.isfunction(source) or inspect.ismethod(source):
+            digest.update(inspect.getsource(source).encode())
+            continue
+        path = Path(getattr(source, '__file__', source))
+        if path.suffix == '.ipynb':
+            notebook = json.loads(path.read_text(encoding='utf-8'))
+            code = '\n'.join(''.join(cell['source']) for cell in notebook['cells']
+                             if cell['cell_type'] == 'code')
+            digest.update(code.encode())
+        else:
+            # Line endings depend on the checkout, not on the generator
+            digest.update(path.read_bytes().replace(b'\r\n', b'\n'))
+    return digest.hexdigest()
+
+def cache_key(table: str, config: dict = None, seed: int = None, scale=None, code_version: str = None):
+    """SHA-256 over everything that determines a generated table's contents"""
+    payload = json.dumps({
+        'table': table,
+        'config': config,
+        'seed': seed,
+        'scale': scale,
+        'code_version': code_version
+    }, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def arrow_table(df: pd.DataFrame):
+    """Arrow table for a DataFrame, coercing object columns Arrow cannot type (e.g. dates mixed with timestamps)"""
+    try:
+        return pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowTypeError, pa.ArrowInvalid):
+        pass
+
+    df = df.copy(deep=False)
+    for column in df.select_dtypes('object').columns:
+        try:
+            pa.array(df[column], from_pandas=True)
+        except (pa.ArrowTypeError, pa.ArrowInvalid):
+            try:
+                df[column] = pd.to_datetime(df[column])
+            except (TypeError, ValueError):
+                df[column] = df[column].astype(str)
+    return pa.Table.from_pandas(df, preserve_index=False)
+
+# ============================================================================
+# CACHE
+# ============================================================================
+
+class DatasetCache:
+    """Directory of memory-mappable Arrow files named by their content key"""
+
+    def __init__(self, cache_dir=CACHE_DIR, max_bytes: int = DISK_BUDGET_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+
+    def path(self, key: str):
+        return self.cache_dir / f"{key}.arrow"
+
+    def load(self, key: str, as_pandas: bool = True):
+        """Memory-map a cached table, or None on a miss; Arrow tables are returned zero-copy"""
+        path = self.path(key)
+        try:
+            source = pa.memory_map(str(path), 'r')
+        except FileNotFoundError:
+            return None
+        table = pa.ipc.open_file(source).read_all()
+        os.utime(path)  # Modification time doubles as the LRU clock
+        return table.to_pandas(split_blocks=True) if as_pandas else table
+
+    def store(self, key: str, data, metadata: dict = None):
+        """Write a DataFrame or Arrow table under `key`, then evict down to the disk budget"""
+        table = data if isinstance(data, pa.Table) else arrow_table(data)
+        if metadata:
+            schema_metadata = dict(table.schema.metadata or {})
+            schema_metadata[b'dataset_cache'] = json.dumps(metadata, default=str).encode()
+            table = table.replace_schema_metadata(schema_metadata)
+
+        path = self.path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        feather.write_feather(table, str(temp_path), compression='uncompressed')  # mmap needs uncompressed buffers
+        os.replace(temp_path, path)
+        self.evict(keep=path)
+        return path
+
+    def get_or_create(self, table: str, generate, config: dict = None, seed: int = None, scale=None,
+                      code_version: str = None, as_pandas: bool = True):
+        """Cached table if present, otherwise `generate()` it and store the result"""
+        key = cache_key(table, config, seed, scale, code_version)
+        cached = self.load(key, as_pandas)
+        if cached is not None:
+            return cached
+
+        data = generate()
+        self.store(key, data, {
+            'table': table,
+            'config': config,
+            'seed': seed,
+            'scale': scale,
+            'created': time.strftime('%Y-%m-%d %H:%M:%S')
+        })
+        return data
+
+    def entries(self):
+        """Cached files as (path, bytes, last_used), least recently used first"""
+        entries = []
+        for path in self.cache_dir.glob('*.arrow'):
+            stat = path.stat()
+            entries.append((path, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def evict(self, max_bytes: int = None, keep=None):
+        """Delete least-recently-used files until the cache fits in `max_bytes`"""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for path, size, _ in entries:
+            if total <= max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= size
+            removed.append(path)
+        return removed
+
+    def describe(self, path):
+        """Metadata recorded when a cached file was stored"""
+        schema = pa.ipc.open_file(pa.memory_map(str(path), 'r')).schema
+        metadata = (schema.metadata or {}).get(b'dataset_cache')
+        return json.loads(metadata) if metadata else {}
+
+    def clear(self):
+        return self.evict(max_bytes=0)
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """List or clear the dataset cache"""
+    parser = argparse.ArgumentParser(description="Inspect the generated-dataset cache")
+    parser.add_argument('--cache-dir', default=CACHE_DIR)
+    parser.add_argument('--list', action='store_true', help="List cached tables, least recently used first")
+    parser.add_argument('--clear', action='store_true', help="Delete every cached table")
+    args = parser.parse_args()
+
+    cache = DatasetCache(args.cache_dir)
+    if args.clear:
+        print(f"🗑️ Removed {len(cache.clear())} cached tables from {cache.cache_dir}")
+        return
+
+    entries = cache.entries()
+    total = sum(size for _, size, _ in entries)
+    print(f"📦 {cache.cache_dir}: {len(entries)} tables, {total / 1024 ** 2:,.1f} MB "
+          f"of {cache.max_bytes / 1024 ** 3:,.1f} GB budget")
+    if args.list:
+        for path, size, last_used in entries:
+            metadata = cache.describe(path)
+            print(f"   {path.stem[:12]}  {metadata.get('table', '?'):<25} {size / 1024 ** 2:>9,.1f} MB  "
+                  f"last used {time.strftime('%Y-%m-%d %H:%M', time.localtime(last_used))}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,384 @@
+"""
+Distribution Fidelity Checks
+Declared expectations for a generator's business targets, checked against its output batch by batch
+- Shares: a categorical column (optionally within groups of another column) against expected
+  shares, chi-square goodness of fit
+- Calibrated: a categorical column the generator forces to its target shares; a chi-square test
+  would always pass, so every count must instead be within a row of its expected count
+- Uniform: a numeric column (optionally per group) against uniform bounds, Kolmogorov-Smirnov on
+  a fine histogram, so no column is ever sorted
+- Multiplicity: how many rows share each key (e.g. loans per customer), chi-square
+- One pass: each batch column is dictionary-encoded or converted at most once, whatever number of
+  expectations read it; counts accumulate, the tests run once at the end
+- Derived columns (ratios, lags, lookups) are declared next to the expectations that use them
+"""
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from scipy import stats
+
+from dataset_stats import value_key
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+ALPHA = 0.001  # Per-expectation significance level: a correct generator fails 1 check in 1,000
+KS_BINS = 1024  # Histogram resolution for KS tests (CDF compared at every bin edge)
+ROUNDING_SLACK = 1e-6  # Continuous values this close (relative to the range) to a bound count as inside
+MIN_EXPECTED = 5  # Chi-square cells expected to hold fewer rows are pooled together
+
+# ============================================================================
+# BATCH COLUMNS
+# ============================================================================
+
+class BatchColumns:
+    """Columns of one batch, each encoded at most once however many expectations read it"""
+
+    def __init__(self, batch: pa.Table, derived: dict = None):
+        self.batch = batch
+        self.derived = derived or {}
+        self.cache = {}
+
+    def __len__(self):
+        return self.batch.num_rows
+
+    def array(self, name: str):
+        """Arrow column, computing a derived column on first use"""
+        if ('array', name) not in self.cache:
+            if name in self.batch.column_names:
+                values = self.batch[name]
+            else:
+                values = pa.array(self.derived[name](self))
+            if isinstance(values, pa.ChunkedArray):
+                values = values.unify_dictionaries() if pa.types.is_dictionary(values.type) else values
+                values = values.combine_chunks()
+            self.cache[('array', name)] = values
+        return self.cache[('array', name)]
+
+    def codes(self, name: str):
+        """(int64 code per row, list of values) from dictionary encoding; NULL is a value of its own"""
+        if ('codes', name) not in self.cache:
+            values = self.array(name)
+            if pa.types.is_boolean(values.type) and not values.null_count:
+                codes, dictionary = values.cast(pa.int8()).to_numpy().astype(np.int64), [False, True]
+            else:
+                encoded = values if pa.types.is_dictionary(values.type) and not values.null_count \
+                    else pc.dictionary_encode(values, null_encoding='encode')
+                codes, dictionary = encoded.indices.to_numpy().astype(np.int64), encoded.dictionary.to_pylist()
+            self.cache[('codes', name)] = codes, [value_key(value) for value in dictionary]
+        return self.cache[('codes', name)]
+
+    def numbers(self, name: str):
+        """float64 values; dates as days since 1970 (ISO text from SQLite is parsed), NULL as NaN"""
+        if ('numbers', name) not in self.cache:
+            values = self.array(name)
+            if pa.types.is_dictionary(values.type):
+                values = values.cast(values.type.value_type)
+            if pa.types.is_string(values.type) or pa.types.is_large_string(values.type):
+                values = pc.strptime(values, format='%Y-%m-%d', unit='s').cast(pa.date32())
+            if pa.types.is_date(values.type):
+                values = values.cast(pa.date32()).cast(pa.int32())
+            elif pa.types.is_timestamp(values.type):
+                values = values.cast(pa.timestamp('s'), safe=False).cast(pa.int64())
+            elif pa.types.is_boolean(values.type):
+                values = values.cast(pa.int8())
+            values = values.cast(pa.float64())
+            self.cache[('numbers', name)] = (pc.fill_null(values, np.nan) if values.null_count else values).to_numpy()
+        return self.cache[('numbers', name)]
+
+    def days(self, name: str):
+        """Days since 1970 for a date or timestamp column (pandas hands dates over as timestamps)"""
+        values = self.numbers(name)
+        return np.floor(values / 86400) if pa.types.is_timestamp(self.array(name).type) else values
+
+# ============================================================================
+# TESTS
+# ============================================================================
+
+def normalized(shares: dict):
+    total = sum(shares.values())
+    return {value_key(value): share / total for value, share in shares.items()}
+
+def chi_square(observed: dict, shares: dict):
+    """(statistic, degrees of freedom, unexpected values) of observed counts against expected shares
+
+    Values expected too rarely for the sample size are pooled into one cell.
+    """
+    shares = normalized(shares)
+    total = sum(observed.values())
+    unexpected = {value: count for value, count in observed.items() if shares.get(value, 0) == 0 and count}
+    cells, pooled = [], [0.0, 0]
+    for value, share in shares.items():
+        if share * total < MIN_EXPECTED:
+            pooled[0] += share * total
+            pooled[1] += observed.get(value, 0)
+        else:
+            cells.append((share * total, observed.get(value, 0)))
+    if pooled[0]:
+        cells.append(tuple(pooled))
+    statistic = sum((count - expected) ** 2 / expected for expected, count in cells)
+    return statistic, max(len(cells) - 1, 0), unexpected
+
+def largest_gap(observed: dict, shares: dict):
+    """(gap, 'value observed% vs expected%') for the value furthest from its expected share"""
+    shares, total = normalized(shares), sum(observed.values()) or 1
+    gaps = {value: observed.get(value, 0) / total - shares.get(value, 0) for value in set(shares) | set(observed)}
+    value = max(gaps, key=lambda key: abs(gaps[key]))
+    return abs(gaps[value]), f"{value} {observed.get(value, 0) / total:.2%} vs {shares.get(value, 0):.2%}"
+
+def ks_uniform(counts: np.ndarray, edges: np.ndarray):
+    """(D, p-value) of histogram counts against the uniform CDF at the bins' upper edges"""
+    total = counts.sum()
+    if not total:
+        return 0.0, 1.0
+    distance = float(np.abs(np.cumsum(counts) / total - edges).max())
+    return distance, float(stats.kstwo.sf(distance, int(total)))
+
+# ============================================================================
+# EXPECTATIONS
+# ============================================================================
+
+class Expectation:
+    """Expected distribution of one (possibly derived) column of a table"""
+    test = None
+
+    def __init__(self, table: str, column: str, given: str = None, label: str = None):
+        self.table = table
+        self.column = column
+        self.given = given
+        self.label = label or (f"{column} | {given}" if given else column)
+
+    @staticmethod
+    def resolve(value, rows: dict):
+        """Expected values may depend on the table sizes seen, e.g. how many customers there are"""
+        return value(rows) if callable(value) else value
+
+    def update(self, columns: BatchColumns):
+        raise NotImplementedError
+
+    def result(self, rows: dict):
+        """{'statistic', 'p_value', 'detail'}; p_value 0 marks values that must never occur"""
+        raise NotImplementedError
+
+class Shares(Expectation):
+    """Categorical column against expected shares ({value: weight}, or {group: {value: weight}} with given)"""
+    test = 'chi-square'
+
+    def __init__(self, table: str, column: str, shares, given: str = None, label: str = None):
+        super().__init__(table, column, given, label)
+        self.shares = shares
+        self.counts = {}  # group -> {value: rows}
+
+    def update(self, columns: BatchColumns):
+        codes, values = columns.codes(self.column)
+        if self.given is None:
+            group_codes, groups = None, [None]
+        else:
+            group_codes, groups = columns.codes(self.given)
+        keys = codes if group_codes is None else group_codes * len(values) + codes
+        counts = np.bincount(keys, minlength=len(groups) * len(values))
+        for key in np.flatnonzero(counts):
+            group = self.counts.setdefault(groups[key // len(values)], {})
+            value = values[key % len(values)]
+            group[value] = group.get(value, 0) + int(counts[key])
+
+    def result(self, rows: dict):
+        shares = self.resolve(self.shares, rows)
+        expected = {None: shares} if self.given is None else {value_key(group): group_shares
+                                                              for group, group_shares in shares.items()}
+        statistic, dof, details = 0.0, 0, []
+        for group, group_shares in expected.items():
+            observed = self.counts.get(group, {})
+            if not observed:
+                continue
+            group_statistic, group_dof, unexpected = chi_square(observed, group_shares)
+            if unexpected:
+                return {'statistic': float('inf'), 'p_value': 0.0,
+                        'detail': f"unexpected {self.column} {sorted(unexpected)[:3]}"
+                                  + (f" for {self.given} {group}" if self.given else '')}
+            statistic, dof = statistic + group_statistic, dof + group_dof
+            details.append((*largest_gap(observed, group_shares), group))
+        p_value = float(stats.chi2.sf(statistic, dof)) if dof else 1.0
+        _, gap, group = max(details, key=lambda item: item[0], default=(0, '', None))
+        return {'statistic': statistic, 'p_value': p_value,
+                'detail': (f"{self.given} {group}: " if self.given and group is not None else '') + gap}
+
+class Calibrated(Shares):
+    """Categorical column forced to its shares (e.g. a calibrated churn rate): counts must match to the row"""
+    test = 'exact'
+
+    def result(self, rows: dict):
+        shares = self.resolve(self.shares, rows)
+        expected = {None: shares} if self.given is None else {value_key(group): group_shares
+                                                              for group, group_shares in shares.items()}
+        worst = (-1.0, '', None)
+        for group, group_shares in expected.items():
+            observed = self.counts.get(group, {})
+            total = sum(observed.values())
+            shares = normalized(group_shares)
+            for value in set(shares) | set(observed):
+                gap = abs(observed.get(value, 0) - shares.get(value, 0) * total)
+                if gap > worst[0]:
+                    worst = (gap, f"{value} {observed.get(value, 0):,} rows vs {shares.get(value, 0) * total:,.1f}",
+                             group)
+        gap, detail, group = worst
+        return {'statistic': max(gap, 0.0), 'p_value': 1.0 if gap < 1 else 0.0,
+                'detail': (f"{self.given} {group}: " if self.given and group is not None else '') + detail}
+
+class Uniform(Expectation):
+    """Numeric column uniform on [low, high] ({group: (low, high)} with given); integers are discrete"""
+    test = 'KS'
+
+    def __init__(self, table: str, column: str, bounds, given: str = None, integers: bool = False,
+                 label: str = None):
+        super().__init__(table, column, given, label)
+        self.bounds = {value_key(group): limits for group, limits in bounds.items()} if given else {None: bounds}
+        self.integers = integers
+        self.counts = {}  # group -> histogram with an extra first/last bin for values below/above the bounds
+
+    def bins(self, low: float, high: float):
+        """(bin width, number of bins, CDF at each bin's upper edge)"""
+        if not self.integers:
+            return (high - low) / KS_BINS, KS_BINS, np.arange(1, KS_BINS + 1) / KS_BINS
+        support = int(high - low + 1)
+        width = -(-support // KS_BINS)
+        count = -(-support // width)
+        return width, count, np.minimum(np.arange(1, count + 1) * width, support) / support
+
+    def update(self, columns: BatchColumns):
+        values = columns.numbers(self.column)
+        if self.given is None:
+            group_codes, groups = None, [None]
+        else:
+            group_codes, groups = columns.codes(self.given)
+        for code, group in enumerate(groups):
+            if group not in self.bounds:
+                continue
+            low, high = self.bounds[group]
+            group_values = values if group_codes is None else values[group_codes == code]
+            group_values = group_values[~np.isnan(group_values)]
+            width, count, _ = self.bins(low, high)
+            slack = 0 if self.integers else (high - low) * ROUNDING_SLACK  # Values rounded to cents
+            below = np.count_nonzero(group_values < low - slack)
+            above = np.count_nonzero(group_values > high + slack)
+            index = ((group_values - low) / width).astype(np.int64)  # Truncation: values in the slack stay inside
+            histogram = np.bincount(np.clip(index, 0, count - 1, out=index), minlength=count)
+            histogram[0] -= below  # Out-of-range values were clipped into the end bins
+            histogram[-1] -= above
+            self.counts[group] = self.counts.get(group, 0) + np.r_[below, histogram, above]
+
+    def result(self, rows: dict):
+        worst, p_values = (0.0, None), []
+        for group, histogram in self.counts.items():
+            low, high = self.bounds[group]
+            outside = int(histogram[0] + histogram[-1])
+            if outside:
+                return {'statistic': float('inf'), 'p_value': 0.0,
+                        'detail': f"{outside:,} values outside [{low}, {high}]"
+                                  + (f" for {self.given} {group}" if self.given else '')}
+            distance, p_value = ks_uniform(histogram[1:-1], self.bins(low, high)[2])
+            p_values.append(p_value)
+            worst = max(worst, (distance, group), key=lambda item: item[0])
+        p_value = min(1.0, min(p_values) * len(p_values)) if p_values else 1.0  # Bonferroni across groups
+        prefix = f"{self.given} {worst[1]}: " if self.given and worst[1] is not None else ''
+        return {'statistic': worst[0], 'p_value': p_value, 'detail': f"{prefix}D = {worst[0]:.5f}"}
+
+class Multiplicity(Expectation):
+    """Non-negative integer key column: share of keys appearing k times ({k: weight}), chi-square"""
+    test = 'chi-square'
+
+    def __init__(self, table: str, column: str, shares, label: str = None):
+        super().__init__(table, column, None, label or f"rows per {column}")
+        self.shares = shares
+        self.counts = np.zeros(0, dtype=np.int64)  # Rows per key value
+
+    def update(self, columns: BatchColumns):
+        keys = columns.numbers(self.column)
+        counts = np.bincount(keys[~np.isnan(keys)].astype(np.int64))
+        if len(counts) > len(self.counts):
+            self.counts = np.pad(self.counts, (0, len(counts) - len(self.counts)))
+        self.counts[:len(counts)] += counts
+
+    def result(self, rows: dict):
+        shares = self.resolve(self.shares, rows)
+        multiplicity = np.bincount(self.counts)
+        observed = {value_key(k): int(n) for k, n in enumerate(multiplicity) if k and n}
+        statistic, dof, unexpected = chi_square(observed, shares)
+        if unexpected:
+            return {'statistic': float('inf'), 'p_value': 0.0,
+                    'detail': f"keys with {sorted(unexpected, key=int)[:3]} rows"}
+        return {'statistic': statistic, 'p_value': float(stats.chi2.sf(statistic, dof)) if dof else 1.0,
+                'detail': f"{largest_gap(observed, shares)[1]} of keys"}
+
+# ============================================================================
+# CHECKER
+# ============================================================================
+
+class FidelityCheck:
+    """Accumulates every expectation over streamed (table, batch) pairs, then tests them all"""
+
+    def __init__(self, expectations: list, derived: dict = None, alpha: float = ALPHA):
+        self.expectations = expectations
+        self.derived = derived or {}  # table -> {column: function(BatchColumns) -> array}
+        self.alpha = alpha
+        self.rows = {}
+
+    def columns(self):
+        """{table: [stored columns]} the expectations read, for sources that load only what is needed"""
+        needed = {}
+        for expectation in self.expectations:
+            for column in (expectation.column, expectation.given):
+                if column is not None:
+                    needed.setdefault(expectation.table, set()).add(column)
+        for table, derived in self.derived.items():
+            for column, function in derived.items():
+                if column in needed.get(table, ()):
+                    needed[table].discard(column)
+                    needed[table].update(getattr(function, 'reads', ()))
+        return {table: sorted(columns) for table, columns in needed.items()}
+
+    def update(self, table: str, batch):
+        if not isinstance(batch, pa.Table):
+            batch = pa.Table.from_pandas(batch, preserve_index=False)
+        self.rows[table] = self.rows.get(table, 0) + batch.num_rows
+        expectations = [expectation for expectation in self.expectations if expectation.table == table]
+        if expectations:
+            columns = BatchColumns(batch, self.derived.get(table))
+            for expectation in expectations:
+                expectation.update(columns)
+        return self
+
+    def report(self):
+        """One result per expectation with a table/label/test/p_value/passed/detail entry"""
+        results = []
+        for expectation in self.expectations:
+            if not self.rows.get(expectation.table):
+                continue
+            result = expectation.result(self.rows)
+            results.append({'table': expectation.table, 'label': expectation.label, 'test': expectation.test,
+                            **result, 'passed': result['p_value'] >= self.alpha})
+        return results
+
+def derived(*reads):
+    """Mark a derived-column function with the stored columns it reads"""
+    def mark(function):
+        function.reads = reads
+        return function
+    return mark
+
+def print_report(results: list, alpha: float = ALPHA):
+    """Pass/fail line per expectation; returns True when all passed"""
+    table = None
+    for result in results:
+        if result['table'] != table:
+            table = result['table']
+            print(f"\n📋 {table}")
+        mark = '✅' if result['passed'] else '❌'
+        print(f"   {mark} {result['label']:<38} {result['test']:<10} p = {result['p_value']:<9.3g} "
+              f"{result['detail']}")
+    failed = sum(not result['passed'] for result in results)
+    print(f"\n{'✅' if not failed else '❌'} {len(results) - failed} of {len(results)} expectations hold "
+          f"at alpha = {alpha:g}")
+    return not failed
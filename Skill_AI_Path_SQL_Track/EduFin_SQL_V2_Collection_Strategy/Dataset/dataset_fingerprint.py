@@ -0,0 +1,310 @@
+"""
+Dataset Fingerprints
+Order-independent, chunked hashes of generated tables, so two generation runs can be compared
+without loading either table again
+- Every cell hashes together with its row's key; a column's fingerprint per key range is the sum
+  of those hashes modulo 2^64, so row order, batch sizes and shard boundaries do not matter
+  (a sum rather than XOR, so duplicated rows do not cancel out)
+- Integer keys are chunked into ranges of CHUNK_KEYS; other keys into HASH_BUCKETS hash buckets
+- Fingerprints merge, so shards or parallel workers fingerprint their own rows and combine
+- The run manifest (JSON) holds the run's settings, row counts and every chunk hash; diffing two
+  manifests names the tables, columns and key ranges that changed
+
+Usage:
+    python dataset_fingerprint.py edufin.duckdb.manifest.json
+    python dataset_fingerprint.py dataset/manifest.json --baseline baseline/manifest.json
+"""
+
+import argparse
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dataset_stats import column_kind, numbers, splitmix64, value_hashes
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+MANIFEST_VERSION = 1
+CHUNK_KEYS = 1 << 16  # Integer keys per chunk: 65,536 rows of a dense key, ~1,500 chunks at 100M rows
+HASH_BUCKETS = 256  # Chunks for string keys, which have no useful ranges
+NULL_HASH = np.uint64(0x9E3779B97F4A7C15)
+CELL_SALT = np.uint64(0xD6E8FEB86659FD93)  # Keeps (key a, value b) and (key b, value a) apart
+SECONDS_PER_DAY = 86400
+
+# ============================================================================
+# HASHING
+# ============================================================================
+
+def cell_hashes(values):
+    """uint64 hash per value, NULLs included; dates hash as midnight timestamps and bools as 0/1"""
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        values = values.cast(values.type.value_type)
+    kind = column_kind(values.type)
+    if kind == 'string':
+        hashes = value_hashes(values, kind)
+    else:
+        seconds = numbers(values, kind) * (SECONDS_PER_DAY if kind == 'date' else 1)
+        hashes = splitmix64((seconds + 0.0).view(np.uint64))
+    if values.null_count:
+        hashes[values.is_null().to_numpy(zero_copy_only=False)] = NULL_HASH
+    return hashes
+
+def chunk_ids(keys, chunking: str):
+    """Chunk of every key: its range for integer keys, its hash bucket otherwise"""
+    if chunking == 'range':
+        return np.floor_divide(keys.to_numpy(zero_copy_only=False).astype(np.int64), CHUNK_KEYS)
+    return (cell_hashes(keys) % np.uint64(HASH_BUCKETS)).astype(np.int64)
+
+def chunk_sums(chunks: np.ndarray, hashes: np.ndarray):
+    """(chunk ids, rows per chunk, per-chunk column sums modulo 2^64) for a (rows, columns) hash matrix"""
+    if len(chunks) > 1 and np.any(chunks[1:] < chunks[:-1]):  # Sorted batches skip the sort
+        order = np.argsort(chunks, kind='stable')
+        chunks, hashes = chunks[order], hashes[order]
+    ids, starts = np.unique(chunks, return_index=True)
+    rows = np.diff(np.append(starts, len(chunks)))
+    with np.errstate(over='ignore'):
+        return ids, rows, np.add.reduceat(hashes, starts, axis=0)
+
+def key_ranges(chunks, chunking: str):
+    """'lo-hi' key ranges (or bucket lists) covering the chunks, with neighbouring chunks merged"""
+    if chunking != 'range':
+        return [f"bucket {chunk}" for chunk in chunks]
+    ranges = []
+    for chunk in sorted(chunks):
+        if ranges and ranges[-1][1] == chunk * CHUNK_KEYS:
+            ranges[-1][1] = (chunk + 1) * CHUNK_KEYS
+        else:
+            ranges.append([chunk * CHUNK_KEYS, (chunk + 1) * CHUNK_KEYS])
+    return [f"{low:,}-{high - 1:,}" for low, high in ranges]
+
+# ============================================================================
+# FINGERPRINTS
+# ============================================================================
+
+class TableFingerprint:
+    """Row count and per-column hash sums for every key chunk of one table"""
+
+    def __init__(self, key: str, chunking: str, columns: list):
+        self.key = key
+        self.chunking = chunking
+        self.columns = list(columns)
+        self.rows = {}  # chunk -> rows
+        self.sums = {}  # chunk -> uint64 sum per column
+
+    def update(self, batch: pa.Table):
+        if batch.num_rows == 0:
+            return self
+        keys = batch[self.key]
+        key_hashes = cell_hashes(keys)
+        hashes = np.empty((batch.num_rows, len(self.columns)), dtype=np.uint64)
+        with np.errstate(over='ignore'):
+            for index, column in enumerate(self.columns):
+                hashes[:, index] = splitmix64(key_hashes + splitmix64(cell_hashes(batch[column]) ^ CELL_SALT))
+        ids, rows, sums = chunk_sums(chunk_ids(keys, self.chunking), hashes)
+        self.add(ids, rows, sums)
+        return self
+
+    def add(self, ids, rows, sums):
+        with np.errstate(over='ignore'):
+            for chunk, count, total in zip(ids.tolist(), rows.tolist(), sums):
+                if chunk in self.sums:
+                    self.rows[chunk] += count
+                    self.sums[chunk] = self.sums[chunk] + total
+                else:
+                    self.rows[chunk], self.sums[chunk] = count, total.copy()
+
+    def merge(self, other: 'TableFingerprint'):
+        if (other.key, other.chunking, other.columns) != (self.key, self.chunking, self.columns):
+            raise ValueError(f"Cannot merge fingerprints keyed on {other.key} into ones keyed on {self.key}")
+        chunks = list(other.sums)
+        if chunks:
+            self.add(np.array(chunks), np.array([other.rows[chunk] for chunk in chunks]),
+                     np.array([other.sums[chunk] for chunk in chunks]))
+        return self
+
+    @property
+    def num_rows(self):
+        return sum(self.rows.values())
+
+    def totals(self):
+        """Whole-table hash per column"""
+        with np.errstate(over='ignore'):
+            return np.sum(list(self.sums.values()), axis=0, dtype=np.uint64) if self.sums \
+                else np.zeros(len(self.columns), dtype=np.uint64)
+
+    def to_dict(self):
+        return {
+            'key': self.key,
+            'chunking': self.chunking,
+            'chunk_keys': CHUNK_KEYS if self.chunking == 'range' else HASH_BUCKETS,
+            'rows': self.num_rows,
+            'columns': {column: f"{total:016x}" for column, total in zip(self.columns, self.totals().tolist())},
+            'chunks': {str(chunk): [self.rows[chunk]] + [f"{value:016x}" for value in self.sums[chunk].tolist()]
+                       for chunk in sorted(self.sums)},
+        }
+
+    @classmethod
+    def from_dict(cls, entry: dict):
+        expected = CHUNK_KEYS if entry['chunking'] == 'range' else HASH_BUCKETS
+        if entry['chunk_keys'] != expected:
+            raise ValueError(f"Fingerprint chunked by {entry['chunk_keys']}; this version uses {expected}")
+        fingerprint = cls(entry['key'], entry['chunking'], list(entry['columns']))
+        for chunk, (rows, *sums) in entry['chunks'].items():
+            fingerprint.rows[int(chunk)] = rows
+            fingerprint.sums[int(chunk)] = np.array([int(value, 16) for value in sums], dtype=np.uint64)
+        return fingerprint
+
+class DatasetFingerprint:
+    """TableFingerprint per table, updated batch by batch as a generator writes"""
+
+    def __init__(self, keys: dict = None):
+        self.keys = keys or {}  # table -> key column (default: the table's first column)
+        self.tables = {}
+
+    def update(self, table: str, batch):
+        """Fold an Arrow table/record batch or a DataFrame into the table's fingerprint"""
+        if isinstance(batch, pd.DataFrame):
+            batch = pa.Table.from_pandas(batch, preserve_index=False)
+        elif isinstance(batch, pa.RecordBatch):
+            batch = pa.Table.from_batches([batch])
+        if table not in self.tables:
+            key = self.keys.get(table, batch.schema.names[0])
+            key_type = batch.schema.field(key).type
+            chunking = 'range' if pa.types.is_integer(key_type) else 'hash'
+            self.tables[table] = TableFingerprint(key, chunking, batch.schema.names)
+        self.tables[table].update(batch)
+        return self
+
+    def merge(self, other: 'DatasetFingerprint'):
+        """Combine with a fingerprint over other rows of the same tables (another shard or worker)"""
+        for table, fingerprint in other.tables.items():
+            if table in self.tables:
+                self.tables[table].merge(fingerprint)
+            else:
+                self.tables[table] = TableFingerprint.from_dict(fingerprint.to_dict())
+        return self
+
+    def to_dict(self):
+        return {table: fingerprint.to_dict() for table, fingerprint in self.tables.items()}
+
+    @classmethod
+    def from_dict(cls, tables: dict):
+        dataset = cls()
+        dataset.tables = {table: TableFingerprint.from_dict(entry) for table, entry in tables.items()}
+        dataset.keys = {table: fingerprint.key for table, fingerprint in dataset.tables.items()}
+        return dataset
+
+# ============================================================================
+# RUN MANIFEST
+# ============================================================================
+
+def save_manifest(path, fingerprint: DatasetFingerprint, **settings):
+    """Write the run manifest: when and how the data was generated, row counts and fingerprints"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'settings': settings,
+        'rows': {table: entry.num_rows for table, entry in fingerprint.tables.items()},
+        'fingerprints': fingerprint.to_dict(),
+    }
+    path.write_text(json.dumps(manifest, indent=1))
+    return path
+
+def load_manifest(path):
+    """(manifest without the fingerprints, DatasetFingerprint)"""
+    manifest = json.loads(Path(path).read_text())
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"{path} is a version {manifest.get('version')} manifest; expected {MANIFEST_VERSION}")
+    return manifest, DatasetFingerprint.from_dict(manifest.pop('fingerprints'))
+
+def diff_fingerprints(baseline: DatasetFingerprint, current: DatasetFingerprint):
+    """[{table, change, columns: {column: [changed chunks]}, chunks, rows}] for every table that differs"""
+    changes = []
+    for table in list(baseline.tables) + [table for table in current.tables if table not in baseline.tables]:
+        before, after = baseline.tables.get(table), current.tables.get(table)
+        if before is None or after is None:
+            changes.append({'table': table, 'change': 'added' if before is None else 'missing'})
+            continue
+        entry = {'table': table, 'change': 'changed', 'rows': (before.num_rows, after.num_rows), 'columns': {},
+                 'chunking': before.chunking, 'chunks': []}
+        if (before.key, before.chunking) != (after.key, after.chunking):
+            entry['change'] = f"rekeyed ({before.key} -> {after.key})"
+            changes.append(entry)
+            continue
+        entry['added'] = [column for column in after.columns if column not in before.columns]
+        entry['removed'] = [column for column in before.columns if column not in after.columns]
+        shared = [column for column in before.columns if column in after.columns]
+        before_index = [before.columns.index(column) for column in shared]
+        after_index = [after.columns.index(column) for column in shared]
+        missing = np.zeros(len(shared), dtype=np.uint64)
+        for chunk in sorted(set(before.sums) | set(after.sums)):
+            old = before.sums[chunk][before_index] if chunk in before.sums else missing
+            new = after.sums[chunk][after_index] if chunk in after.sums else missing
+            changed = [column for column, a, b in zip(shared, old.tolist(), new.tolist()) if a != b]
+            if changed or before.rows.get(chunk, 0) != after.rows.get(chunk, 0):
+                entry['chunks'].append(chunk)
+            for column in changed:
+                entry['columns'].setdefault(column, []).append(chunk)
+        if entry['chunks'] or entry['added'] or entry['removed']:
+            changes.append(entry)
+    return changes
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_changes(changes: list):
+    """One block per changed table: row counts, then each changed column with its key ranges"""
+    for entry in changes:
+        if entry['change'] != 'changed':
+            print(f"   ⚠️ {entry['table']}: {entry['change']}")
+            continue
+        before_rows, after_rows = entry['rows']
+        print(f"   ⚠️ {entry['table']}: {len(entry['chunks'])} chunks differ "
+              f"({before_rows:,} -> {after_rows:,} rows)")
+        for column in entry['added']:
+            print(f"      + {column}")
+        for column in entry['removed']:
+            print(f"      - {column}")
+        for column, chunks in entry['columns'].items():
+            ranges = key_ranges(chunks, entry['chunking'])
+            shown = ', '.join(ranges[:4]) + (f" (+{len(ranges) - 4} more)" if len(ranges) > 4 else '')
+            print(f"      {column:<28} {shown}")
+
+def main():
+    """Print a run manifest, or diff it against a baseline run's manifest"""
+    parser = argparse.ArgumentParser(description="Summarise a run manifest or diff its fingerprints against another")
+    parser.add_argument('manifest', help="manifest.json written next to the data")
+    parser.add_argument('--baseline', help="Manifest of the run to compare against")
+    args = parser.parse_args()
+
+    manifest, fingerprint = load_manifest(args.manifest)
+    if not args.baseline:
+        print(f"🧾 {args.manifest} ({manifest['created']}): {json.dumps(manifest['settings'])}")
+        for table, entry in fingerprint.tables.items():
+            print(f"   {table:<25} {entry.num_rows:>12,} rows {len(entry.sums):>6,} chunks "
+                  f"on {entry.key}  {entry.totals().sum(dtype=np.uint64):016x}")
+        return
+
+    _, baseline = load_manifest(args.baseline)
+    changes = diff_fingerprints(baseline, fingerprint)
+    print("=" * 80)
+    print(f"FINGERPRINT DIFF: {args.manifest} vs {args.baseline}")
+    print("=" * 80)
+    print_changes(changes)
+    print(f"\n{'✅ Identical' if not changes else f'❌ {len(changes)} tables differ'}")
+    sys.exit(1 if changes else 0)
+
+if __name__ == "__main__":
+    main()
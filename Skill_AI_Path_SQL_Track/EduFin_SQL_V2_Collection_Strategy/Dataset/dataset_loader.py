@@ -0,0 +1,196 @@
+"""
+Typed Fast Loader for the Checked-In CSV Datasets
+- load_edufin('loans') / load_retailmax('customers') return DataFrames typed by dataset_schemas
+- Dates are parsed natively by the Arrow CSV reader (EduFin CSVs use dd-mm-yyyy)
+- The first load converts the CSV into the Arrow dataset cache; later loads memory-map it
+- Column projection and row filters run on the Arrow table before anything becomes pandas
+
+Usage:
+    loans = load_edufin('loans', columns=['loan_id', 'loan_amount'],
+                        filters=[('loan_status', '==', 'Defaulted'), ('loan_amount', '>', 200000)])
+"""
+
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+import dataset_schemas
+from dataset_cache import DatasetCache, cache_key, code_version
+from dataset_schemas import EDUFIN_SCHEMAS, RETAILMAX_SCHEMAS, CSV_ALIASES
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+EDUFIN_DIR = REPO_ROOT / 'Skill_AI_Path_SQL_Track' / 'EduFin_SQL_V1_Portfolio_Risk_Analysis' / 'EduFin_Dataset'
+RETAILMAX_DIRS = {
+    'generated': REPO_ROOT / 'Skill_AI_Path_Python_Track' / 'Data_Generation' / 'dataset',
+    'python_v1': (REPO_ROOT / 'Skill_AI_Path_Python_Track' / 'RetailMax_Python_V1_Customer Retention Crisis Analysis'
+                  / 'Python_V1_Dataset'),
+}
+
+EDUFIN_DATE_FORMATS = ['%d-%m-%Y', pa_csv.ISO8601]
+
+ARROW_TYPES = {
+    'int8': pa.int8(),
+    'int16': pa.int16(),
+    'int32': pa.int32(),
+    'int64': pa.int64(),
+    'float64': pa.float64(),
+    'bool': pa.bool_(),
+    'string': pa.string(),
+    'category': pa.string(),  # Dictionary-encoded after parsing
+    'date': pa.timestamp('s'),
+    'datetime': pa.timestamp('s'),
+}
+
+FILTER_OPERATORS = {
+    '==': pc.equal,
+    '!=': pc.not_equal,
+    '<': pc.less,
+    '<=': pc.less_equal,
+    '>': pc.greater,
+    '>=': pc.greater_equal,
+}
+
+_cache = None
+
+# ============================================================================
+# CSV -> ARROW
+# ============================================================================
+
+def read_csv(path, schema: dict, aliases: dict = None, date_formats=None):
+    """Parse a CSV straight into a typed Arrow table with canonical column names
+    Schema columns missing from an older file are skipped, so files written before a schema grew still load"""
+    aliases = aliases or {}
+    headers = {canonical: header for header, canonical in aliases.items()}
+    # Arrow's own header parsing strips the UTF-8 BOM and handles quoted names
+    reader = pa_csv.open_csv(path, convert_options=pa_csv.ConvertOptions(
+        column_types={name: pa.string() for name in list(schema) + list(aliases)}))
+    present = {aliases.get(name, name) for name in reader.schema.names}
+    reader.close()
+    schema = {column: dtype for column, dtype in schema.items() if column in present}
+    column_types = {headers.get(column, column): ARROW_TYPES[dtype] for column, dtype in schema.items()}
+
+    table = pa_csv.read_csv(
+        path,
+        convert_options=pa_csv.ConvertOptions(column_types=column_types, strings_can_be_null=True,
+                                              timestamp_parsers=date_formats or [pa_csv.ISO8601])
+    )
+    table = table.rename_columns([aliases.get(name, name) for name in table.column_names])
+
+    for column, dtype in schema.items():
+        index = table.schema.get_field_index(column)
+        if dtype == 'category':
+            table = table.set_column(index, column, pc.dictionary_encode(table[column]))
+        elif dtype == 'date':
+            table = table.set_column(index, column, table[column].cast(pa.date32()))
+    return table
+
+def apply_filters(table: pa.Table, filters):
+    """Keep rows matching every (column, op, value) filter; op is one of == != < <= > >= in, not in"""
+    mask = None
+    for column, operator, value in filters:
+        values = table[column]
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        if pa.types.is_date(values.type) or pa.types.is_timestamp(values.type):
+            value = [pa.scalar(item).cast(values.type) for item in value] if operator in ('in', 'not in') \
+                else pa.scalar(value).cast(values.type)
+
+        if operator in ('in', 'not in'):
+            condition = pc.is_in(values, value_set=pa.array(value, type=values.type))
+            condition = pc.invert(condition) if operator == 'not in' else condition
+        elif operator in FILTER_OPERATORS:
+            condition = FILTER_OPERATORS[operator](values, value)
+        else:
+            raise ValueError(f"Unsupported filter operator '{operator}'")
+        mask = condition if mask is None else pc.and_(mask, condition)
+
+    return table if mask is None else table.filter(mask)
+
+# ============================================================================
+# CACHED LOADING
+# ============================================================================
+
+def dataset_cache():
+    """Shared cache instance, created on first use"""
+    global _cache
+    if _cache is None:
+        _cache = DatasetCache()
+    return _cache
+
+def load_table(path, schema: dict, columns=None, filters=None, aliases: dict = None,
+               date_formats=None, use_cache: bool = True, as_arrow: bool = False):
+    """Typed table from a CSV, converted once and memory-mapped from the cache afterwards"""
+    path = Path(path)
+    if use_cache:
+        stat = path.stat()
+        key = cache_key(str(path.relative_to(REPO_ROOT)) if path.is_relative_to(REPO_ROOT) else str(path),
+                        config={'bytes': stat.st_size, 'modified': stat.st_mtime_ns, 'schema': schema,
+                                'aliases': aliases, 'date_formats': date_formats},
+                        code_version=code_version(dataset_schemas, __file__))
+        table = dataset_cache().load(key, as_pandas=False)
+        if table is None:
+            table = read_csv(path, schema, aliases, date_formats)
+            dataset_cache().store(key, table, {'table': path.stem, 'source': str(path)})
+    else:
+        table = read_csv(path, schema, aliases, date_formats)
+
+    if filters:
+        table = apply_filters(table, filters)
+    if columns is not None:
+        table = table.select(list(columns))
+    if as_arrow:
+        return table
+    return table.to_pandas(split_blocks=True, self_destruct=not use_cache, date_as_object=False)
+
+def load_edufin(table: str, columns=None, filters=None, use_cache: bool = True, as_arrow: bool = False):
+    """EduFin table from EduFin_Dataset/ with registry dtypes and canonical column names"""
+    if table not in EDUFIN_SCHEMAS:
+        raise KeyError(f"Unknown EduFin table '{table}'; expected one of {sorted(EDUFIN_SCHEMAS)}")
+    return load_table(EDUFIN_DIR / f"{table}.csv", EDUFIN_SCHEMAS[table], columns, filters,
+                      aliases=CSV_ALIASES.get(table), date_formats=EDUFIN_DATE_FORMATS,
+                      use_cache=use_cache, as_arrow=as_arrow)
+
+def load_retailmax(table: str, columns=None, filters=None, source: str = 'generated',
+                   use_cache: bool = True, as_arrow: bool = False):
+    """RetailMax table from Data_Generation/dataset/ (or the Python_V1_Dataset/ copy with source='python_v1')"""
+    if table not in RETAILMAX_SCHEMAS:
+        raise KeyError(f"Unknown RetailMax table '{table}'; expected one of {sorted(RETAILMAX_SCHEMAS)}")
+    return load_table(RETAILMAX_DIRS[source] / f"{table}.csv", RETAILMAX_SCHEMAS[table], columns, filters,
+                      use_cache=use_cache, as_arrow=as_arrow)
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Warm the cache for every checked-in table and report load times and memory"""
+    print("=" * 80)
+    print("TYPED DATASET LOADER")
+    print("=" * 80)
+    tables = [('edufin', name, load_edufin) for name in EDUFIN_SCHEMAS] + \
+             [('retailmax', name, load_retailmax) for name in RETAILMAX_SCHEMAS]
+
+    for dataset, name, loader in tables:
+        path = EDUFIN_DIR / f"{name}.csv" if dataset == 'edufin' else RETAILMAX_DIRS['generated'] / f"{name}.csv"
+        if not path.exists():
+            print(f"   {dataset:<10} {name:<25} not generated yet")
+            continue
+        start_time = time.time()
+        raw = pd.read_csv(path)
+        csv_seconds = time.time() - start_time
+
+        loader(name)  # First load converts into the cache
+        start_time = time.time()
+        typed = loader(name)
+        typed_seconds = time.time() - start_time
+
+        print(f"   {dataset:<10} {name:<25} read_csv {csv_seconds * 1000:7.1f} ms "
+              f"{raw.memory_usage(deep=True).sum() / 1024 ** 2:6.2f} MB | "
+              f"cached {typed_seconds * 1000:6.1f} ms {typed.memory_usage(deep=True).sum() / 1024 ** 2:6.2f} MB")
+
+if __name__ == "__main__":
+    main()
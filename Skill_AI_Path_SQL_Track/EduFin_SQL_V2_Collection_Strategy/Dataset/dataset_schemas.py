@@ -0,0 +1,280 @@
+"""
+Dataset Schema Registry
+Column names and logical types for the EduFin and RetailMax tables
+- Logical types: int8/int16/int32/int64, float64, bool, string, category, date, datetime
+- Column names are the canonical ones used by the generators and the SQL challenges
+- CSV_ALIASES maps misspelled headers in the checked-in CSVs to the canonical names
+"""
+
+# ============================================================================
+# EDUFIN (SQL TRACK)
+# ============================================================================
+
+EDUFIN_SCHEMAS = {
+    'dim_state': {
+        'state_id': 'int32',
+        'state_name': 'string',
+        'region': 'category',
+    },
+    'dim_city': {
+        'city_id': 'int32',
+        'city_name': 'string',
+        'state_id': 'int32',
+        'tier_classification': 'category',
+    },
+    'customers': {
+        'customer_id': 'int32',
+        'full_name': 'string',
+        'phone_number': 'int64',
+        'email_address': 'string',
+        'city_id': 'int32',
+        'current_address': 'string',
+        'annual_income': 'float64',
+        'cibil_score': 'int32',
+        'employment_type': 'category',
+        'employer_name': 'category',
+        'date_of_birth': 'date',
+        'gender': 'category',
+        'education_level': 'category',
+    },
+    'institutions': {
+        'institution_id': 'int32',
+        'institution_name': 'string',
+        'city_id': 'int32',
+        'institution_type': 'category',
+        'establishment_year': 'int16',
+        'total_students': 'int32',
+        'average_course_fee': 'float64',
+        'placement_rate': 'float64',
+        'accreditation_status': 'category',
+    },
+    'loans': {
+        'loan_id': 'int32',
+        'customer_id': 'int32',
+        'institution_id': 'int32',
+        'loan_amount': 'float64',
+        'loan_status': 'category',
+        'interest_rate': 'float64',
+        'loan_tenure_months': 'int16',
+        'application_date': 'date',
+        'disbursement_date': 'date',
+        'maturity_date': 'date',
+        'emi_amount': 'float64',
+        'purpose_of_loan': 'category',
+    },
+    'payments': {
+        'payment_id': 'int32',
+        'loan_id': 'int32',
+        'payment_date': 'date',
+        'payment_amount': 'float64',
+        'payment_method': 'category',
+        'payment_status': 'category',
+        'late_fee': 'float64',
+        'principal_component': 'float64',
+        'interest_component': 'float64',
+        'outstanding_balance': 'float64',
+    },
+    'defaults_collections': {
+        'default_id': 'int32',
+        'customer_id': 'int32',
+        'loan_id': 'int32',
+        'default_date': 'date',
+        'default_amount': 'float64',
+        'days_overdue': 'int32',
+        'collection_status': 'category',
+        'last_contact_date': 'date',
+        'contact_attempts': 'int16',
+        'legal_notice_sent': 'bool',
+        'recovery_amount': 'float64',
+        'collection_agent_id': 'int32',
+    },
+    'geographic_demographics': {
+        'geo_id': 'int32',
+        'city_id': 'int32',
+        'population_total': 'int64',
+        'population_18_35': 'int64',
+        'higher_education_enrollment': 'int64',
+        'average_household_income': 'float64',
+        'unemployment_rate': 'float64',
+        'literacy_rate': 'float64',
+        'number_of_colleges': 'int32',
+    },
+    'economic_indicators': {
+        'indicator_id': 'int32',
+        'state_id': 'int32',
+        'quarter': 'category',
+        'gdp_growth_rate': 'float64',
+        'inflation_rate': 'float64',
+        'unemployment_rate': 'float64',
+        'education_spending_percent': 'float64',
+        'per_capita_income': 'float64',
+        'literacy_rate': 'float64',
+    },
+}
+
+# ============================================================================
+# RETAILMAX (PYTHON TRACK)
+# ============================================================================
+
+RETAILMAX_SCHEMAS = {
+    'customers': {
+        'customer_id': 'string',
+        'name': 'string',
+        'age': 'int16',
+        'gender': 'category',
+        'email': 'string',
+        'phone': 'string',
+        'registration_date': 'datetime',
+        'loyalty_status': 'category',
+        'region': 'category',
+    },
+    'product_catalog': {
+        'product_id': 'string',
+        'name': 'string',
+        'category': 'category',
+        'price': 'float64',
+        'inventory_status': 'category',
+    },
+    'transactions': {
+        'transaction_id': 'string',
+        'customer_id': 'string',
+        'product_id': 'string',
+        'transaction_date': 'datetime',
+        'amount_spent': 'float64',
+        'payment_method': 'category',
+        'product_category': 'category',
+        'quantity': 'int16',
+    },
+    'orders': {
+        'order_id': 'string',
+        'customer_id': 'string',
+        'order_date': 'datetime',
+        'product_category': 'category',
+        'order_value': 'float64',
+        'quantity': 'int16',
+        'discount_amount': 'float64',
+        'payment_method': 'category',
+        'delivery_days': 'int16',
+        'order_status': 'category',
+        'rating': 'float64',
+        'is_repeat_customer': 'int8',
+    },
+    'churn_labels': {
+        'customer_id': 'string',
+        'churn_status': 'int8',
+        'last_active_date': 'datetime',
+    },
+    'campaigns': {
+        'campaign_id': 'string',
+        'campaign_name': 'string',
+        'campaign_type': 'category',
+        'start_date': 'datetime',
+        'end_date': 'datetime',
+        'budget': 'float64',
+        'target_segment': 'category',
+        'channel': 'category',
+    },
+    'campaign_performance': {
+        'campaign_id': 'string',
+        'impressions': 'int64',
+        'clicks': 'int64',
+        'conversions': 'int64',
+        'revenue': 'float64',
+        'roi': 'float64',
+        'ctr': 'float64',
+        'conversion_rate': 'float64',
+    },
+    'customer_feedback': {
+        'feedback_id': 'string',
+        'customer_id': 'string',
+        'transaction_id': 'string',
+        'rating': 'int8',
+        'feedback_text': 'category',
+        'date': 'datetime',
+    },
+    'sessions': {
+        'session_id': 'string',
+        'customer_id': 'string',
+        'device_type': 'category',
+        'session_start': 'datetime',
+        'session_end': 'datetime',
+        'pages_visited': 'int16',
+        'session_duration_minutes': 'int32',
+    },
+    'customer_behavior': {
+        'session_id': 'string',
+        'customer_id': 'string',
+        'session_date': 'datetime',
+        'session_duration_minutes': 'int32',
+        'pages_viewed': 'int16',
+        'page_type': 'category',
+        'device_type': 'category',
+        'bounce_rate': 'float64',
+        'time_on_page_seconds': 'float64',
+        'cart_additions': 'int16',
+        'cart_abandonment': 'int8',
+        'search_queries': 'int16',
+        'support_chat_initiated': 'int8',
+        'email_clicks': 'int16',
+        'app_rating_given': 'int8',
+    },
+    'billing_events': {
+        'event_id': 'string',
+        'customer_id': 'string',
+        'invoice_date': 'datetime',
+        'total_due': 'float64',
+        'payment_status': 'category',
+        'due_date': 'datetime',
+    },
+    'support_tickets': {
+        'ticket_id': 'string',
+        'customer_id': 'string',
+        'issue_type': 'category',
+        'created_date': 'datetime',
+        'assigned_date': 'datetime',
+        'resolved_date': 'datetime',
+        'resolution_time_hours': 'float64',
+        'status': 'category',
+        'priority': 'category',
+        'agent_id': 'category',
+    },
+    'clickstream_events': {
+        'session_id': 'string',
+        'event_number': 'int32',
+        'customer_id': 'string',
+        'event_time': 'datetime',
+        'event_type': 'category',
+        'page_type': 'category',
+        'device_type': 'category',
+        'product_id': 'category',
+    },
+    'order_items': {
+        'order_id': 'string',
+        'line_number': 'int16',
+        'product_id': 'string',
+        'product_category': 'category',
+        'quantity': 'int16',
+        'unit_price': 'float64',
+        'line_total': 'float64',
+    },
+    'campaign_attribution': {
+        'transaction_id': 'string',
+        'customer_id': 'string',
+        'campaign_id': 'category',
+        'transaction_date': 'datetime',
+        'credit': 'float64',
+        'attributed_revenue': 'float64',
+    },
+}
+
+# ============================================================================
+# CSV HEADER ALIASES
+# ============================================================================
+
+# Misspelled headers in EduFin_Dataset/*.csv -> canonical column names
+CSV_ALIASES = {
+    'customers': {'employemnet_type': 'employment_type', 'eduction_level': 'education_level'},
+    'defaults_collections': {'contact_attampts': 'contact_attempts'},
+    'economic_indicators': {'unemployement_rate': 'unemployment_rate'},
+    'geographic_demographics': {'unemploment_rate': 'unemployment_rate'},
+}
@@ -0,0 +1,533 @@
+"""
+Streaming Dataset Statistics
+Single-pass, mergeable column statistics built from the batches a generator is already writing,
+so a per-table statistics catalog comes out with the data at zero extra I/O
+- HyperLogLog for distinct counts, a merging t-digest for quantiles and exact counters for
+  low-cardinality (enum) columns, plus row/NULL counts, min/max and mean
+- Every sketch merges, so catalogs from chunks, partitions or parallel workers combine into one
+- The JSON catalog keeps the sketch state next to the summary; it fills SQLite's sqlite_stat1,
+  answers selectivity estimates and drives drift checks against a baseline run
+
+Usage:
+    python dataset_stats.py edufin.duckdb.stats.json
+    python dataset_stats.py dataset/stats.json --baseline baseline/stats.json
+"""
+
+import argparse
+import base64
+import json
+import math
+import sys
+import zlib
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CATALOG_VERSION = 1
+HLL_PRECISION = 14  # 16,384 registers: ~0.8% standard error on distinct counts
+DIGEST_COMPRESSION = 200  # ~100 centroids per column, smallest at the tails
+ENUM_LIMIT = 128  # Columns with more distinct values than this stop keeping exact counters
+QUANTILES = (0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99)
+ORDERED_KINDS = ('numeric', 'date', 'timestamp')
+EPOCH = datetime(1970, 1, 1)
+
+STRING_MULTIPLIER = np.uint64(0x100000001B3)  # FNV-64 prime for the polynomial string hash
+
+DRIFT_TOLERANCE = {
+    'null_rate': 0.02,  # Absolute change in the share of NULLs
+    'ndv_share': 0.10,  # Relative change in distinct values per non-NULL value
+    'quantiles': 0.05,  # Largest quantile shift, as a share of the baseline p1-p99 range
+    'enum_share': 0.05,  # Total variation distance between the category mixes
+}
+UNIQUE_SHARE = 0.95  # Columns at least this distinct are keys: only their NULL rate is compared
+
+# ============================================================================
+# HASHING
+# ============================================================================
+
+def splitmix64(values: np.ndarray):
+    """SplitMix64 finaliser over uint64 values"""
+    with np.errstate(over='ignore'):
+        values = values ^ (values >> np.uint64(30))
+        values = values * np.uint64(0xBF58476D1CE4E5B9)
+        values = values ^ (values >> np.uint64(27))
+        values = values * np.uint64(0x94D049BB133111EB)
+        return values ^ (values >> np.uint64(31))
+
+def string_hashes(values: pa.Array):
+    """64-bit hash of every string, computed over Arrow's UTF-8 buffer without building Python objects"""
+    values = values.cast(pa.string())
+    offsets = np.frombuffer(values.buffers()[1], dtype=np.int32)[values.offset:values.offset + len(values) + 1]
+    data = np.frombuffer(values.buffers()[2], dtype=np.uint8)[offsets[0]:offsets[-1]]
+    starts, lengths = offsets[:-1] - offsets[0], np.diff(offsets)
+    with np.errstate(over='ignore'):
+        powers = np.cumprod(np.full(max(int(lengths.max()), 1), STRING_MULTIPLIER))
+        position = np.arange(len(data)) - np.repeat(starts, lengths)
+        terms = np.append(data.astype(np.uint64) * powers[position], np.uint64(0))
+    sums = np.add.reduceat(terms, np.minimum(starts, len(data)))
+    sums[lengths == 0] = 0
+    return splitmix64(sums ^ splitmix64(lengths.astype(np.uint64)))
+
+def numbers(values: pa.Array, kind: str):
+    """float64 view of an ordered column: numbers as-is, dates as days and timestamps as seconds since 1970"""
+    if kind == 'date':
+        values = values.cast(pa.date32()).cast(pa.int32())
+    elif kind == 'timestamp':
+        values = values.cast(pa.timestamp('s'), safe=False).cast(pa.int64())
+    elif kind == 'bool':
+        values = values.cast(pa.int8())
+    return values.to_numpy(zero_copy_only=False).astype(np.float64)
+
+def value_hashes(values: pa.Array, kind: str):
+    """uint64 hash per (non-NULL) value; equal values hash equally in every batch"""
+    if kind == 'string':
+        return string_hashes(values)
+    return splitmix64((numbers(values, kind) + 0.0).view(np.uint64))  # + 0.0 folds -0.0 into 0.0
+
+def column_kind(data_type: pa.DataType):
+    """'numeric', 'date', 'timestamp', 'bool' or 'string' for an Arrow type"""
+    if pa.types.is_dictionary(data_type):
+        data_type = data_type.value_type
+    if pa.types.is_boolean(data_type):
+        return 'bool'
+    if pa.types.is_integer(data_type) or pa.types.is_floating(data_type) or pa.types.is_decimal(data_type):
+        return 'numeric'
+    if pa.types.is_date(data_type):
+        return 'date'
+    if pa.types.is_timestamp(data_type):
+        return 'timestamp'
+    return 'string'
+
+def value_key(value):
+    """JSON object key for an enum value"""
+    return value.isoformat() if isinstance(value, (date, datetime)) else str(value)
+
+def to_number(value, kind: str):
+    """Number on the numbers() scale for a Python value or its value_key()"""
+    if kind == 'date':
+        value = date.fromisoformat(value[:10]) if isinstance(value, str) else value
+        return float(((value.date() if isinstance(value, datetime) else value) - EPOCH.date()).days)
+    if kind == 'timestamp':
+        value = datetime.fromisoformat(value) if isinstance(value, str) else value
+        return (value - EPOCH).total_seconds()
+    return float(value)
+
+def from_number(value: float, kind: str):
+    """JSON-friendly value back from the numbers() scale"""
+    if value is None:
+        return None
+    if kind == 'date':
+        return (EPOCH.date() + timedelta(days=round(value))).isoformat()
+    if kind == 'timestamp':
+        return (EPOCH + timedelta(seconds=round(value))).isoformat(sep=' ')
+    return round(float(value), 6)
+
+# ============================================================================
+# SKETCHES
+# ============================================================================
+
+class HyperLogLog:
+    """Distinct-value sketch over 64-bit hashes; merging takes the register-wise maximum"""
+
+    def __init__(self, precision: int = HLL_PRECISION, registers: np.ndarray = None):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, dtype=np.uint8) if registers is None else registers
+
+    def add(self, hashes: np.ndarray):
+        if not len(hashes):
+            return
+        index = (hashes >> np.uint64(64 - self.precision)).astype(np.intp)
+        rest = ((hashes << np.uint64(self.precision)) >> np.uint64(32)).astype(np.float64)  # Next 32 bits
+        rank = np.where(rest > 0, 32 - np.floor(np.log2(np.maximum(rest, 1))), 33).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: 'HyperLogLog'):
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self):
+        m = len(self.registers)
+        estimate = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int(np.count_nonzero(self.registers == 0))
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # Linear counting while registers are still empty
+        return int(round(estimate))
+
+    def state(self):
+        return base64.b64encode(zlib.compress(self.registers.tobytes())).decode('ascii')
+
+    @classmethod
+    def from_state(cls, state: str):
+        registers = np.frombuffer(zlib.decompress(base64.b64decode(state)), dtype=np.uint8).copy()
+        return cls(int(math.log2(len(registers))), registers)
+
+class TDigest:
+    """Merging t-digest: centroids are re-bucketed on the arcsine (k1) scale, so the tails stay nearly exact"""
+
+    def __init__(self, compression: int = DIGEST_COMPRESSION, means=None, weights=None):
+        self.compression = compression
+        self.means = np.asarray([] if means is None else means, dtype=np.float64)
+        self.weights = np.asarray([] if weights is None else weights, dtype=np.float64)
+
+    def add(self, means: np.ndarray, weights: np.ndarray = None):
+        if not len(means):
+            return
+        weights = np.ones(len(means)) if weights is None else weights
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind='stable')  # Two sorted runs: timsort merges them in linear time
+        means, weights = means[order], weights[order]
+        middle = (np.cumsum(weights) - weights / 2) / weights.sum()
+        bucket = np.floor(self.compression / (2 * np.pi) * np.arcsin(2 * middle - 1))
+        starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+        self.weights = np.add.reduceat(weights, starts)
+        self.means = np.add.reduceat(means * weights, starts) / self.weights
+
+    def merge(self, other: 'TDigest'):
+        self.add(other.means, other.weights)
+
+    def positions(self):
+        """Cumulative share of the weight at every centroid's midpoint"""
+        return (np.cumsum(self.weights) - self.weights / 2) / self.weights.sum()
+
+    def quantile(self, q, low: float, high: float):
+        return np.interp(q, np.r_[0, self.positions(), 1], np.r_[low, self.means, high])
+
+    def cdf(self, value, low: float, high: float):
+        return float(np.interp(value, np.r_[low, self.means, high], np.r_[0, self.positions(), 1]))
+
+# ============================================================================
+# COLUMN AND TABLE STATISTICS
+# ============================================================================
+
+class ColumnStats:
+    """Running statistics for one column, updated from Arrow arrays and mergeable with another ColumnStats"""
+
+    def __init__(self, kind: str):
+        self.kind = kind
+        self.count = self.nulls = 0
+        self.low = self.high = None
+        self.total = 0.0
+        self.counts = {}  # Exact value counts while the column stays under ENUM_LIMIT; None beyond
+        self.hll = HyperLogLog()
+        self.digest = TDigest() if kind in ORDERED_KINDS else None
+
+    def update(self, values):
+        if isinstance(values, pa.ChunkedArray):
+            values = values.combine_chunks()
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        self.nulls += values.null_count
+        values = values.drop_null() if values.null_count else values
+        self.count += len(values)
+        if not len(values):
+            return
+
+        if self.counts is not None:
+            counted = pc.value_counts(values)
+            distinct = counted.field('values')
+            if len(distinct) > ENUM_LIMIT:
+                self.counts = None
+            else:
+                for value, count in zip(distinct.to_pylist(), counted.field('counts').to_pylist()):
+                    key = value_key(value)
+                    self.counts[key] = self.counts.get(key, 0) + count
+                if len(self.counts) > ENUM_LIMIT:
+                    self.counts = None
+            self.hll.add(value_hashes(distinct, self.kind))  # Repeats never change a register
+        else:
+            self.hll.add(value_hashes(values, self.kind))
+
+        if self.digest is not None:
+            column = np.sort(numbers(values, self.kind))
+            self.low = column[0] if self.low is None else min(self.low, column[0])
+            self.high = column[-1] if self.high is None else max(self.high, column[-1])
+            self.total += float(column.sum())
+            self.digest.add(column)
+
+    def merge(self, other: 'ColumnStats'):
+        self.count += other.count
+        self.nulls += other.nulls
+        self.total += other.total
+        if other.low is not None:
+            self.low = other.low if self.low is None else min(self.low, other.low)
+            self.high = other.high if self.high is None else max(self.high, other.high)
+        if self.counts is not None and other.counts is not None:
+            for key, count in other.counts.items():
+                self.counts[key] = self.counts.get(key, 0) + count
+            if len(self.counts) > ENUM_LIMIT:
+                self.counts = None
+        else:
+            self.counts = None
+        self.hll.merge(other.hll)
+        if self.digest is not None and other.digest is not None:
+            self.digest.merge(other.digest)
+
+    @property
+    def ndv(self):
+        """Distinct non-NULL values: exact for enum columns, HyperLogLog beyond"""
+        return len(self.counts) if self.counts is not None else min(self.hll.count(), self.count)
+
+    def quantiles(self):
+        if self.digest is None or not self.count:
+            return None
+        levels = self.digest.quantile(QUANTILES, self.low, self.high)
+        return {f"p{round(q * 100)}": from_number(value, self.kind) for q, value in zip(QUANTILES, levels)}
+
+    def cdf(self, value, inclusive: bool = False):
+        """Share of the non-NULL values below (or at, if inclusive) value"""
+        if not self.count:
+            return 0.0
+        value = to_number(value, self.kind)
+        if self.counts is not None:
+            below = sum(count for key, count in self.counts.items()
+                        if to_number(key, self.kind) < value or (inclusive and to_number(key, self.kind) == value))
+            return below / self.count
+        return self.digest.cdf(value, self.low, self.high)
+
+    def to_dict(self):
+        rows = self.count + self.nulls
+        summary = {
+            'type': self.kind,
+            'count': self.count,
+            'nulls': self.nulls,
+            'null_rate': round(self.nulls / rows, 6) if rows else 0.0,
+            'ndv': self.ndv,
+        }
+        if self.digest is not None and self.count:
+            summary.update({'min': from_number(self.low, self.kind), 'max': from_number(self.high, self.kind),
+                            'mean': from_number(self.total / self.count, self.kind),
+                            'quantiles': self.quantiles()})
+        if self.counts is not None:
+            summary['values'] = dict(sorted(self.counts.items(), key=lambda item: -item[1]))
+        summary['sketch'] = {
+            'hll': self.hll.state(),
+            'low': self.low if self.low is None else float(self.low),
+            'high': self.high if self.high is None else float(self.high),
+            'total': self.total,
+        }
+        if self.digest is not None:
+            summary['sketch']['digest'] = [self.digest.means.tolist(), self.digest.weights.tolist()]
+        return summary
+
+    @classmethod
+    def from_dict(cls, summary: dict):
+        stats = cls(summary['type'])
+        sketch = summary['sketch']
+        stats.count, stats.nulls = summary['count'], summary['nulls']
+        stats.low, stats.high, stats.total = sketch['low'], sketch['high'], sketch['total']
+        stats.counts = dict(summary['values']) if 'values' in summary else None
+        stats.hll = HyperLogLog.from_state(sketch['hll'])
+        if 'digest' in sketch:
+            stats.digest = TDigest(means=sketch['digest'][0], weights=sketch['digest'][1])
+        return stats
+
+# ============================================================================
+# CATALOG
+# ============================================================================
+
+class StatsCatalog:
+    """Per-table row counts and ColumnStats, updated batch by batch as a generator writes"""
+
+    def __init__(self):
+        self.rows = {}
+        self.columns = {}
+
+    def update(self, table: str, batch):
+        """Fold an Arrow table/record batch or a DataFrame into the table's statistics"""
+        if isinstance(batch, pd.DataFrame):
+            batch = pa.Table.from_pandas(batch, preserve_index=False)
+        self.rows[table] = self.rows.get(table, 0) + batch.num_rows
+        columns = self.columns.setdefault(table, {})
+        for name, values in zip(batch.schema.names, batch.columns):
+            if name not in columns:
+                columns[name] = ColumnStats(column_kind(values.type))
+            columns[name].update(values)
+        return self
+
+    def merge(self, other: 'StatsCatalog'):
+        """Combine with a catalog built over other rows of the same tables (another chunk or worker)"""
+        for table, rows in other.rows.items():
+            self.rows[table] = self.rows.get(table, 0) + rows
+            columns = self.columns.setdefault(table, {})
+            for name, stats in other.columns[table].items():
+                if name in columns:
+                    columns[name].merge(stats)
+                else:
+                    columns[name] = ColumnStats.from_dict(stats.to_dict())
+        return self
+
+    def selectivity(self, table: str, column: str, op: str, value):
+        """Estimated share of the table's rows where `column op value` holds ('=', '!=', '<', '<=', '>', '>=')"""
+        stats, rows = self.columns[table][column], self.rows[table]
+        present = stats.count / rows if rows else 0.0
+        if op in ('=', '!='):
+            if stats.counts is not None:
+                share = stats.counts.get(value_key(value), 0) / stats.count if stats.count else 0.0
+            else:
+                share = 1 / max(stats.ndv, 1)
+            return present * share if op == '=' else present * (1 - share)
+        if op in ('<', '<='):
+            return present * stats.cdf(value, inclusive=op == '<=')
+        if op in ('>', '>='):
+            return present * (1 - stats.cdf(value, inclusive=op == '>'))
+        raise ValueError(f"Unknown operator '{op}'")
+
+    def estimate_rows(self, table: str, column: str, op: str, value):
+        return round(self.rows[table] * self.selectivity(table, column, op, value))
+
+    def to_dict(self):
+        return {
+            'version': CATALOG_VERSION,
+            'tables': {table: {'rows': rows, 'columns': {name: stats.to_dict()
+                                                         for name, stats in self.columns[table].items()}}
+                       for table, rows in self.rows.items()},
+        }
+
+    def save(self, path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=1))
+        return path
+
+    @classmethod
+    def load(cls, path):
+        data = json.loads(Path(path).read_text())
+        if data.get('version') != CATALOG_VERSION:
+            raise ValueError(f"{path} is a version {data.get('version')} catalog; expected {CATALOG_VERSION}")
+        catalog = cls()
+        for table, entry in data['tables'].items():
+            catalog.rows[table] = entry['rows']
+            catalog.columns[table] = {name: ColumnStats.from_dict(summary)
+                                      for name, summary in entry['columns'].items()}
+        return catalog
+
+# ============================================================================
+# OPTIMIZER STATISTICS
+# ============================================================================
+
+def write_sqlite_stat1(connection, catalog: StatsCatalog):
+    """Fill sqlite_stat1 from the catalog instead of letting ANALYZE scan every table and index
+
+    Multi-column index prefixes assume independent columns, capped at the row count.
+    """
+    connection.execute("ANALYZE sqlite_master")  # Creates an empty sqlite_stat1 without scanning
+    connection.execute("DELETE FROM sqlite_stat1")
+    entries = []
+    for table, rows in catalog.rows.items():
+        if not rows:
+            continue
+        indexes = connection.execute(f"PRAGMA index_list({table})").fetchall()  # seq, name, unique, ...
+        if not indexes:
+            entries.append((table, None, str(rows)))
+        for _, index, unique, *_ in indexes:
+            stat, distinct = [rows], 1
+            for _, _, column in connection.execute(f"PRAGMA index_info({index})").fetchall():
+                distinct = min(rows, distinct * max(catalog.columns[table][column].ndv, 1))
+                stat.append(max(1, math.ceil(rows / distinct)))
+            if unique:
+                stat[-1] = 1
+            entries.append((table, index, ' '.join(map(str, stat))))
+    connection.executemany("INSERT INTO sqlite_stat1 VALUES (?, ?, ?)", entries)
+    return entries
+
+# ============================================================================
+# DRIFT CHECKS
+# ============================================================================
+
+def compare_catalogs(baseline: StatsCatalog, current: StatsCatalog, tolerance: dict = None):
+    """[(table, column, check, baseline value, current value)] for every statistic beyond its tolerance"""
+    tolerance = {**DRIFT_TOLERANCE, **(tolerance or {})}
+    drift = []
+    for table, columns in baseline.columns.items():
+        if table not in current.columns:
+            drift.append((table, None, 'missing table', baseline.rows[table], None))
+            continue
+        for name, before in columns.items():
+            after = current.columns[table].get(name)
+            if after is None:
+                drift.append((table, name, 'missing column', before.kind, None))
+                continue
+            before_rate = before.nulls / max(before.count + before.nulls, 1)
+            after_rate = after.nulls / max(after.count + after.nulls, 1)
+            if abs(after_rate - before_rate) > tolerance['null_rate']:
+                drift.append((table, name, 'null_rate', round(before_rate, 4), round(after_rate, 4)))
+            if not before.count or not after.count or before.ndv >= UNIQUE_SHARE * before.count:
+                continue  # Keys: distinct counts and ranges follow the row count
+
+            if before.counts is not None and after.counts is not None:
+                keys = set(before.counts) | set(after.counts)
+                distance = sum(abs(before.counts.get(key, 0) / before.count - after.counts.get(key, 0) / after.count)
+                               for key in keys) / 2
+                if distance > tolerance['enum_share']:
+                    top = max(before.counts, key=before.counts.get)
+                    drift.append((table, name, f"enum_share (TVD {distance:.3f})",
+                                  f"{top} {before.counts[top] / before.count:.1%}",
+                                  f"{top} {after.counts.get(top, 0) / after.count:.1%}"))
+            else:
+                before_share, after_share = before.ndv / before.count, after.ndv / after.count
+                if abs(after_share - before_share) > tolerance['ndv_share'] * before_share:
+                    drift.append((table, name, 'ndv_share', round(before_share, 4), round(after_share, 4)))
+
+            if before.digest is not None and after.digest is not None:
+                levels_before = before.digest.quantile(QUANTILES, before.low, before.high)
+                levels_after = after.digest.quantile(QUANTILES, after.low, after.high)
+                spread = levels_before[-1] - levels_before[0] or 1.0
+                shifts = np.abs(levels_after - levels_before) / spread
+                worst = int(np.argmax(shifts))
+                if shifts[worst] > tolerance['quantiles']:
+                    drift.append((table, name, f"p{round(QUANTILES[worst] * 100)}",
+                                  from_number(levels_before[worst], before.kind),
+                                  from_number(levels_after[worst], after.kind)))
+    return drift
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_catalog(catalog: StatsCatalog):
+    """One line per column: type, NULL rate, distinct values and range or top values"""
+    for table, columns in catalog.columns.items():
+        print(f"\n📊 {table} ({catalog.rows[table]:,} rows)")
+        for name, stats in columns.items():
+            summary = stats.to_dict()
+            if 'values' in summary:
+                top = list(summary['values'].items())[:3]
+                detail = ', '.join(f"{key} {count / stats.count:.0%}" for key, count in top)
+            elif 'quantiles' in summary:
+                detail = f"{summary['min']} .. {summary['quantiles']['p50']} .. {summary['max']}"
+            else:
+                detail = ''
+            print(f"   {name:<28} {stats.kind:<9} {summary['null_rate']:>6.1%} null "
+                  f"{stats.ndv:>12,} distinct  {detail}")
+
+def main():
+    """Print a statistics catalog, or check it for drift against a baseline catalog"""
+    parser = argparse.ArgumentParser(description="Summarise a dataset statistics catalog or check it for drift")
+    parser.add_argument('catalog', help="stats.json written next to the data")
+    parser.add_argument('--baseline', help="Catalog of a known-good run to compare against")
+    args = parser.parse_args()
+
+    catalog = StatsCatalog.load(args.catalog)
+    if not args.baseline:
+        print_catalog(catalog)
+        return
+
+    drift = compare_catalogs(StatsCatalog.load(args.baseline), catalog)
+    print("=" * 80)
+    print(f"DRIFT CHECK: {args.catalog} vs {args.baseline}")
+    print("=" * 80)
+    for table, column, check, before, after in drift:
+        print(f"   ⚠️ {table}.{column or '*'}: {check} {before} -> {after}")
+    print(f"\n{'✅ No drift' if not drift else f'❌ {len(drift)} statistics drifted'}")
+    sys.exit(1 if drift else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+EduFin Downsampler
+Cuts a large EduFin dataset down to workshop size without breaking a single foreign key
+- Customers are sampled per city (stratified), ranked by a counter-based hash of their ID, so
+  a smaller sample is always a subset of a larger one with the same seed
+- Loans follow their customers, payments and collection cases follow their loans: semi-joins on
+  key columns only, through a bitmap over the key range (binary search on sorted keys when the
+  range is too sparse for a bitmap)
+- Geographic and economic rows are sampled at the same rate by the same hash
+- Closure: every institution, customer, city and state a kept row references is kept too
+- Sources: the virtual tables at any scale (only key columns are generated for the full table,
+  full rows only for the sample) or an existing DuckDB/SQLite warehouse
+
+Usage:
+    python edufin_downsample.py --scale 20 --rows 50000 --out edufin_sample
+    python edufin_downsample.py --warehouse edufin_500k.duckdb --fraction 0.01 --out edufin_sample
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from dataset_schemas import EDUFIN_SCHEMAS
+from edufin_rng import DEFAULT_SEED, stream_key
+from edufin_virtual_tables import DEFAULT_AS_OF
+from edufin_warehouse import (FOREIGN_KEYS, PRIMARY_KEYS, TABLE_ORDER, build_warehouse, connect,
+                              remap_geo_cities, typed_batch, virtual_tables)
+
+SAMPLE_STRATA = {'customers': 'city_id'}  # Sampled tables -> column stratified on
+INDEPENDENT_TABLES = ['geographic_demographics', 'economic_indicators']  # Sampled by hash alone
+SEMI_JOINS = {  # Table -> (column, parent) its rows follow
+    'loans': ('customer_id', 'customers'),
+    'payments': ('loan_id', 'loans'),
+    'defaults_collections': ('loan_id', 'loans'),
+}
+BITMAP_MAX_KEY = 1 << 28  # Largest key a membership bitmap is built for (256 MB of bools)
+SAMPLE_STREAM = 'downsample'
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+class VirtualSource:
+    """Virtual tables at a scale: key columns for the whole table, full rows only where asked"""
+
+    def __init__(self, scale: float = 1.0, seed: int = DEFAULT_SEED, as_of=DEFAULT_AS_OF):
+        self.tables = virtual_tables(scale, seed, as_of)
+
+    def num_rows(self, table: str):
+        return len(self.tables[table])
+
+    def keys(self, table: str, column: str = None):
+        """(primary keys, values of `column`) for every row"""
+        data = self.tables[table]
+        if isinstance(data, pd.DataFrame):  # Checked-in dimension
+            ids = data[PRIMARY_KEYS[table]].to_numpy()
+            return ids, (ids if column is None else data[column].to_numpy())
+        ids = np.arange(1, len(data) + 1)  # Virtual IDs are row positions + 1
+        if column is None or column == PRIMARY_KEYS[table]:
+            return ids, ids
+        values = data[:, [column]]
+        if table == 'geographic_demographics':
+            values = remap_geo_cities(values, self.tables['dim_city'])
+        return ids, values[column].to_numpy()
+
+    def rows(self, table: str, ids):
+        """Typed Arrow rows for the given primary keys, in key order"""
+        data, ids = self.tables[table], np.sort(ids)
+        if isinstance(data, pd.DataFrame):
+            return typed_batch(table, data[data[PRIMARY_KEYS[table]].isin(ids)])
+        batch = data.take(ids - 1, list(EDUFIN_SCHEMAS[table]))
+        if table == 'geographic_demographics':
+            batch = remap_geo_cities(batch, self.tables['dim_city'])
+        return typed_batch(table, batch)
+
+class WarehouseSource:
+    """A DuckDB or SQLite warehouse built by edufin_warehouse.py"""
+
+    def __init__(self, path, engine: str = None):
+        self.connection = connect(path, engine)
+        self.sqlite = not hasattr(self.connection, 'register')
+
+    def query(self, sql: str):
+        cursor = self.connection.execute(sql)
+        names = [column[0] for column in cursor.description]
+        if self.sqlite:
+            rows = cursor.fetchall()
+            return pa.table({name: [row[index] for row in rows] for index, name in enumerate(names)})
+        return cursor.fetch_arrow_table()
+
+    def num_rows(self, table: str):
+        return self.connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def keys(self, table: str, column: str = None):
+        key = PRIMARY_KEYS[table]
+        result = self.query(f"SELECT {key} AS id, {column or key} AS value FROM {table}")
+        return tuple(pc.fill_null(result[name], 0).to_numpy() for name in ('id', 'value'))
+
+    def rows(self, table: str, ids):
+        key = PRIMARY_KEYS[table]
+        if self.sqlite:
+            self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS sample_ids (id INTEGER PRIMARY KEY)")
+            self.connection.execute("DELETE FROM sample_ids")
+            self.connection.executemany("INSERT INTO sample_ids VALUES (?)", ((int(id_),) for id_ in ids))
+            rows = self.query(f"SELECT t.* FROM {table} t JOIN sample_ids s ON t.{key} = s.id ORDER BY t.{key}")
+        else:
+            self.connection.register('sample_ids', pa.table({'id': np.asarray(ids)}))
+            rows = self.query(f"SELECT * FROM {table} WHERE {key} IN (SELECT id FROM sample_ids) ORDER BY {key}")
+            self.connection.unregister('sample_ids')
+        return typed_batch(table, rows)
+
+# ============================================================================
+# SAMPLING
+# ============================================================================
+
+def member(values, keys):
+    """Boolean mask of `values` found in `keys`: a bitmap over the key range, or binary search"""
+    values, keys = np.asarray(values), np.asarray(keys)
+    if len(keys) == 0 or len(values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    top = int(max(values.max(), keys.max()))
+    if top <= BITMAP_MAX_KEY and values.min() >= 0:
+        bitmap = np.zeros(top + 1, dtype=bool)
+        bitmap[keys] = True
+        return bitmap[values]
+    keys = np.sort(keys)
+    positions = np.minimum(np.searchsorted(keys, values), len(keys) - 1)
+    return keys[positions] == values
+
+def sample_hash(table: str, ids, seed: int):
+    """Uniform [0, 1) value per primary key, fixed for a given seed and table (splitmix64 finalizer)
+
+    A few integer multiplies per key, so hashing tens of millions of keys stays well under a second.
+    """
+    low, high = (int(word) for word in stream_key(table, SAMPLE_STREAM, seed))
+    key = high << 32 | low
+    with np.errstate(over='ignore'):
+        mixed = np.asarray(ids, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15) + np.uint64(key)
+        for shift, multiplier in ((30, 0xBF58476D1CE4E5B9), (27, 0x94D049BB133111EB)):
+            mixed ^= mixed >> np.uint64(shift)
+            mixed *= np.uint64(multiplier)
+        mixed ^= mixed >> np.uint64(31)
+    return (mixed >> np.uint64(11)).astype(np.float64) / float(1 << 53)
+
+def stratified_sample(ids, strata, fraction: float, table: str, seed: int):
+    """IDs of round(fraction * size) rows per stratum, those with the smallest hash
+
+    Only rows hashing under a cutoff a few standard deviations above `fraction` are sorted;
+    if some stratum falls short of its quota that way, every row is.
+    """
+    codes = np.unique(strata, return_inverse=True)[1] if strata.min() < 0 or strata.max() > len(strata) \
+        else strata
+    counts = np.bincount(codes)
+    quotas = np.round(counts * fraction)
+    hashes = sample_hash(table, ids, seed)
+    smallest = counts[quotas > 0].min(initial=len(ids))
+    cutoff = fraction + 6 * np.sqrt(fraction / smallest) + 1 / smallest
+    candidates = np.flatnonzero(hashes < cutoff)
+    if (np.bincount(codes[candidates], minlength=len(quotas)) < quotas).any():
+        candidates = np.arange(len(ids))
+    order = candidates[np.lexsort((hashes[candidates], codes[candidates]))]
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    sizes = np.diff(np.r_[starts, len(sorted_codes)])
+    rank = np.arange(len(sorted_codes)) - np.repeat(starts, sizes)
+    return ids[order[rank < np.repeat(quotas[sorted_codes[starts]], sizes)]]
+
+def downsample(source, fraction: float, seed: int = DEFAULT_SEED, verbose: bool = True):
+    """{table: Arrow rows} of a referentially closed sample holding about `fraction` of the data"""
+    kept, rows, report = {}, {}, {}
+
+    for table, stratum in SAMPLE_STRATA.items():
+        ids, strata = source.keys(table, stratum)
+        kept[table] = stratified_sample(ids, strata, fraction, table, seed)
+        report[table] = {'source_rows': len(ids), 'strata': strata}
+    for table in INDEPENDENT_TABLES:
+        ids, _ = source.keys(table)
+        kept[table] = ids[sample_hash(table, ids, seed) < fraction]
+        report[table] = {'source_rows': len(ids)}
+    for table, (column, parent) in SEMI_JOINS.items():  # Parents come first in SEMI_JOINS
+        ids, references = source.keys(table, column)
+        kept[table] = ids[member(references, kept[parent])]
+        report[table] = {'source_rows': len(ids), 'references': references}
+
+    for table in kept:
+        rows[table] = source.rows(table, kept[table])
+    for table in reversed(TABLE_ORDER):  # Children before parents, so added rows get their own parents
+        for column, parent in FOREIGN_KEYS.get(table, []):
+            referenced = pc.unique(rows[table][column].drop_null()).to_numpy()
+            have = kept.get(parent, np.array([], dtype=np.int64))
+            missing = referenced[~member(referenced, have)]
+            if len(missing):
+                added = source.rows(parent, missing)
+                rows[parent] = pa.concat_tables([rows[parent], added]) if parent in rows else added
+                kept[parent] = np.concatenate([have, missing])
+                report.setdefault(parent, {}).setdefault('closure_rows', 0)
+                report[parent]['closure_rows'] += len(missing)
+    rows = {table: rows[table].sort_by(PRIMARY_KEYS[table]) for table in TABLE_ORDER if table in rows}
+    if verbose:
+        print_report(source, rows, report, fraction)
+    return rows
+
+def print_report(source, rows: dict, report: dict, fraction: float):
+    """Rows per table, plus how well the customer city mix and loans per customer survived"""
+    for table in TABLE_ORDER:
+        source_rows = report.get(table, {}).get('source_rows') or source.num_rows(table)
+        closure = report.get(table, {}).get('closure_rows', 0)
+        kept = rows[table].num_rows if table in rows else 0
+        print(f"   {table:<25} {source_rows:>12,} -> {kept:>8,} rows"
+              + (f" ({closure:,} kept as referenced)" if closure else ""))
+
+    strata = report['customers']['strata']
+    sampled = rows['customers']['city_id'].to_numpy()
+    cities = np.union1d(strata, sampled)
+    source_share = np.bincount(np.searchsorted(cities, strata), minlength=len(cities)) / len(strata)
+    sample_share = np.bincount(np.searchsorted(cities, sampled), minlength=len(cities)) / max(len(sampled), 1)
+    print(f"\n   Customer city mix: largest share difference {np.abs(source_share - sample_share).max() * 100:.2f} pp")
+    references = report['loans']['references']
+    source_ratio = len(references) / max(np.count_nonzero(np.bincount(references)), 1)
+    sample_customers = rows['loans']['customer_id'].to_numpy()
+    sample_ratio = len(sample_customers) / max(len(np.unique(sample_customers)), 1)
+    print(f"   Loans per borrowing customer: {source_ratio:.3f} source, {sample_ratio:.3f} sample")
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def write_csvs(rows: dict, out_dir):
+    """One <table>.csv per table, named like EduFin_Dataset/"""
+    out = Path(out_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    for table, batch in rows.items():
+        pa_csv.write_csv(batch, out / f"{table}.csv")
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Downsample virtual tables or a warehouse into CSVs and/or a warehouse file"""
+    parser = argparse.ArgumentParser(description="Referentially consistent EduFin sample from a large dataset")
+    source_group = parser.add_mutually_exclusive_group(required=True)
+    source_group.add_argument('--scale', type=float, help="Sample the virtual tables at this scale")
+    source_group.add_argument('--warehouse', help="Sample an existing DuckDB/SQLite warehouse")
+    size_group = parser.add_mutually_exclusive_group(required=True)
+    size_group.add_argument('--rows', type=int, help="Approximate total rows in the sample")
+    size_group.add_argument('--fraction', type=float, help="Share of customers (and independent rows) to keep")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--out', help="Write <table>.csv files here")
+    parser.add_argument('--out-warehouse', help="Also load the sample into this .duckdb/.sqlite file")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("EDUFIN DOWNSAMPLER")
+    print("=" * 80)
+    start_time = time.time()
+    source = VirtualSource(args.scale, args.seed, args.as_of) if args.scale else WarehouseSource(args.warehouse)
+    fraction = args.fraction or args.rows / sum(source.num_rows(table) for table in TABLE_ORDER)
+    rows = downsample(source, min(fraction, 1.0), args.seed)
+    total_rows = sum(batch.num_rows for batch in rows.values())
+    print(f"\n✅ {total_rows:,} rows (fraction {fraction:.6f}) in {time.time() - start_time:.1f}s")
+
+    if args.out:
+        write_csvs(rows, args.out)
+        print(f"💾 CSVs written to {args.out}")
+    if args.out_warehouse:
+        engine = 'sqlite' if Path(args.out_warehouse).suffix in ('.sqlite', '.db', '.sqlite3') else 'duckdb'
+        build_warehouse(args.out_warehouse, engine, rows.items(), verbose=False)
+        print(f"💾 Warehouse written to {args.out_warehouse}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+EduFin Distribution Fidelity
+Checks that generated EduFin tables still hit the generators' business targets, so vectorized,
+parallel or sharded rewrites can land without quietly changing the data
+- Targets come from the virtual table classes (tier weights, the 60/25/15 loan mix, payment method
+  weights, education and employment mixes, collection status by days overdue, recovery rates),
+  so a changed constant changes its check; 92% payment success and 8% late fees are declared here
+- Marginals and conditionals (X | Y) get chi-square tests, uniform ranges get KS tests, all from
+  one pass over only the columns the checks read (see dataset_fidelity)
+- Sources: the virtual tables at any scale, or a DuckDB/SQLite warehouse from edufin_warehouse.py
+
+Usage:
+    python edufin_fidelity.py --scale 1
+    python edufin_fidelity.py --warehouse edufin_500k.duckdb
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from scipy import stats
+
+from dataset_fidelity import ALPHA, FidelityCheck, Multiplicity, Shares, Uniform, derived, print_report
+from edufin_rng import DEFAULT_SEED
+from edufin_virtual_tables import (DEFAULT_AS_OF, VirtualCustomers, VirtualDefaultsCollections,
+                                   VirtualEconomicIndicators, VirtualInstitutions, VirtualLoans, VirtualPayments)
+from edufin_warehouse import BATCH_SIZE, TABLE_ORDER, connect, virtual_tables
+
+PAYMENT_SUCCESS_RATE = 0.92  # VirtualPayments: the rest split evenly between Failed and Pending
+LATE_FEE_RATE = 0.08  # Share of successful payments charged a late fee
+MOST_LOANS = 64  # Loans-per-customer shares are computed up to this many loans per customer
+
+# ============================================================================
+# TARGETS
+# ============================================================================
+
+def weighted(choices, weights=None):
+    """{choice: weight}, equal weights by default (as in edufin_rng.weighted_choice)"""
+    return dict(zip(choices, weights or [1] * len(choices)))
+
+def loans_per_customer_shares(num_loans: int, num_customers: int, shares: dict = None):
+    """Share of borrowing customers holding k loans
+
+    VirtualLoans hands out single, paired and tripled loans to customers drawn with replacement, so a
+    customer drawn for two blocks holds their sum: the blocks' binomial counts are convolved.
+    """
+    shares = shares or VirtualLoans.LOANS_PER_CUSTOMER_SHARES
+    distribution, remaining = np.zeros(MOST_LOANS + 1), num_loans
+    distribution[0] = 1.0
+    for loans_per_customer, share in shares.items():
+        rows = remaining if loans_per_customer == max(shares) else int(share * num_loans)
+        remaining -= rows
+        blocks = np.arange(MOST_LOANS // loans_per_customer + 1)
+        block_distribution = np.zeros(MOST_LOANS + 1)
+        block_distribution[blocks * loans_per_customer] = stats.binom.pmf(
+            blocks, -(-rows // loans_per_customer), 1 / num_customers)
+        distribution = np.convolve(distribution, block_distribution)[:MOST_LOANS + 1]
+    return {loans: share for loans, share in enumerate(distribution[1:] / distribution[1:].sum(), start=1)
+            if share > 0}
+
+def tier_shares(cities: pd.DataFrame, tier_weights: dict):
+    """Share of rows per tier when every city is drawn with its tier's weight"""
+    cities_per_tier = cities['tier_classification'].value_counts()
+    return {tier: weight * cities_per_tier.get(tier, 0) for tier, weight in tier_weights.items()}
+
+def overdue_bucket_shares():
+    """{days-overdue bucket: collection status weights} from VirtualDefaultsCollections.STATUS_BUCKETS"""
+    buckets = {f"> {min_days}": weighted(statuses, weights)
+               for min_days, statuses, weights in VirtualDefaultsCollections.STATUS_BUCKETS}
+    buckets[f"<= {min(min_days for min_days, _, _ in VirtualDefaultsCollections.STATUS_BUCKETS)}"] = {'Active': 1}
+    return buckets
+
+# ============================================================================
+# EXPECTATIONS
+# ============================================================================
+
+def derived_columns(cities: pd.DataFrame):
+    """{table: {derived column: function(BatchColumns)}} for the expectations below"""
+    tiers = sorted(cities['tier_classification'].unique())
+    tier_codes = np.full(int(cities['city_id'].max()) + 1, -1, dtype=np.int32)
+    tier_codes[cities['city_id'].to_numpy()] = [tiers.index(tier) for tier in cities['tier_classification']]
+
+    @derived('city_id')
+    def tier(columns):
+        codes = tier_codes[columns.numbers('city_id').astype(np.int64)]
+        return pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), pa.array(tiers))
+
+    @derived('application_date', 'disbursement_date')
+    def disbursement_lag(columns):
+        return columns.days('disbursement_date') - columns.days('application_date')
+
+    @derived('interest_component', 'payment_amount')
+    def interest_share(columns):
+        return columns.numbers('interest_component') / columns.numbers('payment_amount')
+
+    @derived('late_fee')
+    def late(columns):
+        return columns.numbers('late_fee') > 0
+
+    @derived('recovery_amount', 'default_amount')
+    def recovery_rate(columns):
+        return columns.numbers('recovery_amount') / columns.numbers('default_amount')
+
+    @derived('days_overdue')
+    def overdue_bucket(columns):
+        days = columns.numbers('days_overdue')
+        buckets = list(overdue_bucket_shares())
+        codes = np.select([days > min_days for min_days, _, _ in VirtualDefaultsCollections.STATUS_BUCKETS],
+                          range(len(buckets) - 1), default=len(buckets) - 1)
+        return pa.DictionaryArray.from_arrays(pa.array(codes.astype(np.int32)), pa.array(buckets))
+
+    return {
+        'customers': {'tier': tier},
+        'institutions': {'tier': tier},
+        'loans': {'disbursement_lag': disbursement_lag},
+        'payments': {'interest_share': interest_share, 'late': late},
+        'defaults_collections': {'recovery_rate': recovery_rate, 'overdue_bucket': overdue_bucket},
+    }
+
+def edufin_expectations(cities: pd.DataFrame):
+    """Expectations for the EduFin generator targets; cities is dim_city (tiers weight the city draws)"""
+    customers, institutions, loans = VirtualCustomers, VirtualInstitutions, VirtualLoans
+    payments, defaults = VirtualPayments, VirtualDefaultsCollections
+    cities_by_tier = {tier: weighted(group['city_id'].tolist())
+                      for tier, group in cities.groupby('tier_classification')}
+    other_accreditation = weighted(institutions.ACCREDITATIONS, institutions.OTHER_ACCREDITATION_WEIGHTS)
+    failure_rate = (1 - PAYMENT_SUCCESS_RATE) / 2
+    loan_mix = dict(loans.LOANS_PER_CUSTOMER_SHARES)
+    return [
+        Shares('customers', 'tier', tier_shares(cities, customers.TIER_WEIGHTS)),
+        Shares('customers', 'city_id', cities_by_tier, given='tier'),
+        Shares('customers', 'gender', weighted(['Male', 'Female'])),
+        Shares('customers', 'employment_type', weighted(customers.EMPLOYMENT_TYPES, customers.EMPLOYMENT_WEIGHTS)),
+        Shares('customers', 'employer_name', {kind: weighted(employers)
+                                              for kind, employers in customers.EMPLOYERS.items()},
+               given='employment_type'),
+        Shares('customers', 'education_level', weighted(customers.EDUCATION_LEVELS, customers.EDUCATION_WEIGHTS)),
+
+        Shares('institutions', 'tier', tier_shares(cities, institutions.TIER_WEIGHTS)),
+        Shares('institutions', 'institution_type', weighted(institutions.INSTITUTION_TYPES)),
+        Shares('institutions', 'accreditation_status',
+               {'Tier1': weighted(institutions.ACCREDITATIONS, institutions.TIER1_ACCREDITATION_WEIGHTS),
+                'Tier2': other_accreditation, 'Tier3': other_accreditation}, given='tier'),
+        Uniform('institutions', 'establishment_year', {tier: profile['establishment_year']
+                                                       for tier, profile in institutions.TIER_PROFILES.items()},
+                given='tier', integers=True),
+
+        Multiplicity('loans', 'customer_id',
+                     lambda rows: loans_per_customer_shares(rows['loans'], rows['customers'], loan_mix),
+                     label='loans per customer'),
+        Shares('loans', 'loan_tenure_months', weighted(loans.TENURES)),
+        Shares('loans', 'purpose_of_loan', weighted(loans.PURPOSES, loans.PURPOSE_WEIGHTS)),
+        Uniform('loans', 'disbursement_lag', (7, 45), integers=True, label='days from application to disbursement'),
+
+        Shares('payments', 'payment_method', weighted(payments.PAYMENT_METHODS, payments.METHOD_WEIGHTS)),
+        Shares('payments', 'payment_status', {'Success': PAYMENT_SUCCESS_RATE, 'Failed': failure_rate,
+                                              'Pending': failure_rate}),
+        Shares('payments', 'late', {'Success': {True: LATE_FEE_RATE, False: 1 - LATE_FEE_RATE},
+                                    'Failed': {False: 1}, 'Pending': {False: 1}}, given='payment_status'),
+        Uniform('payments', 'interest_share', {'Success': (0.3, 0.7)}, given='payment_status'),
+
+        Uniform('defaults_collections', 'days_overdue', (30, 1095), integers=True),
+        Shares('defaults_collections', 'collection_status', overdue_bucket_shares(), given='overdue_bucket'),
+        Uniform('defaults_collections', 'recovery_rate', defaults.RECOVERY_RATES, given='collection_status'),
+        Uniform('defaults_collections', 'contact_attempts', (5, 50), integers=True),
+
+        Shares('economic_indicators', 'quarter', weighted([f"{year}-{quarter}"
+                                                            for year in VirtualEconomicIndicators.YEARS
+                                                            for quarter in VirtualEconomicIndicators.QUARTERS])),
+    ]
+
+def edufin_check(cities: pd.DataFrame, alpha: float = ALPHA):
+    return FidelityCheck(edufin_expectations(cities), derived_columns(cities), alpha)
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def virtual_columns(columns: dict, scale: float = 1.0, seed: int = DEFAULT_SEED, batch_size: int = BATCH_SIZE,
+                    as_of=DEFAULT_AS_OF):
+    """(table, Arrow batch) holding only the requested columns; nothing else is generated"""
+    tables = virtual_tables(scale, seed, as_of)
+    for table in TABLE_ORDER:
+        if table not in columns:
+            continue
+        data = tables[table]
+        for start in range(0, len(data), batch_size):
+            batch = data[start:start + batch_size] if isinstance(data, pd.DataFrame) \
+                else data[start:start + batch_size, columns[table]]
+            yield table, pa.Table.from_pandas(batch[columns[table]], preserve_index=False)
+
+def warehouse_columns(connection, columns: dict, batch_size: int = BATCH_SIZE):
+    """(table, Arrow batch) of the requested columns read from a DuckDB or SQLite warehouse"""
+    for table in TABLE_ORDER:
+        if table not in columns:
+            continue
+        cursor = connection.execute(f"SELECT {', '.join(columns[table])} FROM {table}")
+        arrow_reader = getattr(cursor, 'to_arrow_reader', None) or getattr(cursor, 'fetch_record_batch', None)
+        if arrow_reader is not None:  # DuckDB streams Arrow record batches
+            for batch in arrow_reader(batch_size):
+                yield table, pa.Table.from_batches([batch])
+            continue
+        while rows := cursor.fetchmany(batch_size):
+            yield table, pa.table({name: [row[index] for row in rows] for index, name in enumerate(columns[table])})
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Check generated EduFin data against the generator's business targets"""
+    parser = argparse.ArgumentParser(description="Chi-square/KS checks of EduFin data against the generator targets")
+    parser.add_argument('--scale', type=float, default=1.0, help="Check the virtual tables at this scale")
+    parser.add_argument('--warehouse', help="Check a DuckDB/SQLite warehouse instead")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--alpha', type=float, default=ALPHA, help="Significance level per expectation")
+    args = parser.parse_args()
+
+    if args.warehouse:
+        connection = connect(args.warehouse)
+        cities = connection.execute("SELECT city_id, tier_classification FROM dim_city").fetchall()
+        cities = pd.DataFrame(cities, columns=['city_id', 'tier_classification'])
+        check = edufin_check(cities, args.alpha)
+        source, label = warehouse_columns(connection, check.columns(), args.batch_size), args.warehouse
+    else:
+        cities = virtual_tables(args.scale, args.seed, args.as_of)['dim_city']
+        check = edufin_check(cities, args.alpha)
+        source = virtual_columns(check.columns(), args.scale, args.seed, args.batch_size, args.as_of)
+        label = f"virtual tables, scale {args.scale:g}, seed {args.seed}, as of {args.as_of}"
+
+    print("=" * 80)
+    print(f"EDUFIN DISTRIBUTION FIDELITY ({label})")
+    print("=" * 80)
+    start_time = time.time()
+    for table, batch in source:
+        check.update(table, batch)
+    passed = print_report(check.report(), args.alpha)
+    print(f"⏱️ {sum(check.rows.values()):,} rows checked in {time.time() - start_time:.1f}s")
+    sys.exit(0 if passed else 1)
+
+if __name__ == "__main__":
+    main()
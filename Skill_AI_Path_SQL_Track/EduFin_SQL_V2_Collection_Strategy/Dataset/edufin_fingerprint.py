@@ -0,0 +1,195 @@
+"""
+EduFin Fingerprints
+Run manifests for the EduFin virtual tables and warehouses, and diffs between two runs down to
+the columns, key ranges and finally the rows that changed
+- Virtual tables are fingerprinted without writing anything; --shards N fingerprints N disjoint
+  row ranges separately, last shard first, and merges them, so a sharded run is checked against
+  the single pass
+- Warehouses are fingerprinted through the schema's Arrow types, so a DuckDB and a SQLite build
+  of the same data fingerprint identically
+- --diff reads only the two manifests; --rows N then queries just the changed key ranges of two
+  warehouse files and prints the differing rows
+
+Usage:
+    python edufin_fingerprint.py --scale 1 --as-of 2025-01-01 --out scale1.manifest.json
+    python edufin_fingerprint.py --scale 1 --batch-size 33333 --shards 4 --out sharded.manifest.json
+    python edufin_fingerprint.py --warehouse edufin_500k.duckdb
+    python edufin_fingerprint.py --diff before.duckdb after.duckdb --rows 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from dataset_fingerprint import (CHUNK_KEYS, DatasetFingerprint, diff_fingerprints, load_manifest, print_changes,
+                                 save_manifest)
+from dataset_schemas import EDUFIN_SCHEMAS
+from edufin_rng import DEFAULT_SEED
+from edufin_virtual_tables import DEFAULT_AS_OF
+from edufin_warehouse import (BATCH_SIZE, PRIMARY_KEYS, TABLE_ORDER, connect, manifest_path, remap_geo_cities,
+                              typed_batch, virtual_tables)
+
+MAX_RANGES = 4  # Changed key ranges queried per table by --rows
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def virtual_shard(tables: dict, shard: int, shards: int, batch_size: int = BATCH_SIZE):
+    """(table, Arrow batch) for one of `shards` equal row ranges of every virtual table (dimensions go to shard 0)"""
+    for table in TABLE_ORDER:
+        data = tables[table]
+        if isinstance(data, pd.DataFrame):
+            if shard == 0:
+                yield table, typed_batch(table, data)
+            continue
+        columns = list(EDUFIN_SCHEMAS[table])
+        low, high = len(data) * shard // shards, len(data) * (shard + 1) // shards
+        for start in range(low, high, batch_size):
+            batch = data[start:min(start + batch_size, high), columns]
+            if table == 'geographic_demographics':
+                batch = remap_geo_cities(batch, tables['dim_city'])
+            yield table, typed_batch(table, batch)
+
+def virtual_fingerprint(scale: float = 1.0, seed: int = DEFAULT_SEED, batch_size: int = BATCH_SIZE, shards: int = 1,
+                        as_of=DEFAULT_AS_OF):
+    """DatasetFingerprint of the virtual tables, merged from `shards` separately fingerprinted row ranges"""
+    tables = virtual_tables(scale, seed, as_of)
+    merged = DatasetFingerprint(PRIMARY_KEYS)
+    for shard in reversed(range(shards)):
+        fingerprint = DatasetFingerprint(PRIMARY_KEYS)
+        for table, batch in virtual_shard(tables, shard, shards, batch_size):
+            fingerprint.update(table, batch)
+        merged.merge(fingerprint)
+    return merged
+
+def fetch_batch(connection, table: str, where: str = '', parameters=()):
+    """Rows of a warehouse table as an Arrow table with the schema's types"""
+    columns = list(EDUFIN_SCHEMAS[table])
+    rows = connection.execute(f"SELECT {', '.join(columns)} FROM {table}{where}", parameters).fetchall()
+    return typed_batch(table, pa.table({name: [row[index] for row in rows] for index, name in enumerate(columns)}))
+
+def warehouse_batches(connection, batch_size: int = BATCH_SIZE):
+    """(table, Arrow batch) for every table of a DuckDB or SQLite warehouse, in primary key ranges"""
+    for table in TABLE_ORDER:
+        key = PRIMARY_KEYS[table]
+        low, high = connection.execute(f"SELECT MIN({key}), MAX({key}) FROM {table}").fetchone()
+        if low is None:
+            continue
+        for start in range(low, high + 1, batch_size):
+            yield table, fetch_batch(connection, table, f" WHERE {key} >= ? AND {key} < ?", (start, start + batch_size))
+
+def warehouse_fingerprint(path, batch_size: int = BATCH_SIZE):
+    connection = connect(path)
+    try:
+        fingerprint = DatasetFingerprint(PRIMARY_KEYS)
+        for table, batch in warehouse_batches(connection, batch_size):
+            fingerprint.update(table, batch)
+        return fingerprint
+    finally:
+        connection.close()
+
+# ============================================================================
+# ROW DIFFS
+# ============================================================================
+
+def run_manifest(path):
+    """A manifest, or the manifest written next to a warehouse file"""
+    path = Path(path)
+    return path if path.suffix == '.json' else manifest_path(path)
+
+def changed_rows(before: pd.DataFrame, after: pd.DataFrame, key: str):
+    """Rows of one key range that differ, were added or were removed, with the differing columns"""
+    merged = before.merge(after, on=key, how='outer', suffixes=('_before', '_after'), indicator=True)
+    columns = [column for column in before.columns if column != key]
+    differs = pd.DataFrame({column: merged[f"{column}_before"].ne(merged[f"{column}_after"])
+                            & ~(merged[f"{column}_before"].isna() & merged[f"{column}_after"].isna())
+                            for column in columns})
+    changed = []
+    for index in np.flatnonzero(differs.any(axis=1).to_numpy() | (merged['_merge'] != 'both').to_numpy()):
+        row = merged.iloc[index]
+        if row['_merge'] != 'both':
+            changed.append((row[key], 'removed' if row['_merge'] == 'left_only' else 'added', {}))
+            continue
+        changed.append((row[key], 'changed', {column: (row[f"{column}_before"], row[f"{column}_after"])
+                                              for column in columns if differs[column].iloc[index]}))
+    return changed
+
+def print_changed_rows(changes: list, before_path, after_path, limit: int):
+    """Query only the changed key ranges of both warehouses and print up to `limit` differing rows per table"""
+    before, after = connect(before_path), connect(after_path)
+    try:
+        for entry in changes:
+            if entry['change'] != 'changed' or entry['chunking'] != 'range':
+                continue
+            table, key, shown = entry['table'], PRIMARY_KEYS[entry['table']], 0
+            print(f"\n🔎 {table}")
+            for chunk in entry['chunks'][:MAX_RANGES]:
+                where, bounds = f" WHERE {key} >= ? AND {key} < ?", (chunk * CHUNK_KEYS, (chunk + 1) * CHUNK_KEYS)
+                rows = changed_rows(fetch_batch(before, table, where, bounds).to_pandas(),
+                                    fetch_batch(after, table, where, bounds).to_pandas(), key)
+                for value, change, columns in rows[:limit - shown]:
+                    detail = ', '.join(f"{column}: {old} -> {new}" for column, (old, new) in columns.items())
+                    print(f"   {key} = {value}: {change} {detail}".rstrip())
+                shown += min(len(rows), limit - shown)
+                if shown >= limit:
+                    break
+    finally:
+        before.close()
+        after.close()
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Fingerprint EduFin virtual tables or a warehouse, or diff two runs"""
+    parser = argparse.ArgumentParser(description="Fingerprint EduFin data or diff two generation runs")
+    parser.add_argument('--scale', type=float, default=1.0, help="Fingerprint the virtual tables at this scale")
+    parser.add_argument('--warehouse', help="Fingerprint a DuckDB/SQLite warehouse instead")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--shards', type=int, default=1, help="Fingerprint the virtual tables as N merged shards")
+    parser.add_argument('--out', help="Manifest to write (default: print the table hashes)")
+    parser.add_argument('--diff', nargs=2, metavar=('BEFORE', 'AFTER'), help="Manifests or warehouse files to diff")
+    parser.add_argument('--rows', type=int, default=0, help="With --diff on two warehouses: show N changed rows")
+    args = parser.parse_args()
+
+    if args.diff:
+        before, after = args.diff
+        changes = diff_fingerprints(load_manifest(run_manifest(before))[1], load_manifest(run_manifest(after))[1])
+        print("=" * 80)
+        print(f"EDUFIN FINGERPRINT DIFF: {before} -> {after}")
+        print("=" * 80)
+        print_changes(changes)
+        if changes and args.rows and run_manifest(before) != Path(before):
+            print_changed_rows(changes, before, after, args.rows)
+        print(f"\n{'✅ Identical' if not changes else f'❌ {len(changes)} tables differ'}")
+        sys.exit(1 if changes else 0)
+
+    start_time = time.time()
+    if args.warehouse:
+        fingerprint = warehouse_fingerprint(args.warehouse, args.batch_size)
+        settings = {'source': 'warehouse', 'warehouse': args.warehouse}
+    else:
+        fingerprint = virtual_fingerprint(args.scale, args.seed, args.batch_size, args.shards, args.as_of)
+        settings = {'source': 'virtual', 'scale': args.scale, 'seed': args.seed, 'as_of': args.as_of,
+                    'batch_size': args.batch_size, 'shards': args.shards}
+    rows = sum(entry.num_rows for entry in fingerprint.tables.values())
+    for table, entry in fingerprint.tables.items():
+        print(f"   {table:<25} {entry.num_rows:>12,} rows {len(entry.sums):>6,} chunks  "
+              f"{entry.totals().sum(dtype=np.uint64):016x}")
+    print(f"\n⏱️ {rows:,} rows fingerprinted in {time.time() - start_time:.1f}s")
+    if args.out:
+        save_manifest(args.out, fingerprint, **settings)
+        print(f"🧾 Saved {args.out}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,401 @@
+"""
+Incremental KPI Cube for the V2 Collection-Strategy Cheat Sheet
+The KPI families of KPI_cheatsheet_V2.html, pre-aggregated by month x state x city tier x
+collection_agent_id x channel
+- Fact batches (payments, defaults_collections, loans) reduce to sums, counts, mins and maxes per cell
+- Partial aggregates merge by adding sums and taking min/max, so appended batches update the cube
+  without rescanning the rows that came before
+- KPIs are ratios of rolled-up partials: a dashboard refresh reads the cube's cells, not the fact tables
+- KPIs that need data the tables do not have (promise-to-pay, skip tracing, field visits) are left out
+
+Usage:
+    python edufin_kpi_cube.py --by month
+    python edufin_kpi_cube.py --by state_id tier --family cost_roi portfolio_health
+    python edufin_kpi_cube.py --virtual-rows 5000000 --batch-size 1000000 --save kpi_cube.arrow
+"""
+
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow.feather as feather
+
+from dataset_cache import arrow_table
+from dataset_loader import load_edufin
+from edufin_scenarios import TABLE_ROWS, default_tables
+from edufin_virtual_tables import DEFAULT_AS_OF, VIRTUAL_TABLES
+
+DIMENSIONS = ['month', 'state_id', 'tier', 'collection_agent_id', 'channel']
+FACT_TABLES = ['loans', 'payments', 'defaults_collections']
+
+NO_AGENT = 0  # Payments and loans are not worked by a collection agent
+UNKNOWN_STATE, UNKNOWN_TIER = 0, 'Unknown'  # Rows whose customer or loan has not been registered
+
+# Payments use payment_method as their channel; collections have no channel column, so a legal
+# notice counts as its own channel and everything else as agent contact
+LEGAL_CHANNEL, CONTACT_CHANNEL, PORTFOLIO_CHANNEL = 'Legal Notice', 'Agent Contact', 'Portfolio'
+
+# Cost model for the Cost & ROI family; the tables carry no collection costs
+CONTACT_ATTEMPT_COST = 60
+LEGAL_NOTICE_COST = 2500
+
+RESOLVED_STATUSES = ['Settled', 'Written Off']
+PORTFOLIO_STATUSES = ['Active', 'Overdue', 'Defaulted']  # Loans still carrying a balance
+
+# Measure -> how two partial aggregates of it combine
+MEASURES = {
+    # payments
+    'payments_due': 'sum',
+    'payments_received': 'sum',
+    'amount_due': 'sum',
+    'amount_collected': 'sum',
+    'late_payments': 'sum',
+    'late_fees': 'sum',
+    # defaults_collections
+    'cases': 'sum',
+    'default_amount': 'sum',
+    'recovered_amount': 'sum',
+    'recovered_cases': 'sum',
+    'resolved_cases': 'sum',
+    'resolution_days': 'sum',
+    'settled_cases': 'sum',
+    'written_off_amount': 'sum',
+    'days_overdue': 'sum',
+    'max_days_overdue': 'max',
+    'dpd_30_60_cases': 'sum',
+    'dpd_30_60_amount': 'sum',
+    'dpd_30_60_recovered': 'sum',
+    'dpd_90_cases': 'sum',
+    'dpd_90_amount': 'sum',
+    'dpd_90_recovered': 'sum',
+    'contact_attempts': 'sum',
+    'legal_notices': 'sum',
+    'collection_cost': 'sum',
+    # loans
+    'loans': 'sum',
+    'defaulted_loans': 'sum',
+    'portfolio_amount': 'sum',
+    # every fact
+    'first_activity': 'min',
+    'last_activity': 'max',
+}
+
+def ratio(numerator: str, denominator: str, scale: float = 1.0):
+    """KPI formula numerator / denominator over rolled-up measures, NaN where the denominator is zero"""
+    return lambda totals: scale * totals[numerator] / totals[denominator].where(totals[denominator] != 0)
+
+KPI_FAMILIES = {
+    'collection_efficiency': {
+        'collection_efficiency_ratio': ratio('amount_collected', 'amount_due', 100),
+        'payment_success_rate': ratio('payments_received', 'payments_due', 100),
+        'dpd_30_60_recovery_rate': ratio('dpd_30_60_recovered', 'dpd_30_60_amount', 100),
+        'dpd_90_recovery_rate': ratio('dpd_90_recovered', 'dpd_90_amount', 100),
+    },
+    'timeliness_resolution': {
+        'avg_resolution_days': ratio('resolution_days', 'resolved_cases'),
+        'average_dpd': ratio('days_overdue', 'cases'),
+        'max_dpd': lambda totals: totals['max_days_overdue'],
+        'avg_contact_attempts': ratio('contact_attempts', 'cases'),
+        'late_payment_rate': ratio('late_payments', 'payments_received', 100),
+    },
+    'cost_roi': {
+        'cost_per_recovery': ratio('collection_cost', 'recovered_cases'),
+        'overall_roi': ratio('recovered_amount', 'collection_cost'),
+        'collection_cost_ratio': ratio('collection_cost', 'recovered_amount', 100),
+        'recovery_rate': ratio('recovered_amount', 'default_amount', 100),
+    },
+    'portfolio_health': {
+        'portfolio_at_risk': ratio('dpd_90_amount', 'portfolio_amount', 100),
+        'write_off_rate': ratio('written_off_amount', 'portfolio_amount', 100),
+        'recovery_conversion': ratio('settled_cases', 'cases', 100),
+        'default_rate': ratio('defaulted_loans', 'loans', 100),
+    },
+}
+
+# ============================================================================
+# PARTIAL AGGREGATES
+# ============================================================================
+
+def month_start(dates):
+    """First day of each date's month as datetime64[s]"""
+    return np.asarray(dates).astype('datetime64[M]').astype('datetime64[s]')
+
+def dense_lookup(keys, values, fill, lookup=None):
+    """Array indexed by integer key, extended and overwritten with (keys, values)"""
+    keys = np.asarray(keys, dtype=np.int64)
+    size = max(int(keys.max(initial=-1)) + 1, 0 if lookup is None else len(lookup))
+    extended = np.full(size, fill, dtype=np.asarray(values).dtype if lookup is None else lookup.dtype)
+    if lookup is not None:
+        extended[:len(lookup)] = lookup
+    extended[keys] = values
+    return extended
+
+def look_up(lookup, keys, fill):
+    """lookup[keys], with `fill` for keys outside the lookup"""
+    keys = np.asarray(keys, dtype=np.int64)
+    known = (keys >= 0) & (keys < len(lookup))
+    return np.where(known, lookup[np.where(known, keys, 0)], fill)
+
+def aggregate(dimensions: dict, measures: dict):
+    """Partial aggregates of one fact batch: one row per non-empty cell"""
+    frame = pd.DataFrame({**dimensions, **measures})
+    return frame.groupby(DIMENSIONS, sort=False, observed=True).agg(
+        {name: MEASURES[name] for name in measures}).reset_index()
+
+def merge_cells(*partials):
+    """Combine partial aggregates cell by cell: sums add, mins and maxes take the extreme"""
+    frames = [frame for frame in partials if frame is not None and len(frame)]
+    if not frames:
+        return pd.DataFrame(columns=DIMENSIONS + list(MEASURES))
+    combined = pd.concat(frames, ignore_index=True)
+    for name in MEASURES:
+        if name not in combined:
+            combined[name] = np.nan
+    cells = combined.groupby(DIMENSIONS, sort=False, observed=True).agg(MEASURES).reset_index()
+    return cells.sort_values(DIMENSIONS, ignore_index=True)
+
+# ============================================================================
+# KPI CUBE
+# ============================================================================
+
+class KpiCube:
+    """Mergeable KPI partials per DIMENSIONS cell, updated batch by batch"""
+
+    def __init__(self, customers: pd.DataFrame, cities: pd.DataFrame, loans: pd.DataFrame = None):
+        cities = cities.set_index('city_id')
+        self.city_state = dense_lookup(cities.index, cities['state_id'].to_numpy(np.int64), UNKNOWN_STATE)
+        self.city_tier = dense_lookup(cities.index, cities['tier_classification'].astype(str).to_numpy(object),
+                                      UNKNOWN_TIER)
+        self.customer_city = np.zeros(0, dtype=np.int64)
+        self.loan_customer = np.zeros(0, dtype=np.int64)
+        self.add_customers(customers)
+        if loans is not None:
+            self.add_loans(loans)
+        self.cells = merge_cells()
+        self.rows_seen = dict.fromkeys(FACT_TABLES, 0)
+
+    def add_customers(self, customers: pd.DataFrame):
+        """Register customer_id -> city_id for locating later facts"""
+        self.customer_city = dense_lookup(customers['customer_id'], customers['city_id'].to_numpy(np.int64), -1,
+                                          self.customer_city if len(self.customer_city) else None)
+
+    def add_loans(self, loans: pd.DataFrame):
+        """Register loan_id -> customer_id so payments can be located"""
+        self.loan_customer = dense_lookup(loans['loan_id'], loans['customer_id'].to_numpy(np.int64), -1,
+                                          self.loan_customer if len(self.loan_customer) else None)
+
+    def locate(self, customer_ids):
+        """(state_id, tier) of each customer's city"""
+        city = look_up(self.customer_city, customer_ids, -1)
+        return look_up(self.city_state, city, UNKNOWN_STATE), look_up(self.city_tier, city, UNKNOWN_TIER)
+
+    def dimensions(self, dates, customer_ids, agents, channels):
+        state, tier = self.locate(customer_ids)
+        size = len(state)
+        return {
+            'month': month_start(dates),
+            'state_id': state,
+            'tier': pd.Categorical(tier),
+            'collection_agent_id': np.broadcast_to(np.asarray(agents, dtype=np.int64), size),
+            'channel': pd.Categorical(np.broadcast_to(np.asarray(channels, dtype=object), size)),
+        }
+
+    def payment_partials(self, payments: pd.DataFrame):
+        dates = payments['payment_date'].to_numpy()
+        received = (payments['payment_status'] == 'Success').to_numpy()
+        amount = payments['payment_amount'].to_numpy(np.float64)
+        late_fee = payments['late_fee'].to_numpy(np.float64)
+        customers = look_up(self.loan_customer, payments['loan_id'], -1)
+        return aggregate(self.dimensions(dates, customers, NO_AGENT, payments['payment_method'].to_numpy(object)), {
+            'payments_due': np.ones(len(payments), dtype=np.int64),
+            'payments_received': received.astype(np.int64),
+            'amount_due': amount,
+            'amount_collected': np.where(received, amount, 0.0),
+            'late_payments': (late_fee > 0).astype(np.int64),
+            'late_fees': late_fee,
+            'first_activity': dates.astype('datetime64[s]'),
+            'last_activity': dates.astype('datetime64[s]'),
+        })
+
+    def collection_partials(self, collections: pd.DataFrame):
+        default_date = collections['default_date'].to_numpy().astype('datetime64[s]')
+        status = collections['collection_status'].astype(str).to_numpy()
+        default_amount = collections['default_amount'].to_numpy(np.float64)
+        recovered = collections['recovery_amount'].to_numpy(np.float64)
+        days_overdue = collections['days_overdue'].to_numpy(np.int64)
+        attempts = collections['contact_attempts'].to_numpy(np.int64)
+        legal = collections['legal_notice_sent'].to_numpy().astype(bool)
+        resolved = np.isin(status, RESOLVED_STATUSES)
+        resolution_days = (collections['last_contact_date'].to_numpy().astype('datetime64[s]') - default_date) \
+            / np.timedelta64(1, 'D')
+        dpd_30_60 = (days_overdue >= 30) & (days_overdue <= 60)
+        dpd_90 = days_overdue > 90
+
+        channel = np.where(legal, LEGAL_CHANNEL, CONTACT_CHANNEL).astype(object)
+        dimensions = self.dimensions(default_date, collections['customer_id'],
+                                     collections['collection_agent_id'].to_numpy(np.int64), channel)
+        return aggregate(dimensions, {
+            'cases': np.ones(len(collections), dtype=np.int64),
+            'default_amount': default_amount,
+            'recovered_amount': recovered,
+            'recovered_cases': (recovered > 0).astype(np.int64),
+            'resolved_cases': resolved.astype(np.int64),
+            'resolution_days': np.where(resolved, np.maximum(resolution_days, 0), 0.0),
+            'settled_cases': (status == 'Settled').astype(np.int64),
+            'written_off_amount': np.where(status == 'Written Off', default_amount, 0.0),
+            'days_overdue': days_overdue,
+            'max_days_overdue': days_overdue,
+            'dpd_30_60_cases': dpd_30_60.astype(np.int64),
+            'dpd_30_60_amount': np.where(dpd_30_60, default_amount, 0.0),
+            'dpd_30_60_recovered': np.where(dpd_30_60, recovered, 0.0),
+            'dpd_90_cases': dpd_90.astype(np.int64),
+            'dpd_90_amount': np.where(dpd_90, default_amount, 0.0),
+            'dpd_90_recovered': np.where(dpd_90, recovered, 0.0),
+            'contact_attempts': attempts,
+            'legal_notices': legal.astype(np.int64),
+            'collection_cost': attempts * CONTACT_ATTEMPT_COST + legal * LEGAL_NOTICE_COST,
+            'first_activity': default_date,
+            'last_activity': default_date,
+        })
+
+    def loan_partials(self, loans: pd.DataFrame):
+        dates = loans['disbursement_date'].to_numpy().astype('datetime64[s]')
+        status = loans['loan_status'].astype(str).to_numpy()
+        amount = loans['loan_amount'].to_numpy(np.float64)
+        return aggregate(self.dimensions(dates, loans['customer_id'], NO_AGENT, PORTFOLIO_CHANNEL), {
+            'loans': np.ones(len(loans), dtype=np.int64),
+            'defaulted_loans': (status == 'Defaulted').astype(np.int64),
+            'portfolio_amount': np.where(np.isin(status, PORTFOLIO_STATUSES), amount, 0.0),
+            'first_activity': dates,
+            'last_activity': dates,
+        })
+
+    def update(self, loans: pd.DataFrame = None, payments: pd.DataFrame = None,
+               defaults_collections: pd.DataFrame = None):
+        """Fold appended fact batches into the cube; loans are registered first so payments can be located"""
+        partials = []
+        if loans is not None and len(loans):
+            self.add_loans(loans)
+            partials.append(self.loan_partials(loans))
+            self.rows_seen['loans'] += len(loans)
+        if payments is not None and len(payments):
+            partials.append(self.payment_partials(payments))
+            self.rows_seen['payments'] += len(payments)
+        if defaults_collections is not None and len(defaults_collections):
+            partials.append(self.collection_partials(defaults_collections))
+            self.rows_seen['defaults_collections'] += len(defaults_collections)
+        self.cells = merge_cells(self.cells, *partials)
+        return self
+
+    def merge(self, other: 'KpiCube'):
+        """Cube over both cubes' facts, e.g. from batches aggregated in parallel"""
+        self.cells = merge_cells(self.cells, other.cells)
+        self.rows_seen = {name: self.rows_seen[name] + other.rows_seen[name] for name in FACT_TABLES}
+        return self
+
+    def totals(self, by=('month',), where: dict = None):
+        """Measures rolled up to the `by` dimensions (a single 'All' row when empty), after `where` filters"""
+        cells = self.cells
+        for dimension, value in (where or {}).items():
+            cells = cells[cells[dimension].isin(np.atleast_1d(value))]
+        if not by:
+            cells, by = cells.assign(total='All'), ['total']
+        return cells.groupby(list(by), observed=True).agg(MEASURES)
+
+    def kpis(self, by=('month',), families=None, where: dict = None):
+        """KPI_FAMILIES values per group of the `by` dimensions"""
+        totals = self.totals(by, where)
+        return pd.DataFrame({name: formula(totals) for family in (families or KPI_FAMILIES)
+                             for name, formula in KPI_FAMILIES[family].items()}, index=totals.index)
+
+    def save(self, path):
+        """Write the cells as an uncompressed Arrow file, like the dataset cache"""
+        feather.write_feather(arrow_table(self.cells), str(path), compression='uncompressed')
+
+    @classmethod
+    def load(cls, path, customers: pd.DataFrame, cities: pd.DataFrame, loans: pd.DataFrame = None):
+        """Cube saved by save(), ready for further updates"""
+        cube = cls(customers, cities, loans)
+        cube.cells = feather.read_table(str(path)).to_pandas()
+        return cube
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def checked_in_tables():
+    """Dimension and fact tables from EduFin_Dataset/"""
+    return {
+        'customers': load_edufin('customers', columns=['customer_id', 'city_id']),
+        'cities': load_edufin('dim_city'),
+        'loans': load_edufin('loans'),
+        'payments': load_edufin('payments'),
+        'defaults_collections': load_edufin('defaults_collections'),
+    }
+
+def virtual_batches(num_rows: int, batch_size: int, cities: pd.DataFrame, as_of=DEFAULT_AS_OF):
+    """(customers, loan owners, {fact: batch} batches) from the virtual tables at num_rows payments"""
+    tables = default_tables(num_rows / TABLE_ROWS['payments'], as_of=as_of)
+    customers = VIRTUAL_TABLES['customers'](tables['loans'].num_customers, cities=cities, as_of=as_of)
+    customers_df = customers[:, ['customer_id', 'city_id']]
+    loans_df = tables['loans'][:, ['loan_id', 'customer_id']]
+    longest = max(len(tables[name]) for name in FACT_TABLES)
+
+    def batches():
+        for start in range(0, longest, batch_size):
+            yield {name: tables[name][start:min(start + batch_size, len(tables[name]))] for name in FACT_TABLES}
+    return customers_df, loans_df, batches()
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Build the cube batch by batch and print KPI families"""
+    parser = argparse.ArgumentParser(description="Incremental KPI cube for the V2 collection-strategy cheat sheet")
+    parser.add_argument('--by', nargs='*', default=['month'], choices=DIMENSIONS, help="Dimensions to group KPIs by")
+    parser.add_argument('--family', nargs='+', choices=list(KPI_FAMILIES), help="KPI families to show (default all)")
+    parser.add_argument('--batches', type=int, default=4, help="Batches the checked-in facts are appended in")
+    parser.add_argument('--virtual-rows', type=int, help="Use virtual tables with this many payments instead")
+    parser.add_argument('--batch-size', type=int, default=1_000_000, help="Rows per virtual batch")
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--save', help="Write the cube cells to this Arrow file")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("EDUFIN KPI CUBE")
+    print("=" * 80)
+    start_time = time.time()
+    if args.virtual_rows:
+        cities = load_edufin('dim_city')
+        customers, loans, batches = virtual_batches(args.virtual_rows, args.batch_size, cities, args.as_of)
+    else:
+        tables = checked_in_tables()
+        cities, customers, loans = tables['cities'], tables['customers'], tables['loans']
+        bounds = {name: np.linspace(0, len(tables[name]), args.batches + 1).astype(int) for name in FACT_TABLES}
+        batches = ({name: tables[name].iloc[bounds[name][i]:bounds[name][i + 1]] for name in FACT_TABLES}
+                   for i in range(args.batches))
+
+    cube = KpiCube(customers, cities, loans)
+    for batch in batches:
+        batch_start = time.time()
+        cube.update(**batch)
+        print(f"   ➕ {', '.join(f'{len(df):,} {name}' for name, df in batch.items())} "
+              f"-> {len(cube.cells):,} cells in {time.time() - batch_start:.2f}s")
+    facts = sum(cube.rows_seen.values())
+    print(f"\n📦 {facts:,} fact rows -> {len(cube.cells):,} cells in {time.time() - start_time:.1f}s")
+
+    query_start = time.time()
+    kpis = cube.kpis(args.by, args.family)
+    print(f"⚡ KPIs by {', '.join(args.by) or 'total'} from the cube in {(time.time() - query_start) * 1000:.1f} ms\n")
+    with pd.option_context('display.width', 200, 'display.max_columns', None, 'display.max_rows', 60):
+        print(kpis.round(2))
+
+    if args.save:
+        cube.save(args.save)
+        print(f"\n💾 Saved cube to {args.save}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,428 @@
+"""
+EduFin Approximate KPIs
+Collection KPIs over payments and defaults_collections answered from stratified samples with
+confidence intervals, so exploratory questions on 100M-row tables come back in milliseconds
+- Fact rows are stratified by their customer's state and city tier and their loan's status; each
+  stratum keeps the SAMPLE_PER_STRATUM rows with the smallest key-hash priority (bottom-k), i.e. a
+  simple random sample per stratum that appended batches update and that merges across workers
+- Stratum sizes are counted exactly; sums are expanded by N_h / n_h, and rates and averages use the
+  combined ratio estimator with its linearized variance (finite population correction included)
+- A query whose interval is wider than max_error of its estimate in any group is answered exactly
+  instead: pushed down to the warehouse as SQL, or streamed from the virtual tables
+- KPIs are SQL expressions (see KPIS) that DuckDB evaluates on the sample and on the full tables alike
+
+Usage:
+    python edufin_kpi_sample.py --warehouse edufin.duckdb --sample kpi_sample
+    python edufin_kpi_sample.py --warehouse edufin.duckdb --sample kpi_sample --kpi recovery_rate --by state_id
+    python edufin_kpi_sample.py --scale 1 --kpi payment_success_rate --by tier --where loan_status=Overdue
+"""
+
+import argparse
+import json
+import re
+import time
+import zlib
+from pathlib import Path
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from dataset_stats import splitmix64
+from edufin_rng import DEFAULT_SEED
+from edufin_virtual_tables import DEFAULT_AS_OF
+from edufin_warehouse import BATCH_SIZE, PRIMARY_KEYS, connect, duckdb, typed_batch, virtual_tables
+
+SAMPLED_TABLES = ['payments', 'defaults_collections']
+STRATA = ['state_id', 'tier', 'loan_status']
+SAMPLE_PER_STRATUM = 2000  # ~120 strata: ~240k sampled rows per table, about ±0.6pp on a state's rate
+CONFIDENCE = 0.95
+MAX_RELATIVE_ERROR = 0.05  # Interval half-width, as a share of the estimate, beyond which a query runs exactly
+
+SUCCESS = "CASE WHEN payment_status = 'Success' THEN 1 ELSE 0 END"
+
+# KPI -> (table, numerator, denominator or None for a total, scale); names follow edufin_kpi_cube
+KPIS = {
+    'payments': ('payments', '1', None, 1),
+    'amount_collected': ('payments', f"{SUCCESS} * payment_amount", None, 1),
+    'collection_efficiency_ratio': ('payments', f"{SUCCESS} * payment_amount", 'payment_amount', 100),
+    'payment_success_rate': ('payments', SUCCESS, '1', 100),
+    'late_payment_rate': ('payments', 'CASE WHEN late_fee > 0 THEN 1 ELSE 0 END', SUCCESS, 100),
+    'avg_payment_amount': ('payments', 'payment_amount', '1', 1),
+    'cases': ('defaults_collections', '1', None, 1),
+    'recovered_amount': ('defaults_collections', 'recovery_amount', None, 1),
+    'recovery_rate': ('defaults_collections', 'recovery_amount', 'default_amount', 100),
+    'average_dpd': ('defaults_collections', 'days_overdue', '1', 1),
+    'avg_contact_attempts': ('defaults_collections', 'contact_attempts', '1', 1),
+    'recovery_conversion': ('defaults_collections', "CASE WHEN collection_status = 'Settled' THEN 1 ELSE 0 END",
+                            '1', 100),
+}
+
+# Fact rows with their strata (and city), as the warehouse computes them
+ENRICHED_SQL = {
+    'payments': """
+        SELECT f.*, c.city_id, d.state_id, d.tier_classification AS tier, l.loan_status
+        FROM payments f
+        JOIN loans l ON f.loan_id = l.loan_id
+        JOIN customers c ON l.customer_id = c.customer_id
+        JOIN dim_city d ON c.city_id = d.city_id""",
+    'defaults_collections': """
+        SELECT f.*, c.city_id, d.state_id, d.tier_classification AS tier, l.loan_status
+        FROM defaults_collections f
+        JOIN loans l ON f.loan_id = l.loan_id
+        JOIN customers c ON f.customer_id = c.customer_id
+        JOIN dim_city d ON c.city_id = d.city_id""",
+}
+
+# ============================================================================
+# STRATIFIED SAMPLES
+# ============================================================================
+
+def stratum_codes(batch: pa.Table):
+    """(stratum index per row, [(state_id, tier, loan_status)] per index)"""
+    combined, levels = np.zeros(batch.num_rows, dtype=np.int64), []
+    for column in STRATA:
+        codes, uniques = pd.factorize(batch[column].to_numpy(zero_copy_only=False))
+        combined = combined * len(uniques) + codes
+        levels.append(uniques)
+    codes, combinations = pd.factorize(combined)
+    labels = []
+    for combination in combinations.tolist():
+        label = []
+        for uniques in reversed(levels):
+            combination, code = divmod(combination, len(uniques))
+            label.append(uniques[code].item() if hasattr(uniques[code], 'item') else uniques[code])
+        labels.append(tuple(reversed(label)))
+    return codes, labels
+
+def priorities(keys, table: str):
+    """Uniform [0, 1) priority per primary key; the same row gets the same priority in every run"""
+    salt = np.uint64(zlib.crc32(table.encode()))
+    hashes = splitmix64(np.asarray(keys).astype(np.uint64) ^ salt)
+    return (hashes >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
+
+class StratifiedSample:
+    """Bottom-k sample per stratum of one fact table, with exact stratum sizes"""
+
+    def __init__(self, table: str, per_stratum: int = SAMPLE_PER_STRATUM):
+        self.table = table
+        self.per_stratum = per_stratum
+        self.population = {}  # stratum -> rows seen
+        self.thresholds = {}  # stratum -> largest kept priority, once the stratum is full
+        self.rows = None  # Sampled rows plus their 'priority'
+
+    def update(self, batch: pa.Table):
+        """Fold appended fact rows (with STRATA columns) into the sample"""
+        if batch.num_rows == 0:
+            return self
+        codes, labels = stratum_codes(batch)
+        for label, rows in zip(labels, np.bincount(codes, minlength=len(labels)).tolist()):
+            self.population[label] = self.population.get(label, 0) + rows
+        priority = priorities(batch[PRIMARY_KEYS[self.table]].to_numpy(zero_copy_only=False), self.table)
+        limits = np.array([self.thresholds.get(label, 1.0) for label in labels])
+        keep = priority < limits[codes]  # Full strata only admit rows that beat their k-th priority
+        if keep.any():
+            candidates = batch.filter(pa.array(keep)).append_column('priority', pa.array(priority[keep]))
+            self.rows = candidates if self.rows is None else pa.concat_tables([self.rows, candidates])
+            self.trim()
+        return self
+
+    def trim(self):
+        """Keep the per_stratum smallest priorities of every stratum"""
+        codes, labels = stratum_codes(self.rows)
+        priority = self.rows['priority'].to_numpy()
+        order = np.lexsort((priority, codes))
+        sorted_codes = codes[order]
+        starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        rank = np.arange(len(order)) - np.repeat(starts, np.diff(np.r_[starts, len(order)]))
+        self.rows = self.rows.take(np.sort(order[rank < self.per_stratum]))
+        for start, code in zip(starts.tolist(), sorted_codes[starts].tolist()):
+            last = start + self.per_stratum - 1
+            if last < len(order) and sorted_codes[last] == code:
+                self.thresholds[labels[code]] = float(priority[order[last]])
+
+    def merge(self, other: 'StratifiedSample'):
+        """Sample of both samples' rows, e.g. from batches sampled in parallel"""
+        for label, rows in other.population.items():
+            self.population[label] = self.population.get(label, 0) + rows
+        if other.rows is not None:
+            self.rows = other.rows if self.rows is None else pa.concat_tables([self.rows, other.rows])
+            self.trim()
+        return self
+
+    def strata(self):
+        """One row per stratum: its population N_h and sampled rows n_h"""
+        population = pd.DataFrame([(*label, rows) for label, rows in self.population.items()],
+                                  columns=STRATA + ['population'])
+        codes, labels = stratum_codes(self.rows)
+        sampled = pd.DataFrame([(*label, rows) for label, rows in zip(labels, np.bincount(codes).tolist())],
+                               columns=STRATA + ['sampled'])
+        return population.merge(sampled, on=STRATA, how='left').fillna({'sampled': 0})
+
+    def save(self, path):
+        """Write the sampled rows as an uncompressed Arrow file, the stratum sizes in its metadata"""
+        metadata = {'table': self.table, 'per_stratum': self.per_stratum,
+                    'population': [[*label, rows] for label, rows in self.population.items()]}
+        feather.write_feather(self.rows.replace_schema_metadata({'kpi_sample': json.dumps(metadata)}),
+                              str(path), compression='uncompressed')
+
+    @classmethod
+    def load(cls, path):
+        rows = feather.read_table(str(path))
+        metadata = json.loads(rows.schema.metadata[b'kpi_sample'])
+        sample = cls(metadata['table'], metadata['per_stratum'])
+        sample.population = {tuple(entry[:-1]): entry[-1] for entry in metadata['population']}
+        sample.rows = rows.replace_schema_metadata(None)
+        sample.trim()  # Restores the thresholds, so the loaded sample keeps taking appended batches
+        return sample
+
+# ============================================================================
+# ESTIMATION
+# ============================================================================
+
+def identifiers(names):
+    """Column names checked before they are spliced into SQL"""
+    for name in names:
+        if not re.fullmatch(r'[A-Za-z_][A-Za-z0-9_]*', name):
+            raise ValueError(f"'{name}' is not a column name")
+    return list(names)
+
+def partial_sums(connection, relation: str, kpi: str, by=(), where: dict = None):
+    """Per (group, stratum): matching rows and the sums the estimators need, computed by SQL"""
+    _, numerator, denominator, _ = KPIS[kpi]
+    y, x = f"CAST({numerator} AS DOUBLE)", f"CAST({denominator or '1'} AS DOUBLE)"  # SQLite reads DOUBLE as REAL
+    groups = identifiers(list(by) + [column for column in STRATA if column not in by])
+    conditions, parameters = [], []
+    for column, values in (where or {}).items():
+        values = list(np.atleast_1d(values))
+        conditions.append(f"{identifiers([column])[0]} IN ({', '.join('?' * len(values))})")
+        parameters += [value.item() if hasattr(value, 'item') else value for value in values]
+    sql = (f"SELECT {', '.join(groups)}, COUNT(*) AS matched, SUM({y}) AS y, SUM({y} * {y}) AS yy, "
+           f"SUM({x}) AS x, SUM({x} * {x}) AS xx, SUM({x} * {y}) AS xy FROM {relation}"
+           + (f" WHERE {' AND '.join(conditions)}" if conditions else '') + f" GROUP BY {', '.join(groups)}")
+    cursor = connection.execute(sql, parameters)
+    return pd.DataFrame(cursor.fetchall(), columns=[column[0] for column in cursor.description])
+
+def estimate(parts: pd.DataFrame, strata: pd.DataFrame, kpi: str, by=(), confidence: float = CONFIDENCE):
+    """KPI per group with its confidence interval; exact when every stratum was read in full"""
+    _, _, denominator, scale = KPIS[kpi]
+    by = list(by)
+    if not len(parts):
+        return pd.DataFrame(columns=['estimate', 'low', 'high', 'relative_error', 'rows'])
+    parts = parts.merge(strata, on=STRATA, how='left')
+    population, sampled = parts['population'].to_numpy(np.float64), parts['sampled'].to_numpy(np.float64)
+    weight = population / sampled
+    parts = parts.assign(total_y=weight * parts['y'], total_x=weight * parts['x'],
+                         group=0 if not by else parts.groupby(by, sort=True, observed=True).ngroup())
+    totals = parts.groupby('group')[['total_y', 'total_x', 'matched']].sum()
+    ratio = (totals['total_y'] / totals['total_x']).to_numpy() if denominator else np.zeros(len(totals))
+
+    # Per stratum: variance of d = y - R x (d = y for totals) over all n_h sampled rows, zeros included
+    r = ratio[parts['group'].to_numpy()]
+    d = parts['y'] - r * parts['x']
+    dd = parts['yy'] - 2 * r * parts['xy'] + r * r * parts['xx']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        spread = np.where(sampled > 1, (dd - d * d / sampled) / (sampled - 1), np.inf)
+        spread = np.where(sampled >= population, 0.0, np.maximum(spread, 0.0))
+        terms = population * population * (1 - sampled / population) / sampled * spread
+    variance = pd.Series(terms).groupby(parts['group'].to_numpy()).sum().to_numpy()
+    if denominator:
+        variance = variance / totals['total_x'].to_numpy() ** 2
+    value = (ratio if denominator else totals['total_y'].to_numpy()) * scale
+    half_width = NormalDist().inv_cdf(0.5 + confidence / 2) * np.sqrt(variance) * abs(scale)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_error = half_width / np.abs(value)
+
+    index = parts.groupby('group')[by].first() if by else pd.DataFrame(index=totals.index)
+    result = pd.DataFrame({'estimate': value, 'low': value - half_width, 'high': value + half_width,
+                           'relative_error': relative_error, 'rows': totals['matched'].to_numpy()},
+                          index=pd.MultiIndex.from_frame(index) if len(by) > 1
+                          else pd.Index(index[by[0]], name=by[0]) if by else pd.Index(['All'], name='total'))
+    return result.sort_index()
+
+# ============================================================================
+# QUERIES
+# ============================================================================
+
+class KpiSample:
+    """Stratified samples of the fact tables answering KPI queries, with an exact fallback"""
+
+    def __init__(self, per_stratum: int = SAMPLE_PER_STRATUM, exact=None):
+        self.samples = {table: StratifiedSample(table, per_stratum) for table in SAMPLED_TABLES}
+        self.exact = exact  # function(table, aggregate) -> partial sums over the full table (exact_warehouse)
+        self.connection = None
+
+    def update(self, table: str, batch: pa.Table):
+        """Fold appended rows of a sampled table (with STRATA columns) into its sample"""
+        self.samples[table].update(batch)
+        self.connection = None
+        return self
+
+    def merge(self, other: 'KpiSample'):
+        for table, sample in other.samples.items():
+            self.samples[table].merge(sample)
+        self.connection = None
+        return self
+
+    def sample_connection(self):
+        """In-memory DuckDB with each sample registered under its table name"""
+        if duckdb is None:
+            raise ImportError("duckdb is not installed; `pip install duckdb` to query the samples")
+        if self.connection is None:
+            self.connection = duckdb.connect()
+            for table, sample in self.samples.items():
+                if sample.rows is not None:
+                    self.connection.register(table, sample.rows)
+        return self.connection
+
+    def query(self, kpi: str, by=(), where: dict = None, max_error: float = MAX_RELATIVE_ERROR):
+        """KPI per group: estimate, 95% interval, relative error, sampled rows and 'sample' or 'exact'"""
+        table = KPIS[kpi][0]
+        sample = self.samples[table]
+        result = estimate(partial_sums(self.sample_connection(), table, kpi, by, where), sample.strata(), kpi, by)
+        too_wide = ~(result['relative_error'] <= max_error)  # NaN (no rows, zero estimate) counts as too wide
+        if self.exact is not None and (too_wide.any() or not len(result)):
+            parts = self.exact(table, lambda connection, relation: partial_sums(connection, relation, kpi, by, where))
+            every_row = parts[STRATA].drop_duplicates().assign(population=1, sampled=1)  # Weight 1, no variance
+            return estimate(parts, every_row, kpi, by).assign(method='exact')
+        return result.assign(method='sample')
+
+    def save(self, directory):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        for table, sample in self.samples.items():
+            sample.save(directory / f"{table}.arrow")
+
+    @classmethod
+    def load(cls, directory, exact=None):
+        kpi_sample = cls(exact=exact)
+        kpi_sample.samples = {table: StratifiedSample.load(Path(directory) / f"{table}.arrow")
+                              for table in SAMPLED_TABLES}
+        return kpi_sample
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def warehouse_batches(connection, table: str, batch_size: int = BATCH_SIZE):
+    """Arrow batches of a fact table joined to its strata, streamed from a DuckDB or SQLite warehouse"""
+    cursor = connection.execute(ENRICHED_SQL[table])
+    arrow_reader = getattr(cursor, 'to_arrow_reader', None) or getattr(cursor, 'fetch_record_batch', None)
+    if arrow_reader is not None:  # DuckDB streams Arrow record batches
+        for batch in arrow_reader(batch_size):
+            yield pa.Table.from_batches([batch])
+        return
+    columns = [column[0] for column in cursor.description]
+    while rows := cursor.fetchmany(batch_size):
+        yield pa.table({name: [row[index] for row in rows] for index, name in enumerate(columns)})
+
+def virtual_batches(tables: dict, table: str, batch_size: int = BATCH_SIZE):
+    """Arrow batches of a virtual fact table with the strata of the loans and customers it references"""
+    cities = tables['dim_city'].set_index('city_id')
+    facts, loans, customers = tables[table], tables['loans'], tables['customers']
+    for start in range(0, len(facts), batch_size):
+        batch = facts[start:start + batch_size]
+        loan = loans.take(batch['loan_id'].to_numpy() - 1, ['customer_id', 'loan_status'])
+        owner = batch['customer_id'] if 'customer_id' in batch else loan['customer_id']
+        city_id = customers.take(owner.to_numpy() - 1, ['city_id'])['city_id'].to_numpy()
+        enriched = typed_batch(table, batch)
+        for name, values in [('city_id', city_id), ('state_id', cities['state_id'].loc[city_id].to_numpy()),
+                             ('tier', cities['tier_classification'].loc[city_id].astype(str).to_numpy()),
+                             ('loan_status', loan['loan_status'].astype(str).to_numpy())]:
+            enriched = enriched.append_column(name, pa.array(values))
+        yield enriched
+
+def exact_warehouse(connection):
+    """Exact fallback pushed down to the warehouse as one aggregate over the joined fact table"""
+    return lambda table, aggregate: aggregate(connection, f"({ENRICHED_SQL[table]}) AS facts")
+
+def exact_virtual(tables: dict, batch_size: int = BATCH_SIZE):
+    """Exact fallback streamed from the virtual tables: the same aggregate per batch, summed"""
+    def run(table, aggregate):
+        connection, parts = duckdb.connect(), []
+        for batch in virtual_batches(tables, table, batch_size):
+            connection.register('facts', batch)
+            parts.append(aggregate(connection, 'facts'))
+            connection.unregister('facts')
+        parts = pd.concat(parts, ignore_index=True)
+        groups = [column for column in parts.columns if column not in ('matched', 'y', 'yy', 'x', 'xx', 'xy')]
+        return parts.groupby(groups, as_index=False, dropna=False).sum()
+    return run
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def parse_where(conditions):
+    """{'column': value} from column=value strings; integer-looking values become ints"""
+    where = {}
+    for condition in conditions or []:
+        column, value = condition.split('=', 1)
+        where.setdefault(column, []).append(int(value) if value.lstrip('-').isdigit() else value)
+    return where
+
+def main():
+    """Build or load the stratified samples and answer KPI queries from them"""
+    parser = argparse.ArgumentParser(description="Approximate EduFin collection KPIs from stratified samples")
+    parser.add_argument('--warehouse', help="DuckDB/SQLite warehouse to sample (and to answer exact fallbacks)")
+    parser.add_argument('--scale', type=float, default=1.0, help="Sample the virtual tables at this scale instead")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--sample', help="Directory the samples are loaded from, or saved to when it does not exist")
+    parser.add_argument('--per-stratum', type=int, default=SAMPLE_PER_STRATUM)
+    parser.add_argument('--kpi', nargs='+', choices=list(KPIS), default=['collection_efficiency_ratio',
+                                                                         'recovery_rate'])
+    parser.add_argument('--by', nargs='*', default=['state_id'], help="Columns to group by, e.g. tier loan_status")
+    parser.add_argument('--where', nargs='*', metavar='COLUMN=VALUE', help="Filters; repeated columns are ORed")
+    parser.add_argument('--max-error', type=float, default=MAX_RELATIVE_ERROR,
+                        help="Relative interval half-width beyond which a query is answered exactly")
+    parser.add_argument('--no-exact', action='store_true', help="Never fall back to the full tables")
+    args = parser.parse_args()
+
+    if args.warehouse:
+        connection = connect(args.warehouse)
+        exact, label = exact_warehouse(connection), args.warehouse
+        batches = lambda table: warehouse_batches(connection, table, args.batch_size)
+    else:
+        tables = virtual_tables(args.scale, args.seed, args.as_of)
+        exact = exact_virtual(tables, args.batch_size)
+        label = f"virtual tables, scale {args.scale:g}, as of {args.as_of}"
+        batches = lambda table: virtual_batches(tables, table, args.batch_size)
+    exact = None if args.no_exact else exact
+
+    print("=" * 80)
+    print(f"EDUFIN APPROXIMATE KPIS ({label})")
+    print("=" * 80)
+    start_time = time.time()
+    if args.sample and Path(args.sample).exists():
+        kpi_sample = KpiSample.load(args.sample, exact)
+        print(f"📂 Loaded samples from {args.sample} in {time.time() - start_time:.2f}s")
+    else:
+        kpi_sample = KpiSample(args.per_stratum, exact)
+        for table in SAMPLED_TABLES:
+            for batch in batches(table):
+                kpi_sample.update(table, batch)
+        print(f"🎯 Sampled in {time.time() - start_time:.1f}s")
+        if args.sample:
+            kpi_sample.save(args.sample)
+            print(f"💾 Saved samples to {args.sample}")
+    for table, sample in kpi_sample.samples.items():
+        print(f"   {table:<22} {sample.rows.num_rows:>10,} of {sum(sample.population.values()):>13,} rows "
+              f"in {len(sample.population)} strata")
+
+    where = parse_where(args.where)
+    for kpi in args.kpi:
+        query_start = time.time()
+        result = kpi_sample.query(kpi, args.by, where, args.max_error)
+        method = result['method'].iloc[0] if len(result) else 'sample'
+        print(f"\n⚡ {kpi} by {', '.join(args.by) or 'total'} ({method}) in "
+              f"{(time.time() - query_start) * 1000:.1f} ms")
+        with pd.option_context('display.width', 200, 'display.max_columns', None, 'display.max_rows', 60):
+            print(result.drop(columns='method').round(4))
+
+if __name__ == "__main__":
+    main()
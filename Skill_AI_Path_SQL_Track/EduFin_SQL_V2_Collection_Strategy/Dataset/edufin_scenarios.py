@@ -0,0 +1,215 @@
+"""
+EduFin What-If Scenario Engine
+Stress-tests the generator's business rules without rerunning the whole pipeline
+- A scenario file (JSON) overrides rule constants per table
+- A column-level dependency graph finds every column an override reaches
+- Only those columns are recomputed; all other columns are reused from the baseline
+
+Usage:
+    python edufin_scenarios.py scenarios/severe_recession.json scenarios/collections_squeeze.json --scale 0.1
+"""
+
+import argparse
+import copy
+import json
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from edufin_rng import DEFAULT_SEED
+from edufin_virtual_tables import VIRTUAL_TABLES
+
+# Row counts used by SQL_V2_data_Code_5Lakh.py for the tables that expose scenario parameters
+TABLE_ROWS = {
+    'loans': 400000,
+    'payments': 350000,
+    'defaults_collections': 350000,
+    'economic_indicators': 350000,
+}
+
+# ============================================================================
+# SCENARIO FILES
+# ============================================================================
+
+def load_scenario(path):
+    """Load a scenario file: {"name": ..., "overrides": {table: {PARAMETER: value}}}"""
+    path = Path(path)
+    with open(path, encoding='utf-8') as f:
+        scenario = json.load(f)
+    if 'overrides' not in scenario:
+        raise ValueError(f"Scenario file {path} has no 'overrides' section")
+    scenario.setdefault('name', path.stem)
+    return scenario
+
+def default_tables(scale: float = 1.0, seed: int = DEFAULT_SEED, as_of=None):
+    """Baseline virtual tables at the generator's row counts multiplied by `scale`"""
+    loans = max(1, int(TABLE_ROWS['loans'] * scale))
+    others = max(1, int(TABLE_ROWS['payments'] * scale))
+    customers = max(1, int(500000 * scale))
+    common = {'seed': seed, 'as_of': as_of}
+    return {
+        'loans': VIRTUAL_TABLES['loans'](loans, num_customers=customers, num_institutions=others, **common),
+        'payments': VIRTUAL_TABLES['payments'](others, num_loans=loans, **common),
+        'defaults_collections': VIRTUAL_TABLES['defaults_collections'](
+            others, num_customers=customers, num_loans=loans, **common),
+        'economic_indicators': VIRTUAL_TABLES['economic_indicators'](others, **common),
+    }
+
+# ============================================================================
+# COLUMN DEPENDENCY GRAPH
+# ============================================================================
+
+def column_graph(tables: dict):
+    """Downstream edges 'table.rule' -> {'table.rule', ...} for every rule of every table
+
+    Tables only share keys drawn from their own streams, so edges stay within a table.
+    """
+    graph = {}
+    for name, table in tables.items():
+        for rule in table.rules:
+            graph.setdefault(f"{name}.{rule}", set())
+            for dependency in table.dependencies.get(rule, []):
+                graph.setdefault(f"{name}.{dependency}", set()).add(f"{name}.{rule}")
+    return graph
+
+def downstream(graph: dict, nodes):
+    """All nodes reachable from `nodes`, including the nodes themselves"""
+    reached = set()
+    pending = list(nodes)
+    while pending:
+        node = pending.pop()
+        if node not in reached:
+            reached.add(node)
+            pending.extend(graph.get(node, ()))
+    return reached
+
+# ============================================================================
+# SCENARIO ENGINE
+# ============================================================================
+
+class ScenarioEngine:
+    """Runs scenarios against one materialized baseline, recomputing only affected columns"""
+
+    def __init__(self, tables: dict):
+        self.tables = tables
+        self.graph = column_graph(tables)
+        self._baseline = {}
+
+    def baseline(self, name: str):
+        """Baseline DataFrame for a table, generated once and then reused by every scenario"""
+        if name not in self._baseline:
+            self._baseline[name] = self.tables[name][:]
+        return self._baseline[name]
+
+    def variants(self, scenario: dict):
+        """Copies of the overridden tables with the scenario parameters applied"""
+        variants = {}
+        for name, overrides in scenario['overrides'].items():
+            if name not in self.tables:
+                raise KeyError(f"Scenario '{scenario['name']}' overrides unknown table '{name}'")
+            variants[name] = copy.copy(self.tables[name])
+            variants[name].set_parameters(overrides)
+        return variants
+
+    def affected_columns(self, scenario: dict, variants: dict = None):
+        """{table: [output columns]} that the scenario changes"""
+        variants = variants or self.variants(scenario)
+        seeds = [f"{name}.{rule}"
+                 for name, overrides in scenario['overrides'].items()
+                 for parameter in overrides
+                 for rule in variants[name].parameter_rules(parameter)]
+        reached = downstream(self.graph, seeds)
+
+        affected = {}
+        for name, table in self.tables.items():
+            columns = [column for column in table.columns if f"{name}.{column}" in reached]
+            if columns:
+                affected[name] = columns
+        return affected
+
+    def run(self, scenario: dict, tables=None):
+        """Scenario version of each table; unaffected tables are the baseline objects themselves"""
+        variants = self.variants(scenario)
+        affected = self.affected_columns(scenario, variants)
+
+        results = {}
+        for name in tables or self.tables:
+            baseline = self.baseline(name)
+            columns = affected.get(name)
+            if not columns:
+                results[name] = baseline
+                continue
+            recomputed = variants[name].take(np.arange(len(baseline)), columns,
+                                             known=baseline.drop(columns=columns))
+            results[name] = baseline.assign(**{column: recomputed[column].to_numpy() for column in columns})
+        return results
+
+# ============================================================================
+# SCENARIO COMPARISON
+# ============================================================================
+
+def summarize(tables: dict):
+    """Headline stress metrics for one set of tables"""
+    summary = {}
+    if 'loans' in tables:
+        status = tables['loans']['loan_status']
+        summary['loan_default_rate'] = (status == 'Defaulted').mean()
+        summary['loan_overdue_rate'] = (status == 'Overdue').mean()
+        summary['avg_interest_rate'] = tables['loans']['interest_rate'].mean()
+    if 'defaults_collections' in tables:
+        defaults = tables['defaults_collections']
+        summary['recovery_rate'] = defaults['recovery_amount'].sum() / defaults['default_amount'].sum()
+        summary['written_off_share'] = (defaults['collection_status'] == 'Written Off').mean()
+    if 'economic_indicators' in tables:
+        economic = tables['economic_indicators']
+        year = economic['quarter'].str[:4]
+        summary['gdp_growth_2020'] = economic.loc[year == '2020', 'gdp_growth_rate'].mean()
+        summary['unemployment_2020'] = economic.loc[year == '2020', 'unemployment_rate'].mean()
+    return summary
+
+def compare_scenarios(engine: ScenarioEngine, scenarios):
+    """One row of summary metrics per scenario, with the baseline first"""
+    rows = [{'scenario': 'baseline', **summarize({name: engine.baseline(name) for name in engine.tables})}]
+    for scenario in scenarios:
+        start_time = time.time()
+        affected = engine.affected_columns(scenario)
+        results = engine.run(scenario)
+        rows.append({
+            'scenario': scenario['name'],
+            **summarize(results),
+            'columns_recomputed': sum(len(columns) for columns in affected.values()),
+            'seconds': round(time.time() - start_time, 2)
+        })
+    return pd.DataFrame(rows).set_index('scenario')
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Compare scenario files against the baseline"""
+    parser = argparse.ArgumentParser(description="Compare EduFin what-if scenarios against the baseline")
+    parser.add_argument('scenarios', nargs='+', help="Scenario JSON files")
+    parser.add_argument('--scale', type=float, default=1.0, help="Fraction of the generator's row counts")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    args = parser.parse_args()
+
+    engine = ScenarioEngine(default_tables(args.scale, args.seed))
+    scenarios = [load_scenario(path) for path in args.scenarios]
+
+    print("=" * 80)
+    print("EDUFIN WHAT-IF SCENARIOS")
+    print("=" * 80)
+    for scenario in scenarios:
+        print(f"\n📋 {scenario['name']}: {scenario.get('description', '')}")
+        for table, columns in engine.affected_columns(scenario).items():
+            print(f"   {table}: {', '.join(columns)}")
+
+    print()
+    with pd.option_context('display.width', 200, 'display.max_columns', None):
+        print(compare_scenarios(engine, scenarios).round(4))
+
+if __name__ == "__main__":
+    main()
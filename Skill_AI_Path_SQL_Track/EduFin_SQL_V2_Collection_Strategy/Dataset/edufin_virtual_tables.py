@@ -0,0 +1,889 @@
+"""
+EduFin Virtual Tables
+Random-access fact tables backed by the counter-based RNG in edufin_rng
+- virtual_payments[10_000_000:10_000_100] generates only those 100 rows
+- Every cell is a pure function of (seed, table, column, row ID)
+- Columns draw from independent streams, so one column can be regenerated alone
+- Disjoint row ranges can be generated in parallel and concatenated
+- rule_version() hashes only the rules, helpers and constants behind a table's columns, so editing
+  one table's rules leaves the cached copies of the others valid
+"""
+
+import hashlib
+import inspect
+import json
+import re
+
+import numpy as np
+import pandas as pd
+from datetime import datetime
+
+import edufin_rng
+from dataset_cache import code_version
+from edufin_rng import (DEFAULT_SEED, random_uint32, random_uniform, column_generator,
+                        uniform_between, integers_between, weighted_choice)
+
+BATCH_SIZE = 100000
+DEFAULT_AS_OF = '2025-01-01'  # Pinned as-of date for command-line runs, so reruns match on any day
+
+# ============================================================================
+# BASE CLASS
+# ============================================================================
+
+class VirtualTable:
+    """Random-access table whose rows are generated on demand from their row IDs"""
+
+    table_name = None
+    id_column = None
+    columns = []
+    rules = []  # Evaluation order of column rules, including helper columns
+    dependencies = {}  # Rule -> rules whose values it reads
+    parameters = {}  # Overridable class constant -> rules that read it
+
+    def __init__(self, num_rows: int, seed: int = DEFAULT_SEED, as_of=None, overrides: dict = None):
+        self.num_rows = num_rows
+        self.seed = seed
+        self.as_of = np.datetime64(as_of or datetime.now().date(), 'D')
+        self.set_parameters(overrides or {})
+
+    def set_parameters(self, overrides: dict):
+        """Override business-rule constants on this instance; dict parameters are merged one level deep"""
+        for name, value in overrides.items():
+            if name not in self.parameters:
+                raise KeyError(f"{self.table_name} has no scenario parameter '{name}'")
+            current = getattr(self, name)
+            if isinstance(current, dict):
+                key_type = type(next(iter(current)))
+                value = {**current, **{key_type(key): item for key, item in value.items()}}
+            setattr(self, name, value)
+
+    def parameter_rules(self, name: str):
+        """Rules whose output depends on a scenario parameter"""
+        return list(self.parameters[name])
+
+    def config(self):
+        """Everything besides code that determines this table's contents (used for cache keys)"""
+        config = {'class': type(self).__name__}
+        for name, value in vars(self).items():
+            if name.startswith('_'):
+                continue
+            if isinstance(value, pd.DataFrame):
+                value = int(pd.util.hash_pandas_object(value, index=False).sum())
+            config[name] = value
+        config.update({name: getattr(self, name) for name in self.parameters})
+        return config
+
+    def rule_version(self, columns=None):
+        """Hash of the code behind the given columns (default all): their rules, the helpers and class
+        constants those read, the row generator and edufin_rng"""
+        cls, methods = type(self), []
+        rules = self.required_rules(columns or self.columns)
+        constants = {'dependencies': {rule: self.dependencies.get(rule, []) for rule in rules}}
+        pending = [cls._generate] + [getattr(cls, f"_column_{rule}") for rule in rules]
+        while pending:
+            method = pending.pop()
+            if method in methods:
+                continue
+            methods.append(method)
+            for name in re.findall(r'self\.(\w+)', inspect.getsource(method)):
+                attribute = getattr(cls, name, None)
+                if inspect.isfunction(attribute):
+                    pending.append(attribute)
+                elif name.isupper():
+                    constants[name] = attribute
+        digest = hashlib.blake2b(code_version(edufin_rng, *sorted(methods, key=lambda method: method.__name__))
+                                 .encode(), digest_size=16)
+        digest.update(json.dumps(constants, sort_keys=True, default=str).encode())
+        return digest.hexdigest()
+
+    def __len__(self):
+        return self.num_rows
+
+    def __repr__(self):
+        return f"{type(self).__name__}(num_rows={self.num_rows:,}, seed={self.seed}, as_of={self.as_of})"
+
+    def __getitem__(self, item):
+        """Rows by slice, position or array of positions, optionally with a column list"""
+        columns = None
+        if isinstance(item, tuple):
+            item, columns = item
+        if isinstance(item, slice):
+            return self.take(np.arange(*item.indices(self.num_rows)), columns)
+        if isinstance(item, (int, np.integer)):
+            position = item + self.num_rows if item < 0 else item
+            return self.take(np.array([position]), columns)
+        return self.take(np.asarray(item, dtype=np.int64), columns)
+
+    def take(self, positions, columns=None, known: pd.DataFrame = None):
+        """Generate the rows at the given 0-based positions, computing only the requested columns
+
+        `known` holds already-generated columns for the same rows; dependencies found
+        there are reused instead of being recomputed.
+        """
+        positions = np.asarray(positions, dtype=np.int64)
+        if len(positions) and (positions.min() < 0 or positions.max() >= self.num_rows):
+            raise IndexError(f"{self.table_name} positions out of range for {self.num_rows:,} rows")
+        return self._generate(positions + 1, columns or self.columns, known)
+
+    def required_rules(self, columns, known=()):
+        """Rules needed to compute the given columns, i.e. the columns plus their unknown dependencies"""
+        required = set()
+        pending = [column for column in columns if column != self.id_column]
+        while pending:
+            rule = pending.pop()
+            if rule not in self.rules:
+                raise KeyError(f"{self.table_name} has no column '{rule}'")
+            if rule not in required:
+                required.add(rule)
+                pending.extend(dependency for dependency in self.dependencies.get(rule, [])
+                               if dependency not in known)
+        return [rule for rule in self.rules if rule in required]
+
+    def sample(self, n: int, random_state=None):
+        """Uniform sample of n rows without generating the rest of the table"""
+        rng = np.random.default_rng(random_state)
+        positions = np.sort(rng.choice(self.num_rows, size=n, replace=False))
+        return self.take(positions)
+
+    def iter_batches(self, batch_size: int = BATCH_SIZE, start: int = 0, stop: int = None):
+        """Yield consecutive DataFrame batches covering rows [start, stop)"""
+        stop = self.num_rows if stop is None else min(stop, self.num_rows)
+        for batch_start in range(start, stop, batch_size):
+            yield self[batch_start:min(batch_start + batch_size, stop)]
+
+    def to_arrow(self, start: int = 0, stop: int = None):
+        """Rows [start, stop) as a pyarrow Table"""
+        import pyarrow as pa
+        return pa.Table.from_pandas(self[start:stop], preserve_index=False)
+
+    # ------------------------------------------------------------------------
+    # Helpers for column rules
+    # ------------------------------------------------------------------------
+
+    def _uniform(self, column: str, values: dict, lanes: int = 1):
+        """Uniforms for one column stream; a single array, or one array per lane"""
+        u = random_uniform(self.table_name, column, values[self.id_column], lanes, self.seed)
+        return u[:, 0] if lanes == 1 else u.T
+
+    def _days_ago(self, days):
+        """Dates `days` before the as-of date"""
+        return self.as_of - np.asarray(days).astype('timedelta64[D]')
+
+    @staticmethod
+    def _by_group(groups, ranges: dict):
+        """Per-row (low, high) bounds looked up from a {group: (low, high)} mapping"""
+        conditions = [groups == group for group in ranges]
+        low = np.select(conditions, [bounds[0] for bounds in ranges.values()])
+        high = np.select(conditions, [bounds[1] for bounds in ranges.values()])
+        return low, high
+
+    def _row_faker(self, column: str, values: dict, locale: str = 'en_IN'):
+        """Yield a Faker re-seeded from the column stream for each row, keeping Faker output random-access"""
+        from faker import Faker
+        fake = Faker(locale)
+        for row_seed in random_uint32(self.table_name, column, values[self.id_column], 1, self.seed)[:, 0]:
+            fake.seed_instance(int(row_seed))
+            yield fake
+
+    def _generate(self, row_ids, columns, known=None):
+        values = {self.id_column: row_ids}
+        if known is not None:
+            values.update({column: known[column].to_numpy() for column in known.columns})
+        for column in self.required_rules(columns, values):
+            values[column] = getattr(self, f"_column_{column}")(values)
+        return pd.DataFrame({column: values[column] for column in columns})
+
+# ============================================================================
+# CUSTOMERS
+# ============================================================================
+
+class VirtualCustomers(VirtualTable):
+    """Education-loan borrowers spread across real cities, favouring higher tiers"""
+
+    table_name = 'customers'
+    id_column = 'customer_id'
+    columns = ['customer_id', 'full_name', 'phone_number', 'email_address', 'city_id',
+               'current_address', 'annual_income', 'cibil_score', 'employment_type',
+               'employer_name', 'date_of_birth', 'gender', 'education_level']
+    rules = ['city_id', 'tier', 'gender', 'first_name', 'last_name', 'full_name', 'phone_number',
+             'email_address', 'current_address', 'employment_type', 'annual_income', 'cibil_score',
+             'employer_name', 'date_of_birth', 'education_level']
+    dependencies = {
+        'tier': ['city_id'],
+        'first_name': ['gender'],
+        'full_name': ['first_name', 'last_name'],
+        'email_address': ['first_name', 'last_name'],
+        'annual_income': ['tier', 'employment_type'],
+        'cibil_score': ['employment_type', 'annual_income'],
+        'employer_name': ['employment_type'],
+    }
+
+    TIER_WEIGHTS = {'Tier1': 0.45, 'Tier2': 0.35, 'Tier3': 0.20}
+    TIER_INCOME = {'Tier1': (600000, 1800000), 'Tier2': (400000, 1200000), 'Tier3': (250000, 800000)}
+    EMPLOYMENT_TYPES = ['Private Employee', 'Government Employee', 'Self Employed', 'Business Owner', 'Student']
+    EMPLOYMENT_WEIGHTS = [45, 20, 20, 10, 5]
+    EMPLOYMENT_MULTIPLIERS = {
+        'Government Employee': (0.8, 1.3),
+        'Private Employee': (0.6, 1.6),
+        'Business Owner': (1.0, 3.0),
+        'Self Employed': (0.4, 2.0),
+        'Student': (0.1, 0.4)
+    }
+    EMPLOYMENT_CIBIL = {
+        'Government Employee': (650, 850),
+        'Private Employee': (600, 800),
+        'Self Employed': (550, 750),
+        'Business Owner': (550, 750),
+        'Student': (550, 750)
+    }
+    EMPLOYERS = {
+        'Government Employee': ['Ministry of Education', 'State Government', 'Railway', 'PSU Bank'],
+        'Private Employee': ['TCS', 'Infosys', 'Wipro', 'Accenture', 'IBM', 'Microsoft'],
+        'Self Employed': ['Self Employed', 'Freelance', 'Consultant'],
+        'Business Owner': ['Own Business', 'Family Business', 'Trading Co'],
+        'Student': ['Not Applicable', 'Part-time', 'Internship']
+    }
+    EDUCATION_LEVELS = ['Bachelors', 'Masters', 'PhD', 'Diploma', 'Higher Secondary']
+    EDUCATION_WEIGHTS = [50, 30, 5, 10, 5]
+
+    def __init__(self, num_rows: int = 500000, cities: pd.DataFrame = None, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.cities = cities
+
+    def _column_city_id(self, values):
+        weights = self.cities['tier_classification'].map(self.TIER_WEIGHTS).to_numpy()
+        return weighted_choice(self._uniform('city_id', values), self.cities['city_id'].to_numpy(), weights)
+
+    def _column_tier(self, values):
+        tiers = self.cities.set_index('city_id')['tier_classification']
+        return tiers.reindex(values['city_id']).to_numpy()
+
+    def _column_gender(self, values):
+        return weighted_choice(self._uniform('gender', values), ['Male', 'Female'])
+
+    def _column_first_name(self, values):
+        from faker.providers.person.en_IN import Provider
+        u = self._uniform('first_name', values)
+        return np.where(values['gender'] == 'Male',
+                        weighted_choice(u, Provider.first_names_male),
+                        weighted_choice(u, Provider.first_names_female))
+
+    def _column_last_name(self, values):
+        from faker.providers.person.en_IN import Provider
+        return weighted_choice(self._uniform('last_name', values), Provider.last_names)
+
+    def _column_full_name(self, values):
+        return np.char.add(np.char.add(values['first_name'], ' '), values['last_name'])
+
+    def _column_phone_number(self, values):
+        number = integers_between(self._uniform('phone_number', values), 7000000000, 9999999999)
+        return np.char.add('+91', number.astype(str))
+
+    def _column_email_address(self, values):
+        local_part = (pd.Series(values['first_name']).str.lower() + '.' +
+                      pd.Series(values['last_name']).str.lower() + values[self.id_column].astype(str))
+        return (local_part + '@gmail.com').to_numpy()
+
+    def _column_current_address(self, values):
+        return np.array([fake.address() for fake in self._row_faker('current_address', values)])
+
+    def _column_employment_type(self, values):
+        return weighted_choice(self._uniform('employment_type', values),
+                               self.EMPLOYMENT_TYPES, self.EMPLOYMENT_WEIGHTS)
+
+    def _column_annual_income(self, values):
+        u_base, u_multiplier = self._uniform('annual_income', values, lanes=2)
+        base_income = uniform_between(u_base, *self._by_group(values['tier'], self.TIER_INCOME))
+        multiplier = uniform_between(u_multiplier,
+                                     *self._by_group(values['employment_type'], self.EMPLOYMENT_MULTIPLIERS))
+        return np.round(base_income * multiplier, 2)
+
+    def _column_cibil_score(self, values):
+        low, high = self._by_group(values['employment_type'], self.EMPLOYMENT_CIBIL)
+        cibil = uniform_between(self._uniform('cibil_score', values), low, high)
+        cibil += np.where(values['annual_income'] > 1000000, 50, 0)
+        return np.clip(cibil, 300, 900).astype(np.int64)
+
+    def _column_employer_name(self, values):
+        u = self._uniform('employer_name', values)
+        employment_type = values['employment_type']
+        return np.select([employment_type == kind for kind in self.EMPLOYERS],
+                         [weighted_choice(u, employers) for employers in self.EMPLOYERS.values()],
+                         default='')
+
+    def _column_date_of_birth(self, values):
+        u_age, u_month, u_day = self._uniform('date_of_birth', values, lanes=3)
+        birth_year = self.as_of.astype(object).year - integers_between(u_age, 18, 30)
+        return pd.to_datetime(pd.DataFrame({'year': birth_year,
+                                            'month': integers_between(u_month, 1, 12),
+                                            'day': integers_between(u_day, 1, 28)})).to_numpy()
+
+    def _column_education_level(self, values):
+        return weighted_choice(self._uniform('education_level', values),
+                               self.EDUCATION_LEVELS, self.EDUCATION_WEIGHTS)
+
+# ============================================================================
+# INSTITUTIONS
+# ============================================================================
+
+class VirtualInstitutions(VirtualTable):
+    """Colleges and universities whose size, fees and placements follow city tier"""
+
+    table_name = 'institutions'
+    id_column = 'institution_id'
+    columns = ['institution_id', 'institution_name', 'city_id', 'institution_type',
+               'establishment_year', 'total_students', 'average_course_fee', 'placement_rate',
+               'accreditation_status']
+    rules = ['city_id', 'tier', 'institution_type', 'institution_name', 'establishment_year',
+             'total_students', 'average_course_fee', 'placement_rate', 'accreditation_status']
+    dependencies = {
+        'tier': ['city_id'],
+        'institution_name': ['city_id', 'institution_type'],
+        'establishment_year': ['tier'],
+        'total_students': ['tier'],
+        'average_course_fee': ['tier'],
+        'placement_rate': ['tier'],
+        'accreditation_status': ['tier'],
+    }
+
+    TIER_WEIGHTS = {'Tier1': 0.5, 'Tier2': 0.3, 'Tier3': 0.2}
+    INSTITUTION_TYPES = ['University', 'College', 'Institute', 'Academy']
+    PREFIXES = ['National', 'Indian', 'Government', 'State', 'Regional', 'Central']
+    SPECIALIZATIONS = ['Engineering', 'Medical', 'Management', 'Arts & Science', 'Technology', 'Commerce', 'Law']
+    TIER_PROFILES = {
+        'Tier1': {'total_students': (8000, 30000), 'average_course_fee': (250000, 1000000),
+                  'placement_rate': (75, 95), 'establishment_year': (1950, 2010)},
+        'Tier2': {'total_students': (3000, 15000), 'average_course_fee': (150000, 500000),
+                  'placement_rate': (60, 85), 'establishment_year': (1960, 2015)},
+        'Tier3': {'total_students': (800, 8000), 'average_course_fee': (75000, 300000),
+                  'placement_rate': (40, 75), 'establishment_year': (1970, 2020)},
+    }
+    ACCREDITATIONS = ['NAAC A+', 'NAAC A', 'NAAC B+', 'NAAC B', 'NBA Accredited', 'UGC Recognized']
+    TIER1_ACCREDITATION_WEIGHTS = [15, 25, 20, 15, 15, 10]
+    OTHER_ACCREDITATION_WEIGHTS = [5, 15, 25, 20, 15, 20]
+
+    def __init__(self, num_rows: int = 350000, cities: pd.DataFrame = None, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.cities = cities
+
+    def _tier_bounds(self, values, column):
+        return self._by_group(values['tier'], {tier: profile[column]
+                                               for tier, profile in self.TIER_PROFILES.items()})
+
+    def _column_city_id(self, values):
+        weights = self.cities['tier_classification'].map(self.TIER_WEIGHTS).to_numpy()
+        return weighted_choice(self._uniform('city_id', values), self.cities['city_id'].to_numpy(), weights)
+
+    def _column_tier(self, values):
+        tiers = self.cities.set_index('city_id')['tier_classification']
+        return tiers.reindex(values['city_id']).to_numpy()
+
+    def _column_institution_type(self, values):
+        return weighted_choice(self._uniform('institution_type', values), self.INSTITUTION_TYPES)
+
+    def _column_institution_name(self, values):
+        u_prefix, u_specialization = self._uniform('institution_name', values, lanes=2)
+        city_names = self.cities.set_index('city_id')['city_name'].reindex(values['city_id'])
+        return (pd.Series(weighted_choice(u_prefix, self.PREFIXES)) + ' ' +
+                pd.Series(weighted_choice(u_specialization, self.SPECIALIZATIONS)) + ' ' +
+                pd.Series(values['institution_type']) + ', ' + city_names.to_numpy()).to_numpy()
+
+    def _column_establishment_year(self, values):
+        low, high = self._tier_bounds(values, 'establishment_year')
+        return integers_between(self._uniform('establishment_year', values), low, high)
+
+    def _column_total_students(self, values):
+        low, high = self._tier_bounds(values, 'total_students')
+        return integers_between(self._uniform('total_students', values), low, high)
+
+    def _column_average_course_fee(self, values):
+        low, high = self._tier_bounds(values, 'average_course_fee')
+        return np.round(uniform_between(self._uniform('average_course_fee', values), low, high), 2)
+
+    def _column_placement_rate(self, values):
+        u_rate, u_missing = self._uniform('placement_rate', values, lanes=2)
+        low, high = self._tier_bounds(values, 'placement_rate')
+        return np.where(u_missing > 0.05, np.round(uniform_between(u_rate, low, high), 2), np.nan)
+
+    def _column_accreditation_status(self, values):
+        u = self._uniform('accreditation_status', values)
+        return np.where(values['tier'] == 'Tier1',
+                        weighted_choice(u, self.ACCREDITATIONS, self.TIER1_ACCREDITATION_WEIGHTS),
+                        weighted_choice(u, self.ACCREDITATIONS, self.OTHER_ACCREDITATION_WEIGHTS))
+
+# ============================================================================
+# LOANS
+# ============================================================================
+
+class VirtualLoans(VirtualTable):
+    """Education loans; 60% of loans belong to single-loan customers, 25% to pairs, 15% to triples"""
+
+    table_name = 'loans'
+    id_column = 'loan_id'
+    columns = ['loan_id', 'customer_id', 'institution_id', 'loan_amount', 'loan_status',
+               'interest_rate', 'loan_tenure_months', 'application_date', 'disbursement_date',
+               'maturity_date', 'emi_amount', 'purpose_of_loan']
+    rules = ['customer_id', 'institution_id', 'loan_amount', 'cibil_score', 'interest_rate',
+             'loan_tenure_months', 'application_date', 'disbursement_date', 'maturity_date',
+             'emi_amount', 'loan_status', 'purpose_of_loan']
+    dependencies = {
+        'interest_rate': ['cibil_score'],
+        'disbursement_date': ['application_date'],
+        'maturity_date': ['disbursement_date', 'loan_tenure_months'],
+        'emi_amount': ['loan_amount', 'interest_rate', 'loan_tenure_months'],
+        'loan_status': ['cibil_score', 'disbursement_date', 'loan_tenure_months'],
+    }
+    parameters = {
+        'CIBIL_INTEREST_BANDS': ['interest_rate'],
+        'BASE_DEFAULT_PROBABILITY': ['loan_status'],
+        'CIBIL_DEFAULT_UPLIFT': ['loan_status'],
+        'OVERDUE_PROBABILITY': ['loan_status'],
+    }
+
+    LOANS_PER_CUSTOMER_SHARES = {1: 0.60, 2: 0.25, 3: 0.15}
+    CIBIL_INTEREST_BANDS = [(750, (8.5, 11.5)), (650, (10.5, 14.0)), (0, (12.5, 17.5))]
+    TENURES = [36, 48, 60, 72, 84, 96]
+    BASE_DEFAULT_PROBABILITY = 0.08
+    CIBIL_DEFAULT_UPLIFT = [(600, 0.15), (700, 0.08)]  # (CIBIL below, added default probability)
+    OVERDUE_PROBABILITY = 0.06
+    PURPOSES = ['Course Fees', 'Living Expenses', 'Course Fees + Living', 'Equipment & Books']
+    PURPOSE_WEIGHTS = [35, 15, 35, 15]
+
+    def __init__(self, num_rows: int = 400000, num_customers: int = 500000,
+                 num_institutions: int = 350000, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.num_customers = num_customers
+        self.num_institutions = num_institutions
+        self._customer_assignment = None
+
+    def _customer_ids(self):
+        """Customer for every loan, built once per table from the customer_id stream
+
+        Grouping loans by customer needs the whole column, so this is the one rule that
+        is computed for the full table (O(num_rows) integers) and then indexed.
+        """
+        if self._customer_assignment is None:
+            rng = column_generator(self.table_name, 'customer_id', self.seed)
+            assignments = []
+            remaining = self.num_rows
+            for loans_per_customer, share in self.LOANS_PER_CUSTOMER_SHARES.items():
+                group_rows = remaining if loans_per_customer == max(self.LOANS_PER_CUSTOMER_SHARES) \
+                    else int(share * self.num_rows)
+                remaining -= group_rows
+                customers = rng.integers(1, self.num_customers + 1, size=-(-group_rows // loans_per_customer))
+                assignments.append(np.repeat(customers, loans_per_customer)[:group_rows])
+            self._customer_assignment = rng.permutation(np.concatenate(assignments))
+        return self._customer_assignment
+
+    def _column_customer_id(self, values):
+        return self._customer_ids()[values[self.id_column] - 1]
+
+    def _column_institution_id(self, values):
+        return integers_between(self._uniform('institution_id', values), 1, self.num_institutions)
+
+    def _column_loan_amount(self, values):
+        u_course, u_living = self._uniform('loan_amount', values, lanes=2)
+        amount = uniform_between(u_course, 150000, 800000) + uniform_between(u_living, 50000, 250000)
+        return np.round(amount, 2)
+
+    def _column_cibil_score(self, values):
+        return integers_between(self._uniform('cibil_score', values), 300, 900)
+
+    def _column_interest_rate(self, values):
+        cibil_score = values['cibil_score']
+        conditions = [cibil_score >= floor for floor, _ in self.CIBIL_INTEREST_BANDS]
+        low = np.select(conditions, [band[0] for _, band in self.CIBIL_INTEREST_BANDS])
+        high = np.select(conditions, [band[1] for _, band in self.CIBIL_INTEREST_BANDS])
+        return np.round(uniform_between(self._uniform('interest_rate', values), low, high), 2)
+
+    def _column_loan_tenure_months(self, values):
+        return weighted_choice(self._uniform('loan_tenure_months', values), self.TENURES)
+
+    def _column_application_date(self, values):
+        return self._days_ago(integers_between(self._uniform('application_date', values), 60, 1460))
+
+    def _column_disbursement_date(self, values):
+        days = integers_between(self._uniform('disbursement_date', values), 7, 45)
+        return values['application_date'] + days.astype('timedelta64[D]')
+
+    def _column_maturity_date(self, values):
+        return values['disbursement_date'] + (values['loan_tenure_months'] * 30).astype('timedelta64[D]')
+
+    def _column_emi_amount(self, values):
+        monthly_rate = values['interest_rate'] / 100 / 12
+        growth = (1 + monthly_rate) ** values['loan_tenure_months']
+        emi = values['loan_amount'] * monthly_rate * growth / (growth - 1)
+        return np.round(emi, 2)
+
+    def _column_loan_status(self, values):
+        cibil_score = values['cibil_score']
+        default_prob = np.full(len(cibil_score), self.BASE_DEFAULT_PROBABILITY)
+        default_prob += np.select([cibil_score < below for below, _ in self.CIBIL_DEFAULT_UPLIFT],
+                                  [uplift for _, uplift in self.CIBIL_DEFAULT_UPLIFT], default=0)
+        days_since = (self.as_of - values['disbursement_date']).astype('timedelta64[D]').astype(np.int64)
+        months_since = np.maximum(1, days_since // 30)
+
+        u = self._uniform('loan_status', values)
+        return np.select([u < default_prob,
+                          u < default_prob + self.OVERDUE_PROBABILITY,
+                          months_since >= values['loan_tenure_months']],
+                         ['Defaulted', 'Overdue', 'Closed'], default='Active')
+
+    def _column_purpose_of_loan(self, values):
+        return weighted_choice(self._uniform('purpose_of_loan', values), self.PURPOSES, self.PURPOSE_WEIGHTS)
+
+# ============================================================================
+# PAYMENTS
+# ============================================================================
+
+class VirtualPayments(VirtualTable):
+    """EMI payments against loans; 92% succeed, 5% are partial"""
+
+    table_name = 'payments'
+    id_column = 'payment_id'
+    columns = ['payment_id', 'loan_id', 'payment_date', 'payment_amount', 'payment_method',
+               'payment_status', 'late_fee', 'principal_component', 'interest_component',
+               'outstanding_balance']
+    rules = ['loan_id', 'payment_date', 'payment_amount', 'payment_method', 'payment_status',
+             'interest_component', 'principal_component', 'outstanding_balance', 'late_fee']
+    dependencies = {
+        'interest_component': ['payment_status', 'payment_amount'],
+        'principal_component': ['payment_status', 'payment_amount', 'interest_component'],
+        'outstanding_balance': ['payment_status'],
+        'late_fee': ['payment_status'],
+    }
+
+    parameters = {'METHOD_WEIGHTS': ['payment_method']}
+
+    PAYMENT_METHODS = ['UPI', 'Net Banking', 'Debit Card', 'Credit Card', 'Cheque', 'NEFT']
+    METHOD_WEIGHTS = [40, 25, 15, 8, 7, 5]
+
+    def __init__(self, num_rows: int = 350000, num_loans: int = 400000, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.num_loans = num_loans
+
+    def _column_loan_id(self, values):
+        return integers_between(self._uniform('loan_id', values), 1, self.num_loans)
+
+    def _column_payment_date(self, values):
+        return self._days_ago(integers_between(self._uniform('payment_date', values), 1, 730))
+
+    def _column_payment_amount(self, values):
+        u_emi, u_partial, u_share, u_jitter = self._uniform('payment_amount', values, lanes=4)
+        base_emi = uniform_between(u_emi, 5000, 50000)
+        amount = np.where(u_partial < 0.05,
+                          base_emi * uniform_between(u_share, 0.3, 0.8),
+                          base_emi + uniform_between(u_jitter, -500, 500))
+        return np.round(np.maximum(1000, amount), 2)
+
+    def _column_payment_method(self, values):
+        return weighted_choice(self._uniform('payment_method', values),
+                               self.PAYMENT_METHODS, self.METHOD_WEIGHTS)
+
+    def _column_payment_status(self, values):
+        u_success, u_failure = self._uniform('payment_status', values, lanes=2)
+        return np.where(u_success < 0.92, 'Success', weighted_choice(u_failure, ['Failed', 'Pending']))
+
+    def _column_interest_component(self, values):
+        share = uniform_between(self._uniform('interest_component', values), 0.3, 0.7)
+        interest = np.where(values['payment_status'] == 'Success', values['payment_amount'] * share, 0)
+        return np.round(interest, 2)
+
+    def _column_principal_component(self, values):
+        principal = values['payment_amount'] - values['interest_component']
+        return np.round(np.where(values['payment_status'] == 'Success', principal, 0), 2)
+
+    def _column_outstanding_balance(self, values):
+        u = self._uniform('outstanding_balance', values)
+        balance = np.where(values['payment_status'] == 'Success',
+                           uniform_between(u, 50000, 500000),
+                           uniform_between(u, 100000, 600000))
+        return np.round(balance, 2)
+
+    def _column_late_fee(self, values):
+        u_late, u_fee = self._uniform('late_fee', values, lanes=2)
+        is_late = (values['payment_status'] == 'Success') & (u_late < 0.08)
+        return np.round(np.where(is_late, uniform_between(u_fee, 0, 1000), 0), 2)
+
+# ============================================================================
+# DEFAULTS_COLLECTIONS
+# ============================================================================
+
+class VirtualDefaultsCollections(VirtualTable):
+    """Defaulted loans and their collection follow-up"""
+
+    table_name = 'defaults_collections'
+    id_column = 'default_id'
+    columns = ['default_id', 'customer_id', 'loan_id', 'default_date', 'default_amount',
+               'days_overdue', 'collection_status', 'last_contact_date', 'contact_attempts',
+               'legal_notice_sent', 'recovery_amount', 'collection_agent_id']
+    rules = ['customer_id', 'loan_id', 'days_overdue', 'default_date', 'default_amount',
+             'collection_status', 'contact_attempts', 'last_contact_date', 'legal_notice_sent',
+             'recovery_amount', 'collection_agent_id']
+    dependencies = {
+        'default_date': ['days_overdue'],
+        'collection_status': ['days_overdue'],
+        'last_contact_date': ['days_overdue'],
+        'legal_notice_sent': ['collection_status', 'days_overdue'],
+        'recovery_amount': ['collection_status', 'default_amount'],
+    }
+    parameters = {'STATUS_BUCKETS': ['collection_status'], 'RECOVERY_RATES': ['recovery_amount']}
+
+    # Status mix by days overdue: (minimum days overdue, statuses, weights)
+    STATUS_BUCKETS = [
+        (730, ['Written Off', 'Legal Action', 'Settled'], [50, 30, 20]),
+        (365, ['Legal Action', 'Active', 'Written Off'], [40, 35, 25]),
+        (180, ['Active', 'Legal Action'], [60, 40]),
+    ]
+    RECOVERY_RATES = {
+        'Settled': (0.4, 0.9),
+        'Active': (0.0, 0.5),
+        'Legal Action': (0.1, 0.6),
+        'Written Off': (0.0, 0.3)
+    }
+
+    def __init__(self, num_rows: int = 350000, num_customers: int = 500000,
+                 num_loans: int = 400000, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.num_customers = num_customers
+        self.num_loans = num_loans
+
+    def _column_customer_id(self, values):
+        return integers_between(self._uniform('customer_id', values), 1, self.num_customers)
+
+    def _column_loan_id(self, values):
+        return integers_between(self._uniform('loan_id', values), 1, self.num_loans)
+
+    def _column_days_overdue(self, values):
+        return integers_between(self._uniform('default_date', values), 30, 1095)
+
+    def _column_default_date(self, values):
+        return self._days_ago(values['days_overdue'])
+
+    def _column_default_amount(self, values):
+        return np.round(uniform_between(self._uniform('default_amount', values), 100000, 800000), 2)
+
+    def _column_collection_status(self, values):
+        u = self._uniform('collection_status', values)
+        days_overdue = values['days_overdue']
+        conditions = [days_overdue > min_days for min_days, _, _ in self.STATUS_BUCKETS]
+        choices = [weighted_choice(u, statuses, weights) for _, statuses, weights in self.STATUS_BUCKETS]
+        return np.select(conditions, choices, default='Active')
+
+    def _column_contact_attempts(self, values):
+        return integers_between(self._uniform('contact_attempts', values), 5, 50)
+
+    def _column_last_contact_date(self, values):
+        high = np.minimum(values['days_overdue'], 90)
+        return self._days_ago(integers_between(self._uniform('last_contact_date', values), 1, high))
+
+    def _column_legal_notice_sent(self, values):
+        escalated = np.isin(values['collection_status'], ['Legal Action', 'Written Off'])
+        notice_sent = (values['days_overdue'] > 180) & (self._uniform('legal_notice_sent', values) < 0.4)
+        return escalated | notice_sent
+
+    def _column_recovery_amount(self, values):
+        low, high = self._by_group(values['collection_status'], self.RECOVERY_RATES)
+        rate = uniform_between(self._uniform('recovery_amount', values), low, high)
+        return np.round(values['default_amount'] * rate, 2)
+
+    def _column_collection_agent_id(self, values):
+        return integers_between(self._uniform('collection_agent_id', values), 1, 100)
+
+# ============================================================================
+# GEOGRAPHIC_DEMOGRAPHICS
+# ============================================================================
+
+class VirtualGeographicDemographics(VirtualTable):
+    """City-level demographic snapshots with tier-dependent ranges"""
+
+    table_name = 'geographic_demographics'
+    id_column = 'geo_id'
+    columns = ['geo_id', 'city_id', 'population_total', 'population_18_35',
+               'higher_education_enrollment', 'average_household_income', 'unemployment_rate',
+               'literacy_rate', 'number_of_colleges']
+    rules = ['city_id', 'tier', 'population_total', 'population_18_35',
+             'higher_education_enrollment', 'average_household_income', 'unemployment_rate',
+             'literacy_rate', 'number_of_colleges']
+    dependencies = {
+        'population_total': ['tier'],
+        'population_18_35': ['population_total'],
+        'higher_education_enrollment': ['population_18_35'],
+        'average_household_income': ['tier'],
+        'unemployment_rate': ['tier'],
+        'literacy_rate': ['tier'],
+        'number_of_colleges': ['tier'],
+    }
+
+    TIER_PROFILES = {
+        'Tier1': {'population_total': (2000000, 15000000), 'average_household_income': (900000, 1800000),
+                  'unemployment_rate': (2.5, 5.5), 'literacy_rate': (85.0, 96.0),
+                  'number_of_colleges': (60, 200)},
+        'Tier2': {'population_total': (400000, 4000000), 'average_household_income': (550000, 1100000),
+                  'unemployment_rate': (3.5, 7.5), 'literacy_rate': (75.0, 90.0),
+                  'number_of_colleges': (25, 80)},
+        'Tier3': {'population_total': (80000, 1200000), 'average_household_income': (350000, 750000),
+                  'unemployment_rate': (4.5, 12.0), 'literacy_rate': (65.0, 82.0),
+                  'number_of_colleges': (8, 35)},
+    }
+
+    def __init__(self, num_rows: int = 350000, num_cities: int = 252, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.num_cities = num_cities
+
+    def _tier_bounds(self, values, column):
+        return self._by_group(values['tier'], {tier: profile[column]
+                                               for tier, profile in self.TIER_PROFILES.items()})
+
+    def _column_city_id(self, values):
+        return integers_between(self._uniform('city_id', values), 1, self.num_cities)
+
+    def _column_tier(self, values):
+        return weighted_choice(self._uniform('tier', values), list(self.TIER_PROFILES))
+
+    def _column_population_total(self, values):
+        low, high = self._tier_bounds(values, 'population_total')
+        return integers_between(self._uniform('population_total', values), low, high)
+
+    def _column_population_18_35(self, values):
+        share = uniform_between(self._uniform('population_18_35', values), 0.24, 0.36)
+        return (values['population_total'] * share).astype(np.int64)
+
+    def _column_higher_education_enrollment(self, values):
+        share = uniform_between(self._uniform('higher_education_enrollment', values), 0.12, 0.28)
+        return (values['population_18_35'] * share).astype(np.int64)
+
+    def _column_average_household_income(self, values):
+        low, high = self._tier_bounds(values, 'average_household_income')
+        return np.round(uniform_between(self._uniform('average_household_income', values), low, high), 2)
+
+    def _column_unemployment_rate(self, values):
+        low, high = self._tier_bounds(values, 'unemployment_rate')
+        return np.round(uniform_between(self._uniform('unemployment_rate', values), low, high), 2)
+
+    def _column_literacy_rate(self, values):
+        low, high = self._tier_bounds(values, 'literacy_rate')
+        return np.round(uniform_between(self._uniform('literacy_rate', values), low, high), 2)
+
+    def _column_number_of_colleges(self, values):
+        low, high = self._tier_bounds(values, 'number_of_colleges')
+        return integers_between(self._uniform('number_of_colleges', values), low, high)
+
+# ============================================================================
+# ECONOMIC_INDICATORS
+# ============================================================================
+
+class VirtualEconomicIndicators(VirtualTable):
+    """Quarterly state-level macro indicators, with the COVID-19 dip in 2020/2021"""
+
+    table_name = 'economic_indicators'
+    id_column = 'indicator_id'
+    columns = ['indicator_id', 'state_id', 'quarter', 'gdp_growth_rate', 'inflation_rate',
+               'unemployment_rate', 'education_spending_percent', 'per_capita_income',
+               'literacy_rate']
+    rules = ['state_id', 'year', 'quarter', 'region', 'gdp_growth_rate', 'inflation_rate',
+             'unemployment_rate', 'education_spending_percent', 'per_capita_income',
+             'literacy_rate']
+    dependencies = {
+        'quarter': ['year'],
+        'gdp_growth_rate': ['region', 'year'],
+        'inflation_rate': ['region', 'year'],
+        'unemployment_rate': ['region', 'year'],
+        'education_spending_percent': ['region', 'year'],
+        'per_capita_income': ['region', 'year'],
+        'literacy_rate': ['region', 'year'],
+    }
+    parameters = {
+        'REGION_PROFILES': ['gdp_growth_rate', 'inflation_rate', 'unemployment_rate',
+                            'education_spending_percent', 'per_capita_income', 'literacy_rate'],
+        'COVID_IMPACT': [],  # Resolved from the impacted columns, see parameter_rules
+    }
+
+    YEARS = list(range(2019, 2025))
+    QUARTERS = ['Q1', 'Q2', 'Q3', 'Q4']
+    REGIONS = ['North', 'South', 'East', 'West', 'Central', 'Northeast']
+    REGION_PROFILES = {
+        'West/South': {'gdp_growth_rate': (6.5, 9.5), 'inflation_rate': (3.0, 6.2),
+                       'unemployment_rate': (2.0, 5.5), 'per_capita_income': (220000, 450000),
+                       'education_spending_percent': (4.2, 7.5), 'literacy_rate': (82.0, 96.0)},
+        'North': {'gdp_growth_rate': (5.5, 8.0), 'inflation_rate': (3.2, 6.8),
+                  'unemployment_rate': (2.8, 6.5), 'per_capita_income': (190000, 350000),
+                  'education_spending_percent': (3.8, 6.2), 'literacy_rate': (76.0, 92.0)},
+        'Other': {'gdp_growth_rate': (3.5, 7.0), 'inflation_rate': (3.8, 7.8),
+                  'unemployment_rate': (3.5, 11.0), 'per_capita_income': (130000, 280000),
+                  'education_spending_percent': (2.8, 5.5), 'literacy_rate': (62.0, 85.0)},
+    }
+    # COVID-19 impact: {year: {column: (low multiplier, high multiplier)}}
+    COVID_IMPACT = {
+        2020: {'gdp_growth_rate': (0.4, 0.7), 'unemployment_rate': (1.3, 1.6)},
+        2021: {'gdp_growth_rate': (0.7, 0.9), 'unemployment_rate': (1.1, 1.3)},
+    }
+
+    def __init__(self, num_rows: int = 350000, num_states: int = 28, **kwargs):
+        super().__init__(num_rows, **kwargs)
+        self.num_states = num_states
+
+    def parameter_rules(self, name: str):
+        if name != 'COVID_IMPACT':
+            return super().parameter_rules(name)
+        impacts = list(type(self).COVID_IMPACT.values()) + list(self.COVID_IMPACT.values())
+        return sorted({column for impact in impacts for column in impact})
+
+    def _region_value(self, values, column):
+        """Region-profile draw for a column, with the COVID multiplier applied where relevant"""
+        u_value, u_impact = self._uniform(column, values, lanes=2)
+        low, high = self._by_group(values['region'], {region: profile[column]
+                                                      for region, profile in self.REGION_PROFILES.items()})
+        value = uniform_between(u_value, low, high)
+        for year, impact in self.COVID_IMPACT.items():
+            if column in impact:
+                multiplier = uniform_between(u_impact, *impact[column])
+                value = np.where(values['year'] == year, value * multiplier, value)
+        return np.round(value, 2)
+
+    def _column_state_id(self, values):
+        return integers_between(self._uniform('state_id', values), 1, self.num_states)
+
+    def _column_year(self, values):
+        return weighted_choice(self._uniform('year', values), self.YEARS)
+
+    def _column_quarter(self, values):
+        quarter = weighted_choice(self._uniform('quarter', values), self.QUARTERS)
+        return np.char.add(np.char.add(values['year'].astype(str), '-'), quarter)
+
+    def _column_region(self, values):
+        region = weighted_choice(self._uniform('region', values), self.REGIONS)
+        return np.select([np.isin(region, ['West', 'South']), region == 'North'],
+                         ['West/South', 'North'], default='Other')
+
+    def _column_gdp_growth_rate(self, values):
+        return self._region_value(values, 'gdp_growth_rate')
+
+    def _column_inflation_rate(self, values):
+        return self._region_value(values, 'inflation_rate')
+
+    def _column_unemployment_rate(self, values):
+        return self._region_value(values, 'unemployment_rate')
+
+    def _column_education_spending_percent(self, values):
+        return self._region_value(values, 'education_spending_percent')
+
+    def _column_per_capita_income(self, values):
+        return self._region_value(values, 'per_capita_income')
+
+    def _column_literacy_rate(self, values):
+        return self._region_value(values, 'literacy_rate')
+
+# ============================================================================
+# REGISTRY
+# ============================================================================
+
+VIRTUAL_TABLES = {
+    'customers': VirtualCustomers,
+    'institutions': VirtualInstitutions,
+    'loans': VirtualLoans,
+    'payments': VirtualPayments,
+    'defaults_collections': VirtualDefaultsCollections,
+    'geographic_demographics': VirtualGeographicDemographics,
+    'economic_indicators': VirtualEconomicIndicators,
+}
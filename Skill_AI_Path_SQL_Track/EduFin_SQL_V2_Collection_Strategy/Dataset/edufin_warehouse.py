@@ -0,0 +1,447 @@
+"""
+Local EduFin Warehouse Builder
+Bulk-loads the nine EduFin tables into a DuckDB or SQLite file, so the SQL challenges run
+without SQL Server or Databricks
+- DDL comes from dataset_schemas, with primary keys, foreign keys and indexes on the join columns
+- DuckDB ingests Arrow batches directly into unconstrained tables; SQLite uses executemany inside
+  one transaction with journaling and syncing switched off for the load. Both check keys and
+  foreign keys once after the load instead of on every insert
+- Secondary indexes are built once the data is in, instead of being maintained row by row
+- A statistics catalog (<out>.stats.json) is collected from the same batches; SQLite's
+  sqlite_stat1 is filled from it instead of an ANALYZE scan
+- A run manifest (<out>.manifest.json) records the settings and chunked table fingerprints, so
+  two builds can be diffed without reopening either warehouse (see dataset_fingerprint)
+- Sources: the checked-in EduFin_Dataset/ CSVs, or the virtual tables at any scale
+  (scale 1 = the 5-lakh Databricks generator's row counts)
+
+Usage:
+    python edufin_warehouse.py --engine duckdb --out edufin.duckdb
+    python edufin_warehouse.py --engine sqlite --scale 1 --as-of 2025-01-01 --out edufin_500k.sqlite
+    python edufin_warehouse.py --engine sqlite --indexes physical_design/sqlite_indexes.json
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+try:
+    import duckdb
+except ImportError:  # SQLite from the standard library is always available
+    duckdb = None
+
+import dataset_schemas
+import edufin_rng
+import edufin_virtual_tables
+from dataset_cache import code_version
+from dataset_fingerprint import DatasetFingerprint, save_manifest
+from dataset_loader import load_edufin
+from dataset_stats import StatsCatalog, write_sqlite_stat1
+from dataset_schemas import EDUFIN_SCHEMAS
+from edufin_rng import DEFAULT_SEED
+from edufin_scenarios import TABLE_ROWS
+from edufin_virtual_tables import DEFAULT_AS_OF, VIRTUAL_TABLES
+
+TABLE_ORDER = list(EDUFIN_SCHEMAS)  # Parents before children
+PRIMARY_KEYS = {table: next(iter(schema)) for table, schema in EDUFIN_SCHEMAS.items()}
+
+# Table -> [(column, referenced table)]; the referenced column is that table's primary key
+FOREIGN_KEYS = {
+    'dim_city': [('state_id', 'dim_state')],
+    'customers': [('city_id', 'dim_city')],
+    'institutions': [('city_id', 'dim_city')],
+    'loans': [('customer_id', 'customers'), ('institution_id', 'institutions')],
+    'payments': [('loan_id', 'loans')],
+    'defaults_collections': [('customer_id', 'customers'), ('loan_id', 'loans')],
+    'geographic_demographics': [('city_id', 'dim_city')],
+    'economic_indicators': [('state_id', 'dim_state')],
+}
+
+# Secondary indexes: every foreign key, since the challenge queries join along all of them
+INDEXES = {table: [column for column, _ in references] for table, references in FOREIGN_KEYS.items()}
+
+SQL_TYPES = {
+    'duckdb': {
+        'int8': 'TINYINT', 'int16': 'SMALLINT', 'int32': 'INTEGER', 'int64': 'BIGINT',
+        'float64': 'DOUBLE', 'bool': 'BOOLEAN', 'string': 'VARCHAR', 'category': 'VARCHAR',
+        'date': 'DATE', 'datetime': 'TIMESTAMP',
+    },
+    'sqlite': {
+        'int8': 'INTEGER', 'int16': 'INTEGER', 'int32': 'INTEGER', 'int64': 'INTEGER',
+        'float64': 'REAL', 'bool': 'INTEGER', 'string': 'TEXT', 'category': 'TEXT',
+        'date': 'TEXT', 'datetime': 'TEXT',  # ISO-8601 text works with SQLite's date functions
+    },
+    'sqlserver': {  # DDL only: the Databricks/SQL Server deployments, not a local engine
+        'int8': 'SMALLINT', 'int16': 'SMALLINT', 'int32': 'INT', 'int64': 'BIGINT',  # TINYINT is unsigned
+        'float64': 'FLOAT', 'bool': 'BIT', 'string': 'NVARCHAR(255)', 'category': 'NVARCHAR(100)',
+        'date': 'DATE', 'datetime': 'DATETIME2(0)',
+    },
+}
+
+ARROW_TYPES = {
+    'int8': pa.int8(), 'int16': pa.int16(), 'int32': pa.int32(), 'int64': pa.int64(),
+    'float64': pa.float64(), 'bool': pa.bool_(), 'string': pa.string(), 'category': pa.string(),
+    'date': pa.date32(), 'datetime': pa.timestamp('s'),
+}
+
+# Load-time pragmas: no rollback journal or fsync while the file is being built from scratch
+SQLITE_LOAD_PRAGMAS = [
+    'PRAGMA page_size = 65536',
+    'PRAGMA journal_mode = OFF',
+    'PRAGMA synchronous = OFF',
+    'PRAGMA locking_mode = EXCLUSIVE',
+    'PRAGMA temp_store = MEMORY',
+    'PRAGMA cache_size = -262144',  # 256 MB
+    'PRAGMA foreign_keys = OFF',  # Checked once with foreign_key_check after the load
+]
+
+CUSTOMER_ROWS = 500000
+OTHER_TABLE_ROWS = 350000
+BATCH_SIZE = 250000
+
+# ============================================================================
+# DDL
+# ============================================================================
+
+def create_table_sql(table: str, engine: str, constraints: bool = True):
+    """CREATE TABLE with column types, primary key and foreign keys for one EduFin table"""
+    types = SQL_TYPES[engine]
+    primary_key = PRIMARY_KEYS[table] if constraints else None
+    lines = [f"    {column} {types[dtype]}" + (" PRIMARY KEY" if column == primary_key else "")
+             for column, dtype in EDUFIN_SCHEMAS[table].items()]
+    lines += [f"    FOREIGN KEY ({column}) REFERENCES {parent} ({PRIMARY_KEYS[parent]})"
+              for column, parent in (FOREIGN_KEYS.get(table, []) if constraints else [])]
+    return f"CREATE TABLE {table} (\n" + ",\n".join(lines) + "\n)"
+
+def index_name(table: str, columns):
+    return f"ix_{table}_{'_'.join([columns] if isinstance(columns, str) else columns)}"
+
+def create_index_sql(table: str, columns):
+    """CREATE INDEX on one column or a list of columns (the same statement for DuckDB and SQLite)"""
+    columns = [columns] if isinstance(columns, str) else list(columns)
+    return f"CREATE INDEX {index_name(table, columns)} ON {table} ({', '.join(columns)})"
+
+def warehouse_ddl(engine: str, indexes: dict = None):
+    """Every CREATE TABLE followed by every CREATE INDEX, in load order"""
+    indexes = INDEXES if indexes is None else indexes
+    return ([create_table_sql(table, engine) for table in TABLE_ORDER]
+            + [create_index_sql(table, columns) for table in TABLE_ORDER for columns in indexes.get(table, [])])
+
+# ============================================================================
+# SOURCES
+# ============================================================================
+
+def typed_batch(table: str, batch):
+    """Arrow table with exactly the schema's columns and types, from a DataFrame or Arrow table"""
+    if not isinstance(batch, pa.Table):
+        batch = pa.Table.from_pandas(batch, preserve_index=False)
+    columns = []
+    for column, dtype in EDUFIN_SCHEMAS[table].items():
+        values = batch[column]
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+        text = pa.types.is_string(values.type) or pa.types.is_large_string(values.type)
+        if text and pa.types.is_integer(ARROW_TYPES[dtype]):
+            values = pc.replace_substring_regex(values, r'\D', '')  # '+91 98765 43210' -> 919876543210
+        columns.append(values.cast(ARROW_TYPES[dtype]))
+    return pa.table(columns, names=list(EDUFIN_SCHEMAS[table]))
+
+def checked_in_source():
+    """(table, Arrow batch) for every table in EduFin_Dataset/"""
+    for table in TABLE_ORDER:
+        yield table, typed_batch(table, load_edufin(table, as_arrow=True))
+
+def virtual_tables(scale: float = 1.0, seed: int = DEFAULT_SEED, as_of=DEFAULT_AS_OF):
+    """{table: DataFrame or VirtualTable}: the checked-in states and cities, virtual tables for the rest
+    `as_of` is the date every relative date is counted back from"""
+    states, cities = load_edufin('dim_state'), load_edufin('dim_city')
+    customers = max(1, int(CUSTOMER_ROWS * scale))
+    others = max(1, int(OTHER_TABLE_ROWS * scale))
+    loans = max(1, int(TABLE_ROWS['loans'] * scale))
+    return {
+        'dim_state': states,
+        'dim_city': cities,
+        'customers': VIRTUAL_TABLES['customers'](customers, cities=cities, seed=seed, as_of=as_of),
+        'institutions': VIRTUAL_TABLES['institutions'](others, cities=cities, seed=seed, as_of=as_of),
+        'loans': VIRTUAL_TABLES['loans'](loans, num_customers=customers, num_institutions=others, seed=seed,
+                                         as_of=as_of),
+        'payments': VIRTUAL_TABLES['payments'](others, num_loans=loans, seed=seed, as_of=as_of),
+        'defaults_collections': VIRTUAL_TABLES['defaults_collections'](
+            others, num_customers=customers, num_loans=loans, seed=seed, as_of=as_of),
+        'geographic_demographics': VIRTUAL_TABLES['geographic_demographics'](
+            others, num_cities=len(cities), seed=seed, as_of=as_of),
+        'economic_indicators': VIRTUAL_TABLES['economic_indicators'](
+            others, num_states=len(states), seed=seed, as_of=as_of),
+    }
+
+def remap_geo_cities(batch: pd.DataFrame, cities: pd.DataFrame):
+    """Virtual geographic rows number cities 1..n; map them onto dim_city's ids"""
+    batch['city_id'] = cities['city_id'].to_numpy()[batch['city_id'].to_numpy() - 1]
+    return batch
+
+def virtual_source(scale: float = 1.0, seed: int = DEFAULT_SEED, batch_size: int = BATCH_SIZE, as_of=DEFAULT_AS_OF):
+    """(table, Arrow batch) pairs from the virtual tables, with the checked-in states and cities as dimensions"""
+    tables = virtual_tables(scale, seed, as_of)
+    yield 'dim_state', typed_batch('dim_state', tables['dim_state'])
+    yield 'dim_city', typed_batch('dim_city', tables['dim_city'])
+    for table in TABLE_ORDER[2:]:
+        columns = list(EDUFIN_SCHEMAS[table])
+        for start in range(0, len(tables[table]), batch_size):
+            batch = tables[table][start:start + batch_size, columns]
+            if table == 'geographic_demographics':
+                batch = remap_geo_cities(batch, tables['dim_city'])
+            yield table, typed_batch(table, batch)
+
+# ============================================================================
+# ENGINES
+# ============================================================================
+
+class Warehouse:
+    """Connection to a local warehouse file plus its bulk-load path"""
+    engine = None
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.connection = None
+
+    def execute(self, sql: str):
+        return self.connection.execute(sql)
+
+    def create_tables(self):
+        for table in TABLE_ORDER:
+            self.execute(create_table_sql(table, self.engine))
+
+    def create_indexes(self, indexes: dict = None):
+        indexes = INDEXES if indexes is None else indexes
+        for table in TABLE_ORDER:
+            for columns in indexes.get(table, []):
+                self.execute(create_index_sql(table, columns))
+
+    def analyze(self, catalog: StatsCatalog = None):
+        """Planner statistics once the indexes exist (DuckDB keeps its own while loading)"""
+
+    def row_count(self, table: str):
+        return self.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+class DuckDBWarehouse(Warehouse):
+    """DuckDB file loaded straight from Arrow into unconstrained tables; keys are checked after the load"""
+    engine = 'duckdb'
+
+    def open(self):
+        if duckdb is None:
+            raise ImportError("duckdb is not installed; use engine='sqlite' or `pip install duckdb`")
+        self.connection = duckdb.connect(str(self.path))
+        return self
+
+    def insert(self, table: str, batch: pa.Table):
+        self.connection.register('arrow_batch', batch)
+        self.execute(f"INSERT INTO {table} SELECT * FROM arrow_batch")
+        self.connection.unregister('arrow_batch')
+
+    def create_tables(self):
+        # DuckDB checks PRIMARY KEY / REFERENCES on every insert, which dominates the load
+        for table in TABLE_ORDER:
+            self.execute(create_table_sql(table, self.engine, constraints=False))
+
+    def check_keys(self):
+        """Raise on null or duplicate primary keys and on foreign keys without a parent row"""
+        for table in TABLE_ORDER:
+            key = PRIMARY_KEYS[table]
+            nulls, duplicates = self.execute(f"SELECT COUNT(*) - COUNT({key}), COUNT({key}) - COUNT(DISTINCT {key}) "
+                                             f"FROM {table}").fetchone()
+            if nulls or duplicates:
+                raise ValueError(f"{table}.{key}: {nulls:,} null and {duplicates:,} duplicate primary keys")
+            for column, parent in FOREIGN_KEYS.get(table, []):
+                violations, first = self.execute(
+                    f"SELECT COUNT(*), MIN(child.{column}) FROM {table} child ANTI JOIN {parent} "
+                    f"ON child.{column} = {parent}.{PRIMARY_KEYS[parent]} WHERE child.{column} IS NOT NULL"
+                ).fetchone()
+                if violations:
+                    raise ValueError(f"{violations:,} foreign key violations, first: "
+                                     f"{table}.{column} = {first} not in {parent}")
+
+    def finish(self):
+        self.check_keys()
+        for table in TABLE_ORDER:
+            self.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({PRIMARY_KEYS[table]})")
+        self.execute("CHECKPOINT")
+
+    def close(self):
+        self.connection.close()
+
+class SQLiteWarehouse(Warehouse):
+    """SQLite file loaded with executemany in a single transaction"""
+    engine = 'sqlite'
+
+    def open(self):
+        self.connection = sqlite3.connect(str(self.path), isolation_level=None)
+        for pragma in SQLITE_LOAD_PRAGMAS:
+            self.execute(pragma)
+        self.execute("BEGIN")
+        return self
+
+    def insert(self, table: str, batch: pa.Table):
+        columns = []
+        for values in batch.columns:
+            if pa.types.is_date(values.type) or pa.types.is_timestamp(values.type):
+                values = pc.strftime(values, format='%Y-%m-%d' if pa.types.is_date(values.type)
+                                     else '%Y-%m-%d %H:%M:%S')
+            elif pa.types.is_boolean(values.type):
+                values = values.cast(pa.int8())
+            columns.append(values.to_pylist())
+        placeholders = ', '.join('?' * batch.num_columns)
+        self.connection.executemany(f"INSERT INTO {table} VALUES ({placeholders})", zip(*columns))
+
+    def finish(self):
+        self.execute("COMMIT")
+        violations = self.execute("PRAGMA foreign_key_check").fetchall()
+        if violations:
+            raise ValueError(f"{len(violations):,} foreign key violations, first: {violations[0]}")
+
+    def analyze(self, catalog: StatsCatalog = None):
+        if catalog is None:
+            self.execute("ANALYZE")
+        else:
+            write_sqlite_stat1(self.connection, catalog)
+
+    def close(self):
+        self.connection.close()
+
+WAREHOUSE_ENGINES = {
+    'duckdb': DuckDBWarehouse,
+    'sqlite': SQLiteWarehouse,
+}
+
+def connect(path, engine: str = None):
+    """Read/write connection to an existing warehouse file; the engine defaults from the file suffix"""
+    engine = engine or ('sqlite' if Path(path).suffix in ('.sqlite', '.db', '.sqlite3') else 'duckdb')
+    if engine == 'sqlite':
+        connection = sqlite3.connect(str(path))
+        connection.execute('PRAGMA foreign_keys = ON')
+        return connection
+    if duckdb is None:
+        raise ImportError("duckdb is not installed; use a SQLite warehouse or `pip install duckdb`")
+    return duckdb.connect(str(path))
+
+# ============================================================================
+# BUILD
+# ============================================================================
+
+def stats_path(path):
+    """Statistics catalog written next to a warehouse file"""
+    path = Path(path)
+    return path.with_name(path.name + '.stats.json')
+
+def manifest_path(path):
+    """Run manifest (settings, row counts and fingerprints) written next to a warehouse file"""
+    path = Path(path)
+    return path.with_name(path.name + '.manifest.json')
+
+def build_warehouse(path, engine: str = 'duckdb', source=None, indexes: dict = None, verbose: bool = True,
+                    stats: bool = True, fingerprint: bool = True, settings: dict = None):
+    """Create a fresh warehouse file from (table, batch) pairs (default: the checked-in CSVs)
+
+    Returns {table: {'rows': n, 'seconds': s}} plus 'indexes', 'statistics' and 'fingerprints' entries.
+    `settings` (scale, seed, ...) are recorded in the run manifest.
+    """
+    path = Path(path)
+    if engine not in WAREHOUSE_ENGINES:
+        raise KeyError(f"Unknown engine '{engine}'; expected one of {sorted(WAREHOUSE_ENGINES)}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # The file is rebuilt from scratch
+    for stale in [path, path.with_name(path.name + '.wal'), stats_path(path), manifest_path(path)]:
+        stale.unlink(missing_ok=True)
+
+    warehouse = WAREHOUSE_ENGINES[engine](path).open()
+    warehouse.create_tables()
+    catalog = StatsCatalog() if stats else None
+    fingerprints = DatasetFingerprint(PRIMARY_KEYS) if fingerprint else None
+    timings = {'statistics': {'rows': 0, 'seconds': 0.0}, 'fingerprints': {'rows': 0, 'seconds': 0.0}}
+    try:
+        for table, batch in (checked_in_source() if source is None else source):
+            start_time = time.time()
+            warehouse.insert(table, batch)
+            entry = timings.setdefault(table, {'rows': 0, 'seconds': 0.0})
+            entry['rows'] += batch.num_rows
+            entry['seconds'] += time.time() - start_time
+            if catalog is not None:
+                start_time = time.time()
+                catalog.update(table, batch)
+                timings['statistics']['seconds'] += time.time() - start_time
+            if fingerprints is not None:
+                start_time = time.time()
+                fingerprints.update(table, batch)
+                timings['fingerprints']['seconds'] += time.time() - start_time
+
+        start_time = time.time()
+        warehouse.finish()
+        warehouse.create_indexes(indexes)
+        warehouse.analyze(catalog)
+        timings['indexes'] = {'rows': 0, 'seconds': time.time() - start_time}
+        if catalog is not None:
+            catalog.save(stats_path(path))
+        if fingerprints is not None:
+            save_manifest(manifest_path(path), fingerprints, engine=engine, **(settings or {}))
+        if verbose:
+            for table in TABLE_ORDER:
+                entry = timings.get(table, {'rows': 0, 'seconds': 0.0})
+                rate = entry['rows'] / entry['seconds'] if entry['seconds'] else 0
+                print(f"   {table:<25} {entry['rows']:>12,} rows {entry['seconds']:7.2f}s ({rate:,.0f} rows/s)")
+            print(f"   {'constraints + indexes':<25} {'':>12}      {timings['indexes']['seconds']:7.2f}s")
+            if catalog is not None:
+                print(f"   {'statistics catalog':<25} {'':>12}      {timings['statistics']['seconds']:7.2f}s "
+                      f"-> {stats_path(path).name}")
+            if fingerprints is not None:
+                print(f"   {'fingerprints':<25} {'':>12}      {timings['fingerprints']['seconds']:7.2f}s "
+                      f"-> {manifest_path(path).name}")
+    finally:
+        warehouse.close()
+    return timings
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Build a DuckDB or SQLite EduFin warehouse and report load speed"""
+    parser = argparse.ArgumentParser(description="Bulk-load the EduFin tables into a local DuckDB or SQLite file")
+    parser.add_argument('--engine', choices=list(WAREHOUSE_ENGINES), default='duckdb' if duckdb else 'sqlite')
+    parser.add_argument('--out', help="Warehouse file (default edufin.duckdb / edufin.sqlite)")
+    parser.add_argument('--scale', type=float, help="Load virtual tables at this scale instead of the checked-in CSVs")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    parser.add_argument('--indexes', help="JSON {table: [columns]} of secondary indexes, e.g. from physical_design.py")
+    parser.add_argument('--no-stats', action='store_true', help="Skip the <out>.stats.json statistics catalog")
+    parser.add_argument('--no-fingerprint', action='store_true', help="Skip the <out>.manifest.json fingerprints")
+    parser.add_argument('--ddl', action='store_true', help="Print the DDL and exit")
+    args = parser.parse_args()
+
+    indexes = json.loads(Path(args.indexes).read_text()) if args.indexes else None
+    if args.ddl:
+        print(';\n\n'.join(warehouse_ddl(args.engine, indexes)) + ';')
+        return
+
+    out = Path(args.out or f"edufin.{args.engine}")
+    source = virtual_source(args.scale, args.seed, args.batch_size, args.as_of) if args.scale else checked_in_source()
+    print("=" * 80)
+    print(f"EDUFIN WAREHOUSE ({args.engine.upper()})")
+    print("=" * 80)
+    start_time = time.time()
+    settings = {'source': 'virtual', 'scale': args.scale, 'seed': args.seed, 'as_of': args.as_of,
+                'batch_size': args.batch_size} if args.scale else {'source': 'checked_in'}
+    settings['code_version'] = code_version(edufin_rng, edufin_virtual_tables, dataset_schemas, __file__)
+    timings = build_warehouse(out, args.engine, source, indexes, stats=not args.no_stats,
+                              fingerprint=not args.no_fingerprint, settings=settings)
+    total_rows = sum(entry['rows'] for entry in timings.values())
+    print(f"\n✅ {total_rows:,} rows in {time.time() - start_time:.1f}s -> {out} "
+          f"({out.stat().st_size / 1024 ** 2:,.1f} MB)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,400 @@
+"""
+EduFin Physical Design
+Index and layout DDL for the EduFin schema, driven by the columns the SQL challenge queries
+join and filter on, with every index measured before it ships
+- Candidates: columns in join predicates (a.x = b.y) and filter predicates (col <op> literal)
+  of benchmark_queries/*.sql, resolved through each query's table aliases
+- Measurement: an index-free SQLite and/or DuckDB warehouse built from the virtual tables;
+  each candidate is created, the queries whose plan it changes are timed with and without it,
+  and the index is dropped. It is kept only when they get faster by enough to pay for it
+- Targets:
+    sqlserver  clustered columnstore on the fact tables, nonclustered B-tree indexes where the
+               SQLite (B-tree) measurement kept them
+    delta      OPTIMIZE ... ZORDER BY on the large tables' most used columns (data skipping,
+               not an index; cannot be measured locally)
+    duckdb     CREATE INDEX where the DuckDB measurement kept them
+    sqlite     CREATE INDEX where the SQLite measurement kept them
+
+Usage:
+    python physical_design.py --out physical_design
+    python physical_design.py --engines sqlite --scale 0.05 --out physical_design
+    python physical_design.py --no-measure --target delta
+"""
+
+import argparse
+import calendar
+import json
+import re
+import statistics
+import threading
+import time
+from collections import defaultdict
+from datetime import date, datetime
+from pathlib import Path
+
+from dataset_schemas import EDUFIN_SCHEMAS
+from edufin_rng import DEFAULT_SEED
+from edufin_warehouse import (PRIMARY_KEYS, TABLE_ORDER, build_warehouse, connect, create_table_sql,
+                              duckdb, index_name, virtual_source)
+from query_benchmark import WAREHOUSE_DIR, load_queries, rewrite_calls
+
+FACT_TABLES = ['loans', 'payments', 'defaults_collections']  # Clustered columnstore in SQL Server
+ZORDER_TABLES = ['customers', 'institutions'] + FACT_TABLES  # Big enough for file skipping to matter
+MAX_ZORDER_COLUMNS = 4  # Z-ordering dilutes quickly beyond 3-4 columns
+
+SQL_KEYWORDS = {'ON', 'WHERE', 'JOIN', 'LEFT', 'RIGHT', 'INNER', 'OUTER', 'FULL', 'CROSS', 'GROUP', 'ORDER',
+                'LIMIT', 'UNION', 'HAVING', 'USING', 'SELECT', 'AS', 'WITH'}
+TABLE_REFERENCE = re.compile(r'\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(\w+))?', re.I)
+PREDICATE = re.compile(r"\b(?:WHERE|AND|OR|ON)\s+\(?\s*(?:(\w+)\.)?(\w+)\s*"
+                       r"(=|<>|!=|<=|>=|<|>|\bNOT\s+IN\b|\bIN\b|\bBETWEEN\b|\bLIKE\b|\bIS\b)\s*"
+                       r"(?:(\w+)\.(\w+)\b(?!\s*\())?", re.I)
+
+DEFAULT_ENGINES = ['sqlite', 'duckdb']
+DESIGN_SCALE = 0.05  # ~130k rows: indexes show up clearly and each run stays under a few minutes
+REPEAT = 3
+QUERY_TIMEOUT_S = 5.0  # Slower runs count as the timeout, so an index that fixes one still scores
+MIN_SAVING_MS = 2.0  # An index must save at least this much across the queries that use it...
+MIN_SAVING_SHARE = 0.10  # ...and this share of their time without it
+
+# ============================================================================
+# QUERY ANALYSIS
+# ============================================================================
+
+def table_aliases(sql: str):
+    """{alias or table name: table} for every EduFin table in FROM/JOIN clauses"""
+    aliases = {}
+    for table, alias in TABLE_REFERENCE.findall(sql):
+        if table.lower() in EDUFIN_SCHEMAS:
+            aliases[table.lower()] = table.lower()
+            if alias and alias.upper() not in SQL_KEYWORDS:
+                aliases[alias.lower()] = table.lower()
+    return aliases
+
+def resolve_column(aliases: dict, qualifier: str, column: str):
+    """EduFin table of a (qualifier, column) reference, or None when it is a CTE column or ambiguous"""
+    column = column.lower()
+    if qualifier:
+        table = aliases.get(qualifier.lower())
+        return table if table and column in EDUFIN_SCHEMAS[table] else None
+    tables = {table for table in aliases.values() if column in EDUFIN_SCHEMAS[table]}
+    return tables.pop() if len(tables) == 1 else None
+
+def column_usage(sql: str):
+    """{(table, column, role)} for the join and filter predicates of one query"""
+    aliases = table_aliases(sql)
+    usage = set()
+    for qualifier, column, operator, right_qualifier, right_column in PREDICATE.findall(sql):
+        table = resolve_column(aliases, qualifier, column)
+        right_table = resolve_column(aliases, right_qualifier, right_column) if right_column else None
+        if operator == '=' and right_table:
+            usage.add((table, column.lower(), 'join'))
+            usage.add((right_table, right_column.lower(), 'join'))
+        elif not right_column:
+            usage.add((table, column.lower(), 'filter'))
+    return {entry for entry in usage if entry[0]}
+
+def index_candidates(queries: dict):
+    """{(table, column): {'join': n, 'filter': n, 'queries': [...]}} for non-key columns, most used first"""
+    candidates = defaultdict(lambda: {'join': 0, 'filter': 0, 'queries': []})
+    for name, sql in queries.items():
+        for table, column, role in sorted(column_usage(sql)):
+            if column == PRIMARY_KEYS[table]:
+                continue
+            entry = candidates[(table, column)]
+            entry[role] += 1
+            if name not in entry['queries']:
+                entry['queries'].append(name)
+    return dict(sorted(candidates.items(), key=lambda item: (-len(item[1]['queries']), item[0])))
+
+# ============================================================================
+# SQLITE STAND-IN
+# ============================================================================
+
+def as_datetime(value):
+    """SQLite stores dates as ISO text"""
+    return None if value is None else datetime.fromisoformat(str(value)[:19])
+
+def date_diff(part: str, start, end):
+    start, end = as_datetime(start), as_datetime(end)
+    if start is None or end is None:
+        return None
+    part = part.lower().rstrip('s')
+    months = (end.year - start.year) * 12 + end.month - start.month
+    return {
+        'day': (end.date() - start.date()).days,
+        'week': (end.date() - start.date()).days // 7,
+        'month': months,
+        'quarter': (end.year - start.year) * 4 + (end.month - 1) // 3 - (start.month - 1) // 3,
+        'year': end.year - start.year,
+        'hour': int((end - start).total_seconds() // 3600),
+    }[part]
+
+def date_part(part: str, value):
+    value = as_datetime(value)
+    if value is None:
+        return None
+    return {
+        'year': value.year, 'quarter': (value.month - 1) // 3 + 1, 'month': value.month, 'day': value.day,
+        'week': value.isocalendar()[1], 'dow': value.isoweekday() % 7, 'dayofweek': value.isoweekday() % 7,
+    }[part.lower()]
+
+class SampleStdDev:
+    """stddev_samp aggregate"""
+
+    def __init__(self):
+        self.values = []
+
+    def step(self, value):
+        if value is not None:
+            self.values.append(value)
+
+    def finalize(self):
+        return statistics.stdev(self.values) if len(self.values) > 1 else None
+
+def register_sqlite_functions(connection):
+    """The DuckDB functions the translated challenge queries use, as SQLite UDFs"""
+    functions = {
+        'date_diff': (3, date_diff),
+        'date_part': (2, date_part),
+        'year': (1, lambda value: date_part('year', value)),
+        'quarter': (1, lambda value: date_part('quarter', value)),
+        'month': (1, lambda value: date_part('month', value)),
+        'hour': (1, lambda value: value and as_datetime(value).hour),
+        'dayofweek': (1, lambda value: date_part('dow', value)),
+        'monthname': (1, lambda value: value and calendar.month_name[as_datetime(value).month]),
+        'dayname': (1, lambda value: value and calendar.day_name[as_datetime(value).weekday()]),
+        'make_date': (3, lambda year, month, day: date(int(year), int(month), int(day)).isoformat()),
+        'regexp_replace': (4, lambda text, pattern, replacement, flags: None if text is None
+                           else re.sub(pattern, replacement, str(text))),
+        'concat': (-1, lambda *parts: ''.join('' if part is None else str(part) for part in parts)),
+        'greatest': (-1, lambda *values: max((value for value in values if value is not None), default=None)),
+        'least': (-1, lambda *values: min((value for value in values if value is not None), default=None)),
+    }
+    for name, (arity, function) in functions.items():
+        connection.create_function(name, arity, function, deterministic=True)
+    connection.create_aggregate('stddev_samp', 1, SampleStdDev)
+    connection.create_aggregate('stddev', 1, SampleStdDev)
+
+def sqlite_interval(arguments):
+    """date_add(d, to_days(n)) -> datetime(d, '+n days'); None leaves other calls alone"""
+    match = re.fullmatch(r'to_(\w+?)s\s*\(\s*CAST\((.*)\s+AS\s+INTEGER\)\s*\)', arguments[1], re.S | re.I)
+    if not match:
+        return None
+    part, amount = match.groups()
+    if part == 'quarter':
+        part, amount = 'month', f"3 * ({amount})"
+    elif part == 'week':
+        part, amount = 'day', f"7 * ({amount})"
+    return f"date({arguments[0]}, printf('%+d {part}s', {amount}))"
+
+def to_sqlite(sql: str):
+    """Rewrite a translated (DuckDB) challenge query for SQLite plus register_sqlite_functions()"""
+    sql = re.sub(r'\blocaltimestamp\b', "datetime('now')", sql, flags=re.I)
+    sql = re.sub(r'\bcurrent_date\b', "date('now')", sql, flags=re.I)
+    sql = re.sub(r"\bDATE\s+('\d{4}-\d{2}-\d{2}')", r'\1', sql)
+    sql = re.sub(r"([\w.']+|\([^()]*\))\s*([-+])\s*INTERVAL\s+'(\d+)\s+(\w+?)s?'",
+                 lambda match: f"date({match[1]}, '{match[2]}{match[3]} {match[4]}s')", sql, flags=re.I)
+    sql = rewrite_calls(sql, 'date_add', sqlite_interval)
+    sql = rewrite_calls(sql, 'strftime', lambda arguments: f"strftime({arguments[1]}, {arguments[0]})")
+    sql = rewrite_calls(sql, 'CAST', lambda arguments: f"date({arguments[0][:-8].strip()})"
+                        if re.search(r'\s+AS\s+DATE$', arguments[0], re.I) else None)
+    sql = rewrite_calls(sql, 'format', lambda arguments: f"printf('%,.0f', {arguments[1]})"
+                        if '{:,' in arguments[0] else None)
+    return sql
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def stand_in(engine: str, scale: float, seed: int):
+    """Index-free warehouse of the virtual tables (primary keys only) and an open connection to it"""
+    path = WAREHOUSE_DIR / f"design_{scale:g}_{seed}.{engine}"
+    build_warehouse(path, engine, virtual_source(scale, seed), indexes={}, verbose=False)
+    connection = connect(path, engine)
+    if engine == 'sqlite':
+        register_sqlite_functions(connection)
+    return connection
+
+def best_time(connection, sql: str, repeat: int = REPEAT, timeout: float = QUERY_TIMEOUT_S):
+    """Fastest of `repeat` runs in ms, capped at the timeout (a watchdog interrupts slower runs)"""
+    best = timeout * 1000
+    for _ in range(repeat):
+        watchdog = threading.Timer(timeout, connection.interrupt)
+        watchdog.start()
+        start_time = time.perf_counter()
+        try:
+            connection.execute(sql).fetchall()
+        except Exception as error:
+            if 'interrupt' not in str(error).lower():
+                raise
+            return best
+        finally:
+            watchdog.cancel()
+        best = min(best, (time.perf_counter() - start_time) * 1000)
+    return best
+
+def query_plan(connection, engine: str, sql: str):
+    """EXPLAIN text of one query; an index that leaves it unchanged cannot change the query's time"""
+    explain = 'EXPLAIN QUERY PLAN ' if engine == 'sqlite' else 'EXPLAIN '
+    return '\n'.join(str(row) for row in connection.execute(explain + sql).fetchall())
+
+def measure_indexes(engine: str, candidates: dict, queries: dict, scale: float = DESIGN_SCALE,
+                    seed: int = DEFAULT_SEED, repeat: int = REPEAT, verbose: bool = True):
+    """Per candidate: build time, time of its queries without/with the index, and whether to keep it"""
+    connection = stand_in(engine, scale, seed)
+    statements = {name: to_sqlite(sql) if engine == 'sqlite' else sql for name, sql in queries.items()}
+    plans, skipped = {}, {}
+    for name, sql in statements.items():
+        try:
+            best_time(connection, sql, repeat=1)
+            plans[name] = query_plan(connection, engine, sql)
+        except Exception as error:
+            skipped[name] = str(error).splitlines()[0][:100]
+    if verbose:
+        print(f"\n🔬 {engine}: {len(plans)} queries run at scale {scale:g}, "
+              f"{len(skipped)} not runnable on this engine")
+
+    measurements = {}
+    for (table, column), usage in candidates.items():
+        affected = [name for name in usage['queries'] if name in plans]
+        if not affected:
+            continue
+        start_time = time.perf_counter()
+        connection.execute(f"CREATE INDEX {index_name(table, column)} ON {table} ({column})")
+        if engine == 'sqlite':
+            connection.execute(f"ANALYZE {index_name(table, column)}")  # Let the planner cost it
+        build_ms = (time.perf_counter() - start_time) * 1000
+        # Only queries whose plan changed are timed, so noise on the others can't decide the outcome
+        changed = [name for name in affected if query_plan(connection, engine, statements[name]) != plans[name]]
+        after = {name: best_time(connection, statements[name], repeat) for name in changed}
+        connection.execute(f"DROP INDEX {index_name(table, column)}")
+        before = {name: best_time(connection, statements[name], repeat) for name in changed}
+
+        before_ms = sum(before.values())
+        saving_ms = before_ms - sum(after.values())
+        keep = saving_ms >= max(MIN_SAVING_MS, MIN_SAVING_SHARE * before_ms)
+        measurements[f"{table}.{column}"] = {
+            'table': table, 'column': column, 'queries': len(affected), 'plan_changes': len(changed),
+            'build_ms': round(build_ms, 2), 'before_ms': round(before_ms, 2),
+            'after_ms': round(sum(after.values()), 2), 'saving_ms': round(saving_ms, 2), 'keep': keep,
+        }
+        if verbose:
+            print(f"   {'✅' if keep else '❌'} {table + '.' + column:<36} {len(changed):>3}/{len(affected):<3} plans "
+                  f"{before_ms:9.1f} -> {sum(after.values()):9.1f} ms  (build {build_ms:7.1f} ms)")
+    connection.close()
+    return {'engine': engine, 'scale': scale, 'seed': seed, 'skipped': skipped, 'indexes': measurements}
+
+def kept_indexes(measurement: dict):
+    """{table: [column, ...]} of the indexes that paid for themselves, in edufin_warehouse's INDEXES shape"""
+    indexes = defaultdict(list)
+    for entry in measurement['indexes'].values():
+        if entry['keep']:
+            indexes[entry['table']].append(entry['column'])
+    return {table: indexes[table] for table in TABLE_ORDER if table in indexes}
+
+# ============================================================================
+# TARGET DDL
+# ============================================================================
+
+def index_ddl(indexes: dict):
+    return [f"CREATE INDEX {index_name(table, column)} ON {table} ({column});"
+            for table in TABLE_ORDER for column in indexes.get(table, [])]
+
+def sqlserver_ddl(indexes: dict):
+    """Tables, clustered columnstore on the facts and nonclustered B-tree indexes"""
+    statements = []
+    for table in TABLE_ORDER:
+        create = create_table_sql(table, 'sqlserver')
+        if table in FACT_TABLES:  # The columnstore takes the clustered slot; the key stays a B-tree
+            create = create.replace(' PRIMARY KEY', ' PRIMARY KEY NONCLUSTERED', 1)
+        statements.append(create + ';')
+    statements.append('GO')
+    statements += [f"CREATE CLUSTERED COLUMNSTORE INDEX cci_{table} ON {table};" for table in FACT_TABLES]
+    statements += [f"CREATE NONCLUSTERED INDEX {index_name(table, column)} ON {table} ({column});"
+                   for table in TABLE_ORDER for column in indexes.get(table, [])]
+    return statements + ['GO']
+
+def delta_ddl(candidates: dict):
+    """OPTIMIZE ... ZORDER BY on each large table's most used join/filter columns"""
+    statements = []
+    for table in ZORDER_TABLES:
+        columns = [column for (candidate_table, column) in candidates if candidate_table == table]
+        columns = columns[:MAX_ZORDER_COLUMNS]
+        if columns:
+            statements.append(f"-- Liquid clustering alternative: ALTER TABLE {table} CLUSTER BY ({', '.join(columns)});")
+            statements.append(f"OPTIMIZE {table} ZORDER BY ({', '.join(columns)});")
+    return statements
+
+def usage_indexes(candidates: dict):
+    """Unmeasured fallback: every candidate used by at least two queries"""
+    indexes = defaultdict(list)
+    for (table, column), usage in candidates.items():
+        if len(usage['queries']) >= 2:
+            indexes[table].append(column)
+    return dict(indexes)
+
+def physical_design(candidates: dict, measurements: dict):
+    """{target: [statement, ...]}; unmeasured engines fall back to the usage counts"""
+    fallback = usage_indexes(candidates)
+    sqlite_indexes = kept_indexes(measurements['sqlite']) if 'sqlite' in measurements else fallback
+    duckdb_indexes = kept_indexes(measurements['duckdb']) if 'duckdb' in measurements else fallback
+    return {
+        'sqlserver': sqlserver_ddl(sqlite_indexes),  # SQLite's B-trees stand in for rowstore indexes
+        'delta': delta_ddl(candidates),
+        'duckdb': index_ddl(duckdb_indexes),
+        'sqlite': index_ddl(sqlite_indexes),
+    }
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Derive index candidates from the challenge queries, measure them and write target DDL"""
+    parser = argparse.ArgumentParser(description="Measured index and layout DDL for the EduFin schema")
+    parser.add_argument('--engines', nargs='+', choices=DEFAULT_ENGINES, default=DEFAULT_ENGINES,
+                        help="Stand-in engines to measure on")
+    parser.add_argument('--no-measure', action='store_true', help="Use usage counts instead of measuring")
+    parser.add_argument('--scale', type=float, default=DESIGN_SCALE)
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--queries', nargs='+', help="Only queries whose names start with these prefixes")
+    parser.add_argument('--target', choices=['sqlserver', 'delta', 'duckdb', 'sqlite'], help="Print one target's DDL")
+    parser.add_argument('--out', help="Write <target>.sql files and measurements.json to this directory")
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("EDUFIN PHYSICAL DESIGN")
+    print("=" * 80)
+    queries = load_queries(args.queries)
+    candidates = index_candidates(queries)
+    print(f"🔎 {len(candidates)} candidate columns from {len(queries)} challenge queries")
+    for (table, column), usage in candidates.items():
+        print(f"   {table + '.' + column:<42} {len(usage['queries']):>3} queries "
+              f"({usage['join']} join, {usage['filter']} filter)")
+
+    measurements = {}
+    if not args.no_measure:
+        engines = [engine for engine in args.engines if engine != 'duckdb' or duckdb is not None]
+        for engine in engines:
+            measurements[engine] = measure_indexes(engine, candidates, queries, args.scale, args.seed, args.repeat)
+
+    design = physical_design(candidates, measurements)
+    if args.target:
+        print(f"\n-- {args.target}\n" + '\n\n'.join(design[args.target]))
+    if args.out:
+        out = Path(args.out)
+        out.mkdir(parents=True, exist_ok=True)
+        for target, statements in design.items():
+            (out / f"{target}.sql").write_text('\n\n'.join(statements) + '\n')
+        for engine, measurement in measurements.items():
+            (out / f"{engine}_indexes.json").write_text(json.dumps(kept_indexes(measurement), indent=1))
+        (out / 'measurements.json').write_text(json.dumps(measurements, indent=1))
+        print(f"\n💾 DDL for {', '.join(design)} written to {out}")
+
+    for engine, measurement in measurements.items():
+        kept = sum(entry['keep'] for entry in measurement['indexes'].values())
+        print(f"✅ {engine}: {kept} of {len(measurement['indexes'])} measured indexes pay for themselves")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,474 @@
+"""
+SQL Challenge Query Benchmark
+Runs the SQL V1/V2/V3 challenge queries against generated EduFin warehouses at several scale factors
+- --extract pulls every query out of the challenge pages (the V1 HTML pages and the V2/V3 Databricks
+  notebook exports) into benchmark_queries/*.sql, translated from T-SQL / Spark SQL to DuckDB
+- Each scale factor gets its own DuckDB warehouse, rebuilt only when the generator or schema changes
+- Per query: latency percentiles over repeated runs, rows scanned and the operator plan from
+  DuckDB's profiler
+- Comparing with a saved run flags latency regressions, plan changes and changed row counts,
+  and says when the generator or schema differs from the baseline's
+
+Usage:
+    python query_benchmark.py --extract
+    python query_benchmark.py --scales 0.01 0.1 1 --repeat 10 --out benchmark_results.json
+    python query_benchmark.py --scales 0.1 --baseline benchmark_results.json
+"""
+
+import argparse
+import base64
+import hashlib
+import html
+import json
+import os
+import re
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import unquote
+
+import numpy as np
+
+import dataset_schemas
+import edufin_rng
+import edufin_virtual_tables
+import edufin_warehouse
+from dataset_cache import CACHE_DIR, code_version
+from dataset_loader import REPO_ROOT
+from edufin_rng import DEFAULT_SEED
+from edufin_virtual_tables import DEFAULT_AS_OF
+from edufin_warehouse import TABLE_ORDER, build_warehouse, connect, duckdb, virtual_source
+
+SQL_TRACK_DIR = REPO_ROOT / 'Skill_AI_Path_SQL_Track'
+QUERY_DIR = Path(__file__).resolve().parent / 'benchmark_queries'
+WAREHOUSE_DIR = Path(os.environ.get('BENCHMARK_WAREHOUSE_DIR', os.path.join(CACHE_DIR, 'warehouses')))
+
+# Page file pattern -> query name prefix
+CHALLENGE_PAGES = {
+    r'SQL_session_1_challenge_(\d+)\.html': 'v1_c{}',
+    r'SQL_V2_[cC]hallenge_(\d+)\.html': 'v2_c{}',
+    r'SQL_V3_challenge_(\d+)\.html': 'v3_c{}',
+}
+
+DEFAULT_SCALES = [0.01, 0.1, 1.0]
+REPEAT = 10
+# Regressions compare the fastest warm run: scheduler and cache noise only ever add time, so the minimum is
+# the steadiest statistic. Even so, minimums of 10-50 ms queries drift by 1.5x between processes on a busy
+# machine, so only a doubling that reproduces on a re-time counts; plan changes are flagged separately
+REGRESSION_TOLERANCE = 1.0  # A query more than twice as slow as the baseline is a regression...
+MIN_REGRESSION_MS = 10.0  # ...if it also lost at least this much
+
+# Spark date patterns -> strftime
+DATE_PATTERN_TOKENS = {'yyyy': '%Y', 'MM': '%m', 'dd': '%d', 'HH': '%H', 'mm': '%M', 'ss': '%S'}
+NUMBER_FORMATS = {"'N0'": "'{:,.0f}'", "'N1'": "'{:,.1f}'", "'N2'": "'{:,.2f}'"}
+
+# ============================================================================
+# EXTRACTION
+# ============================================================================
+
+def page_queries(path: Path):
+    """SQL cells of one challenge page; Databricks exports embed the notebook as encoded JSON"""
+    text = path.read_text(encoding='utf-8')
+    model = re.search(r"__DATABRICKS_NOTEBOOK_MODEL = '([^']*)'", text)
+    if model:
+        notebook = json.loads(unquote(base64.b64decode(model.group(1)).decode('utf-8')))
+        cells = [command['command'] for command in notebook['commands']]
+    else:
+        # Highlighting is <span> markup only; literal '<' inside strings is left as it is in the page
+        cells = [html.unescape(re.sub(r'</?span[^>]*>', '', block))
+                 for block in re.findall(r'<div class="code-block">(.*?)</div>', text, re.S)]
+    return [cell.strip() for cell in cells
+            if not cell.lstrip().startswith('%') and re.search(r'\bSELECT\b', cell, re.I)]
+
+def query_name(prefix: str, sql: str, position: int, taken: set):
+    """'v1_c3_step_3b' from the cell's '-- Step 3B: ...' comment, else the cell position"""
+    step = re.search(r'--\s*Step\s+(\w+)', sql, re.I)
+    name = f"{prefix}_step_{step.group(1).lower()}" if step else f"{prefix}_q{position + 1}"
+    suffix = 2
+    while name in taken:
+        name = f"{name.rsplit('__', 1)[0]}__{suffix}"
+        suffix += 1
+    taken.add(name)
+    return name
+
+def challenge_queries():
+    """{name: (source page, cell position, sql)} for every challenge page under the SQL track"""
+    queries, taken = {}, set()
+    for path in sorted(SQL_TRACK_DIR.rglob('*.html')):
+        for pattern, prefix in CHALLENGE_PAGES.items():
+            match = re.fullmatch(pattern, path.name)
+            if match:
+                for position, sql in enumerate(page_queries(path)):
+                    name = query_name(prefix.format(match.group(1)), sql, position, taken)
+                    queries[name] = (str(path.relative_to(REPO_ROOT)), position, sql)
+    return queries
+
+# ============================================================================
+# DIALECT TRANSLATION
+# ============================================================================
+
+def call_arguments(sql: str, open_paren: int):
+    """(top-level arguments, index after the closing paren) of the call whose '(' is at open_paren"""
+    depth, quote, start, arguments = 0, None, open_paren + 1, []
+    for index in range(open_paren, len(sql)):
+        char = sql[index]
+        if quote:
+            quote = None if char == quote else quote
+        elif char in "'\"`":
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+            if depth == 0:
+                arguments.append(sql[start:index].strip())
+                return [argument for argument in arguments if argument], index + 1
+        elif char == ',' and depth == 1:
+            arguments.append(sql[start:index].strip())
+            start = index + 1
+    raise ValueError("Unbalanced parentheses")
+
+def rewrite_calls(sql: str, function: str, rewrite):
+    """Replace every function(...) call with rewrite(arguments); innermost calls are rewritten first"""
+    for match in reversed(list(re.finditer(rf'\b{function}\s*\(', sql, re.I))):
+        arguments, end = call_arguments(sql, match.end() - 1)
+        replacement = rewrite(arguments)
+        if replacement is not None:
+            sql = sql[:match.start()] + replacement + sql[end:]
+    return sql
+
+def date_pattern(pattern: str):
+    for token, directive in DATE_PATTERN_TOKENS.items():
+        pattern = pattern.replace(token, directive)
+    return pattern
+
+def unit(argument: str):
+    return f"'{argument.strip().strip(chr(39)).lower()}'"
+
+def interval(unit_name: str, amount: str):
+    """DuckDB interval of `amount` units, as a call the SQLite stand-in can rewrite too"""
+    return f"to_{unit_name.strip().strip(chr(39)).lower().rstrip('s')}s(CAST({amount} AS INTEGER))"
+
+def regexp_replace(arguments):
+    subject, pattern, replacement = arguments[:3]
+    return f"regexp_replace(CAST({subject} AS VARCHAR), {pattern.replace(chr(92) * 2, chr(92))}, {replacement}, 'g')"
+
+# Function -> rewrite of its arguments (None keeps the call as it is)
+FUNCTION_REWRITES = {
+    'DATEDIFF': lambda a: (f"date_diff({unit(a[0])}, {a[1]}, {a[2]})" if len(a) == 3
+                           else f"date_diff('day', {a[1]}, {a[0]})"),
+    'TIMESTAMPDIFF': lambda a: f"date_diff({unit(a[0])}, {a[1]}, {a[2]})",
+    'DATEADD': lambda a: f"date_add({a[2]}, {interval(a[0], a[1])})",
+    'DATEPART': lambda a: f"date_part({unit(a[0])}, {a[1]})",
+    'DATENAME': lambda a: (f"monthname({a[1]})" if a[0].lower() == 'month'
+                           else f"dayname({a[1]})" if a[0].lower() in ('weekday', 'dw') else None),
+    'DATEFROMPARTS': lambda a: f"make_date({', '.join(a)})",
+    'MONTHS_BETWEEN': lambda a: f"(date_diff('day', {a[1]}, {a[0]}) / 31.0)",
+    'DATE_FORMAT': lambda a: f"strftime({a[0]}, {date_pattern(a[1])})",
+    'TRY_DIVIDE': lambda a: f"(({a[0]}) / NULLIF({a[1]}, 0))",
+    'GETDATE': lambda a: "localtimestamp",
+    'CURRENT_TIMESTAMP': lambda a: "localtimestamp",
+    'CURRENT_DATE': lambda a: "current_date",
+    'ISNULL': lambda a: f"coalesce({', '.join(a)})" if len(a) == 2 else None,
+    'LEN': lambda a: f"length(CAST({a[0]} AS VARCHAR))",
+    'LENGTH': lambda a: f"length(CAST({a[0]} AS VARCHAR))",  # Spark casts numbers implicitly
+    'FORMAT': lambda a: (f"format({NUMBER_FORMATS[a[1]]}, CAST({a[0]} AS DOUBLE))" if a[1] in NUMBER_FORMATS
+                         else f"strftime({a[0]}, {date_pattern(a[1])})") if len(a) == 2 else None,
+    'ADD_MONTHS': lambda a: f"date_add({a[0]}, {interval('month', a[1])})",
+    'STDEV': lambda a: f"stddev_samp({a[0]})",
+    'REGEXP_REPLACE': lambda a: regexp_replace(a) if len(a) == 3 else None,
+}
+
+def to_duckdb(sql: str):
+    """Translate the T-SQL / Spark SQL used in the challenges into DuckDB SQL"""
+    sql = re.sub(r'\b\w+\.\w+\.(' + '|'.join(TABLE_ORDER) + r')\b', r'\1', sql)  # catalog.schema.table
+    sql = sql.replace('`', '"')
+    sql = re.sub(r"\s\+\s*'", " || '", sql)  # T-SQL string concatenation next to a literal
+    sql = re.sub(r"'\s*\+\s", "' || ", sql)
+    for function, rewrite in FUNCTION_REWRITES.items():
+        sql = rewrite_calls(sql, function, rewrite)
+    sql = re.sub(r'\b(GETDATE|CURRENT_TIMESTAMP)\b', 'localtimestamp', sql, flags=re.I)
+
+    top = re.search(r'\bSELECT\s+TOP\s+(\d+)\s', sql, re.I)
+    if top:  # T-SQL TOP n on the final SELECT -> LIMIT n
+        sql = sql[:top.start()] + 'SELECT ' + sql[top.end():]
+        sql = sql.rstrip().rstrip(';') + f"\nLIMIT {top.group(1)};"
+    return sql
+
+def is_read_only(sql: str):
+    """True when the cell only queries (no DDL or DML)"""
+    code = re.sub(r'--[^\n]*', '', sql)
+    return not re.search(r'\b(CREATE|INSERT|UPDATE|DELETE|DROP|ALTER|MERGE|TRUNCATE)\b', code, re.I)
+
+def extract_queries(verbose: bool = True):
+    """Write the challenge queries that run on DuckDB to benchmark_queries/, with a manifest of all of them"""
+    queries = challenge_queries()
+    with tempfile.TemporaryDirectory() as directory:
+        warehouse = Path(directory) / 'checked_in.duckdb'
+        build_warehouse(warehouse, 'duckdb', verbose=False)
+        connection = connect(warehouse, 'duckdb')
+
+        QUERY_DIR.mkdir(exist_ok=True)
+        for stale in QUERY_DIR.glob('*.sql'):
+            stale.unlink()
+        manifest = {}
+        for name, (source, position, sql) in queries.items():
+            entry = {'source': source, 'cell': position}
+            if not is_read_only(sql):
+                entry['status'] = 'skipped: creates or modifies objects'
+            else:
+                translated = to_duckdb(sql)
+                try:
+                    connection.execute(translated).fetchall()
+                    entry['status'] = 'ok'
+                    header = f"-- Source: {source} (cell {position})\n-- Translated to DuckDB by query_benchmark.py --extract\n\n"
+                    (QUERY_DIR / f"{name}.sql").write_text(header + translated.strip() + '\n', encoding='utf-8')
+                except Exception as error:  # Kept in the manifest so the gap is visible
+                    entry['status'] = f"error: {str(error).splitlines()[0]}"
+            manifest[name] = entry
+        connection.close()
+
+    (QUERY_DIR / 'manifest.json').write_text(json.dumps(manifest, indent=2) + '\n', encoding='utf-8')
+    if verbose:
+        runnable = sum(entry['status'] == 'ok' for entry in manifest.values())
+        print(f"📝 {runnable} of {len(manifest)} challenge queries written to {QUERY_DIR}")
+        for name, entry in manifest.items():
+            if entry['status'] != 'ok':
+                print(f"   ⚠️ {name}: {entry['status'][:100]}")
+    return manifest
+
+def load_queries(names=None):
+    """{name: sql} from benchmark_queries/, optionally only names matching any of the given prefixes"""
+    queries = {path.stem: path.read_text(encoding='utf-8') for path in sorted(QUERY_DIR.glob('*.sql'))}
+    if names:
+        queries = {name: sql for name, sql in queries.items() if any(name.startswith(prefix) for prefix in names)}
+    return queries
+
+# ============================================================================
+# WAREHOUSES
+# ============================================================================
+
+def generator_version():
+    """Hash of everything that determines the warehouse contents and layout"""
+    return code_version(edufin_rng, edufin_virtual_tables, dataset_schemas, edufin_warehouse)
+
+def warehouse_for(scale: float, seed: int = DEFAULT_SEED, as_of: str = DEFAULT_AS_OF, verbose: bool = True):
+    """DuckDB warehouse at `scale`, rebuilt when the generator or schema changed since it was built"""
+    WAREHOUSE_DIR.mkdir(parents=True, exist_ok=True)
+    path = WAREHOUSE_DIR / f"edufin_scale_{scale:g}_seed_{seed}.duckdb"
+    stamp_path = path.with_suffix('.json')
+    stamp = {'scale': scale, 'seed': seed, 'as_of': str(as_of), 'generator_version': generator_version()}
+    if path.exists() and stamp_path.exists() and json.loads(stamp_path.read_text()) == stamp:
+        return path
+
+    if verbose:
+        print(f"🏗️ Building scale {scale:g} warehouse at {path}...")
+    start_time = time.time()
+    build_warehouse(path, 'duckdb', virtual_source(scale, seed, as_of=as_of), verbose=False)
+    stamp_path.write_text(json.dumps(stamp))
+    if verbose:
+        print(f"   ✅ Built in {time.time() - start_time:.1f}s")
+    return path
+
+# ============================================================================
+# MEASUREMENT
+# ============================================================================
+
+def plan_lines(node: dict, depth: int = 0):
+    """Operator tree of a DuckDB JSON profile as indented lines"""
+    lines = []
+    name = node.get('operator_name') or node.get('operator_type')
+    if name:
+        table = node.get('extra_info', {}).get('Table', '')
+        lines.append('  ' * depth + name.strip() + (f" ({table})" if table else ''))
+        depth += 1
+    for child in node.get('children', []):
+        lines.extend(plan_lines(child, depth))
+    return lines
+
+def run_query(connection, sql: str, repeat: int = REPEAT):
+    """Latency percentiles over `repeat` warm runs, plus rows scanned and plan from one profiled run"""
+    rows = connection.execute(sql).fetchall()  # Warm-up: pulls the columns into the buffer pool
+    timings = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        connection.execute(sql).fetchall()
+        timings.append((time.perf_counter() - start_time) * 1000)
+
+    connection.execute("PRAGMA enable_profiling = 'no_output'")
+    connection.execute(sql).fetchall()
+    profile = json.loads(connection.get_profiling_information(format='json'))
+    connection.execute("PRAGMA disable_profiling")
+    plan = plan_lines(profile)
+
+    p50, p95 = np.percentile(timings, [50, 95])
+    return {
+        'min_ms': round(min(timings), 3),
+        'p50_ms': round(float(p50), 3),
+        'p95_ms': round(float(p95), 3),
+        'max_ms': round(max(timings), 3),
+        'rows_returned': len(rows),
+        'rows_scanned': int(profile.get('cumulative_rows_scanned', 0)),
+        'plan_hash': hashlib.blake2b('\n'.join(plan).encode(), digest_size=8).hexdigest(),
+        'plan': plan,
+    }
+
+def run_benchmark(scales=DEFAULT_SCALES, repeat: int = REPEAT, names=None, seed: int = DEFAULT_SEED,
+                  as_of: str = DEFAULT_AS_OF, verbose: bool = True):
+    """Benchmark every extracted query at every scale factor"""
+    if duckdb is None:
+        raise ImportError("The benchmark runs on DuckDB; `pip install duckdb`")
+    queries = load_queries(names)
+    if not queries:
+        raise FileNotFoundError(f"No queries in {QUERY_DIR}; run with --extract first")
+
+    results = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'engine': f"duckdb {duckdb.__version__}",
+        'generator_version': generator_version(),
+        'seed': seed,
+        'as_of': str(as_of),
+        'repeat': repeat,
+        'scales': {},
+    }
+    for scale in scales:
+        connection = duckdb.connect(str(warehouse_for(scale, seed, as_of, verbose)), read_only=True)
+        measured = {}
+        for name, sql in queries.items():
+            try:
+                measured[name] = run_query(connection, sql, repeat)
+            except Exception as error:
+                measured[name] = {'error': str(error).splitlines()[0]}
+        connection.close()
+        results['scales'][f"{scale:g}"] = measured
+        if verbose:
+            print_scale(scale, measured)
+    return results
+
+# ============================================================================
+# REGRESSIONS
+# ============================================================================
+
+def compare_results(results: dict, baseline: dict, tolerance: float = REGRESSION_TOLERANCE,
+                    min_ms: float = MIN_REGRESSION_MS):
+    """Flags for every query and scale present in both runs: latency, plan, rows scanned/returned, new errors"""
+    flags = []
+    for scale, measured in results['scales'].items():
+        for name, current in measured.items():
+            previous = baseline['scales'].get(scale, {}).get(name)
+            if previous is None or 'error' in previous:
+                continue
+            if 'error' in current:
+                flags.append((scale, name, 'error', current['error']))
+                continue
+            statistic = 'min_ms' if 'min_ms' in previous else 'p50_ms'  # Baselines from before min_ms
+            before, after = previous[statistic], current[statistic]
+            if after > before * (1 + tolerance) and after - before >= min_ms:
+                flags.append((scale, name, 'latency',
+                              f"{statistic[:-3]} {before:.1f} -> {after:.1f} ms ({after / before:.2f}x)"))
+            if current['plan_hash'] != previous['plan_hash']:
+                flags.append((scale, name, 'plan', f"{previous['plan_hash']} -> {current['plan_hash']}"))
+            for metric in ['rows_scanned', 'rows_returned']:
+                if current[metric] != previous[metric]:
+                    flags.append((scale, name, metric, f"{previous[metric]:,} -> {current[metric]:,}"))
+    return flags
+
+def recheck_latency(results: dict, flags: list, repeat: int = REPEAT, verbose: bool = True):
+    """Re-time the queries flagged as slower and keep the fastest run, so only a reproducible slowdown stays"""
+    suspects = {(scale, name) for scale, name, kind, _ in flags if kind == 'latency'}
+    if not suspects:
+        return
+    if verbose:
+        print(f"\n🔁 Re-timing {len(suspects)} query(ies) flagged as slower...")
+    queries = load_queries()
+    for scale in sorted({scale for scale, _ in suspects}, key=float):
+        path = warehouse_for(float(scale), results['seed'], results['as_of'], verbose)
+        connection = duckdb.connect(str(path), read_only=True)
+        for name in sorted(name for suspect_scale, name in suspects if suspect_scale == scale):
+            current = results['scales'][scale][name]
+            current['min_ms'] = min(current['min_ms'], run_query(connection, queries[name], repeat)['min_ms'])
+        connection.close()
+
+# ============================================================================
+# REPORTING
+# ============================================================================
+
+def print_scale(scale: float, measured: dict):
+    print(f"\n📊 SCALE {scale:g}")
+    print(f"   {'query':<26} {'p50 ms':>10} {'p95 ms':>10} {'rows scanned':>14} {'rows':>8}")
+    for name, metrics in measured.items():
+        if 'error' in metrics:
+            print(f"   {name:<26} ❌ {metrics['error'][:80]}")
+        else:
+            print(f"   {name:<26} {metrics['p50_ms']:>10.2f} {metrics['p95_ms']:>10.2f} "
+                  f"{metrics['rows_scanned']:>14,} {metrics['rows_returned']:>8,}")
+
+def print_scaling(results: dict, top: int = 10):
+    """Queries whose p50 grows fastest from the smallest to the largest scale"""
+    scales = sorted(results['scales'], key=float)
+    if len(scales) < 2:
+        return
+    small, large = results['scales'][scales[0]], results['scales'][scales[-1]]
+    growth = sorted(((large[name]['p50_ms'] / max(small[name]['p50_ms'], 1e-3), name) for name in small
+                     if 'error' not in small[name] and 'error' not in large.get(name, {'error': None})),
+                    reverse=True)
+    data_growth = float(scales[-1]) / float(scales[0])
+    print(f"\n📈 LATENCY GROWTH {scales[0]} -> {scales[-1]} ({data_growth:g}x data)")
+    for ratio, name in growth[:top]:
+        print(f"   {name:<26} {ratio:8.1f}x  ({small[name]['p50_ms']:.1f} -> {large[name]['p50_ms']:.1f} ms)")
+
+# ============================================================================
+# COMMAND LINE
+# ============================================================================
+
+def main():
+    """Extract the challenge queries, or benchmark them across scale factors"""
+    parser = argparse.ArgumentParser(description="Benchmark the SQL challenge queries across scale factors")
+    parser.add_argument('--extract', action='store_true', help="Re-extract benchmark_queries/ from the challenge pages")
+    parser.add_argument('--scales', type=float, nargs='+', default=DEFAULT_SCALES)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--queries', nargs='+', help="Only queries whose names start with these prefixes")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED)
+    parser.add_argument('--as-of', default=DEFAULT_AS_OF,
+                        help="Date the virtual tables' relative dates count back from (YYYY-MM-DD)")
+    parser.add_argument('--out', help="Write the results JSON here")
+    parser.add_argument('--baseline', help="Results JSON of an earlier run to check for regressions")
+    parser.add_argument('--tolerance', type=float, default=REGRESSION_TOLERANCE)
+    parser.add_argument('--min-ms', type=float, default=MIN_REGRESSION_MS,
+                        help="Smallest slowdown in milliseconds that counts as a regression")
+    args = parser.parse_args()
+
+    if args.extract:
+        extract_queries()
+        return
+
+    print("=" * 80)
+    print("SQL CHALLENGE QUERY BENCHMARK")
+    print("=" * 80)
+    results = run_benchmark(args.scales, args.repeat, args.queries, args.seed, args.as_of)
+    print_scaling(results)
+
+    flags = []
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if baseline['generator_version'] != results['generator_version']:
+            print("\n🔄 Generator or schema changed since the baseline: plan and row changes may come from it")
+        if baseline.get('as_of') != results['as_of']:
+            print(f"\n📅 Baseline dates are as of {baseline.get('as_of')}, this run's as of {results['as_of']}: "
+                  f"row changes may come from it")
+        flags = compare_results(results, baseline, args.tolerance, args.min_ms)
+        recheck_latency(results, flags, args.repeat)
+        flags = compare_results(results, baseline, args.tolerance, args.min_ms)
+        print(f"\n🚩 {len(flags)} regression flag(s) against {args.baseline}")
+        for scale, name, kind, detail in flags:
+            print(f"   scale {scale:<6} {name:<26} {kind:<14} {detail}")
+
+    if args.out:  # After any re-timing, so the saved minimums include it
+        Path(args.out).write_text(json.dumps(results, indent=1))
+        print(f"\n💾 Results saved to {args.out}")
+    if flags:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()